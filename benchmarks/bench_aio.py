@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Measure request latency of the asyncio API under concurrent load.
+
+A number of client coroutines send single-word requests as fast as they can, while
+a ticker coroutine that wakes up every millisecond measures how late the event loop
+runs it. Three ways of serving the requests are compared:
+
+    blocking    syllabify_with_details called right in the coroutine, which blocks
+                the event loop.
+    threads     pylabeador.aio with the default thread executor.
+    processes   pylabeador.aio with a ProcessPoolExecutor.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_aio.py [--clients N] [--requests N] [--jobs N]
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+from pathlib import Path
+import sys
+import time
+
+THIS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+from pylabeador import aio  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def blocking(word: str):
+    return pylabeador.syllabify_with_details(word)
+
+
+async def run_load(syllabify, words: list[str], clients: int, requests: int) -> dict:
+    latencies: list[float] = []
+    lags: list[float] = []
+    done = False
+
+    async def ticker():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    async def client(offset: int):
+        for word in itertools.islice(itertools.cycle(words), offset, offset + requests):
+            start = time.perf_counter()
+            await syllabify(word)
+            latencies.append(time.perf_counter() - start)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i * requests) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    latencies.sort()
+    lags.sort()
+    return {
+        "requests/s": len(latencies) / elapsed,
+        "p50 ms": percentile(latencies, 0.5) * 1000,
+        "p99 ms": percentile(latencies, 0.99) * 1000,
+        "max loop lag ms": lags[-1] * 1000 if lags else 0,
+    }
+
+
+async def main_async(args):
+    words = golden_words()
+    cases = {"blocking": None, "threads": None, "processes": ProcessPoolExecutor(args.jobs)}
+    for name, executor in cases.items():
+        if name == "blocking":
+            res = await run_load(blocking, words, args.clients, args.requests)
+        else:
+            async with aio.Batcher(executor) as batcher:
+                # Start the workers before timing
+                await batcher.hyphenate_many(words[:100])
+                res = await run_load(batcher.syllabify_with_details, words, args.clients, args.requests)
+            if executor is not None:
+                executor.shutdown()
+        print(f"{name:>10}: " + "  ".join(f"{key} {value:>10,.2f}" for key, value in res.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=100, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Number of requests per client")
+    parser.add_argument("--jobs", type=int, default=2, help="Number of worker processes")
+    args = parser.parse_args()
+    pylabeador.set_engine("compiled")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Compare the batch API against a Python loop over syllabify_with_details.
+
+The noisy cases replace one word in ten with an invalid one, to compare catching
+HyphenatorError in a loop against getting InvalidWord results back.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_batch.py [--repeat N]
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def loop(words):
+    for word in words:
+        pylabeador.syllabify_with_details(word)
+
+
+def batch(words):
+    for _ in pylabeador.syllabify_with_details_many(words):
+        pass
+
+
+def noisy_loop(words):
+    for word in words:
+        try:
+            pylabeador.syllabify_with_details(word)
+        except pylabeador.HyphenatorError:
+            pass
+
+
+def noisy_batch_raise(words):
+    it = iter(words)
+    while True:
+        try:
+            for _ in pylabeador.syllabify_with_details_many(it):
+                pass
+            break
+        except pylabeador.HyphenatorError:
+            pass
+
+
+def noisy_batch_return(words):
+    for _ in pylabeador.syllabify_with_details_many(words, errors="return"):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case")
+    args = parser.parse_args()
+
+    words = golden_words()
+    noisy = [f"{word}1" if i % 10 == 0 else word for i, word in enumerate(words)]
+
+    # name: (engine, function, words)
+    cases = {f"loop ({engine})": (engine, loop, words) for engine in pylabeador.api.ENGINES}
+    cases["syllabify_with_details_many"] = ("compiled", batch, words)
+    cases["noisy loop (compiled)"] = ("compiled", noisy_loop, noisy)
+    cases["noisy many, raising"] = ("compiled", noisy_batch_raise, noisy)
+    cases["noisy many, returning"] = ("compiled", noisy_batch_return, noisy)
+
+    for name, (engine, run, case_words) in cases.items():
+        pylabeador.set_engine(engine)
+        best = min(timeit.repeat(lambda: run(case_words), number=1, repeat=args.repeat))  # noqa: B023
+        print(f"{name:>28}: {len(words) / best:>12,.0f} words/s  ({best * 1e6 / len(words):.2f} µs/word)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Measure the latency of one-word calls with and without a running daemon.
+
+Four ways of syllabifying a single word are compared:
+
+    cold        A new pylabeador process that does the work itself, as when no
+                daemon is running.
+    forwarded   A new pylabeador process that forwards the word to the daemon.
+    connect     A new connection to the daemon from a running process, one word,
+                then closed. This is the floor of a forwarded call, without the
+                start of the process.
+    client      One more word on an open connection to the daemon.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_daemon.py [--calls N]
+"""
+
+import argparse
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+THIS_DIR = Path(__file__).resolve().parent
+SRC_DIR = THIS_DIR.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from pylabeador.__main__ import DAEMON_ENV  # noqa: E402
+from pylabeador.daemonclient import SOCKET_ENV, connect_daemon  # noqa: E402
+
+COMMAND = [sys.executable, "-m", "pylabeador"]
+WORD = "transatlántico"
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def measure(name: str, call, calls: int) -> None:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50, p99 = percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000
+    print(f"{name:<10} p50 {p50:>9.3f} ms  p99 {p99:>9.3f} ms")
+
+
+def wait_for_daemon(path: str, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while (client := connect_daemon(path)) is None:
+        if time.monotonic() > deadline:
+            sys.exit("The daemon did not start")
+        time.sleep(0.05)
+    client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50, help="Number of calls of each kind")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "pylabeador.sock")
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), SOCKET_ENV: path}
+    daemon = subprocess.Popen([*COMMAND, "daemon"], env=env, stderr=subprocess.DEVNULL)  # noqa: S603
+    try:
+        wait_for_daemon(path)
+
+        def run(extra_env):
+            subprocess.run([*COMMAND, WORD], env={**env, **extra_env}, stdout=subprocess.DEVNULL, check=True)  # noqa: S603
+
+        def connect():
+            with connect_daemon(path) as client:
+                client.hyphenate(WORD)
+
+        measure("cold", lambda: run({}), args.calls)
+        measure("forwarded", lambda: run({DAEMON_ENV: "1"}), args.calls)
+        measure("connect", connect, args.calls * 20)
+        with connect_daemon(path) as client:
+            measure("client", lambda: client.hyphenate(WORD), args.calls * 20)
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Compare the throughput of the syllabification engines over the golden word list.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_engines.py [--repeat N]
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+from pylabeador.api import ENGINES  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per engine")
+    args = parser.parse_args()
+
+    words = golden_words()
+    rates = {}
+    for name, parse in ENGINES.items():
+
+        def run(parse=parse):
+            for word in words:
+                parse(word)
+
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        rates[name] = len(words) / best
+        print(f"{name:>10}: {rates[name]:>12,.0f} words/s  ({best * 1e6 / len(words):.2f} µs/word)")
+
+    print(f"{'speedup':>10}: {rates['compiled'] / rates['rules']:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
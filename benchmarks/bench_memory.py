@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Measure the memory used to keep the results of the golden word list, per word.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_memory.py
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import sys
+import tracemalloc
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+@dataclass
+class PlainSyllable:
+    """Layout of the models before they were slotted, as a reference"""
+
+    onset: str = ""
+    nucleus: str = ""
+    coda: str = ""
+    accented: bool = False
+    stressed: bool = False
+
+
+@dataclass(frozen=True)
+class PlainSyllabifiedWord:
+    original: str
+    syllables: list[PlainSyllable]
+    stressed: int | None = None
+    accented: int | None = None
+
+
+def plain_results(words):
+    results = []
+    for word in words:
+        res = pylabeador.syllabify_with_details(word)
+        syllables = [PlainSyllable(s.onset, s.nucleus, s.coda, s.accented, s.stressed) for s in res.syllables]
+        results.append(PlainSyllabifiedWord(res.original, syllables, res.stressed, res.accented))
+    return results
+
+
+def measure(build, words) -> float:
+    """Bytes still allocated per word after building the results of all words"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    results = build(words)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return (after - before) / len(words)
+
+
+CASES = {
+    "plain dataclasses": plain_results,
+    "SyllabifiedWord": lambda words: [pylabeador.syllabify_with_details(w) for w in words],
+    "SyllabifiedWord (batch)": lambda words: list(pylabeador.syllabify_with_details_many(words)),
+    "SyllableBreaks": lambda words: [pylabeador.syllabify_offsets(w) for w in words],
+    "PackedBreaks": pylabeador.pack_offsets,
+}
+
+
+def main():
+    words = golden_words()
+    for name, build in CASES.items():
+        print(f"{name:>24}: {measure(build, words):>8.1f} bytes/word")
+
+
+if __name__ == "__main__":
+    main()
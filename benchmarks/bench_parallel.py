@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Measure how syllabify_offsets_parallel scales with the number of worker processes.
+
+The golden word list is repeated until it has the requested number of words, and
+each run is compared against a single process using pack_offsets.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_parallel.py [--words N] [--jobs 1,2,4]
+"""
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import time
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=1_000_000, help="Number of words to syllabify")
+    parser.add_argument(
+        "--jobs",
+        default=",".join(str(2**i) for i in range((os.cpu_count() or 1).bit_length())),
+        help="Comma separated numbers of worker processes to try (default: powers of two up to the CPUs)",
+    )
+    args = parser.parse_args()
+
+    golden = golden_words()
+    words = (golden * (args.words // len(golden) + 1))[: args.words]
+
+    start = time.perf_counter()
+    pylabeador.pack_offsets(words)
+    baseline = time.perf_counter() - start
+    print(f"{'single process':>16}: {len(words) / baseline:>12,.0f} words/s")
+
+    for jobs in map(int, args.jobs.split(",")):
+        start = time.perf_counter()
+        for _ in pylabeador.syllabify_offsets_parallel(words, jobs=jobs):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"{f'{jobs} jobs':>16}: {len(words) / elapsed:>12,.0f} words/s  (speedup {baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
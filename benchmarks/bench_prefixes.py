@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Measure the cost of the prefix mode against the plain engines.
+
+Every golden word is used as a stem, the worst case for the stem index. Two word
+lists are timed: the golden list, in which few words are prefixed, so it shows the
+cost of probing the trie and the stem index, and the golden words with a prefix
+added to each of them, which are all split and syllabified in two parts.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_prefixes.py [--repeat N]
+"""
+
+import argparse
+import itertools
+from pathlib import Path
+import sys
+import timeit
+
+THIS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+from pylabeador.prefixes import DEFAULT_PREFIXES  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def loop(words):
+    for word in words:
+        pylabeador.syllabify_with_details(word)
+
+
+def batch(words):
+    for _ in pylabeador.syllabify_with_details_many(words):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case")
+    args = parser.parse_args()
+
+    golden = golden_words()
+    stems = frozenset(word.lower() for word in golden)
+    word_lists = {
+        "golden": golden,
+        "prefixed": [prefix + word for prefix, word in zip(itertools.cycle(DEFAULT_PREFIXES), golden)],
+    }
+
+    # name: (engine, function)
+    cases = {f"loop ({engine})": (engine, loop) for engine in pylabeador.api.ENGINES}
+    cases["syllabify_with_details_many"] = ("compiled", batch)
+
+    print(f"{len(golden)} words per list, {len(stems)} stems")
+    for (name, (engine, run)), (list_name, words) in itertools.product(cases.items(), word_lists.items()):
+        pylabeador.set_engine(engine)
+        rates = []
+        for stem_index in (None, stems):
+            pylabeador.use_prefixes(stem_index)
+            best = min(timeit.repeat(lambda: run(words), number=1, repeat=args.repeat))  # noqa: B023
+            rates.append(len(words) / best)
+        pylabeador.use_prefixes(None)
+        plain, with_prefixes = rates
+        print(
+            f"{name:>28}, {list_name:>8}: {plain:>10,.0f} words/s plain, {with_prefixes:>10,.0f} words/s with "
+            f"prefixes ({plain / with_prefixes:.2f}x slower)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks of the per-letter primitives in the innermost loops of the engines.
+
+Each primitive is timed over the letters, or words, of the golden word list, and the
+result is reported in nanoseconds per call.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_primitives.py [--repeat N]
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+from pylabeador import compiled, engine  # noqa: E402
+from pylabeador.charclass import CLASS_OF  # noqa: E402
+from pylabeador.models import VowelType, WordProgress  # noqa: E402
+from pylabeador.util import find_invalid_chars, is_vowel  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def class_lookup(letters):
+    get = CLASS_OF.get
+    for c in letters:
+        get(c)
+
+
+def vowel_check(pairs):
+    for c, after in pairs:
+        is_vowel(c, after)
+
+
+def vowel_type(vowels):
+    from_char = VowelType.from_char
+    for c in vowels:
+        from_char(c)
+
+
+def classify(words):
+    for word in words:
+        compiled.classify(word)
+
+
+def validate(words):
+    for word in words:
+        find_invalid_chars(word)
+
+
+def scan_checked(words):
+    for word in words:
+        compiled.scan_checked(word)
+
+
+def onset(words):
+    for word in words:
+        engine.onset(WordProgress(word))
+
+
+def cases(words: list[str]) -> dict:
+    """Map the name of each case to its function and the list of inputs it takes, one per call"""
+    lowered = [word.lower() for word in words]
+    letters = [c for word in lowered for c in word]
+    pairs = [(word[i], word[i + 1] if i + 1 < len(word) else None) for word in lowered for i in range(len(word))]
+    return {
+        "CLASS_OF lookup": (class_lookup, letters),
+        "is_vowel": (vowel_check, pairs),
+        "VowelType.from_char": (vowel_type, [c for c in letters if c in "aáeéiíoóuúüy"]),
+        "classify (per word)": (classify, lowered),
+        "find_invalid_chars": (validate, words),
+        "find_invalid_chars, invalid": (validate, [f"{word}1" for word in words]),
+        "scan_checked (per word)": (scan_checked, words),
+        "WordProgress + onset": (onset, lowered),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case")
+    args = parser.parse_args()
+
+    for name, (run, inputs) in cases(golden_words()).items():
+        best = min(timeit.repeat(lambda: run(inputs), number=1, repeat=args.repeat))  # noqa: B023
+        print(f"{name:>30}: {best * 1e9 / len(inputs):>10,.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Compare hyphenate_text over prose against the single-word API per token.
+
+The prose is synthetic: golden-list words drawn with a Zipf distribution, separated
+by spaces and some punctuation.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_text.py [--tokens N] [--repeat N]
+"""
+
+import argparse
+import io
+from pathlib import Path
+import random
+import sys
+import timeit
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+
+
+def golden_words() -> list[str]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split()[0] for line in fin if line.strip() and not line.startswith("#")]
+
+
+def zipf_tokens(words: list[str], count: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)  # noqa: S311
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    return rng.choices(words, weights, k=count)
+
+
+def prose(tokens: list[str], seed: int = 1) -> str:
+    rng = random.Random(seed)  # noqa: S311
+    separators = [" "] * 12 + [", ", ". ", ";\n"]
+    return "".join(token + rng.choice(separators) for token in tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=200_000, help="Number of words in the text")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per case")
+    args = parser.parse_args()
+
+    tokens = zipf_tokens(golden_words(), args.tokens)
+    text = prose(tokens)
+
+    def single_word_api():
+        for token in tokens:
+            pylabeador.hyphenate(token)
+
+    def text_api():
+        for _ in pylabeador.hyphenate_text(io.StringIO(text)):
+            pass
+
+    cases = {
+        "hyphenate per token (rules)": ("rules", single_word_api),
+        "hyphenate per token (compiled)": ("compiled", single_word_api),
+        "hyphenate_text": ("rules", text_api),
+    }
+    for name, (engine, run) in cases.items():
+        pylabeador.set_engine(engine)
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{name:>32}: {len(tokens) / best:>12,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
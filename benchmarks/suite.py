@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+"""
+Benchmark suite of the public API, with regression gates against a stored baseline.
+
+Every case runs one function, one engine and one corpus, with the result cache cold
+(disabled) or warm (unbounded and filled with a first pass). For each case the suite
+measures the throughput, best of several runs, and the p50 and p99 latencies of
+single calls, timed one by one in a separate run.
+
+Corpora, all built offline and deterministically:
+
+    golden  The words of test/spanish-hyphens.txt.
+    long    Long synthetic words, made of 8 to 16 random syllables of golden words.
+    zipf    A stream of golden words drawn with a Zipf distribution, so that a few
+            words are very frequent, as in running text.
+
+Results are written as JSON. With --baseline, they are compared with a previous run
+and the suite exits with status 1 if any case is slower than the thresholds allow.
+
+Usage:
+    PYTHONPATH=src python benchmarks/suite.py [--output FILE] [--baseline FILE]
+        [--max-slowdown F] [--max-p99-increase F] [--engine NAME] [--repeat N]
+
+    # Store a new baseline
+    PYTHONPATH=src python benchmarks/suite.py --output benchmarks/baseline.json
+"""
+
+import argparse
+from collections.abc import Callable
+import datetime
+import json
+from pathlib import Path
+import platform
+import random
+import sys
+import time
+import timeit
+
+THIS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+from pylabeador import compiled  # noqa: E402
+
+GOLDEN_FILE = THIS_DIR.parent / "test" / "spanish-hyphens.txt"
+DEFAULT_BASELINE = THIS_DIR / "baseline.json"
+
+SEED = 20250101
+LONG_WORDS = 2000
+LONG_SYLLABLES = (8, 16)
+ZIPF_TOKENS = 20000
+ZIPF_EXPONENT = 1.1
+
+FUNCTIONS: dict[str, Callable] = {
+    "syllabify": pylabeador.syllabify,
+    "hyphenate": pylabeador.hyphenate,
+    "syllabify_with_details": pylabeador.syllabify_with_details,
+}
+
+
+def golden_entries() -> list[list[str]]:
+    with GOLDEN_FILE.open() as fin:
+        return [line.split() for line in fin if line.strip() and not line.startswith("#")]
+
+
+def long_words(entries: list[list[str]], rng: random.Random) -> list[str]:
+    syllables = sorted({syllable.lower() for _, hyphenated, *_ in entries for syllable in hyphenated.split("-")})
+    words = []
+    while len(words) < LONG_WORDS:
+        word = "".join(rng.choices(syllables, k=rng.randint(*LONG_SYLLABLES)))
+        # Joining syllables can put an accent in two of them, which is still a word
+        if compiled.try_scan(word) is not None:
+            words.append(word)
+    return words
+
+
+def zipf_stream(words: list[str], rng: random.Random) -> list[str]:
+    weights = [1 / rank**ZIPF_EXPONENT for rank in range(1, len(words) + 1)]
+    return rng.choices(words, weights=weights, k=ZIPF_TOKENS)
+
+
+def build_corpora() -> dict[str, list[str]]:
+    rng = random.Random(SEED)  # noqa: S311
+    entries = golden_entries()
+    golden = [word for word, *_ in entries]
+    return {
+        "golden": golden,
+        "long": long_words(entries, rng),
+        "zipf": zipf_stream(golden, rng),
+    }
+
+
+def percentile(sorted_values: list[int], fraction: float) -> int:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def run_case(function: Callable, words: list[str], warm: bool, repeat: int) -> dict:
+    """Measure one function over a corpus, with the cache cold or warm"""
+    if warm:
+        pylabeador.enable_cache(None)
+        for word in words:
+            function(word)
+    else:
+        pylabeador.disable_cache()
+
+    def run():
+        for word in words:
+            function(word)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    latencies = []
+    clock = time.perf_counter_ns
+    for word in words:
+        start = clock()
+        function(word)
+        latencies.append(clock() - start)
+    latencies.sort()
+    pylabeador.disable_cache()
+    return {
+        "words": len(words),
+        "words_per_s": round(len(words) / best, 1),
+        "p50_us": round(percentile(latencies, 0.50) / 1000, 3),
+        "p99_us": round(percentile(latencies, 0.99) / 1000, 3),
+    }
+
+
+def run_suite(engines: list[str], repeat: int) -> dict:
+    corpora = build_corpora()
+    results = {}
+    for engine in engines:
+        pylabeador.set_engine(engine)
+        for corpus, words in corpora.items():
+            for name, function in FUNCTIONS.items():
+                for warm in (False, True):
+                    key = f"{corpus}/{name}/{engine}/{'warm' if warm else 'cold'}"
+                    results[key] = res = run_case(function, words, warm, repeat)
+                    print(
+                        f"{key:<45} {res['words_per_s']:>12,.0f} words/s"
+                        f"  p50 {res['p50_us']:>8.2f} µs  p99 {res['p99_us']:>8.2f} µs",
+                        file=sys.stderr,
+                    )
+    pylabeador.set_engine(pylabeador.api.DEFAULT_ENGINE)
+    return {
+        "meta": {
+            "pylabeador": pylabeador.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, max_slowdown: float, max_p99_increase: float) -> list[str]:
+    """
+    Compare the results of a run with a baseline.
+
+    Returns:
+        A description of each case that regressed beyond the thresholds. Cases that
+        are missing from either run are ignored.
+    """
+    regressions = []
+    for key, res in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        slowdown = 1 - res["words_per_s"] / base["words_per_s"]
+        p99_increase = res["p99_us"] / base["p99_us"] - 1 if base["p99_us"] else 0
+        status = "ok"
+        if slowdown > max_slowdown:
+            status = "SLOWER"
+            regressions.append(f"{key}: {slowdown:.0%} fewer words/s than the baseline")
+        if p99_increase > max_p99_increase:
+            status = "SLOWER"
+            regressions.append(f"{key}: p99 latency {p99_increase:.0%} higher than the baseline")
+        print(
+            f"{key:<45} {base['words_per_s']:>12,.0f} -> {res['words_per_s']:>12,.0f} words/s"
+            f" ({-slowdown:+.0%})  p99 {p99_increase:+.0%}  {status}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", "-o", type=Path, help="Write the results to this JSON file")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        help=f"Compare the results with this JSON file (default: {DEFAULT_BASELINE.name})",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=0.25,
+        metavar="F",
+        help="Largest fraction of throughput that a case may lose (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-p99-increase",
+        type=float,
+        default=1.0,
+        metavar="F",
+        help="Largest fraction by which the p99 latency of a case may grow (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--engine",
+        dest="engines",
+        action="append",
+        choices=sorted(pylabeador.api.ENGINES),
+        help="Engine to measure, can be repeated (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per case")
+    args = parser.parse_args()
+
+    current = run_suite(args.engines or list(pylabeador.api.ENGINES), args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(current, baseline, args.max_slowdown, args.max_p99_increase)
+        if regressions:
+            print("\nRegressions:", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,175 @@
 from .__version__ import __version__
-from .api import syllabify, syllabify_with_details
-from .errors import HyphenatorError
-from .models import SyllabifiedWord, Syllable, WordProgress
+
+# Not typing.TYPE_CHECKING, as importing typing takes longer than the rest of the
+# package. Type checkers take any TYPE_CHECKING as true.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .api import (
+        CacheInfo,
+        cache_clear,
+        cache_info,
+        disable_cache,
+        disable_metrics,
+        enable_cache,
+        enable_metrics,
+        get_engine,
+        get_lexicon,
+        hyphenate,
+        hyphenate_many,
+        render_metrics,
+        set_engine,
+        syllabify,
+        syllabify_many,
+        syllabify_with_details,
+        syllabify_with_details_many,
+        use_cache_file,
+        use_lexicon,
+        use_prefixes,
+        use_word_table,
+    )
+    from .cachefile import CacheFile, build_cache_file
+    from .errors import ErrorKind, HyphenatorError, InvalidWord
+    from .formats import read_results, write_results
+    from .lexicon import build_lexicon_file, load_lexicon
+    from .models import SyllabifiedWord, Syllable, WordProgress
+    from .offsets import PackedBreaks, SyllableBreaks, pack_offsets, syllabify_offsets
+    from .parallel import syllabify_offsets_parallel, syllabify_with_details_parallel
+    from .prefixes import PrefixIndex
+    from .softhyphen import SOFT_HYPHEN, soft_hyphenate_html, soft_hyphenate_text, soft_hyphenate_word
+    from .text import hyphenate_text, syllabify_text
+    from .wordtable import WordTable, build_word_table, load_word_table
+
+# The public names are imported from their modules on first access (PEP 562), so that
+# importing the package, or running the command, only loads what is used.
+_EXPORTS = {
+    "CacheInfo": "api",
+    "cache_clear": "api",
+    "cache_info": "api",
+    "disable_cache": "api",
+    "disable_metrics": "api",
+    "enable_cache": "api",
+    "enable_metrics": "api",
+    "get_engine": "api",
+    "get_lexicon": "api",
+    "hyphenate": "api",
+    "hyphenate_many": "api",
+    "render_metrics": "api",
+    "set_engine": "api",
+    "syllabify": "api",
+    "syllabify_many": "api",
+    "syllabify_with_details": "api",
+    "syllabify_with_details_many": "api",
+    "use_cache_file": "api",
+    "use_lexicon": "api",
+    "use_prefixes": "api",
+    "use_word_table": "api",
+    "CacheFile": "cachefile",
+    "build_cache_file": "cachefile",
+    "ErrorKind": "errors",
+    "HyphenatorError": "errors",
+    "InvalidWord": "errors",
+    "read_results": "formats",
+    "write_results": "formats",
+    "build_lexicon_file": "lexicon",
+    "load_lexicon": "lexicon",
+    "SyllabifiedWord": "models",
+    "Syllable": "models",
+    "WordProgress": "models",
+    "PackedBreaks": "offsets",
+    "SyllableBreaks": "offsets",
+    "pack_offsets": "offsets",
+    "syllabify_offsets": "offsets",
+    "syllabify_offsets_parallel": "parallel",
+    "syllabify_with_details_parallel": "parallel",
+    "PrefixIndex": "prefixes",
+    "SOFT_HYPHEN": "softhyphen",
+    "soft_hyphenate_html": "softhyphen",
+    "soft_hyphenate_text": "softhyphen",
+    "soft_hyphenate_word": "softhyphen",
+    "hyphenate_text": "text",
+    "syllabify_text": "text",
+    "WordTable": "wordtable",
+    "build_word_table": "wordtable",
+    "load_word_table": "wordtable",
+}
+
+
+def _import(module_name):
+    # Not importlib.import_module, which is slower to import and does not show up in
+    # python -X importtime. Importing a submodule sets it in the package.
+    __import__(module_name, globals(), level=1)
+    return globals()[module_name]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        # Submodules are loaded on first access too, as they were all imported before
+        try:
+            return _import(name)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_import(module_name), name)
+    # Later accesses find it right away
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
 
 __all__ = [
+    "CacheFile",
+    "CacheInfo",
+    "ErrorKind",
     "HyphenatorError",
+    "InvalidWord",
+    "PackedBreaks",
+    "PrefixIndex",
+    "SOFT_HYPHEN",
+    "SyllableBreaks",
     "Syllable",
     "WordProgress",
+    "WordTable",
     "SyllabifiedWord",
+    "build_cache_file",
+    "build_lexicon_file",
+    "build_word_table",
+    "cache_clear",
+    "cache_info",
+    "disable_cache",
+    "disable_metrics",
+    "enable_cache",
+    "enable_metrics",
+    "get_engine",
+    "get_lexicon",
+    "hyphenate",
+    "hyphenate_many",
+    "hyphenate_text",
+    "load_lexicon",
+    "load_word_table",
+    "pack_offsets",
+    "read_results",
+    "render_metrics",
+    "set_engine",
+    "soft_hyphenate_html",
+    "soft_hyphenate_text",
+    "soft_hyphenate_word",
     "syllabify",
+    "syllabify_many",
+    "syllabify_offsets",
+    "syllabify_offsets_parallel",
+    "syllabify_text",
     "syllabify_with_details",
+    "syllabify_with_details_many",
+    "syllabify_with_details_parallel",
+    "use_cache_file",
+    "use_lexicon",
+    "use_prefixes",
+    "use_word_table",
+    "write_results",
     "__version__",
 ]
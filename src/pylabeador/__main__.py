@@ -16,35 +16,107 @@
 # You should have received a copy of the GNU General Public License
 # along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
 # -------------------------------------------------------------------------------------
+"""
+Entry point of the pylabeador command.
 
-import argparse
+Most runs of the command syllabify a few words given in the command line, and take
+much longer to start up than to do the work. So this module imports nothing from
+the library until it knows what it has to do. When ``$PYLABEADOR_DAEMON`` is set,
+the words are forwarded to a running daemon, if any, without loading the library at
+all. Otherwise they are syllabified by ``cli.syllabify_plain``, which loads the
+engine but neither the daemon client nor the optional parts of the library. The
+rest of the command line interface is in ``pylabeador.cli``.
+"""
+
+import os
 import sys
 
-from . import HyphenatorError, __version__, syllabify_with_details
+# Other commands, run by pylabeador.cli
+COMMAND_NAMES = frozenset(("build-cache", "build-lexicon", "build-word-table", "serve", "daemon"))
+
+# Set this variable to a non-empty value so that the command forwards its words to
+# a running daemon. It is not the default because the daemon may have been started
+# with other options, which would change the results. Defined here, and not in
+# pylabeador.daemonclient, so that the client is only imported when it is set.
+DAEMON_ENV = "PYLABEADOR_DAEMON"
+
+
+def plain_words(argv):
+    """
+    Return the words and the --keep-going flag of a command line, if that is all it has.
+
+    Only these command lines are forwarded to a daemon. Any other option could change
+    the results or the output, or make the daemon not worth it.
+    """
+    if len(argv) > 1 and argv[1] in COMMAND_NAMES:
+        return None
+    words = []
+    keep_going = False
+    for arg in argv[1:]:
+        if arg in ("-k", "--keep-going"):
+            keep_going = True
+        elif arg.startswith("-"):
+            return None
+        else:
+            words.append(arg)
+    return (words, keep_going) if words else None
 
 
-def parse_args(argv):
-    parser = argparse.ArgumentParser(description="Syllabify Spanish words")
-    parser.add_argument("words", metavar="word", nargs=argparse.ONE_OR_MORE)
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+def forward(client, words, keep_going):
+    """
+    Hyphenate words in a daemon, reporting them as ``cli.syllabify_words`` does.
 
-    return parser.parse_args(argv[1:])
+    Nothing is written until the daemon has answered every word, so that the command
+    can still do the work itself if the daemon fails, times out or answers something
+    that is not the hyphenation of the word.
+
+    Returns:
+        The exit status, or None if the daemon did not answer properly.
+    """
+    results = []
+    try:
+        for word, res in zip(words, client.hyphenate_many(words), strict=False):
+            if isinstance(res, str) and res.replace("-", "") != word:
+                return None
+            results.append(res)
+            if not keep_going and not isinstance(res, str):
+                break
+    except (OSError, ValueError):
+        return None
+    except KeyboardInterrupt:
+        sys.exit(-1)
+    sys.stdout.write("".join(f"{res}\n" for res in results if isinstance(res, str)))
+    sys.stdout.flush()
+    errors = [res for res in results if not isinstance(res, str)]
+    for error in errors:
+        print(f"Error: {str(error)}", file=sys.stderr)
+    if errors and not keep_going:
+        sys.exit(1)
+    return 1 if errors else 0
 
 
 def main(argv=None):
     """Run this program"""
     if argv is None:
         argv = sys.argv
-    args = parse_args(argv)
-    try:
-        for word in args.words:
-            res = syllabify_with_details(word)
-            print(res.hyphenated)
-    except HyphenatorError as e:
-        print(f"Error: {str(e)}", file=sys.stderr)
-        sys.exit(1)
-    except KeyboardInterrupt:
-        sys.exit(-1)
+    plain = plain_words(argv)
+    if plain is not None:
+        words, keep_going = plain
+        if os.environ.get(DAEMON_ENV):
+            from .daemonclient import connect_daemon
+
+            client = connect_daemon()
+            if client is not None:
+                with client:
+                    status = forward(client, words, keep_going)
+                if status is not None:
+                    return status
+        from .cli import syllabify_plain
+
+        return syllabify_plain(words, keep_going)
+    from .cli import main as cli_main
+
+    return cli_main(argv)
 
 
 def entrypoint():
@@ -0,0 +1,349 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Asyncio API, which syllabifies off the event loop, in micro-batches.
+
+Requests from any number of coroutines go into a bounded queue. A collector task
+takes them out and merges them into batches of up to ``max_batch_size`` words,
+waiting at most ``max_delay`` seconds for more requests to arrive, and runs each
+batch with ``syllabify_with_details_many`` on an executor. When the queue is full,
+new requests wait for room in it, which pushes back on the callers instead of
+piling up work in memory. Large requests are split into chunks, and the event loop
+gets control back between chunks.
+
+The default executor of the event loop is used unless another one is given. Threads
+keep the event loop responsive, but share the GIL with it, so a ProcessPoolExecutor
+is the way to use more than one CPU. Worker processes only see the lexicon, the
+prefix mode, the word table and the cache file of the parent process if the pool
+is created with ``process_executor``, or forked after they were set.
+
+Examples:
+    >>> import asyncio
+    >>> from pylabeador import aio
+    >>> asyncio.run(aio.hyphenate_many(["casa", "perro"]))
+    ['ca-sa', 'pe-rro']
+"""
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+import weakref
+
+from .api import get_lookups, set_lookups
+from .api import syllabify_with_details_many as _syllabify_with_details_many
+from .errors import InvalidWord
+from .models import SyllabifiedWord
+from .text import hyphenate_text as _hyphenate_text
+
+DEFAULT_MAX_BATCH_SIZE = 512
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_MAX_PENDING = 256
+DEFAULT_CONCURRENCY = 2
+# Number of words per chunk of a large request, and characters per chunk of a text
+DEFAULT_CHUNK_SIZE = 512
+DEFAULT_TEXT_CHUNK_SIZE = 16 * 1024
+
+
+def process_executor(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    Create a pool of worker processes that look words up as the calling process does.
+
+    The lexicon, the prefix index, the word table and the cache file in use are sent
+    to each worker when it starts. Changes made later are not seen by the workers.
+
+    Args:
+        max_workers: Number of worker processes, the number of CPUs by default.
+    """
+    return ProcessPoolExecutor(max_workers, initializer=set_lookups, initargs=(get_lookups(),))
+
+
+def _syllabify_batch(words: list[str]) -> list[SyllabifiedWord | InvalidWord]:
+    """Syllabify a batch of words, in the executor"""
+    return list(_syllabify_with_details_many(words, errors="return"))
+
+
+def _hyphenate_chunk(text: str, separator: str) -> str:
+    """Hyphenate a chunk of text, in the executor"""
+    return "".join(_hyphenate_text(text, separator))
+
+
+def _text_chunks(text: str, chunk_size: int) -> Iterable[str]:
+    """Split a text into chunks that end at whitespace, so that no word is cut"""
+    start = 0
+    size = len(text)
+    while start < size:
+        end = start + chunk_size
+        if end < size:
+            cut = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+            end = cut + 1 if cut > start else end
+            # Without whitespace in the chunk, go on to the next one
+            while end < size and not text[end - 1].isspace() and text[end].isalpha():
+                end += 1
+        yield text[start:end]
+        start = end
+
+
+class Batcher:
+    """
+    Collect syllabification requests from coroutines and run them in batches.
+
+    Args:
+        executor: Where batches are run, the default executor of the loop if None.
+        max_batch_size: Maximum number of words in a batch.
+        max_delay: Longest time, in seconds, that a batch waits for more requests
+            once it has the first one.
+        max_pending: Maximum number of requests waiting in the queue.
+        concurrency: Maximum number of batches running at the same time.
+        chunk_size: Number of words in each request that a large one is split into.
+
+    The batcher belongs to the event loop in which it is first used. It can be used
+    as an async context manager, which closes it on exit.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if max_batch_size < 1 or max_pending < 1 or concurrency < 1 or chunk_size < 1:
+            raise ValueError("Batch sizes, queue size and concurrency must be at least 1")
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self._queue: asyncio.Queue | None = None
+        self._collector: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self._slots: asyncio.Semaphore | None = None
+        self.batches = 0
+
+    async def __aenter__(self) -> "Batcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _start(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._collector = asyncio.get_running_loop().create_task(self._collect())
+            self._collector.add_done_callback(self._collector_done)
+        return self._queue
+
+    def _collector_done(self, collector: asyncio.Task) -> None:
+        # Drop everything bound to the event loop, which may be closing, so that the
+        # batcher does not keep it alive
+        if collector is not self._collector:
+            return
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+        self._queue = self._collector = self._slots = None
+
+    async def _collect(self) -> None:
+        queue = self._queue
+        slots = self._slots
+        loop = asyncio.get_running_loop()
+        assert queue is not None and slots is not None  # noqa: S101 # Set by _start
+        # A request that did not fit in the previous batch
+        carried = None
+        # The requests taken off the queue and not yet handed to a batch task
+        batch: list[tuple[list[str], asyncio.Future]] = []
+        try:
+            while True:
+                await slots.acquire()
+                batch = [carried or await queue.get()]
+                carried = None
+                size = len(batch[0][0])
+                deadline = loop.time() + self.max_delay
+                while size < self.max_batch_size:
+                    try:
+                        item = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(queue.get(), remaining)
+                        except asyncio.TimeoutError:
+                            break
+                    if size + len(item[0]) > self.max_batch_size:
+                        carried = item
+                        break
+                    batch.append(item)
+                    size += len(item[0])
+                task = loop.create_task(self._run_batch(batch, slots))
+                batch = []
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+        finally:
+            # Nobody else would ever answer these
+            if carried is not None:
+                batch.append(carried)
+            for _, future in batch:
+                future.cancel()
+
+    async def _run_batch(self, batch: list[tuple[list[str], asyncio.Future]], slots: asyncio.Semaphore) -> None:
+        try:
+            words = [word for chunk, _ in batch for word in chunk]
+            self.batches += 1
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(self.executor, _syllabify_batch, words)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            pos = 0
+            for chunk, future in batch:
+                if not future.done():
+                    future.set_result(results[pos : pos + len(chunk)])
+                pos += len(chunk)
+        finally:
+            slots.release()
+
+    async def _submit(self, words: list[str]) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        await self._start().put((words, future))
+        return future
+
+    async def syllabify_with_details_many(
+        self, words: Iterable[str], errors: str = "raise"
+    ) -> list[SyllabifiedWord | InvalidWord]:
+        """
+        Syllabify many words, see ``api.syllabify_with_details_many``.
+
+        Raises:
+            HyphenatorError: When a word is not a valid Spanish word and errors is
+                "raise".
+        """
+        if errors not in ("raise", "return"):
+            raise ValueError(f"errors must be 'raise' or 'return', not {errors!r}")
+        words = list(words)
+        futures = []
+        for start in range(0, len(words), self.chunk_size):
+            futures.append(await self._submit(words[start : start + self.chunk_size]))
+            # Let other coroutines run between the chunks of a large request
+            await asyncio.sleep(0)
+        results = [res for chunk in await asyncio.gather(*futures) for res in chunk]
+        if errors == "raise":
+            for res in results:
+                if isinstance(res, InvalidWord):
+                    raise res.error()
+        return results
+
+    async def syllabify_with_details(self, word: str) -> SyllabifiedWord:
+        """Syllabify a word, in a batch with the concurrent requests"""
+        (res,) = await (await self._submit([word]))
+        if isinstance(res, InvalidWord):
+            raise res.error()
+        return res
+
+    async def syllabify_many(self, words: Iterable[str], errors: str = "raise") -> list[list[str] | InvalidWord]:
+        """Syllabify many words, returning the syllables of each of them"""
+        return [
+            res if isinstance(res, InvalidWord) else [s.value for s in res.syllables]
+            for res in await self.syllabify_with_details_many(words, errors)
+        ]
+
+    async def hyphenate_many(self, words: Iterable[str], errors: str = "raise") -> list[str | InvalidWord]:
+        """Hyphenate many words"""
+        return [
+            res if isinstance(res, InvalidWord) else res.hyphenated
+            for res in await self.syllabify_with_details_many(words, errors)
+        ]
+
+    async def hyphenate_text(self, text: str, separator: str = "-", chunk_size: int = DEFAULT_TEXT_CHUNK_SIZE) -> str:
+        """
+        Hyphenate the words in a text, see ``text.hyphenate_text``.
+
+        The text is split into chunks at whitespace, which are hyphenated in the
+        executor one after the other, giving control back to the loop between them.
+        Texts do not go through the batch queue.
+
+        Raises:
+            ValueError: When chunk_size is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1")
+        loop = asyncio.get_running_loop()
+        pieces = []
+        for chunk in _text_chunks(text, chunk_size):
+            pieces.append(await loop.run_in_executor(self.executor, _hyphenate_chunk, chunk, separator))
+        return "".join(pieces)
+
+    async def close(self) -> None:
+        """Stop collecting requests, waiting for the batches that are running"""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        if self._collector is not None:
+            self._collector_done(self._collector)
+
+
+_default_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Batcher]" = weakref.WeakKeyDictionary()
+
+
+def get_batcher() -> Batcher:
+    """Return the batcher of the running event loop used by the module functions"""
+    loop = asyncio.get_running_loop()
+    batcher = _default_batchers.get(loop)
+    if batcher is None:
+        batcher = _default_batchers[loop] = Batcher()
+    return batcher
+
+
+async def syllabify_with_details(word: str) -> SyllabifiedWord:
+    """Syllabify a word off the event loop, see ``Batcher``"""
+    return await get_batcher().syllabify_with_details(word)
+
+
+async def syllabify_with_details_many(
+    words: Iterable[str], errors: str = "raise"
+) -> list[SyllabifiedWord | InvalidWord]:
+    """Syllabify many words off the event loop, see ``Batcher``"""
+    return await get_batcher().syllabify_with_details_many(words, errors)
+
+
+async def syllabify_many(words: Iterable[str], errors: str = "raise") -> list[list[str] | InvalidWord]:
+    """Syllabify many words off the event loop, returning the syllables of each of them"""
+    return await get_batcher().syllabify_many(words, errors)
+
+
+async def hyphenate_many(words: Iterable[str], errors: str = "raise") -> list[str | InvalidWord]:
+    """Hyphenate many words off the event loop"""
+    return await get_batcher().hyphenate_many(words, errors)
+
+
+async def hyphenate_text(text: str, separator: str = "-", chunk_size: int = DEFAULT_TEXT_CHUNK_SIZE) -> str:
+    """Hyphenate the words in a text off the event loop"""
+    return await get_batcher().hyphenate_text(text, separator, chunk_size)
@@ -17,11 +17,422 @@
 # along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
 # -------------------------------------------------------------------------------------
 
+from collections import namedtuple
+from collections.abc import Callable, Container, Iterable, Iterator
+import functools
+import os
 
-from .engine import parse_word
-from .models import SyllabifiedWord
+from . import compiled, engine
+from .errors import InvalidWord
+from .models import SyllabifiedWord, Syllable
 from .util import check_word_for_spanish_chars
 
+# The optional parts of the library are only imported by the functions that turn
+# them on, so that syllabifying a word does not load them. Not typing.TYPE_CHECKING,
+# which would import typing. Type checkers take any TYPE_CHECKING as true.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .cachefile import CacheFile
+    from .metrics import MetricsRegistry
+    from .prefixes import PrefixIndex
+    from .wordtable import WordTable
+
+# The same as wordtable.COMMON_WORDS_PATH, which is not imported until a table is used
+_COMMON_WORDS_PATH = os.path.join(os.path.dirname(__file__), "commonwords.py")
+
+
+def _parse_with_rules(word: str) -> SyllabifiedWord:
+    check_word_for_spanish_chars(word)
+    return engine.parse_word(word).to_result()
+
+
+# Available syllabification engines, which validate the word and syllabify it. Both
+# produce identical results:
+# - rules: the reference implementation, walking a WordProgress cursor through the word
+# - compiled: the same rules applied in one pass over precomputed character classes,
+#   which also validates the word
+ENGINES: dict[str, Callable[[str], SyllabifiedWord]] = {
+    "rules": _parse_with_rules,
+    "compiled": compiled.parse_valid_word,
+}
+DEFAULT_ENGINE = "rules"
+
+_engine_name = DEFAULT_ENGINE
+_parse = ENGINES[DEFAULT_ENGINE]
+
+
+def set_engine(name: str) -> None:
+    """
+    Select the engine used by all the syllabification functions.
+
+    Args:
+        name: One of the names in ENGINES.
+
+    Examples:
+        >>> import pylabeador
+        >>> pylabeador.set_engine("compiled")
+        >>> pylabeador.hyphenate("encuentro")
+        'en-cuen-tro'
+        >>> pylabeador.set_engine("rules")
+    """
+    global _engine_name, _parse
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine {name!r}, choose one of: {', '.join(ENGINES)}")
+    _engine_name = name
+    _parse = ENGINES[name]
+    cache_clear()
+
+
+def get_engine() -> str:
+    """Return the name of the engine currently in use"""
+    return _engine_name
+
+
+_cache_file: "CacheFile | None" = None
+
+
+def use_cache_file(path: str | os.PathLike | None) -> "CacheFile | None":
+    """
+    Look words up in a cache file before syllabifying them.
+
+    The file, built with ``build_cache_file`` or ``pylabeador build-cache``, is
+    mapped in memory read-only, so processes that use the same file share it. The
+    file is checked after the lexicon, the prefixes and the word table, by every
+    function that syllabifies words, and words that are not in it are syllabified as
+    usual.
+
+    Args:
+        path: The cache file to use, or None to stop using one.
+
+    Returns:
+        The opened cache file, if any.
+    """
+    global _cache_file
+    from .cachefile import CacheFile
+
+    new_cache_file = CacheFile(path) if path is not None else None
+    if _cache_file is not None:
+        _cache_file.close()
+    _cache_file = new_cache_file
+    cache_clear()
+    return _cache_file
+
+
+_word_table: "WordTable | None" = None
+
+
+def use_word_table(path: str | os.PathLike | None = _COMMON_WORDS_PATH) -> "WordTable | None":
+    """
+    Look the most frequent words up in a table of precompiled results.
+
+    Words in the table are not syllabified at all, and the result of each of them is
+    built only once. The table is checked after the lexicon and the prefixes, by every
+    function that syllabifies words, and words that are not in it are syllabified as
+    usual. See ``wordtable`` to build tables out of your own word lists.
+
+    Args:
+        path: The module of the table, the common words that come with the package
+            by default, or None to stop using one.
+
+    Returns:
+        The loaded table, if any.
+
+    Examples:
+        >>> import pylabeador
+        >>> len(pylabeador.use_word_table())
+        8620
+        >>> pylabeador.hyphenate("después")
+        'des-pués'
+        >>> _ = pylabeador.use_word_table(None)
+    """
+    global _word_table
+    from .wordtable import load_word_table
+
+    _word_table = load_word_table(path) if path is not None else None
+    cache_clear()
+    return _word_table
+
+
+_lexicon: "CacheFile | None" = None
+
+
+def use_lexicon(path: str | os.PathLike | None) -> "CacheFile | None":
+    """
+    Take the syllabification of the words in a lexicon instead of applying the rules.
+
+    The lexicon is checked before anything else by every function that syllabifies
+    words, from single words to texts, soft hyphens and worker processes. See
+    ``lexicon`` for its format.
+
+    Args:
+        path: The lexicon, compiled with ``build_lexicon_file`` or written as text,
+            or None to stop using one.
+
+    Returns:
+        The opened lexicon, if any.
+
+    Examples:
+        >>> import pylabeador
+        >>> _ = pylabeador.use_lexicon("overrides.txt")
+        >>> pylabeador.hyphenate("transatlántico")
+        'trans-a-tlán-ti-co'
+    """
+    global _lexicon
+    from .lexicon import load_lexicon
+
+    new_lexicon = load_lexicon(path) if path is not None else None
+    if _lexicon is not None:
+        _lexicon.close()
+    _lexicon = new_lexicon
+    cache_clear()
+    return _lexicon
+
+
+def get_lexicon() -> "CacheFile | None":
+    """Return the lexicon currently in use, if any"""
+    return _lexicon
+
+
+_prefixes: "PrefixIndex | None" = None
+
+
+def use_prefixes(
+    stems: str | os.PathLike | Container[str] | None,
+    prefixes: Iterable[str] | None = None,
+    min_stem: int | None = None,
+) -> "PrefixIndex | None":
+    """
+    Keep prefixes such as trans-, sub- or des- whole when the rest of the word is a stem.
+
+    Prefixed words are checked after the lexicon and before the word table, the cache
+    file and the engine, by every function that syllabifies words. See ``prefixes``
+    for the details.
+
+    Args:
+        stems: The words that can follow a prefix: a cache file or a word list with
+            one word per line, a container of lowercase words, or None to stop
+            splitting prefixes.
+        prefixes: The prefixes, lowercase, ``prefixes.DEFAULT_PREFIXES`` by default.
+        min_stem: Shortest stem, in letters, that is split from a prefix,
+            ``prefixes.DEFAULT_MIN_STEM`` by default.
+
+    Returns:
+        The prefix index in use, if any.
+
+    Examples:
+        >>> import pylabeador
+        >>> _ = pylabeador.use_prefixes({"atlántico", "rayar"})
+        >>> pylabeador.hyphenate("transatlántico"), pylabeador.hyphenate("subrayar")
+        ('trans-a-tlán-ti-co', 'sub-ra-yar')
+        >>> _ = pylabeador.use_prefixes(None)
+    """
+    global _prefixes
+    from .cachefile import CacheFile
+    from .prefixes import DEFAULT_MIN_STEM, DEFAULT_PREFIXES, PrefixIndex, load_stems
+
+    if isinstance(stems, str | os.PathLike):
+        stems = load_stems(stems)
+    if prefixes is None:
+        prefixes = DEFAULT_PREFIXES
+    if min_stem is None:
+        min_stem = DEFAULT_MIN_STEM
+    new_prefixes = PrefixIndex(stems, prefixes, min_stem) if stems is not None else None
+    if _prefixes is not None and isinstance(_prefixes.stems, CacheFile):
+        _prefixes.stems.close()
+    _prefixes = new_prefixes
+    cache_clear()
+    return _prefixes
+
+
+def syllabify_override(word: str) -> SyllabifiedWord | None:
+    """
+    Return the syllabification of a word given by the lexicon or the prefix mode, if any.
+
+    Words without such a syllabification are left to the cache file and the engine.
+    """
+    if _lexicon is not None:
+        res = _lexicon.get(word)
+        if res is not None:
+            return res
+    if _prefixes is not None:
+        if _parse is compiled.parse_valid_word:
+            scanned = _prefixes.scan(word)
+            return None if scanned is None else compiled.build_result(word, *scanned)
+        return _prefixes.parse(word, _parse)
+    return None
+
+
+def lookup_sources() -> tuple:
+    """
+    Return the lexicon, prefix index, word table and cache file in use, in the order they are checked.
+
+    All of them have a ``scan`` method, see ``lookup_scan``.
+    """
+    return tuple(source for source in (_lexicon, _prefixes, _word_table, _cache_file) if source is not None)
+
+
+def lookup_scan(word: str, sources: tuple) -> tuple[list[int], int, int, int | None] | None:
+    """
+    Look a word up in the sources returned by ``lookup_sources``.
+
+    Returns:
+        The same tuple as ``compiled.scan`` from the first source that has the word,
+        or None if none of them has it.
+    """
+    for source in sources:
+        scanned = source.scan(word)
+        if scanned is not None:
+            return scanned
+    return None
+
+
+def scan_with_lookups(word: str, sources: tuple) -> tuple[list[int], int, int, int | None] | InvalidWord:
+    """
+    Same as ``compiled.scan_checked``, but look the word up in the sources first.
+
+    This is what every function that does not build results one word at a time uses,
+    so that they all agree with ``syllabify_with_details``.
+    """
+    scanned = lookup_scan(word, sources) if sources else None
+    return compiled.scan_checked(word) if scanned is None else scanned
+
+
+def get_lookups() -> tuple:
+    """Return the lexicon, prefix index, word table and cache file in use, None for the unused ones"""
+    return _lexicon, _prefixes, _word_table, _cache_file
+
+
+def set_lookups(lookups: tuple) -> None:
+    """
+    Use the lookups returned by ``get_lookups``, usually in another process.
+
+    They can be pickled, so this is meant as the initializer of a pool of worker
+    processes, with the lookups of the parent as its argument.
+    """
+    global _lexicon, _prefixes, _word_table, _cache_file
+    _lexicon, _prefixes, _word_table, _cache_file = lookups
+    cache_clear()
+
+
+def _syllabify_uncached(word: str) -> SyllabifiedWord:
+    if _lexicon is not None or _prefixes is not None:
+        res = syllabify_override(word)
+        if res is not None:
+            return res
+    if _word_table is not None:
+        res = _word_table.get(word)
+        if res is not None:
+            return res
+    if _cache_file is not None:
+        res = _cache_file.get(word)
+        if res is not None:
+            return res
+    return _parse(word)
+
+
+_syllabify: Callable[[str], SyllabifiedWord] = _syllabify_uncached
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+# Statistics of the result cache, see cache_info. A plain named tuple, as that of
+# functools.lru_cache, so that typing is not imported.
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def enable_cache(maxsize: int | None = DEFAULT_CACHE_SIZE) -> None:
+    """
+    Keep the results of the most recently syllabified words in memory.
+
+    Results are immutable, so the same object is returned every time a cached word
+    is requested. Words that fail validation are never cached. Enabling the cache
+    again discards its current contents.
+
+    Args:
+        maxsize: Maximum number of words to keep. The least recently used word is
+            evicted when it is exceeded. None means no limit.
+    """
+    global _syllabify
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError("The cache size must be a positive number or None")
+    _syllabify = functools.lru_cache(maxsize=maxsize)(_syllabify_uncached)
+
+
+def disable_cache() -> None:
+    """Stop caching results and discard the cached ones"""
+    global _syllabify
+    _syllabify = _syllabify_uncached
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return the statistics of the result cache.
+
+    When the cache is disabled, all the values are zero.
+    """
+    if _syllabify is _syllabify_uncached:
+        return CacheInfo(0, 0, 0, 0)
+    return CacheInfo(*_syllabify.cache_info())  # type: ignore[attr-defined]
+
+
+def cache_clear() -> None:
+    """Discard the cached results and reset the statistics"""
+    if _syllabify is not _syllabify_uncached:
+        _syllabify.cache_clear()  # type: ignore[attr-defined]
+
+
+_metrics: "MetricsRegistry | None" = None
+
+
+def enable_metrics() -> "MetricsRegistry":
+    """
+    Start counting the words syllabified, the invalid ones and the latency of the calls.
+
+    Single-word and batch calls are counted. Enabling the metrics again starts
+    from zero.
+
+    Returns:
+        The registry in which the metrics are collected.
+    """
+    global _metrics
+    from .metrics import MetricsRegistry
+
+    _metrics = MetricsRegistry()
+    return _metrics
+
+
+def disable_metrics() -> None:
+    """Stop collecting metrics and discard the collected ones"""
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> "MetricsRegistry | None":
+    """Return the registry of metrics, if they are enabled"""
+    return _metrics
+
+
+def render_metrics() -> str:
+    """
+    Render the metrics, and the statistics of the result cache, for Prometheus.
+
+    Returns:
+        The metrics in the Prometheus text exposition format, empty if they are not
+        enabled.
+
+    Examples:
+        >>> import pylabeador
+        >>> _ = pylabeador.enable_metrics()
+        >>> pylabeador.hyphenate("casa")
+        'ca-sa'
+        >>> [line for line in pylabeador.render_metrics().splitlines() if line.startswith("pylabeador_words")]
+        ['pylabeador_words_total{call="single"} 1', 'pylabeador_words_total{call="batch"} 0']
+        >>> pylabeador.disable_metrics()
+    """
+    if _metrics is None:
+        return ""
+    return _metrics.render_prometheus(None if _syllabify is _syllabify_uncached else cache_info())
+
 
 def syllabify_with_details(word: str) -> SyllabifiedWord:
     """
@@ -38,7 +449,7 @@ def syllabify_with_details(word: str) -> SyllabifiedWord:
         >>> from pprint import pprint
         >>> pprint(pylabeador.syllabify_with_details("encuentro"))
         SyllabifiedWord(original='encuentro',
-                syllables=[Syllable(onset='',
+                syllables=(Syllable(onset='',
                                     nucleus='e',
                                     coda='n',
                                     accented=False,
@@ -52,13 +463,14 @@ def syllabify_with_details(word: str) -> SyllabifiedWord:
                                     nucleus='o',
                                     coda='',
                                     accented=False,
-                                    stressed=False)],
+                                    stressed=False)),
                 stressed=1,
                 accented=None)
     """
 
-    check_word_for_spanish_chars(word)
-    return parse_word(word).to_result()
+    if _metrics is None:
+        return _syllabify(word)
+    return _metrics.observe(_syllabify, word)
 
 
 def syllabify(word: str) -> list[str]:
@@ -98,3 +510,95 @@ def hyphenate(word: str) -> str:
     """
 
     return syllabify_with_details(word).hyphenated
+
+
+# Maximum number of distinct words remembered by a batch call. The memory is discarded when full.
+BATCH_MEMO_SIZE = 65536
+
+
+def _batch_result(word: str, pool: dict[tuple, Syllable], sources: tuple) -> SyllabifiedWord | InvalidWord:
+    """Syllabify a word the first time it is seen in a batch, see ``syllabify_with_details_many``"""
+    scanned = scan_with_lookups(word, sources)
+    return scanned if isinstance(scanned, InvalidWord) else compiled.build_result(word, *scanned, pool)
+
+
+def syllabify_with_details_many(words: Iterable[str], errors: str = "raise") -> Iterator[SyllabifiedWord | InvalidWord]:
+    """
+    Syllabify many words, lazily yielding a SyllabifiedWord for each of them.
+
+    The results are the same as those of ``syllabify_with_details``, but the work is
+    shared across the batch: each distinct word is validated and syllabified once,
+    validation is done in the same pass over the word as the compiled engine, and
+    equal syllables are shared between results. The compiled engine is always used,
+    after looking the word up in the lexicon, the prefix index, the word table and the
+    cache file, if in use.
+
+    Args:
+        words: The words to syllabify. Any iterable, consumed as results are requested.
+        errors: What to do with words that are not valid Spanish words: "raise" a
+            HyphenatorError, or "return" an InvalidWord in their place and carry on.
+            Returning is much faster when there are many invalid words.
+
+    Raises:
+        HyphenatorError: When a word is not a valid Spanish word and errors is
+            "raise". No more results are produced after that.
+
+    Examples:
+        >>> import pylabeador
+        >>> [w.stressed for w in pylabeador.syllabify_with_details_many(["casa", "canción"])]
+        [0, 1]
+        >>> [type(w).__name__ for w in pylabeador.syllabify_with_details_many(["casa", "r2d2"], errors="return")]
+        ['SyllabifiedWord', 'InvalidWord']
+        >>> next(pylabeador.syllabify_with_details_many(["r2d2"], errors="return")).kind
+        <ErrorKind.INVALID_LETTER: 'invalid letter'>
+    """
+    if errors not in ("raise", "return"):
+        raise ValueError(f"errors must be 'raise' or 'return', not {errors!r}")
+    raise_errors = errors == "raise"
+    results: dict[str, SyllabifiedWord | InvalidWord] = {}
+    pool: dict[tuple, Syllable] = {}
+    sources = lookup_sources()
+    metrics = _metrics
+    for word in words:
+        res = results.get(word)
+        if res is None:
+            res = _batch_result(word, pool, sources)
+            if len(results) >= BATCH_MEMO_SIZE:
+                results.clear()
+                pool.clear()
+            results[word] = res
+        if metrics is not None:
+            metrics.count_batch_result(res)
+        if raise_errors and isinstance(res, InvalidWord):
+            raise res.error()
+        yield res
+
+
+def syllabify_many(words: Iterable[str], errors: str = "raise") -> Iterator[list[str] | InvalidWord]:
+    """
+    Syllabify many words, lazily yielding the syllables of each of them.
+
+    See ``syllabify_with_details_many``.
+
+    Examples:
+        >>> import pylabeador
+        >>> list(pylabeador.syllabify_many(["encuentro", "casa"]))
+        [['en', 'cuen', 'tro'], ['ca', 'sa']]
+    """
+    for res in syllabify_with_details_many(words, errors):
+        yield res if isinstance(res, InvalidWord) else [syl.value for syl in res.syllables]
+
+
+def hyphenate_many(words: Iterable[str], errors: str = "raise") -> Iterator[str | InvalidWord]:
+    """
+    Hyphenate many words, lazily yielding the hyphenated form of each of them.
+
+    See ``syllabify_with_details_many``.
+
+    Examples:
+        >>> import pylabeador
+        >>> list(pylabeador.hyphenate_many(["encuentro", "casa"]))
+        ['en-cuen-tro', 'ca-sa']
+    """
+    for res in syllabify_with_details_many(words, errors):
+        yield res if isinstance(res, InvalidWord) else res.hyphenated
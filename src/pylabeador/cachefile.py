@@ -0,0 +1,211 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Persistent syllabification cache, stored in a file that is opened with mmap.
+
+The file is read-only once built, so any number of processes can open it and share
+its pages. The layout, all integers little-endian, is:
+
+    header   magic (8 bytes), version (u32), number of entries (u32), slots (u32)
+    table    one u32 per slot with the offset of a record, 0 for empty slots
+    records  key length (u8), key (lowercase UTF-8), number of syllables (u8),
+             stressed syllable (u8), accent position (u8, 255 for none),
+             accented syllables bit mask (u32), syllable marks (u8 each)
+
+The slot of a word is the CRC-32 of its key modulo the number of slots, with linear
+probing. The syllable marks are the positions returned by ``compiled.scan``.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+import mmap
+import os
+import struct
+from zlib import crc32
+
+from . import compiled
+from .errors import InvalidWord
+from .models import SyllabifiedWord
+
+MAGIC = b"PYLABEAD"
+VERSION = 1
+HEADER = struct.Struct("<8sIII")
+SLOT = struct.Struct("<I")
+RECORD_INFO = struct.Struct("<BBBI")
+NO_ACCENT = 0xFF
+MAX_LENGTH = 0xFE
+
+
+def pack_record(key: bytes, marks: list[int], accented_mask: int, stressed: int, accent: int | None) -> bytes:
+    num_syl = len(marks) // 3
+    info = RECORD_INFO.pack(num_syl, stressed, NO_ACCENT if accent is None else accent, accented_mask)
+    return bytes((len(key),)) + key + info + bytes(marks)
+
+
+def build_cache_file(path: str | os.PathLike, words: Iterable[str]) -> int:
+    """
+    Syllabify a list of words and store the results in a cache file.
+
+    Words that are not valid Spanish words or are too long for the format are
+    skipped. Words are stored lowercase, so lookups are case insensitive.
+
+    Args:
+        path: The file to write. It is replaced atomically if it exists.
+        words: The words to store.
+
+    Returns:
+        The number of words stored.
+    """
+    records: dict[bytes, bytes] = {}
+    for word in words:
+        word = word.lower()
+        key = word.encode()
+        if key in records or len(word) > MAX_LENGTH or len(key) > MAX_LENGTH:
+            continue
+        scanned = compiled.scan_checked(word)
+        if isinstance(scanned, InvalidWord):
+            continue
+        marks, accented_mask, stressed, accent = scanned
+        if len(marks) // 3 > 32:
+            continue
+        records[key] = pack_record(key, marks, accented_mask, stressed, accent)
+    write_image(path, build_image(records))
+    return len(records)
+
+
+def build_image(records: dict[bytes, bytes]) -> bytes:
+    """Lay out the records, by key, in the format of a cache file"""
+    slots = 8
+    while slots < 2 * len(records):
+        slots *= 2
+    table = [0] * slots
+    data = bytearray()
+    offset = HEADER.size + SLOT.size * slots
+    for key, record in records.items():
+        slot = crc32(key) & (slots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = offset + len(data)
+        data += record
+
+    return HEADER.pack(MAGIC, VERSION, len(records), slots) + struct.pack(f"<{slots}I", *table) + data
+
+
+def write_image(path: str | os.PathLike, image: bytes) -> None:
+    """Write a cache file, replacing it atomically if it exists"""
+    tmp_path = f"{os.fspath(path)}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as fout:
+        fout.write(image)
+    os.replace(tmp_path, path)
+
+
+class CacheFile(Mapping[str, SyllabifiedWord]):
+    """
+    Read-only view of a cache file, mapping words to their syllabification.
+
+    Examples:
+        >>> with CacheFile("words.cache") as cache:
+        ...     cache.get("Casa")
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        with open(path, "rb") as fin:
+            self._open(path, mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, name: str = "<memory>") -> "CacheFile":
+        """Read a cache file image that is already in memory"""
+        cache = cls.__new__(cls)
+        cache._open(name, data)
+        return cache
+
+    def _open(self, path, buffer) -> None:
+        self.path = path
+        self._mm = buffer
+        try:
+            magic, version, self._count, self._slots = HEADER.unpack_from(buffer)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a pylabeador cache file")
+
+    def _find(self, key: bytes) -> int | None:
+        mm = self._mm
+        mask = self._slots - 1
+        slot = crc32(key) & mask
+        key_len = len(key)
+        while True:
+            (offset,) = SLOT.unpack_from(mm, HEADER.size + SLOT.size * slot)
+            if not offset:
+                return None
+            if mm[offset] == key_len and mm[offset + 1 : offset + 1 + key_len] == key:
+                return offset + 1 + key_len
+            slot = (slot + 1) & mask
+
+    def scan(self, word: str) -> tuple[list[int], int, int, int | None] | None:
+        """Return the same tuple as ``compiled.scan`` for a word, or None if it is not in the file"""
+        offset = self._find(word.lower().encode())
+        if offset is None:
+            return None
+        num_syl, stressed, accent, accented_mask = RECORD_INFO.unpack_from(self._mm, offset)
+        start = offset + RECORD_INFO.size
+        marks = list(self._mm[start : start + 3 * num_syl + 1])
+        return marks, accented_mask, stressed, None if accent == NO_ACCENT else accent
+
+    def get(self, word: str, default=None):  # type: ignore[override]
+        """Return the syllabification of a word, or default if it is not in the file"""
+        scanned = self.scan(word)
+        if scanned is None:
+            return default
+        return compiled.build_result(word, *scanned)
+
+    def __getitem__(self, word: str) -> SyllabifiedWord:
+        res = self.get(word)
+        if res is None:
+            raise KeyError(word)
+        return res
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self._find(word.lower().encode()) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        mm = self._mm
+        for slot in range(self._slots):
+            (offset,) = SLOT.unpack_from(mm, HEADER.size + SLOT.size * slot)
+            if offset:
+                yield mm[offset + 1 : offset + 1 + mm[offset]].decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __reduce__(self):
+        # Mapped files are mapped again where they are unpickled, in memory ones are copied
+        if isinstance(self._mm, mmap.mmap):
+            return CacheFile, (self.path,)
+        return CacheFile.from_bytes, (bytes(self._mm), self.path)
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
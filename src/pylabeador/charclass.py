@@ -0,0 +1,68 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Precomputed character classes of the Spanish letters.
+
+Every lowercase letter is mapped to a one-character class, and anything else is
+INVALID. The same table is used to validate words, by the compiled engine, through
+``str.translate``, and by the helpers of the rules engine, one letter at a time.
+"""
+
+# Character classes
+OPEN = "a"  # a e o
+OPEN_ACCENTED = "A"  # á é ó
+CLOSED = "i"  # i u ü
+CLOSED_ACCENTED = "I"  # í ú
+Y_VOWEL = "y"  # y acting as a vowel, the class of any y before its context is known
+Y_CONSONANT = "Y"  # y acting as a consonant, when followed by a vowel
+H = "h"  # h, which is silent and can sit inside a nucleus
+CONSONANT = "k"  # any other consonant
+INVALID = "?"  # anything that is not a Spanish letter
+
+VOWEL_CLASSES = frozenset((OPEN, OPEN_ACCENTED, CLOSED, CLOSED_ACCENTED, Y_VOWEL))
+RAW_VOWEL_CLASSES = frozenset((OPEN, OPEN_ACCENTED, CLOSED, CLOSED_ACCENTED))
+OPEN_CLASSES = frozenset((OPEN, OPEN_ACCENTED))
+CLOSED_CLASSES = frozenset((CLOSED, CLOSED_ACCENTED, Y_VOWEL))
+ACCENTED_CLASSES = frozenset((OPEN_ACCENTED, CLOSED_ACCENTED))
+# Consonants that can start an onset. A y acting as consonant is handled apart.
+ONSET_CLASSES = frozenset((CONSONANT, H))
+
+CLASS_OF: dict[str, str] = {
+    **dict.fromkeys("aeo", OPEN),
+    **dict.fromkeys("áéó", OPEN_ACCENTED),
+    **dict.fromkeys("iuü", CLOSED),
+    **dict.fromkeys("íú", CLOSED_ACCENTED),
+    **dict.fromkeys("bcdfgjklmnñpqrstvwxz", CONSONANT),
+    "h": H,
+    "y": Y_VOWEL,
+}
+
+VOWELS = frozenset(c for c, cls in CLASS_OF.items() if cls in RAW_VOWEL_CLASSES)
+LETTERS = frozenset(CLASS_OF)
+
+
+class _ClassTable(dict):
+    """Translation table that maps any unknown character to INVALID"""
+
+    def __missing__(self, key):
+        return INVALID
+
+
+# Table for str.translate, by code point
+CHAR_CLASSES = _ClassTable({ord(c): cls for c, cls in CLASS_OF.items()})
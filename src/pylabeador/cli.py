@@ -0,0 +1,565 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2020 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+"""
+Command line interface, run by ``pylabeador.__main__``.
+
+Syllabifying words loads the engine and ``pylabeador.api``, but none of the optional
+parts of the library: lexicons, prefixes, word tables, cache files and metrics are
+imported by the options that use them. So are the modules needed by the other
+commands, and argparse itself, which is not needed when the command line only has
+words.
+"""
+
+from collections import deque
+import sys
+
+from .__version__ import __version__
+from .api import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_ENGINE,
+    ENGINES,
+    disable_cache,
+    enable_cache,
+    set_engine,
+    syllabify_with_details,
+    use_cache_file,
+    use_lexicon,
+    use_prefixes,
+    use_word_table,
+)
+from .errors import HyphenatorError
+
+
+def add_setup_options(parser):
+    """Add the options that set up the library, see ``configure``"""
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default=DEFAULT_ENGINE,
+        help="Syllabification engine to use (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        metavar="N",
+        help="Remember the results of the last N distinct words, 0 to disable (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-file",
+        metavar="FILE",
+        help="Look words up in this file, created with build-cache, before syllabifying them",
+    )
+    parser.add_argument(
+        "--common-words",
+        action="store_true",
+        help="Look the most common words up in the table of precompiled results that comes with pylabeador",
+    )
+    parser.add_argument(
+        "--word-table",
+        metavar="FILE",
+        help="Look words up in this table of precompiled results, built with build-word-table",
+    )
+    parser.add_argument(
+        "--lexicon",
+        metavar="FILE",
+        help="Take the syllabification of the words in this lexicon, as text or built with build-lexicon, "
+        "over the one given by the rules",
+    )
+    parser.add_argument(
+        "--stems",
+        metavar="FILE",
+        help="Keep prefixes such as trans-, sub- or des- whole when the rest of the word is in this word list "
+        "or cache file",
+    )
+
+
+def parse_args(argv):
+    import argparse
+
+    from .formats import FORMATS
+
+    parser = argparse.ArgumentParser(
+        description="Syllabify Spanish words",
+        epilog="Other commands: build-cache, build-lexicon, build-word-table, serve, daemon "
+        "(run 'pylabeador COMMAND --help' for details)",
+    )
+    parser.add_argument(
+        "words",
+        metavar="word",
+        nargs=argparse.ZERO_OR_MORE,
+        help="Words to syllabify, '-' to read them from stdin, one per line",
+    )
+    parser.add_argument(
+        "--input",
+        "-i",
+        dest="inputs",
+        metavar="FILE",
+        action="append",
+        default=[],
+        help="Read words from this file, one per line ('-' for stdin). Can be repeated.",
+    )
+    parser.add_argument(
+        "--keep-going",
+        "-k",
+        action="store_true",
+        help="Report invalid words and carry on with the rest, instead of stopping at the first one",
+    )
+    add_setup_options(parser)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Syllabify in N worker processes, 0 for one per CPU (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        choices=["text", *FORMATS],
+        default="text",
+        help="Output format: hyphenated words as text, or whole results as JSON lines, TSV or binary records "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the calls, time and branches taken in each stage of the rules engine on stderr when done",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Do not forward the words to a running daemon, even if PYLABEADOR_DAEMON is set",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+
+    args = parser.parse_args(argv[1:])
+    if not args.words and not args.inputs:
+        parser.error("no words given, use '-' or --input to read them from a file")
+    if args.jobs < 0:
+        parser.error("the number of jobs cannot be negative")
+    return args
+
+
+def numbered_words_from_lines(lines):
+    """Take the first word of each line, with its line number, skipping blank lines and comments"""
+    for line_no, line in enumerate(lines, start=1):
+        parts = line.split(maxsplit=1)
+        if parts and not parts[0].startswith("#"):
+            yield line_no, parts[0]
+
+
+def words_from_lines(lines):
+    """Take the first word of each line, skipping blank lines and comments"""
+    for _, word in numbered_words_from_lines(lines):
+        yield word
+
+
+def words_from_files(names):
+    for name in names:
+        if name == "-":
+            yield from words_from_lines(sys.stdin)
+        else:
+            with open(name, encoding="utf-8") as fin:
+                yield from words_from_lines(fin)
+
+
+def located_words(words, inputs):
+    """
+    Yield the words given in the command line and the ones read from the inputs.
+
+    Each word comes with its location, file name and line number, or None for the
+    words given in the command line.
+    """
+
+    def from_file(name, lines):
+        for line_no, word in numbered_words_from_lines(lines):
+            yield f"{name}:{line_no}", word
+
+    for word in words:
+        if word == "-":
+            yield from from_file("<stdin>", sys.stdin)
+        else:
+            yield None, word
+    for name in inputs:
+        if name == "-":
+            yield from from_file("<stdin>", sys.stdin)
+        else:
+            with open(name, encoding="utf-8") as fin:
+                yield from from_file(name, fin)
+
+
+# Number of output lines written at a time
+OUTPUT_BATCH_SIZE = 8192
+
+
+def syllabify_located(words, jobs=1, details=False):
+    """
+    Syllabify located words, yielding the location and the result or the error.
+
+    The result is the hyphenated word, or the whole SyllabifiedWord with details.
+    With more than one job, the words are syllabified in a pool of worker processes.
+    """
+    if jobs == 1:
+        for location, word in words:
+            try:
+                res = syllabify_with_details(word)
+            except HyphenatorError as e:
+                yield location, e
+                continue
+            yield location, res if details else res.hyphenated
+        return
+
+    from .parallel import syllabify_offsets_parallel, syllabify_with_details_parallel
+
+    locations = deque()
+
+    def just_words():
+        for location, word in words:
+            locations.append(location)
+            yield word
+
+    if details:
+        results = syllabify_with_details_parallel(just_words(), jobs)
+    else:
+        results = (
+            (word, res if isinstance(res, HyphenatorError) else res.hyphenate(word))
+            for word, res in syllabify_offsets_parallel(just_words(), jobs)
+        )
+    for _, res in results:
+        yield locations.popleft(), res
+
+
+def _encode_record(encode, res):
+    """Encode a result as a record, or return the error if it cannot be, as for an invalid word"""
+    try:
+        return encode(res)
+    except HyphenatorError as e:
+        return e
+
+
+def syllabify_words(words, keep_going, out=None, batch_size=OUTPUT_BATCH_SIZE, jobs=1, format="text"):
+    """
+    Write the result of each word, in batches of records.
+
+    Args:
+        words: Tuples with the location of a word, or None, and the word.
+        keep_going: Report invalid words on stderr and carry on, instead of raising.
+        out: Where to write the results, stdout by default, or its binary buffer for
+            binary formats.
+        batch_size: Number of records to write at a time.
+        jobs: Number of worker processes.
+        format: "text" for one hyphenated word per line, or one of ``formats.FORMATS``.
+
+    Returns:
+        The number of invalid words.
+
+    Raises:
+        HyphenatorError: When a word is invalid and keep_going is False.
+    """
+    if format == "text":
+        out = out or sys.stdout
+        batch = []
+        encode = None
+        joiner = ""
+    else:
+        from .formats import FORMATS
+
+        fmt = FORMATS[format]
+        out = out or (sys.stdout.buffer if fmt.binary else sys.stdout)
+        batch = [fmt.header()]
+        encode = fmt.encode
+        joiner = b"" if fmt.binary else ""
+    errors = 0
+    try:
+        for location, res in syllabify_located(words, jobs, details=encode is not None):
+            if encode is not None and not isinstance(res, HyphenatorError):
+                res = _encode_record(encode, res)
+            if isinstance(res, HyphenatorError):
+                if not keep_going:
+                    raise res
+                errors += 1
+                where = f"{location}: " if location else ""
+                print(f"Error: {where}{str(res)}", file=sys.stderr)
+                continue
+            batch.append(res if encode else res + "\n")
+            if len(batch) >= batch_size:
+                out.write(joiner.join(batch))
+                batch.clear()
+    finally:
+        if batch:
+            out.write(joiner.join(batch))
+        out.flush()
+    return errors
+
+
+def build_cache(argv):
+    """Build a cache file from word lists"""
+    import argparse
+
+    from .cachefile import build_cache_file
+
+    parser = argparse.ArgumentParser(
+        prog="pylabeador build-cache",
+        description="Build a syllabification cache file from word lists. Only the first word of each line is used.",
+    )
+    parser.add_argument("output", help="The cache file to write")
+    parser.add_argument(
+        "inputs",
+        metavar="input",
+        nargs=argparse.ZERO_OR_MORE,
+        default=["-"],
+        help="Word list files, one word per line ('-' for stdin, the default)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        count = build_cache_file(args.output, words_from_files(args.inputs))
+    except OSError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Stored {count} words in {args.output}", file=sys.stderr)
+
+
+def build_lexicon(argv):
+    """Compile a lexicon written as text"""
+    import argparse
+
+    from .lexicon import build_lexicon_file
+
+    parser = argparse.ArgumentParser(
+        prog="pylabeador build-lexicon",
+        description="Compile lexicons of words with their syllables, such as 'transatlántico trans-a-tlán-ti-co', "
+        "into a file that is mapped in memory when used.",
+    )
+    parser.add_argument("output", help="The lexicon file to write")
+    parser.add_argument(
+        "inputs",
+        metavar="input",
+        nargs=argparse.ZERO_OR_MORE,
+        default=["-"],
+        help="Lexicon files, one word and its syllables per line ('-' for stdin, the default)",
+    )
+    args = parser.parse_args(argv)
+
+    def lines():
+        for name in args.inputs:
+            if name == "-":
+                yield from sys.stdin
+            else:
+                with open(name, encoding="utf-8") as fin:
+                    yield from fin
+
+    try:
+        count = build_lexicon_file(args.output, lines())
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Stored {count} words in {args.output}", file=sys.stderr)
+
+
+def build_table(argv):
+    """Build a word table from word lists"""
+    import argparse
+
+    from .wordtable import build_word_table
+
+    parser = argparse.ArgumentParser(
+        prog="pylabeador build-word-table",
+        description="Build a table of precompiled results, a Python module, from word lists with the most frequent "
+        "words first. Only the first word of each line is used.",
+    )
+    parser.add_argument("output", help="The module to write, such as common.py")
+    parser.add_argument(
+        "inputs",
+        metavar="input",
+        nargs=argparse.ZERO_OR_MORE,
+        default=["-"],
+        help="Word list files, one word per line ('-' for stdin, the default)",
+    )
+    parser.add_argument("--limit", "-n", type=int, metavar="N", help="Store only the first N words")
+    args = parser.parse_args(argv)
+    try:
+        count = build_word_table(args.output, words_from_files(args.inputs), args.limit)
+    except OSError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Stored {count} words in {args.output}", file=sys.stderr)
+
+
+def add_warm_option(parser):
+    parser.add_argument(
+        "--warm",
+        metavar="FILE",
+        action="append",
+        default=[],
+        help="Syllabify the words of this file, one per line, into the cache before serving. Can be repeated.",
+    )
+
+
+def warm_cache(names):
+    """Syllabify the words of some files, so that their results are cached"""
+    for word in words_from_files(names):
+        try:
+            syllabify_with_details(word)
+        except HyphenatorError:
+            pass
+
+
+def serve(argv):
+    """Serve syllabification over HTTP"""
+    import argparse
+
+    from .api import enable_metrics
+    from .server import DEFAULT_HOST, DEFAULT_PORT
+    from .server import serve as run_server
+
+    parser = argparse.ArgumentParser(
+        prog="pylabeador serve",
+        description="Serve syllabification over HTTP, with JSON endpoints for words, batches of words and text. "
+        "See the pylabeador.server module for the endpoints.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Address to listen on (default: %(default)s)")
+    parser.add_argument(
+        "--port", "-p", type=int, default=DEFAULT_PORT, help="Port to listen on, 0 for any (default: %(default)s)"
+    )
+    add_setup_options(parser)
+    add_warm_option(parser)
+    parser.add_argument("--quiet", "-q", action="store_true", help="Do not write the access log")
+    parser.set_defaults(profile=False)
+    args = parser.parse_args(argv)
+    configure(args)
+    enable_metrics()
+    try:
+        warm_cache(args.warm)
+        run_server(args.host, args.port, args.quiet)
+    except OSError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def daemon(argv):
+    """Serve syllabification over a Unix socket"""
+    import argparse
+    import signal
+
+    from .daemon import serve_daemon
+
+    parser = argparse.ArgumentParser(
+        prog="pylabeador daemon",
+        description="Serve syllabification over a Unix socket, in a process that stays running. While it runs, "
+        "the pylabeador command forwards the words given to it to the daemon if PYLABEADOR_DAEMON is set, instead of "
+        "starting up the library. "
+        "See the pylabeador.daemon module for the protocol.",
+    )
+    parser.add_argument("--socket", metavar="PATH", help="The socket to listen on (default: see the module)")
+    add_setup_options(parser)
+    add_warm_option(parser)
+    parser.set_defaults(profile=False)
+    args = parser.parse_args(argv)
+    configure(args)
+    # Stop as on Ctrl-C when terminated, so that the socket is removed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        warm_cache(args.warm)
+        serve_daemon(args.socket)
+    except OSError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+COMMANDS = {
+    "build-cache": build_cache,
+    "build-lexicon": build_lexicon,
+    "build-word-table": build_table,
+    "serve": serve,
+    "daemon": daemon,
+}
+
+
+def configure(args):
+    """Set up the library as the options say"""
+    set_engine(args.engine)
+    if args.cache_size > 0:
+        enable_cache(args.cache_size)
+    else:
+        disable_cache()
+    try:
+        if args.word_table:
+            use_word_table(args.word_table)
+        elif args.common_words:
+            use_word_table()
+        if args.cache_file:
+            use_cache_file(args.cache_file)
+        if args.lexicon:
+            use_lexicon(args.lexicon)
+        if args.stems:
+            use_prefixes(args.stems)
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    if args.profile:
+        from .profiling import enable_profiling
+
+        enable_profiling()
+
+
+def run(function, *args, **kwargs):
+    """Run a function that writes results, and return the exit status for the errors it reports"""
+    try:
+        errors = function(*args, **kwargs)
+    except (HyphenatorError, OSError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(-1)
+    return 1 if errors else 0
+
+
+def syllabify_plain(words, keep_going):
+    """Syllabify the words of a command line without options, as with the default ones"""
+    set_engine(DEFAULT_ENGINE)
+    enable_cache(DEFAULT_CACHE_SIZE)
+    return run(syllabify_words, [(None, word) for word in words], keep_going)
+
+
+def main(argv):
+    """Run the command, or one of the other COMMANDS"""
+    if len(argv) > 1 and argv[1] in COMMANDS:
+        return COMMANDS[argv[1]](argv[2:])
+    args = parse_args(argv)
+    configure(args)
+    reads_stdin = "-" in args.words or "-" in args.inputs
+    # Answer each word right away when someone is typing them
+    batch_size = 1 if reads_stdin and sys.stdin.isatty() else OUTPUT_BATCH_SIZE
+    try:
+        return run(
+            syllabify_words,
+            located_words(args.words, args.inputs),
+            args.keep_going,
+            batch_size=batch_size,
+            jobs=args.jobs or None,
+            format=args.format,
+        )
+    finally:
+        if args.profile:
+            from .profiling import disable_profiling
+
+            print(disable_profiling().report(), file=sys.stderr)
@@ -0,0 +1,8627 @@
+# Generated by pylabeador build-word-table, do not edit.
+"""Precompiled results of 8620 words, see pylabeador.wordtable"""
+
+FORMAT = 1
+
+WORDS = {
+    "y": "00001",
+    "de": "00012",
+    "que": "00023",
+    "no": "00012",
+    "a": "00001",
+    "la": "00012",
+    "el": "00001",
+    "es": "00001",
+    "en": "00001",
+    "lo": "00012",
+    "un": "00001",
+    "por": "00012",
+    "qué": "03123",
+    "me": "00012",
+    "una": "00001123",
+    "te": "00012",
+    "se": "00012",
+    "los": "00012",
+    "con": "00012",
+    "para": "00012234",
+    "mi": "00012",
+    "está": "14201234",
+    "si": "00012",
+    "sí": "02112",
+    "pero": "00012234",
+    "las": "00012",
+    "bien": "00013",
+    "yo": "00002",
+    "su": "00012",
+    "eso": "00001123",
+    "aquí": "14201134",
+    "del": "00012",
+    "al": "00001",
+    "como": "00012234",
+    "le": "00012",
+    "tu": "00012",
+    "más": "02112",
+    "todo": "00012234",
+    "ya": "00002",
+    "muy": "00013",
+    "esto": "00001234",
+    "vamos": "00012234",
+    "ha": "00012",
+    "ahora": "10001123345",
+    "esta": "00001234",
+    "hay": "00013",
+    "estoy": "10001235",
+    "algo": "00001234",
+    "tú": "02112",
+    "tengo": "00012345",
+    "así": "13201123",
+    "nada": "00012234",
+    "nos": "00012",
+    "cuando": "00013456",
+    "cómo": "02112234",
+    "él": "01101",
+    "sé": "02112",
+    "estás": "14201234",
+    "sólo": "02112234",
+    "o": "00001",
+    "quiero": "00024456",
+    "este": "00001234",
+    "tiene": "00013345",
+    "gracias": "00023346",
+    "he": "00012",
+    "puedo": "00013345",
+    "bueno": "00013345",
+    "soy": "00013",
+    "era": "00001123",
+    "ser": "00012",
+    "vez": "00012",
+    "hacer": "10012234",
+    "todos": "00012234",
+    "ella": "00001134",
+    "son": "00012",
+    "fue": "00013",
+    "eres": "00001123",
+    "usted": "10001234",
+    "tienes": "00013345",
+    "puede": "00013345",
+    "señor": "10012234",
+    "ese": "00001123",
+    "voy": "00013",
+    "quién": "04124",
+    "casa": "00012234",
+    "creo": "00023334",
+    "porque": "00012356",
+    "tan": "00012",
+    "favor": "10012234",
+    "hola": "00012234",
+    "dónde": "02112345",
+    "nunca": "00012345",
+    "sus": "00012",
+    "sabes": "00012234",
+    "dos": "00012",
+    "verdad": "10012345",
+    "quieres": "00024456",
+    "mucho": "00012245",
+    "entonces": "10001234567",
+    "estaba": "10001234456",
+    "tiempo": "00013456",
+    "mí": "02112",
+    "esa": "00001123",
+    "mejor": "10012234",
+    "hombre": "00012356",
+    "hace": "00012234",
+    "va": "00012",
+    "dios": "00013",
+    "también": "16212346",
+    "has": "00012",
+    "vida": "00012234",
+    "sin": "00012",
+    "están": "14201234",
+    "ver": "00012",
+    "sr": "00022",
+    "siempre": "00013467",
+    "oh": "00002",
+    "hasta": "00012345",
+    "ti": "00012",
+    "ahí": "13201123",
+    "siento": "00013456",
+    "puedes": "00013345",
+    "decir": "10012234",
+    "ni": "00012",
+    "sobre": "00012245",
+    "años": "00001123",
+    "tenemos": "10012234456",
+    "uno": "00001123",
+    "día": "02112223",
+    "noche": "00012245",
+    "cosas": "00012234",
+    "alguien": "00001246",
+    "antes": "00001234",
+    "mis": "00012",
+    "ir": "00001",
+    "poco": "00012234",
+    "otra": "00001134",
+    "quiere": "00024456",
+    "solo": "00012234",
+    "nadie": "00012235",
+    "nosotros": "10012234467",
+    "padre": "00012245",
+    "gente": "00012345",
+    "parece": "10012234456",
+    "dinero": "10012234456",
+    "estar": "10001234",
+    "hecho": "00012245",
+    "les": "00012",
+    "mismo": "00012345",
+    "sea": "00012223",
+    "estamos": "10001234456",
+    "mira": "00012234",
+    "pasa": "00012234",
+    "trabajo": "10023345567",
+    "dijo": "00012234",
+    "ellos": "00001134",
+    "vas": "00012",
+    "claro": "00023345",
+    "mañana": "10012234456",
+    "han": "00012",
+    "otro": "00001134",
+    "después": "16212346",
+    "desde": "00012345",
+    "mundo": "00012345",
+    "hablar": "10012245",
+    "tal": "00012",
+    "había": "14212234445",
+    "sabe": "00012234",
+    "acuerdo": "10001124567",
+    "momento": "10012234567",
+    "donde": "00012345",
+    "fuera": "00013345",
+    "hijo": "00012234",
+    "podría": "15212245556",
+    "seguro": "10012234456",
+    "mujer": "10012234",
+    "amigo": "10001123345",
+    "días": "02112223",
+    "madre": "00012245",
+    "allí": "14201134",
+    "cosa": "00012234",
+    "tus": "00012",
+    "lugar": "10012234",
+    "dice": "00012234",
+    "gusta": "00012345",
+    "será": "14212234",
+    "gran": "00023",
+    "mierda": "00013456",
+    "tenía": "14212234445",
+    "mamá": "14212234",
+    "papá": "14212234",
+    "espera": "10001234456",
+    "hoy": "00013",
+    "tener": "10012234",
+    "ven": "00012",
+    "buena": "00013345",
+    "estado": "10001234456",
+    "nuevo": "00013345",
+    "luego": "00013345",
+    "podemos": "10012234456",
+    "tres": "00023",
+    "dije": "00012234",
+    "nuestro": "00013467",
+    "sido": "00012234",
+    "menos": "00012234",
+    "debe": "00012234",
+    "tipo": "00012234",
+    "buen": "00013",
+    "conmigo": "10012345567",
+    "mal": "00012",
+    "todas": "00012234",
+    "nombre": "00012356",
+    "haciendo": "10012235678",
+    "crees": "00023334",
+    "toda": "00012234",
+    "amor": "10001123",
+    "mío": "02112223",
+    "visto": "00012345",
+    "estas": "00001234",
+    "quería": "15223345556",
+    "eh": "00002",
+    "tarde": "00012345",
+    "importa": "10001234567",
+    "parte": "00012345",
+    "aún": "12201112",
+    "nuestra": "00013467",
+    "tienen": "00013345",
+    "tanto": "00012345",
+    "cada": "00012234",
+    "hora": "00012234",
+    "veces": "00012234",
+    "necesito": "20012234456678",
+    "contigo": "10012345567",
+    "ve": "00012",
+    "haber": "10012234",
+    "buenas": "00013345",
+    "dicho": "00012245",
+    "quien": "00024",
+    "hacerlo": "10012234567",
+    "demasiado": "20012234457789",
+    "oye": "00001113",
+    "ah": "00002",
+    "haces": "00012234",
+    "hombres": "00012356",
+    "saber": "10012234",
+    "entre": "00001245",
+    "adiós": "14201124",
+    "problema": "10023356678",
+    "unos": "00001123",
+    "vaya": "00012224",
+    "hemos": "00012234",
+    "cierto": "00013456",
+    "debo": "00012234",
+    "razón": "14212234",
+    "alguna": "10001234456",
+    "esos": "00001123",
+    "pues": "00013",
+    "veo": "00012223",
+    "chica": "00023345",
+    "realmente": "20012223456789",
+    "policía": "26312234456667",
+    "hizo": "00012234",
+    "estos": "00001234",
+    "amigos": "10001123345",
+    "ustedes": "10001234456",
+    "quizá": "15223345",
+    "serio": "00012235",
+    "cabeza": "10012234456",
+    "hermano": "10012345567",
+    "digo": "00012234",
+    "van": "00012",
+    "pasado": "10012234456",
+    "salir": "10012234",
+    "cuenta": "00013456",
+    "familia": "10012234457",
+    "cariño": "10012234456",
+    "vale": "00012234",
+    "algún": "14201234",
+    "muchas": "00012245",
+    "señora": "10012234456",
+    "somos": "00012234",
+    "pueden": "00013345",
+    "noches": "00012245",
+    "muerto": "00013456",
+    "ud": "00001",
+    "todavía": "26312234456667",
+    "rápido": "02112234456",
+    "viejo": "00013345",
+    "lado": "00012234",
+    "debería": "26312234456667",
+    "ves": "00012",
+    "sabía": "14212234445",
+    "suerte": "00013456",
+    "cuidado": "10013345567",
+    "buenos": "00013345",
+    "sería": "14212234445",
+    "da": "00012",
+    "mientras": "00013467",
+    "miedo": "00013345",
+    "primera": "10023345567",
+    "contra": "00012356",
+    "puerta": "00013456",
+    "pronto": "00023456",
+    "e": "00001",
+    "casi": "00012234",
+    "nueva": "00013345",
+    "espero": "10001234456",
+    "cualquier": "10013468",
+    "esas": "00001123",
+    "agua": "00001124",
+    "os": "00001",
+    "chico": "00023345",
+    "cuánto": "03113456",
+    "niños": "00012234",
+    "venga": "00012345",
+    "camino": "10012234456",
+    "primero": "10023345567",
+    "hacia": "00012235",
+    "pensé": "15212345",
+    "dentro": "00012356",
+    "pasó": "14212234",
+    "debes": "00012234",
+    "ciudad": "10013345",
+    "historia": "10012345568",
+    "año": "00001123",
+    "viene": "00013345",
+    "deja": "00012234",
+    "durante": "10012234567",
+    "forma": "00012345",
+    "volver": "10012345",
+    "feliz": "10012234",
+    "ojos": "00001123",
+    "guerra": "00023356",
+    "caso": "00012234",
+    "chicos": "00023345",
+    "esposa": "10001234456",
+    "adelante": "20001123345678",
+    "cuál": "03113",
+    "mano": "00012234",
+    "hice": "00012234",
+    "vi": "00012",
+    "gustaría": "27312345567778",
+    "muerte": "00013456",
+    "allá": "14201134",
+    "mas": "00012",
+    "loco": "00012234",
+    "supuesto": "10012235678",
+    "toma": "00012234",
+    "minutos": "10012234456",
+    "haré": "14212234",
+    "entiendo": "10001235678",
+    "pasar": "10012234",
+    "iba": "00001123",
+    "corazón": "26312234456",
+    "semana": "10012234456",
+    "jefe": "00012234",
+    "venir": "10012234",
+    "manos": "00012234",
+    "ayuda": "10001113345",
+    "problemas": "10023356678",
+    "juntos": "00012345",
+    "supongo": "10012234567",
+    "déjame": "02112234456",
+    "importante": "2000123456789:",
+    "vete": "00012234",
+    "niño": "00012234",
+    "arriba": "10001134456",
+    "hija": "00012234",
+    "otros": "00001134",
+    "personas": "10012345567",
+    "tierra": "00013356",
+    "manera": "10012234456",
+    "hablando": "10012245678",
+    "fin": "00012",
+    "mujeres": "10012234456",
+    "cara": "00012234",
+    "grande": "00023456",
+    "ningún": "15212345",
+    "nuestros": "00013467",
+    "cinco": "00012345",
+    "llama": "00023345",
+    "habla": "00012245",
+    "bajo": "00012234",
+    "dices": "00012234",
+    "poder": "10012234",
+    "cuándo": "03113456",
+    "quizás": "15223345",
+    "escucha": "10001234467",
+    "persona": "10012345567",
+    "horas": "00012234",
+    "tío": "02112223",
+    "aunque": "00002356",
+    "único": "01101123345",
+    "dijiste": "10012234567",
+    "siquiera": "10012246678",
+    "quieren": "00024456",
+    "ninguna": "10012345567",
+    "cerca": "00012345",
+    "pequeño": "10012245567",
+    "debemos": "10012234456",
+    "dame": "00012234",
+    "sigue": "00012245",
+    "auto": "00002234",
+    "cuatro": "00013356",
+    "dejar": "10012234",
+    "muchos": "00012245",
+    "igual": "10001124",
+    "hago": "00012234",
+    "listo": "00012345",
+    "significa": "20012345567789",
+    "capitán": "26312234456",
+    "clase": "00023345",
+    "llegar": "10023345",
+    "suficiente": "2001223445789:",
+    "tomar": "10012234",
+    "vivir": "10012234",
+    "joven": "00012234",
+    "trabajar": "20023345567",
+    "haya": "00012224",
+    "abajo": "10001123345",
+    "hubiera": "10012235567",
+    "primer": "10023345",
+    "genial": "10012235",
+    "justo": "00012345",
+    "pensar": "10012345",
+    "misma": "00012345",
+    "puta": "00012234",
+    "comer": "10012234",
+    "necesita": "20012234456678",
+    "conozco": "10012234567",
+    "fui": "00013",
+    "algunos": "10001234456",
+    "entrar": "10001245",
+    "fuerte": "00013456",
+    "número": "02112234456",
+    "morir": "10012234",
+    "basta": "00012345",
+    "dar": "00012",
+    "bastante": "10012345678",
+    "amo": "00001123",
+    "atrás": "14201134",
+    "dicen": "00012234",
+    "difícil": "14212234456",
+    "éste": "01101234",
+    "pueda": "00013345",
+    "punto": "00012345",
+    "vino": "00012234",
+    "hermana": "10012345567",
+    "hijos": "00012234",
+    "unas": "00001123",
+    "escuela": "10001235567",
+    "podía": "14212234445",
+    "pueblo": "00013356",
+    "haga": "00012234",
+    "sangre": "00012356",
+    "meses": "00012234",
+    "coche": "00012245",
+    "juego": "00013345",
+    "encontrar": "20001234578",
+    "realidad": "30012223345567",
+    "cuerpo": "00013456",
+    "mayor": "10012224",
+    "última": "01101234456",
+    "eran": "00001123",
+    "queda": "00023345",
+    "paz": "00012",
+    "dime": "00012234",
+    "vuelta": "00013456",
+    "hiciste": "10012234567",
+    "tenido": "10012234456",
+    "sola": "00012234",
+    "hacen": "00012234",
+    "ido": "00001123",
+    "querida": "10023345567",
+    "iré": "13201123",
+    "culpa": "00012345",
+    "malo": "00012234",
+    "chicas": "00023345",
+    "comida": "10012234456",
+    "dólares": "02112234456",
+    "saben": "00012234",
+    "fácil": "02112234",
+    "alto": "00001234",
+    "posible": "10012234467",
+    "maldito": "10012345567",
+    "dormir": "10012345",
+    "deberías": "26312234456667",
+    "maldita": "10012345567",
+    "pregunta": "10023345678",
+    "incluso": "10001245567",
+    "fiesta": "00013456",
+    "tampoco": "10012345567",
+    "cama": "00012234",
+    "lejos": "00012234",
+    "medio": "00012235",
+    "preocupes": "20023334456678",
+    "ay": "00002",
+    "teléfono": "14212234456678",
+    "diga": "00012234",
+    "trata": "00023345",
+    "equipo": "10001134456",
+    "palabra": "10012234467",
+    "cuanto": "00013456",
+    "idiota": "10001124456",
+    "esté": "14201234",
+    "luz": "00012",
+    "tuve": "00012234",
+    "país": "13212223",
+    "segundo": "10012234567",
+    "querido": "10023345567",
+    "diablos": "00013356",
+    "hagas": "00012234",
+    "señorita": "20012234456678",
+    "oportunidad": "4000112345667889:",
+    "matar": "10012234",
+    "algunas": "10001234456",
+    "esperando": "20001234456789",
+    "necesitamos": "3001223445667889:",
+    "adónde": "13201123456",
+    "estará": "26301234456",
+    "venido": "10012234456",
+    "estabas": "10001234456",
+    "fueron": "00013345",
+    "seis": "00013",
+    "tenga": "00012345",
+    "cuarto": "00013456",
+    "cielo": "00013345",
+    "vivo": "00012234",
+    "recuerdo": "10012235678",
+    "perdón": "15212345",
+    "falta": "00012345",
+    "pequeña": "10012245567",
+    "oído": "12201112234",
+    "creer": "10023334",
+    "pienso": "00013456",
+    "ésta": "01101234",
+    "esperar": "20001234456",
+    "necesitas": "20012234456678",
+    "película": "14212234456678",
+    "además": "25301123345",
+    "marido": "10012234456",
+    "perro": "00012245",
+    "calle": "00012245",
+    "exactamente": "300011234566789:;",
+    "rey": "00013",
+    "padres": "00012245",
+    "lista": "00012345",
+    "habrá": "15212245",
+    "habitación": "39412234456679",
+    "carajo": "10012234456",
+    "pensando": "10012345678",
+    "par": "00012",
+    "fuego": "00013345",
+    "niña": "00012234",
+    "seguir": "10012245",
+    "música": "02112234456",
+    "di": "00012",
+    "habría": "15212245556",
+    "mucha": "00012245",
+    "paso": "00012234",
+    "sentido": "10012345567",
+    "diré": "14212234",
+    "podrías": "15212245556",
+    "afuera": "10001124456",
+    "digas": "00012234",
+    "mía": "02112223",
+    "murió": "15212235",
+    "dio": "00013",
+    "café": "14212234",
+    "entiendes": "10001235678",
+    "nuestras": "00013467",
+    "piensa": "00013456",
+    "ello": "00001134",
+    "lleva": "00023345",
+    "estuvo": "10001234456",
+    "último": "01101234456",
+    "diciendo": "10012235678",
+    "grandes": "00023456",
+    "sitio": "00012235",
+    "libro": "00012245",
+    "buscando": "10012345678",
+    "bebé": "14212234",
+    "cállate": "02112245567",
+    "vuelve": "00013456",
+    "jamás": "14212234",
+    "minuto": "10012234456",
+    "arma": "00001234",
+    "viaje": "00013345",
+    "única": "01101123345",
+    "muchachos": "10012245578",
+    "perdido": "10012345567",
+    "jugar": "10012234",
+    "diez": "00013",
+    "vemos": "00012234",
+    "dado": "00012234",
+    "sabemos": "10012234456",
+    "mil": "00012",
+    "demás": "14212234",
+    "gusto": "00012345",
+    "peor": "10012223",
+    "irme": "00001234",
+    "estaban": "10001234456",
+    "orden": "00001234",
+    "pasando": "10012234567",
+    "cambio": "00012346",
+    "extraño": "10001245567",
+    "pobre": "00012245",
+    "ropa": "00012234",
+    "queremos": "10023345567",
+    "oficina": "20001123345567",
+    "sino": "00012234",
+    "modo": "00012234",
+    "ocurre": "10001123356",
+    "muchacho": "10012245578",
+    "otras": "00001134",
+    "hará": "14212234",
+    "libre": "00012245",
+    "conoces": "10012234456",
+    "piensas": "00013456",
+    "presidente": "2002334556789:",
+    "especial": "20001234457",
+    "anoche": "10001123356",
+    "millones": "10012245567",
+    "acerca": "10001123456",
+    "derecho": "10012234467",
+    "negro": "00012245",
+    "acá": "13201123",
+    "caballeros": "20012234467789",
+    "semanas": "10012234456",
+    "palabras": "10012234467",
+    "buscar": "10012345",
+    "segura": "10012234456",
+    "correcto": "10012245678",
+    "frente": "00023456",
+    "hacemos": "10012234456",
+    "seas": "00012223",
+    "detrás": "15212245",
+    "puesto": "00013456",
+    "asunto": "10001123456",
+    "duro": "00012234",
+    "sucede": "10012234456",
+    "llamar": "10023345",
+    "disculpe": "10012345678",
+    "boca": "00012234",
+    "atención": "27301123457",
+    "mire": "00012234",
+    "armas": "00001234",
+    "encima": "10001234456",
+    "demonios": "10012234457",
+    "mala": "00012234",
+    "llevar": "10023345",
+    "cual": "00013",
+    "odio": "00001124",
+    "deben": "00012234",
+    "sueño": "00013345",
+    "quieras": "00024456",
+    "resto": "00012345",
+    "llamo": "00023345",
+    "perder": "10012345",
+    "llamado": "10023345567",
+    "perfecto": "10012345678",
+    "estaré": "26301234456",
+    "tranquilo": "10023467789",
+    "seguridad": "30012234456678",
+    "ayudar": "20001113345",
+    "tuvo": "00012234",
+    "largo": "00012345",
+    "pena": "00012234",
+    "probablemente": "3002334557889:;<=",
+    "ayer": "10001113",
+    "dile": "00012234",
+    "prueba": "00024456",
+    "siendo": "00013456",
+    "bonito": "10012234456",
+    "recuerdas": "10012235678",
+    "haz": "00012",
+    "veras": "00012234",
+    "increíble": "26301245556689",
+    "quisiera": "10023346678",
+    "tonto": "00012345",
+    "simplemente": "200123566789:;",
+    "haría": "14212234445",
+    "preguntas": "10023345678",
+    "aire": "00002234",
+    "conoce": "10012234456",
+    "fuerza": "00013456",
+    "carta": "00012345",
+    "trato": "00023345",
+    "ése": "01101123",
+    "verlo": "00012345",
+    "hambre": "00012356",
+    "vuelto": "00013456",
+    "empezar": "20001234456",
+    "campo": "00012345",
+    "acaba": "10001123345",
+    "hablas": "00012245",
+    "vive": "00012234",
+    "barco": "00012345",
+    "poner": "10012234",
+    "grupo": "00023345",
+    "creí": "14223334",
+    "sol": "00012",
+    "tuyo": "00012224",
+    "pase": "00012234",
+    "voz": "00012",
+    "baño": "00012234",
+    "usar": "10001123",
+    "conseguir": "20012345578",
+    "placer": "10023345",
+    "llegado": "10023345567",
+    "decirte": "10012234567",
+    "profesor": "20023345567",
+    "noticias": "10012234457",
+    "lamento": "10012234567",
+    "decirle": "10012234567",
+    "blanco": "00023456",
+    "quédate": "03123345567",
+    "estuve": "10001234456",
+    "pie": "00013",
+    "espere": "10001234456",
+    "edad": "10001123",
+    "secreto": "10012245567",
+    "podríamos": "15212245556678",
+    "compañía": "27312345567778",
+    "tren": "00023",
+    "recuerda": "10012235678",
+    "tras": "00023",
+    "siéntate": "03113456678",
+    "prisa": "00023345",
+    "vista": "00012345",
+    "hermosa": "10012345567",
+    "negocio": "10012234457",
+    "deberíamos": "26312234456667789",
+    "gustan": "00012345",
+    "pagar": "10012234",
+    "futuro": "10012234456",
+    "silencio": "10012234568",
+    "siente": "00013456",
+    "médico": "02112234456",
+    "maestro": "10012223467",
+    "quiera": "00024456",
+    "llegó": "15223345",
+    "loca": "00012234",
+    "cambiar": "10012346",
+    "sal": "00012",
+    "raro": "00012234",
+    "viste": "00012345",
+    "novia": "00012235",
+    "diferente": "20012234456789",
+    "imposible": "20001234456689",
+    "amiga": "10001123345",
+    "enseguida": "20001234467789",
+    "llamada": "10023345567",
+    "dan": "00012",
+    "dejó": "14212234",
+    "mes": "00012",
+    "llevo": "00023345",
+    "avión": "14201124",
+    "pelo": "00012234",
+    "haremos": "10012234456",
+    "tendrá": "16212356",
+    "propia": "00023346",
+    "siguiente": "10012246789",
+    "ganar": "10012234",
+    "ley": "00013",
+    "dolor": "10012234",
+    "oro": "00001123",
+    "acabó": "25301123345",
+    "maldición": "28312345568",
+    "oficial": "20001123346",
+    "situación": "28312235568",
+    "daño": "00012234",
+    "sientes": "00013456",
+    "entendido": "20001234567789",
+    "deseo": "10012234445",
+    "mente": "00012345",
+    "ejército": "13201123456678",
+    "comprar": "10012356",
+    "muertos": "00013456",
+    "pensaba": "10012345567",
+    "darle": "00012345",
+    "estúpido": "14201234456678",
+    "decía": "14212234445",
+    "acabo": "10001123345",
+    "suena": "00013345",
+    "mitad": "10012234",
+    "caballo": "10012234467",
+    "asesino": "20001123345567",
+    "vio": "00013",
+    "permiso": "10012345567",
+    "ellas": "00001134",
+    "trabajando": "2002334556789:",
+    "maravilloso": "300122344566899:;",
+    "mesa": "00012234",
+    "divertido": "20012234567789",
+    "mejores": "10012234456",
+    "próxima": "03123345567",
+    "entra": "00001245",
+    "mar": "00012",
+    "siete": "00013345",
+    "hacía": "14212234445",
+    "sexo": "00012234",
+    "encanta": "10001234567",
+    "amable": "10001123356",
+    "mensaje": "10012345567",
+    "información": "3:40123456778:",
+    "traje": "00023345",
+    "alma": "00001234",
+    "encontrado": "2000123457889:",
+    "coronel": "20012234456",
+    "dale": "00012234",
+    "san": "00012",
+    "cena": "00012234",
+    "encontré": "28301234578",
+    "tendrás": "16212356",
+    "eras": "00001123",
+    "propio": "00023346",
+    "culo": "00012234",
+    "adentro": "10001123467",
+    "canción": "16212346",
+    "gobierno": "10012235678",
+    "temo": "00012234",
+    "abre": "00001134",
+    "dijeron": "10012234456",
+    "fuiste": "00013456",
+    "media": "00012235",
+    "das": "00012",
+    "estábamos": "14201234456678",
+    "estaría": "26301234456667",
+    "daré": "14212234",
+    "vosotros": "10012234467",
+    "frío": "03123334",
+    "foto": "00012234",
+    "accidente": "20001234456789",
+    "derecha": "10012234467",
+    "funciona": "10012346678",
+    "vayas": "00012224",
+    "centro": "00012356",
+    "necesario": "20012234456679",
+    "miren": "00012234",
+    "bonita": "10012234456",
+    "ante": "00001234",
+    "pude": "00012234",
+    "teniente": "10012235678",
+    "luna": "00012234",
+    "izquierda": "10001246789",
+    "doy": "00013",
+    "servicio": "10012345568",
+    "llamas": "00023345",
+    "junto": "00012345",
+    "tienda": "00013456",
+    "navidad": "20012234456",
+    "dirección": "28312234568",
+    "abuela": "10001124456",
+    "alrededor": "30001234456678",
+    "vine": "00012234",
+    "tendré": "16212356",
+    "libertad": "20012234567",
+    "sale": "00012234",
+    "línea": "02112234445",
+    "abogado": "20001123345567",
+    "pies": "00013",
+    "tratando": "10023345678",
+    "regresar": "20012245567",
+    "hablo": "00012245",
+    "vieja": "00013345",
+    "papel": "10012234",
+    "terminado": "20012345567789",
+    "dejado": "10012234456",
+    "juro": "00012234",
+    "hermoso": "10012345567",
+    "dulce": "00012345",
+    "sentir": "10012345",
+    "principio": "10023456679",
+    "interesante": "300012344566789:;",
+    "caja": "00012234",
+    "cualquiera": "1001346889:",
+    "ocho": "00001134",
+    "respuesta": "10012346789",
+    "perra": "00012245",
+    "gracioso": "10023346678",
+    "trae": "00023334",
+    "mató": "14212234",
+    "completamente": "3001235667889:;<=",
+    "vienen": "00013345",
+    "sean": "00012223",
+    "llega": "00023345",
+    "abuelo": "10001124456",
+    "tengas": "00012345",
+    "linda": "00012345",
+    "tendremos": "10012356678",
+    "partes": "00012345",
+    "cárcel": "02112345",
+    "hubo": "00012234",
+    "sistema": "10012345567",
+    "lindo": "00012345",
+    "hazlo": "00012345",
+    "hicieron": "10012235567",
+    "tía": "02112223",
+    "busca": "00012345",
+    "don": "00012",
+    "baja": "00012234",
+    "pudo": "00012234",
+    "salud": "10012234",
+    "listos": "00012345",
+    "cita": "00012234",
+    "tenías": "14212234445",
+    "negocios": "10012234457",
+    "tipos": "00012234",
+    "cámara": "02112234456",
+    "agente": "10001123456",
+    "verás": "14212234",
+    "infierno": "10001235678",
+    "regalo": "10012234456",
+    "río": "02112223",
+    "través": "15223345",
+    "carne": "00012345",
+    "totalmente": "2001223456789:",
+    "decirme": "10012234567",
+    "piso": "00012234",
+    "esposo": "10001234456",
+    "oír": "12201112",
+    "sargento": "10012345678",
+    "deje": "00012234",
+    "tuya": "00012224",
+    "ambos": "00001234",
+    "beber": "10012234",
+    "calma": "00012345",
+    "vestido": "10012345567",
+    "salvo": "00012345",
+    "ésa": "01101123",
+    "verdadero": "20012345567789",
+    "basura": "10012234456",
+    "suelo": "00013345",
+    "carrera": "10012245567",
+    "cumpleaños": "20012356667789",
+    "rato": "00012234",
+    "iremos": "10001123345",
+    "universidad": "4000112334567889:",
+    "bailar": "10013345",
+    "triste": "00023456",
+    "iglesia": "10001134457",
+    "delante": "10012234567",
+    "nena": "00012234",
+    "banco": "00012345",
+    "cuántos": "03113456",
+    "encuentra": "10001235689",
+    "supone": "10012234456",
+    "existe": "10001123456",
+    "programa": "10023356678",
+    "alegro": "10001123356",
+    "santo": "00012345",
+    "porqué": "16212356",
+    "novio": "00012235",
+    "broma": "00023345",
+    "diría": "14212234445",
+    "salió": "15212235",
+    "jesús": "14212234",
+    "prometo": "10023345567",
+    "partido": "10012345567",
+    "pregunto": "10023345678",
+    "vuelva": "00013456",
+    "cenar": "10012234",
+    "ocurrió": "27301123357",
+    "creía": "14223334445",
+    "corre": "00012245",
+    "disculpa": "10012345678",
+    "vienes": "00013345",
+    "cerveza": "10012345567",
+    "muerta": "00013456",
+    "pensado": "10012345567",
+    "destino": "10012345567",
+    "matrimonio": "2001224556778:",
+    "fotos": "00012234",
+    "diablo": "00013356",
+    "volveré": "27312345567",
+    "saberlo": "10012234567",
+    "cielos": "00013345",
+    "norte": "00012345",
+    "sala": "00012234",
+    "órdenes": "01101234456",
+    "según": "14212234",
+    "harás": "14212234",
+    "ataque": "10001123356",
+    "parís": "14212234",
+    "ejemplo": "10001123467",
+    "sorpresa": "10012356678",
+    "té": "02112",
+    "pudiera": "10012235567",
+    "baile": "00013345",
+    "temprano": "10012356678",
+    "público": "02112245567",
+    "oí": "12201112",
+    "mirando": "10012234567",
+    "ventana": "10012345567",
+    "conocido": "20012234456678",
+    "duda": "00012234",
+    "boda": "00012234",
+    "peligro": "10012234467",
+    "trabaja": "10023345567",
+    "quise": "00023345",
+    "querías": "15223345556",
+    "caliente": "10012235678",
+    "escribir": "20001245567",
+    "reina": "00013345",
+    "esperaba": "20001234456678",
+    "sur": "00012",
+    "enfermo": "10001234567",
+    "excelente": "20001234456789",
+    "pone": "00012234",
+    "estés": "14201234",
+    "escena": "10001234456",
+    "encuentro": "10001235689",
+    "asesinato": "30001123345567789",
+    "obra": "00001134",
+    "veré": "14212234",
+    "llamó": "15223345",
+    "aquel": "10001134",
+    "terminar": "20012345567",
+    "ganas": "00012234",
+    "conocer": "20012234456",
+    "pruebas": "00024456",
+    "señores": "10012234456",
+    "vos": "00012",
+    "escúchame": "14201234467789",
+    "veamos": "10012223345",
+    "creen": "00023334",
+    "aun": "00002",
+    "ninguno": "10012345567",
+    "parecía": "26312234456667",
+    "viva": "00012234",
+    "apenas": "10001123345",
+    "segunda": "10012234567",
+    "llave": "00023345",
+    "regreso": "10012245567",
+    "trasero": "10023345567",
+    "ojalá": "25301123345",
+    "veremos": "10012234456",
+    "seré": "14212234",
+    "irse": "00001234",
+    "cartas": "00012345",
+    "libros": "00012245",
+    "apuesto": "10001124567",
+    "leer": "10012223",
+    "imbécil": "14201234456",
+    "opinión": "26301123346",
+    "joder": "10012234",
+    "cambiado": "10012346678",
+    "sucedió": "27312234457",
+    "señal": "10012234",
+    "habían": "14212234445",
+    "agradable": "20001134456689",
+    "cocina": "10012234456",
+    "relación": "27312234457",
+    "sueños": "00013345",
+    "segundos": "10012234567",
+    "corte": "00012345",
+    "escuchar": "20001234467",
+    "cerebro": "10012234467",
+    "locura": "10012234456",
+    "peligroso": "20012234467789",
+    "hermanos": "10012345567",
+    "entender": "20001234567",
+    "cine": "00012234",
+    "dejes": "00012234",
+    "reunión": "16213346",
+    "tendría": "16212356667",
+    "verla": "00012345",
+    "duele": "00013345",
+    "hicimos": "10012234456",
+    "londres": "00012356",
+    "tocar": "10012234",
+    "mirar": "10012234",
+    "verme": "00012345",
+    "suyo": "00012224",
+    "causa": "00013345",
+    "pelea": "10012234445",
+    "prisión": "16223346",
+    "mayoría": "26312224456667",
+    "fondo": "00012345",
+    "acaso": "10001123345",
+    "vuelvo": "00013456",
+    "serán": "14212234",
+    "montón": "15212345",
+    "toca": "00012234",
+    "comandante": "2001223456789:",
+    "tome": "00012234",
+    "éxito": "01101123345",
+    "misión": "15212235",
+    "vidas": "00012234",
+    "decisión": "27312234457",
+    "hogar": "10012234",
+    "rico": "00012234",
+    "trago": "00023345",
+    "capaz": "10012234",
+    "cargo": "00012345",
+    "unidos": "10001123345",
+    "lleno": "00023345",
+    "bar": "00012",
+    "estrella": "10001245578",
+    "posición": "27312234457",
+    "estación": "27301234457",
+    "interesa": "20001234456678",
+    "edificio": "20001123345568",
+    "vayan": "00012224",
+    "consejo": "10012345567",
+    "pistola": "10012345567",
+    "humano": "10012234456",
+    "irnos": "00001234",
+    "fantástico": "1521234567889:",
+    "ojo": "00001123",
+    "jóvenes": "02112234456",
+    "zapatos": "10012234456",
+    "majestad": "20012234567",
+    "lee": "00012223",
+    "flores": "00023345",
+    "ocupado": "20001123345567",
+    "bienvenido": "2001345667889:",
+    "zona": "00012234",
+    "contacto": "10012345678",
+    "sacar": "10012234",
+    "podrían": "15212245556",
+    "tema": "00012234",
+    "matado": "10012234456",
+    "soldado": "10012345567",
+    "sabías": "14212234445",
+    "pido": "00012234",
+    "cierra": "00013356",
+    "intento": "10001234567",
+    "irá": "13201123",
+    "calor": "10012234",
+    "finalmente": "2001223456789:",
+    "equivocado": "3000113445667889:",
+    "animales": "20001123345567",
+    "departamento": "30012234567789:;<",
+    "enemigo": "20001123345567",
+    "caballero": "20012234467789",
+    "color": "10012234",
+    "necesitan": "20012234456678",
+    "empieza": "10001235567",
+    "soldados": "10012345567",
+    "vea": "00012223",
+    "entiende": "10001235678",
+    "valor": "10012234",
+    "azul": "10001123",
+    "miles": "00012234",
+    "espacio": "10001234457",
+    "estarás": "26301234456",
+    "mantener": "20012345567",
+    "aprender": "20001134567",
+    "inteligente": "300012344566789:;",
+    "serás": "14212234",
+    "arte": "00001234",
+    "respeto": "10012345567",
+    "pedir": "10012234",
+    "puso": "00012234",
+    "llaman": "00023345",
+    "oiga": "00002234",
+    "juez": "00013",
+    "inglés": "15201245",
+    "precio": "00023346",
+    "rojo": "00012234",
+    "formas": "00012345",
+    "hagan": "00012234",
+    "verano": "10012234456",
+    "podido": "10012234456",
+    "piernas": "00013456",
+    "isla": "00001234",
+    "darme": "00012345",
+    "damas": "00012234",
+    "guardia": "00013457",
+    "espalda": "10001234567",
+    "vengan": "00012345",
+    "parar": "10012234",
+    "llevas": "00023345",
+    "banda": "00012345",
+    "quedarme": "10023345678",
+    "habéis": "14212235",
+    "marcha": "00012356",
+    "luces": "00012234",
+    "estuviera": "20001234457789",
+    "crimen": "00023345",
+    "dejo": "00012234",
+    "ayudarte": "20001113345678",
+    "esperen": "10001234456",
+    "teníamos": "14212234445567",
+    "diferencia": "2001223445678:",
+    "llamaré": "27323345567",
+    "ama": "00001123",
+    "conocí": "26312234456",
+    "tiempos": "00013456",
+    "déjalo": "02112234456",
+    "debajo": "10012234456",
+    "compañero": "20012345567789",
+    "dejé": "14212234",
+    "come": "00012234",
+    "déjeme": "02112234456",
+    "molesta": "10012234567",
+    "contar": "10012345",
+    "dejaré": "26312234456",
+    "hablamos": "10012245567",
+    "cansado": "10012345567",
+    "ganado": "10012234456",
+    "pareces": "10012234456",
+    "juicio": "00013346",
+    "hablado": "10012245567",
+    "estilo": "10001234456",
+    "ayúdame": "13201113345567",
+    "sepa": "00012234",
+    "viendo": "00013456",
+    "salida": "10012234456",
+    "alegra": "10001123356",
+    "despierta": "10012346789",
+    "estupendo": "20001234456789",
+    "darte": "00012345",
+    "estados": "10001234456",
+    "quedan": "00023345",
+    "próximo": "03123345567",
+    "nota": "00012234",
+    "llevó": "15223345",
+    "puedas": "00013345",
+    "podrá": "15212245",
+    "tenían": "14212234445",
+    "sube": "00012234",
+    "vuelo": "00013345",
+    "excepto": "10001234567",
+    "golpe": "00012345",
+    "viento": "00013456",
+    "estaremos": "20001234456678",
+    "acción": "15201235",
+    "tonterías": "27312345567778",
+    "respecto": "10012345678",
+    "desea": "10012234445",
+    "sigues": "00012245",
+    "debía": "14212234445",
+    "vendrá": "16212356",
+    "encontramos": "2000123457889:",
+    "beso": "00012234",
+    "cuestión": "17213457",
+    "volvió": "16212346",
+    "reglas": "00012245",
+    "ruido": "00013345",
+    "acabado": "20001123345567",
+    "salga": "00012345",
+    "olvidado": "20001234456678",
+    "mentira": "10012345567",
+    "brazo": "00023345",
+    "empezó": "26301234456",
+    "cálmate": "02112345567",
+    "caballos": "10012234467",
+    "experiencia": "2000123445789;",
+    "tranquila": "10023467789",
+    "quedar": "10023345",
+    "esperanza": "20001234456789",
+    "irte": "00001234",
+    "perros": "00012245",
+    "casado": "10012234456",
+    "llegue": "00023356",
+    "drogas": "00023345",
+    "pidió": "15212235",
+    "espíritu": "14201234456678",
+    "vacaciones": "20012234457789",
+    "copa": "00012234",
+    "investigación": "4<5012345677899:<",
+    "prefiero": "10023346678",
+    "solía": "14212234445",
+    "llevaré": "27323345567",
+    "menudo": "10012234456",
+    "partir": "10012345",
+    "visita": "10012234456",
+    "alta": "00001234",
+    "abrir": "10001134",
+    "nueve": "00013345",
+    "bomba": "00012345",
+    "energía": "26301123456667",
+    "bolsa": "00012345",
+    "hacerte": "10012234567",
+    "santa": "00012345",
+    "pan": "00012",
+    "piel": "00013",
+    "usa": "00001123",
+    "metros": "00012245",
+    "perdona": "10012345567",
+    "escrito": "10001245567",
+    "exacto": "10001123456",
+    "jugando": "10012234567",
+    "cuello": "00013356",
+    "larga": "00012345",
+    "escapar": "20001234456",
+    "salvar": "10012345",
+    "escuche": "10001234467",
+    "perdone": "10012345567",
+    "sirve": "00012345",
+    "preocupe": "20023334456678",
+    "especie": "10001234457",
+    "aquella": "10001134467",
+    "verá": "14212234",
+    "brazos": "00023345",
+    "llena": "00023345",
+    "subir": "10012234",
+    "blanca": "00023456",
+    "fe": "00012",
+    "modos": "00012234",
+    "traído": "14223334456",
+    "películas": "14212234456678",
+    "dama": "00012234",
+    "suya": "00012224",
+    "decirlo": "10012234567",
+    "doble": "00012245",
+    "inmediatamente": "400012344577899:;<=>",
+    "culpable": "10012345578",
+    "preocupa": "20023334456678",
+    "tardes": "00012345",
+    "vengo": "00012345",
+    "bosque": "00012356",
+    "perdí": "15212345",
+    "volverá": "27312345567",
+    "taxi": "00012234",
+    "volar": "10012234",
+    "debido": "10012234456",
+    "repente": "10012234567",
+    "bromeando": "20023345556789",
+    "viejos": "00013345",
+    "planeta": "10023345567",
+    "leche": "00012245",
+    "tanta": "00012345",
+    "tuviera": "10012235567",
+    "encantado": "20001234567789",
+    "cabrón": "15212245",
+    "correr": "10012245",
+    "depende": "10012234567",
+    "común": "14212234",
+    "informe": "10001234567",
+    "solamente": "20012234456789",
+    "máquina": "02112245567",
+    "muere": "00013345",
+    "ridículo": "14212234456678",
+    "entrada": "10001245567",
+    "encontró": "28301234578",
+    "podamos": "10012234456",
+    "acabar": "20001123345",
+    "américa": "13201123345567",
+    "regresa": "10012245567",
+    "probar": "10023345",
+    "príncipe": "03123456678",
+    "preparado": "20023345567789",
+    "pedido": "10012234456",
+    "propósito": "15223345567789",
+    "dieron": "00013345",
+    "salido": "10012234456",
+    "cliente": "00024567",
+    "árbol": "01101234",
+    "absoluto": "20001234456678",
+    "dejas": "00012234",
+    "quiénes": "04124456",
+    "habías": "14212234445",
+    "parecen": "10012234456",
+    "belleza": "10012245567",
+    "llame": "00023345",
+    "intenta": "10001234567",
+    "humanos": "10012234456",
+    "tratar": "10023345",
+    "vuestra": "00013467",
+    "hayas": "00012224",
+    "princesa": "10023456678",
+    "sigo": "00012234",
+    "quedarse": "10023345678",
+    "oeste": "10001112345",
+    "traer": "10023334",
+    "olvídalo": "14201234456678",
+    "francia": "00023457",
+    "tuvimos": "10012234456",
+    "ayudarme": "20001113345678",
+    "deprisa": "10012245567",
+    "llaves": "00023345",
+    "tiro": "00012234",
+    "cerdo": "00012345",
+    "gato": "00012234",
+    "inglaterra": "2000124556779:",
+    "vistazo": "10012345567",
+    "cuántas": "03113456",
+    "defensa": "10012234567",
+    "nuevos": "00013345",
+    "últimos": "01101234456",
+    "reloj": "10012234",
+    "fuimos": "00013345",
+    "batalla": "10012234467",
+    "hable": "00012245",
+    "caminar": "20012234456",
+    "hacerle": "10012234567",
+    "vayamos": "10012224456",
+    "interior": "20001234457",
+    "bella": "00012245",
+    "felices": "10012234456",
+    "intentando": "2000123456789:",
+    "apartamento": "300011234566789:;",
+    "teatro": "10012223356",
+    "hacerme": "10012234567",
+    "papi": "00012234",
+    "asuntos": "10001123456",
+    "confiar": "10012346",
+    "hielo": "00013345",
+    "deberían": "26312234456667",
+    "cantar": "10012345",
+    "bajar": "10012234",
+    "vuestro": "00013467",
+    "pelear": "20012234445",
+    "locos": "00012234",
+    "paga": "00012234",
+    "oyes": "00001113",
+    "completo": "10012356678",
+    "lucha": "00012245",
+    "fuerzas": "00013456",
+    "borracho": "10012245578",
+    "héroe": "02112234445",
+    "camión": "15212235",
+    "cabo": "00012234",
+    "dientes": "00013456",
+    "verde": "00012345",
+    "despacio": "10012345568",
+    "decidido": "20012234456678",
+    "sociedad": "20012235567",
+    "pareja": "10012234456",
+    "dígame": "02112234456",
+    "estuviste": "20001234456789",
+    "nariz": "10012234",
+    "vergüenza": "10012356789",
+    "caer": "10012223",
+    "herido": "10012234456",
+    "cuentas": "00013456",
+    "pista": "00012345",
+    "siéntese": "03113456678",
+    "bebe": "00012234",
+    "sonido": "10012234456",
+    "estrellas": "10001245578",
+    "sombrero": "10012356678",
+    "cayó": "14212224",
+    "evitar": "20001123345",
+    "pasará": "26312234456",
+    "maría": "14212234445",
+    "memoria": "10012234457",
+    "solos": "00012234",
+    "llorar": "10023345",
+    "nervioso": "10012346678",
+    "lástima": "02112345567",
+    "haberlo": "10012234567",
+    "época": "01101123345",
+    "naturaleza": "3001223445667889:",
+    "vender": "10012345",
+    "política": "14212234456678",
+    "levántate": "14212234567789",
+    "estudio": "10001234457",
+    "brillante": "10023356789",
+    "nivel": "10012234",
+    "diferentes": "20012234456789",
+    "dando": "00012345",
+    "hubiese": "10012235567",
+    "permite": "10012345567",
+    "justicia": "10012345568",
+    "planes": "00023345",
+    "mírame": "02112234456",
+    "llegamos": "10023345567",
+    "roma": "00012234",
+    "seguramente": "300122344566789:;",
+    "papa": "00012234",
+    "parecer": "20012234456",
+    "terminó": "27312345567",
+    "pierna": "00013456",
+    "quienes": "00024456",
+    "millón": "15212245",
+    "enorme": "10001123456",
+    "inocente": "20001123345678",
+    "mismos": "00012345",
+    "pantalones": "20012345567789",
+    "ministro": "10012234578",
+    "bienvenida": "2001345667889:",
+    "u": "00001",
+    "refiero": "10012235567",
+    "nombres": "00012356",
+    "mando": "00012345",
+    "preciosa": "10023346678",
+    "quedó": "15223345",
+    "podrás": "15212245",
+    "pesar": "10012234",
+    "enferma": "10001234567",
+    "extraña": "10001245567",
+    "enamorado": "30001123345567789",
+    "autobús": "26302234456",
+    "recordar": "20012234567",
+    "estáis": "14201235",
+    "pequeños": "10012245567",
+    "luchar": "10012245",
+    "contrario": "10012356679",
+    "tomado": "10012234456",
+    "sois": "00013",
+    "movimiento": "2001223445789:",
+    "sentado": "10012345567",
+    "gana": "00012234",
+    "estén": "14201234",
+    "motivo": "10012234456",
+    "absolutamente": "4000123445667889:;<=",
+    "dé": "02112",
+    "puente": "00013456",
+    "comprendo": "10012356789",
+    "huevos": "00013345",
+    "tomó": "14212234",
+    "cuento": "00013456",
+    "botella": "10012234467",
+    "cuesta": "00013456",
+    "corriendo": "10012246789",
+    "confianza": "10012346789",
+    "felicidad": "30012234456678",
+    "espada": "10001234456",
+    "silla": "00012245",
+    "noticia": "10012234457",
+    "casas": "00012234",
+    "televisión": "39412234456679",
+    "acuerdas": "10001124567",
+    "necesitaba": "3001223445667889:",
+    "pared": "10012234",
+    "aquellos": "10001134467",
+    "prensa": "00023456",
+    "trampa": "00023456",
+    "presente": "10023345678",
+    "estarán": "26301234456",
+    "jardín": "15212345",
+    "cabello": "10012234467",
+    "espectáculo": "273012345677899:;",
+    "podré": "15212245",
+    "grave": "00023345",
+    "bastardo": "10012345678",
+    "dará": "14212234",
+    "siga": "00012234",
+    "periódico": "15212235567789",
+    "coño": "00012234",
+    "negros": "00012245",
+    "alguno": "10001234456",
+    "anillo": "10001123356",
+    "monstruo": "00012468",
+    "piedra": "00013356",
+    "contento": "10012345678",
+    "quedarte": "10023345678",
+    "tengan": "00012345",
+    "oigan": "00002234",
+    "sentí": "15212345",
+    "debí": "14212234",
+    "policías": "26312234456667",
+    "lugares": "10012234456",
+    "contrato": "10012356678",
+    "playa": "00023335",
+    "costa": "00012345",
+    "puertas": "00013456",
+    "asiento": "10001124567",
+    "tarjeta": "10012345567",
+    "restaurante": "200123466789:;",
+    "quede": "00023345",
+    "paseo": "10012234445",
+    "hechos": "00012245",
+    "hagamos": "10012234456",
+    "maravillosa": "300122344566899:;",
+    "pon": "00012",
+    "domingo": "10012234567",
+    "especialmente": "3000123445789:;<=",
+    "velocidad": "30012234456678",
+    "negra": "00012245",
+    "intentar": "20001234567",
+    "proyecto": "10023335678",
+    "clientes": "00024567",
+    "victoria": "10012345568",
+    "encantaría": "3940123456778999:",
+    "operación": "38401123345568",
+    "perdió": "16212346",
+    "tonta": "00012345",
+    "imagen": "10001123345",
+    "lleve": "00023345",
+    "amas": "00001123",
+    "gustaba": "10012345567",
+    "aspecto": "10001234567",
+    "tantos": "00012345",
+    "sentimientos": "200123455689:;",
+    "creerlo": "10023334567",
+    "objetivo": "20001234456678",
+    "llevan": "00023345",
+    "malas": "00012234",
+    "red": "00012",
+    "dejen": "00012234",
+    "nuevas": "00013345",
+    "muchacha": "10012245578",
+    "dormido": "10012345567",
+    "historias": "10012345568",
+    "arreglar": "20001134467",
+    "turno": "00012345",
+    "yendo": "00002345",
+    "tuviste": "10012234567",
+    "ponga": "00012345",
+    "olvides": "10001234456",
+    "escuché": "27301234467",
+    "pasada": "10012234456",
+    "mata": "00012234",
+    "tantas": "00012345",
+    "montaña": "10012345567",
+    "gracia": "00023346",
+    "enfermedad": "30001234567789",
+    "dedos": "00012234",
+    "guapa": "00013345",
+    "querer": "10023345",
+    "ocurrido": "20001123356678",
+    "pocos": "00012234",
+    "deber": "10012234",
+    "refieres": "10012235567",
+    "viernes": "00013456",
+    "preocupado": "3002333445667889:",
+    "clases": "00023345",
+    "rayos": "00012224",
+    "inútil": "13201123345",
+    "abierto": "10001124567",
+    "haberte": "10012234567",
+    "oscuridad": "30001234456678",
+    "verdadera": "20012345567789",
+    "americano": "30001123345567789",
+    "trajo": "00023345",
+    "gustó": "15212345",
+    "primo": "00023345",
+    "nacional": "20012235567",
+    "supe": "00012234",
+    "colegio": "10012234457",
+    "malditos": "10012345567",
+    "cuchillo": "10012245578",
+    "ibas": "00001123",
+    "llegué": "16223356",
+    "diario": "00013346",
+    "francés": "16223456",
+    "quedo": "00023345",
+    "podremos": "10012245567",
+    "orgulloso": "20001234467789",
+    "ladrón": "15212245",
+    "preguntar": "20023345678",
+    "pedí": "14212234",
+    "voluntad": "20012234567",
+    "harán": "14212234",
+    "militar": "20012234456",
+    "agradezco": "20001134456789",
+    "llevaba": "10023345567",
+    "mami": "00012234",
+    "lluvia": "00023346",
+    "éramos": "01101123345",
+    "calles": "00012245",
+    "cien": "00013",
+    "lengua": "00012346",
+    "testigo": "10012345567",
+    "ayude": "10001113345",
+    "quiso": "00023345",
+    "cansada": "10012345567",
+    "puse": "00012234",
+    "irás": "13201123",
+    "alemanes": "20001123345567",
+    "pago": "00012234",
+    "mirada": "10012234456",
+    "momentos": "10012234567",
+    "quieto": "00024456",
+    "sentía": "15212345556",
+    "escuchen": "10001234467",
+    "descansar": "20012345678",
+    "mercado": "10012345567",
+    "dura": "00012234",
+    "humana": "10012234456",
+    "estúpida": "14201234456678",
+    "bienvenidos": "2001345667889:",
+    "conocía": "26312234456667",
+    "entero": "10001234456",
+    "roja": "00012234",
+    "llamaba": "10023345567",
+    "tomas": "00012234",
+    "dueño": "00013345",
+    "echar": "10001134",
+    "emergencia": "2000112345678:",
+    "roto": "00012234",
+    "actuar": "10001235",
+    "inmediato": "20001234457789",
+    "puntos": "00012345",
+    "paciente": "10012235678",
+    "olvidé": "26301234456",
+    "hables": "00012245",
+    "varios": "00012235",
+    "polvo": "00012345",
+    "ángeles": "01101234456",
+    "coger": "10012234",
+    "distancia": "10012345679",
+    "bravo": "00023345",
+    "europa": "10002234456",
+    "mataron": "10012234456",
+    "tomando": "10012234567",
+    "verle": "00012345",
+    "señoría": "26312234456667",
+    "casarse": "10012234567",
+    "toque": "00012245",
+    "toques": "00012245",
+    "ángel": "01101234",
+    "amante": "10001123456",
+    "habló": "15212245",
+    "saca": "00012234",
+    "digamos": "10012234456",
+    "perfecta": "10012345678",
+    "rosa": "00012234",
+    "llámame": "03123345567",
+    "nosotras": "10012234467",
+    "peso": "00012234",
+    "carga": "00012345",
+    "acto": "00001234",
+    "robar": "10012234",
+    "dejaste": "10012234567",
+    "desastre": "10012234578",
+    "bote": "00012234",
+    "huele": "00013345",
+    "embarazada": "3000123445667889:",
+    "muestra": "00013467",
+    "gordo": "00012345",
+    "puto": "00012234",
+    "viviendo": "10012235678",
+    "cerrar": "10012245",
+    "papeles": "10012234456",
+    "valiente": "10012235678",
+    "gloria": "00023346",
+    "aceptar": "20001123456",
+    "perdóname": "15212345567789",
+    "perfectamente": "3001234567889:;<=",
+    "oscuro": "10001234456",
+    "cuidar": "10013345",
+    "dedo": "00012234",
+    "ruego": "00013345",
+    "pareció": "27312234457",
+    "tumba": "00012345",
+    "coge": "00012234",
+    "resulta": "10012234567",
+    "dejarlo": "10012234567",
+    "comenzar": "20012234567",
+    "área": "01101123334",
+    "metido": "10012234456",
+    "limpio": "00012346",
+    "descanso": "10012345678",
+    "lados": "00012234",
+    "posibilidad": "4001223445667889:",
+    "guapo": "00013345",
+    "uso": "00001123",
+    "talento": "10012234567",
+    "matarme": "10012234567",
+    "continuar": "20012345568",
+    "código": "02112234456",
+    "comenzó": "27312234567",
+    "duerme": "00013456",
+    "definitivamente": "5001223445667889::;<=>?",
+    "directo": "10012234567",
+    "vuelvas": "00013456",
+    "demonio": "10012234457",
+    "parque": "00012356",
+    "cambia": "00012346",
+    "olvidar": "20001234456",
+    "cinta": "00012345",
+    "famoso": "10012234456",
+    "mataré": "26312234456",
+    "siguen": "00012245",
+    "saliendo": "10012235678",
+    "muevas": "00013345",
+    "señoras": "10012234456",
+    "disparar": "20012345567",
+    "pide": "00012234",
+    "debió": "15212235",
+    "empresa": "10001245567",
+    "precioso": "10023346678",
+    "termina": "10012345567",
+    "intención": "28301234568",
+    "recibir": "20012234456",
+    "hubieras": "10012235567",
+    "abrigo": "10001134456",
+    "encuentras": "10001235689",
+    "diste": "00012345",
+    "tendrán": "16212356",
+    "cerrado": "10012245567",
+    "conocerte": "20012234456789",
+    "hablé": "15212245",
+    "menor": "10012234",
+    "querría": "16223356667",
+    "imagino": "20001123345567",
+    "genio": "00012235",
+    "profesional": "3002334556889:",
+    "oigo": "00002234",
+    "pongo": "00012345",
+    "niñas": "00012234",
+    "muévete": "03113345567",
+    "opción": "15201235",
+    "tribunal": "20023345567",
+    "tenéis": "14212235",
+    "lago": "00012234",
+    "unidad": "20001123345",
+    "abierta": "10001124567",
+    "efecto": "10001123456",
+    "presión": "16223346",
+    "varias": "00012235",
+    "robo": "00012234",
+    "saldrá": "16212356",
+    "veía": "13212223334",
+    "quedado": "10023345567",
+    "alcalde": "10001234567",
+    "empleo": "10001245556",
+    "pollo": "00012245",
+    "whisky": "00023456",
+    "carretera": "20012245567789",
+    "sábado": "02112234456",
+    "aeropuerto": "3000111223445789:",
+    "jodido": "10012234456",
+    "pobres": "00012245",
+    "medicina": "20012234456678",
+    "llevará": "27323345567",
+    "gratis": "00023345",
+    "cae": "00012223",
+    "fortuna": "10012345567",
+    "castillo": "10012345578",
+    "nieve": "00013345",
+    "busco": "00012345",
+    "riesgo": "00013456",
+    "alemán": "25301123345",
+    "sucio": "00012235",
+    "idiotas": "10001124456",
+    "conversación": "3;41234567889;",
+    "fuese": "00013345",
+    "comienzo": "10012235678",
+    "pasé": "14212234",
+    "encontraron": "2000123457889:",
+    "elección": "27301123457",
+    "salgan": "00012345",
+    "carro": "00012245",
+    "piensan": "00013456",
+    "rostro": "00012356",
+    "razones": "10012234456",
+    "fué": "03113",
+    "propiedad": "20023346678",
+    "mundial": "10012346",
+    "familiar": "20012234457",
+    "libras": "00012245",
+    "hablemos": "10012245567",
+    "pedazo": "10012234456",
+    "continúa": "27312345567778",
+    "cola": "00012234",
+    "enemigos": "20001123345567",
+    "marca": "00012345",
+    "líder": "02112234",
+    "hablan": "00012245",
+    "durmiendo": "10012346789",
+    "socorro": "10012234467",
+    "fútbol": "02112345",
+    "detalles": "10012234467",
+    "hiciera": "10012235567",
+    "recibido": "20012234456678",
+    "tesoro": "10012234456",
+    "camisa": "10012234456",
+    "comienza": "10012235678",
+    "conducir": "20012345567",
+    "andar": "10001234",
+    "compañeros": "20012345567789",
+    "llevado": "10023345567",
+    "alegría": "26301123356667",
+    "envió": "15201235",
+    "interés": "26301234456",
+    "parecido": "20012234456678",
+    "fueras": "00013345",
+    "hayan": "00012224",
+    "fantasma": "10012345678",
+    "teniendo": "10012235678",
+    "pertenece": "20012345567789",
+    "presento": "10023345678",
+    "llevamos": "10023345567",
+    "mama": "00012234",
+    "desayuno": "20012234446678",
+    "merece": "10012234456",
+    "conocemos": "20012234456678",
+    "mueve": "00013345",
+    "lárgate": "02112345567",
+    "pones": "00012234",
+    "oficiales": "20001123346678",
+    "víctima": "02112345567",
+    "malos": "00012234",
+    "barrio": "00012246",
+    "oferta": "10001123456",
+    "desgraciado": "200123566799:;",
+    "resultado": "20012234567789",
+    "responsabilidad": "5001234567889::;<<=>",
+    "entró": "15201245",
+    "combate": "10012345567",
+    "fría": "03123334",
+    "tormenta": "10012345678",
+    "hablaba": "10012245567",
+    "oíste": "12201112345",
+    "llamé": "15223345",
+    "olor": "10001123",
+    "cantidad": "20012345567",
+    "bala": "00012234",
+    "importantes": "2000123456789:",
+    "grandioso": "10023457789",
+    "kilómetros": "14212234456689",
+    "querían": "15223345556",
+    "débil": "02112234",
+    "laboratorio": "3001223445667889;",
+    "fumar": "10012234",
+    "entrenador": "30001245567789",
+    "llamando": "10023345678",
+    "premio": "00023346",
+    "conseguido": "2001234557889:",
+    "bordo": "00012345",
+    "agujero": "20001123345567",
+    "escuchando": "2000123446789:",
+    "escribió": "28301245568",
+    "asustado": "20001123456678",
+    "invitado": "20001234456678",
+    "mapa": "00012234",
+    "tenia": "00012235",
+    "granja": "00023456",
+    "viniste": "10012234567",
+    "jurado": "10012234456",
+    "profundo": "10023345678",
+    "tomé": "14212234",
+    "alemania": "20001123345568",
+    "seguros": "10012234456",
+    "conocen": "10012234456",
+    "pastel": "10012345",
+    "americanos": "30001123345567789",
+    "privado": "10023345567",
+    "lunes": "00012234",
+    "directamente": "30012234567789:;<",
+    "socio": "00012235",
+    "robado": "10012234456",
+    "explicar": "20001245567",
+    "necesidad": "30012234456678",
+    "juegos": "00013345",
+    "importancia": "2000123456789;",
+    "corriente": "10012246789",
+    "habido": "10012234456",
+    "derechos": "10012234467",
+    "leído": "13212223345",
+    "llegará": "27323345567",
+    "desierto": "10012235678",
+    "modelo": "10012234456",
+    "invierno": "10001235678",
+    "plata": "00023345",
+    "apoyo": "10001123335",
+    "iban": "00001123",
+    "maté": "14212234",
+    "tercer": "10012345",
+    "obviamente": "2000123556789:",
+    "tomaré": "26312234456",
+    "recién": "15212235",
+    "árboles": "01101234456",
+    "techo": "00012245",
+    "blancos": "00023456",
+    "haberme": "10012234567",
+    "tomo": "00012234",
+    "campeón": "26312345556",
+    "salón": "14212234",
+    "últimamente": "011012344566789:;",
+    "relaciones": "20012234457789",
+    "cura": "00012234",
+    "escenario": "20001234456679",
+    "cobarde": "10012234567",
+    "tercera": "10012345567",
+    "quedas": "00023345",
+    "usando": "10001123456",
+    "aseguro": "20001123345567",
+    "ex": "00001",
+    "vieron": "00013345",
+    "obtener": "20001234456",
+    "entera": "10001234456",
+    "quedará": "27323345567",
+    "leo": "00012223",
+    "créeme": "03123334456",
+    "secretos": "10012245567",
+    "pecho": "00012245",
+    "mentiras": "10012345567",
+    "sienta": "00013456",
+    "guste": "00012345",
+    "esquina": "10001245567",
+    "primeros": "10023345567",
+    "sensación": "28312345568",
+    "ciego": "00013345",
+    "fábrica": "02112245567",
+    "sabido": "10012234456",
+    "dirá": "14212234",
+    "corta": "00012345",
+    "artista": "10001234567",
+    "recuerdos": "10012235678",
+    "pescado": "10012345567",
+    "dígale": "02112234456",
+    "sepas": "00012234",
+    "íbamos": "01101123345",
+    "desaparecido": "4001223445667889::;<",
+    "reino": "00013345",
+    "piloto": "10012234456",
+    "harías": "14212234445",
+    "andando": "10001234567",
+    "veinte": "00013456",
+    "vives": "00012234",
+    "vimos": "00012234",
+    "muchísimo": "15212245567789",
+    "seria": "00012235",
+    "preguntaba": "2002334567889:",
+    "viven": "00012234",
+    "almuerzo": "10001235678",
+    "puedan": "00013345",
+    "romper": "10012345",
+    "discutir": "20012345567",
+    "correo": "10012245556",
+    "condiciones": "2001234556889:",
+    "levanta": "10012234567",
+    "suficientemente": "4001223445789::;<=>?",
+    "montañas": "10012345567",
+    "mataste": "10012234567",
+    "disculpas": "10012345678",
+    "corto": "00012345",
+    "olvida": "10001234456",
+    "violencia": "10013345679",
+    "perdiendo": "10012346789",
+    "dejan": "00012234",
+    "presencia": "10023345679",
+    "pasan": "00012234",
+    "poquito": "10012245567",
+    "quítate": "03123345567",
+    "fuertes": "00013456",
+    "serie": "00012235",
+    "labios": "00012235",
+    "caray": "10012235",
+    "intentarlo": "2000123456789:",
+    "desapareció": "4;51223445667889;",
+    "termine": "10012345567",
+    "esperas": "10001234456",
+    "llego": "00023345",
+    "teoría": "25312223345556",
+    "daría": "14212234445",
+    "esperamos": "20001234456678",
+    "enfermera": "20001234567789",
+    "siglo": "00012245",
+    "escuchado": "20001234467789",
+    "tamaño": "10012234456",
+    "mio": "00013",
+    "disculpen": "10012345678",
+    "virgen": "00012345",
+    "manejar": "20012234456",
+    "muévanse": "03113345678",
+    "propios": "00023346",
+    "míos": "02112223",
+    "truco": "00023345",
+    "vivos": "00012234",
+    "disco": "00012345",
+    "contó": "15212345",
+    "milagro": "10012234467",
+    "crear": "10023334",
+    "pelota": "10012234456",
+    "cuerpos": "00013456",
+    "cientos": "00013456",
+    "vaso": "00012234",
+    "despues": "00012346",
+    "universo": "20001123345678",
+    "gira": "00012234",
+    "salvaje": "10012345567",
+    "elegir": "20001123345",
+    "escucho": "10001234467",
+    "curso": "00012345",
+    "trabajas": "10023345567",
+    "decirles": "10012234567",
+    "firma": "00012345",
+    "acabas": "10001123345",
+    "herida": "10012234456",
+    "queso": "00023345",
+    "pequeñas": "10012245567",
+    "esperan": "10001234456",
+    "limpiar": "10012346",
+    "déjenme": "02112234567",
+    "solas": "00012234",
+    "parado": "10012234456",
+    "magia": "00012235",
+    "casada": "10012234456",
+    "compré": "16212356",
+    "campamento": "2001234556789:",
+    "mentiroso": "20012345567789",
+    "dispuesto": "10012346789",
+    "firme": "00012345",
+    "pondré": "16212356",
+    "estómago": "14201234456678",
+    "regrese": "10012245567",
+    "vacío": "14212234445",
+    "casarme": "10012234567",
+    "tira": "00012234",
+    "torre": "00012245",
+    "destruir": "10012357",
+    "frontera": "10023456678",
+    "huellas": "00013356",
+    "quedaré": "27323345567",
+    "aquello": "10001134467",
+    "antiguo": "10001234457",
+    "suéltame": "03113456678",
+    "relájate": "14212234456678",
+    "judíos": "14212234445",
+    "aviones": "10001124456",
+    "cadáver": "14212234456",
+    "autos": "00002234",
+    "millas": "00012245",
+    "pudiste": "10012234567",
+    "cierta": "00013456",
+    "dioses": "00013345",
+    "comido": "10012234456",
+    "leyes": "00012224",
+    "vivía": "14212234445",
+    "emperador": "30001234456678",
+    "pregunté": "28323345678",
+    "cigarrillo": "2001223446779:",
+    "helado": "10012234456",
+    "miembro": "00013467",
+    "felicidades": "3001223445667889:",
+    "consigue": "10012345578",
+    "mires": "00012234",
+    "paciencia": "10012235679",
+    "apúrate": "13201123345567",
+    "ayudarle": "20001113345678",
+    "ó": "01101",
+    "discúlpeme": "1521234567889:",
+    "sigan": "00012234",
+    "traigo": "00024456",
+    "cristo": "00023456",
+    "superior": "20012234457",
+    "dudo": "00012234",
+    "invitados": "20001234456678",
+    "confía": "15212345556",
+    "estudiar": "20001234457",
+    "piense": "00013456",
+    "encantador": "30001234567789",
+    "felicitaciones": "4001223445667889;;<=",
+    "disparo": "10012345567",
+    "sobrevivir": "30012245567789",
+    "miras": "00012234",
+    "lío": "02112223",
+    "intentado": "20001234567789",
+    "primavera": "20023345567789",
+    "intenté": "27301234567",
+    "ricos": "00012234",
+    "encontraste": "200012345789:;",
+    "proceso": "10023345567",
+    "sujeto": "10012234456",
+    "rápidamente": "021122344566789:;",
+    "respirar": "20012345567",
+    "acciones": "10001235567",
+    "gobernador": "30012234567789",
+    "poniendo": "10012235678",
+    "proteger": "20023345567",
+    "ciencia": "00013457",
+    "conde": "00012345",
+    "pura": "00012234",
+    "viajar": "10013345",
+    "números": "02112234456",
+    "miembros": "00013467",
+    "sospechoso": "2001234557889:",
+    "podías": "14212234445",
+    "sopa": "00012234",
+    "adonde": "10001123456",
+    "escribe": "10001245567",
+    "llevaron": "10023345567",
+    "juega": "00013345",
+    "limpia": "00012346",
+    "canciones": "10012346678",
+    "trabajaba": "20023345567789",
+    "droga": "00023345",
+    "orgullo": "10001234467",
+    "discurso": "10012345678",
+    "pecado": "10012234456",
+    "llegaron": "10023345567",
+    "tarea": "10012234445",
+    "encantadora": "300012345677899:;",
+    "enviado": "10001235567",
+    "volviendo": "10012346789",
+    "compras": "00012356",
+    "cheque": "00023356",
+    "huir": "00013",
+    "caído": "13212223345",
+    "seguimos": "10012245567",
+    "hablaré": "27312245567",
+    "recoger": "20012234456",
+    "casos": "00012234",
+    "desgracia": "10012356679",
+    "asesinado": "30001123345567789",
+    "crea": "00023334",
+    "revista": "10012234567",
+    "vean": "00012223",
+    "averiguar": "30001123345568",
+    "palacio": "10012234457",
+    "contado": "10012345567",
+    "amistad": "20001123456",
+    "bola": "00012234",
+    "educación": "38401123345568",
+    "enamorada": "30001123345567789",
+    "centavos": "10012345567",
+    "quedamos": "10023345567",
+    "llorando": "10023345678",
+    "taza": "00012234",
+    "efectivo": "20001123456678",
+    "construir": "10012468",
+    "madera": "10012234456",
+    "gustas": "00012345",
+    "hablaremos": "20012245567789",
+    "amenaza": "20001123345567",
+    "mono": "00012234",
+    "falso": "00012345",
+    "conseguí": "28312345578",
+    "detener": "20012234456",
+    "pensamos": "10012345567",
+    "libres": "00012245",
+    "periódicos": "15212235567789",
+    "habíamos": "14212234445567",
+    "ocasión": "26301123346",
+    "personalmente": "3001234556789:;<=",
+    "casar": "10012234",
+    "bebida": "10012234456",
+    "fuente": "00013456",
+    "estudiante": "2000123445789:",
+    "consigo": "10012345567",
+    "pájaro": "02112234456",
+    "sencillo": "10012345578",
+    "dejarme": "10012234567",
+    "cuida": "00013345",
+    "pensó": "15212345",
+    "lección": "16212346",
+    "notas": "00012234",
+    "examen": "10001123345",
+    "evidencia": "20001123345679",
+    "empezamos": "20001234456678",
+    "normalmente": "200123456789:;",
+    "indios": "00001235",
+    "sonrisa": "10012345567",
+    "cortar": "10012345",
+    "venía": "14212234445",
+    "uniforme": "20001123345678",
+    "iguales": "10001124456",
+    "cerrada": "10012245567",
+    "solución": "27312234457",
+    "vernos": "00012345",
+    "conciencia": "1001234678:",
+    "bolsillo": "10012345578",
+    "suave": "00013345",
+    "cuantos": "00013456",
+    "queréis": "15223346",
+    "enviar": "10001235",
+    "cero": "00012234",
+    "caminando": "20012234456789",
+    "balas": "00012234",
+    "seremos": "10012234456",
+    "testigos": "10012345567",
+    "tropas": "00023345",
+    "alteza": "10001234456",
+    "protección": "29323345679",
+    "vueltas": "00013456",
+    "aparte": "10001123456",
+    "venganza": "10012345678",
+    "comisario": "20012234456679",
+    "saco": "00012234",
+    "ritmo": "00012345",
+    "cruz": "00023",
+    "abran": "00001134",
+    "familias": "10012234457",
+    "lobo": "00012234",
+    "amar": "10001123",
+    "salgamos": "10012345567",
+    "mintiendo": "10012346789",
+    "estudiantes": "2000123445789:",
+    "pintura": "10012345567",
+    "esfuerzo": "10001235678",
+    "espejo": "10001234456",
+    "encontraremos": "3000123457889::;<",
+    "volví": "15212345",
+    "daba": "00012234",
+    "bestia": "00012346",
+    "camarada": "20012234456678",
+    "muriendo": "10012235678",
+    "matarte": "10012234567",
+    "médicos": "02112234456",
+    "decírselo": "14212234567789",
+    "pierde": "00013456",
+    "dejaron": "10012234456",
+    "aléjate": "13201123345567",
+    "inteligencia": "300012344566789:<",
+    "curioso": "10012235567",
+    "declaración": "3:41224556778:",
+    "dímelo": "02112234456",
+    "aburrido": "20001123356678",
+    "artículo": "14201234456678",
+    "váyase": "02112224456",
+    "dejamos": "10012234456",
+    "regla": "00012245",
+    "criatura": "10024456678",
+    "contenta": "10012345678",
+    "gritar": "10023345",
+    "diversión": "28312234568",
+    "llamadas": "10023345567",
+    "aparece": "20001123345567",
+    "chaqueta": "10023356678",
+    "compra": "00012356",
+    "excelencia": "2000123445678:",
+    "nerviosa": "10012346678",
+    "pongas": "00012345",
+    "abra": "00001134",
+    "hacerse": "10012234567",
+    "vecinos": "10012234456",
+    "camioneta": "20012235567789",
+    "azúcar": "13201123345",
+    "vuelves": "00013456",
+    "colega": "10012234456",
+    "traeré": "26323334456",
+    "amaba": "10001123345",
+    "amigas": "10001123345",
+    "volveremos": "20012345567789",
+    "harto": "00012345",
+    "feo": "00012223",
+    "pedirle": "10012234567",
+    "pasamos": "10012234456",
+    "empecé": "26301234456",
+    "cadena": "10012234456",
+    "judío": "14212234445",
+    "flor": "00023",
+    "murieron": "10012235567",
+    "sabrá": "15212245",
+    "cuerda": "00013456",
+    "supiera": "10012235567",
+    "pez": "00012",
+    "matarlo": "10012234567",
+    "pérdida": "02112345567",
+    "guarda": "00013456",
+    "antigua": "10001234457",
+    "recuperar": "30012234456678",
+    "promesa": "10023345567",
+    "apuesta": "10001124567",
+    "rara": "00012234",
+    "amén": "13201123",
+    "temporada": "20012345567789",
+    "convertido": "2001234567889:",
+    "diles": "00012234",
+    "preguntó": "28323345678",
+    "podéis": "14212235",
+    "leí": "13212223",
+    "volvamos": "10012345567",
+    "humanidad": "30012234456678",
+    "datos": "00012234",
+    "pocas": "00012234",
+    "vengas": "00012345",
+    "asesinos": "20001123345567",
+    "maravilla": "20012234456689",
+    "maleta": "10012234456",
+    "descubrir": "20012345578",
+    "arena": "10001123345",
+    "tuvieron": "10012235567",
+    "muera": "00013345",
+    "doce": "00012234",
+    "consiguió": "29312345579",
+    "llegas": "00023345",
+    "mina": "00012234",
+    "guardias": "00013457",
+    "vinieron": "10012235567",
+    "salimos": "10012234456",
+    "tontería": "27312345567778",
+    "preocupada": "3002333445667889:",
+    "fueran": "00013345",
+    "honesto": "10012234567",
+    "iría": "13201123334",
+    "oso": "00001123",
+    "miel": "00013",
+    "robó": "14212234",
+    "bombas": "00012345",
+    "pesadilla": "20012234456689",
+    "funcionar": "20012346678",
+    "acaban": "10001123345",
+    "tirar": "10012234",
+    "huesos": "00013345",
+    "enojado": "20001123345567",
+    "maneras": "10012234456",
+    "sombra": "00012356",
+    "muñeca": "10012234456",
+    "canal": "10012234",
+    "planta": "00023456",
+    "visión": "15212235",
+    "asqueroso": "20001245567789",
+    "cumplir": "10012356",
+    "escuchas": "10001234467",
+    "calla": "00012245",
+    "vivimos": "10012234456",
+    "agentes": "10001123456",
+    "personaje": "20012345567789",
+    "muero": "00013345",
+    "mostrar": "10012356",
+    "canta": "00012345",
+    "precisamente": "30023345567789:;<",
+    "moda": "00012234",
+    "encuentre": "10001235689",
+    "pasos": "00012234",
+    "útil": "01101123",
+    "revolución": "39412234456679",
+    "hazme": "00012345",
+    "hermanas": "10012345567",
+    "impresión": "28301245568",
+    "pienses": "00013456",
+    "compartir": "20012345678",
+    "tierras": "00013356",
+    "paquete": "10012245567",
+    "imaginar": "30001123345567",
+    "resolver": "20012234567",
+    "comunidad": "30012234456678",
+    "quedé": "15223345",
+    "nació": "15212235",
+    "nadar": "10012234",
+    "acabamos": "20001123345567",
+    "senador": "20012234456",
+    "ocupada": "20001123345567",
+    "chino": "00023345",
+    "favorito": "20012234456678",
+    "errores": "10001134456",
+    "humo": "00012234",
+    "sótano": "02112234456",
+    "julio": "00012235",
+    "venta": "00012345",
+    "sorprende": "10012356789",
+    "ponen": "00012234",
+    "fresco": "00023456",
+    "salí": "14212234",
+    "pasaba": "10012234456",
+    "completa": "10012356678",
+    "comiendo": "10012235678",
+    "bolso": "00012345",
+    "meter": "10012234",
+    "búsqueda": "02112356678",
+    "tratado": "10023345567",
+    "rodillas": "10012234467",
+    "nacido": "10012234456",
+    "licencia": "10012234568",
+    "confío": "15212345556",
+    "magnífico": "15212345567789",
+    "necesitar": "30012234456678",
+    "nación": "15212235",
+    "caza": "00012234",
+    "plato": "00023345",
+    "fecha": "00012245",
+    "vivido": "10012234456",
+    "preguntarte": "200233456789:;",
+    "hablarle": "10012245678",
+    "méxico": "02112234456",
+    "escaleras": "20001234456678",
+    "cambió": "16212346",
+    "servir": "10012345",
+    "importaría": "3940123456778999:",
+    "crédito": "03123345567",
+    "aguanta": "10001124567",
+    "pidiendo": "10012235678",
+    "responder": "20012345678",
+    "soportar": "20012234567",
+    "puro": "00012234",
+    "ira": "00001123",
+    "despierto": "10012346789",
+    "llegan": "00023345",
+    "bruja": "00023345",
+    "complicado": "2001235667889:",
+    "cuídate": "03113345567",
+    "váyanse": "02112224567",
+    "casualidad": "30012235567789",
+    "tengamos": "10012345567",
+    "castigo": "10012345567",
+    "dijera": "10012234456",
+    "amanecer": "30001123345567",
+    "máximo": "02112234456",
+    "verlos": "00012345",
+    "refiere": "10012235567",
+    "cuáles": "03113345",
+    "resultados": "20012234567789",
+    "mirad": "10012234",
+    "dispara": "10012345567",
+    "clara": "00023345",
+    "manda": "00012345",
+    "deseos": "10012234445",
+    "okay": "10001124",
+    "computadora": "300123455677899:;",
+    "víctimas": "02112345567",
+    "deme": "00012234",
+    "naturalmente": "30012234456789:;<",
+    "llevarte": "10023345678",
+    "tele": "00012234",
+    "controlar": "20012356678",
+    "suelta": "00013456",
+    "olvide": "10001234456",
+    "juntas": "00012345",
+    "buscas": "00012345",
+    "título": "02112234456",
+    "propias": "00023346",
+    "estudios": "10001234457",
+    "jueves": "00013345",
+    "preparados": "20023345567789",
+    "entrevista": "2000124556789:",
+    "matando": "10012234567",
+    "despacho": "10012345578",
+    "distinto": "10012345678",
+    "salgo": "00012345",
+    "saltar": "10012345",
+    "concierto": "10012346789",
+    "prisioneros": "2002334667889:",
+    "respira": "10012345567",
+    "adios": "00001124",
+    "decidí": "26312234456",
+    "peces": "00012234",
+    "pieza": "00013345",
+    "quieran": "00024456",
+    "odia": "00001124",
+    "visitar": "20012234456",
+    "perdimos": "10012345567",
+    "comité": "26312234456",
+    "fila": "00012234",
+    "medianoche": "2001223556779:",
+    "parada": "10012234456",
+    "trabajado": "20023345567789",
+    "conseguiste": "200123455789:;",
+    "desearía": "37412234445567778",
+    "decidir": "20012234456",
+    "pedazos": "10012234456",
+    "escalera": "20001234456678",
+    "preguntarle": "200233456789:;",
+    "sabéis": "14212235",
+    "interesado": "3000123445667889:",
+    "seguido": "10012245567",
+    "sección": "16212346",
+    "serlo": "00012345",
+    "seres": "00012234",
+    "vendría": "16212356667",
+    "creemos": "10023334456",
+    "altura": "10001234456",
+    "ganó": "14212234",
+    "empezando": "20001234456789",
+    "documentos": "20012234456789",
+    "compromiso": "2001235667889:",
+    "hecha": "00012245",
+    "vais": "00013",
+    "nuevamente": "2001334556789:",
+    "dulces": "00012345",
+    "martes": "00012345",
+    "trabajos": "10023345567",
+    "caro": "00012234",
+    "dejarte": "10012234567",
+    "equivocada": "3000113445667889:",
+    "amado": "10001123345",
+    "ayudará": "37401113345567",
+    "coches": "00012245",
+    "templo": "00012356",
+    "sabia": "00012235",
+    "metas": "00012234",
+    "esperaré": "38401234456678",
+    "medios": "00012235",
+    "estemos": "10001234456",
+    "guión": "04124",
+    "llamarme": "10023345678",
+    "hubieran": "10012235567",
+    "pensamientos": "200123455689:;",
+    "envía": "14201234445",
+    "encontraré": "3:40123457889:",
+    "treinta": "00024567",
+    "hierba": "00013456",
+    "impresionante": "3000124556889:;<=",
+    "pagado": "10012234456",
+    "italia": "10001123346",
+    "trataba": "10023345567",
+    "volando": "10012234567",
+    "tetas": "00012234",
+    "pagan": "00012234",
+    "pasión": "15212235",
+    "actitud": "20001234456",
+    "cabezas": "10012234456",
+    "prometido": "20023345567789",
+    "clave": "00023345",
+    "acepto": "10001123456",
+    "vuelvan": "00013456",
+    "convirtió": "29312345679",
+    "claramente": "2002334556789:",
+    "preferiría": "3942334556778999:",
+    "acusado": "20001123345567",
+    "llegando": "10023345678",
+    "lágrimas": "02112245567",
+    "agencia": "10001123457",
+    "dias": "00013",
+    "ponerme": "10012234567",
+    "quita": "00023345",
+    "gustado": "10012345567",
+    "casados": "10012234456",
+    "suicidio": "10013345568",
+    "siguiendo": "10012246789",
+    "gasolina": "20012234456678",
+    "jugador": "20012234456",
+    "encontrarlo": "200012345789:;",
+    "encargo": "10001234567",
+    "puerto": "00013456",
+    "urgente": "10001234567",
+    "tomen": "00012234",
+    "rusia": "00012235",
+    "elegante": "20001123345678",
+    "copia": "00012235",
+    "especiales": "20001234457789",
+    "fiestas": "00013456",
+    "aventura": "20001123456678",
+    "entrenamiento": "3000124556778:;<=",
+    "rompió": "16212346",
+    "océano": "13201123334456",
+    "ruta": "00012234",
+    "abandonar": "30001123456678",
+    "paraíso": "25312234445567",
+    "guía": "03123334",
+    "curiosidad": "30012235567789",
+    "salen": "00012234",
+    "responde": "10012345678",
+    "apetece": "20001123345567",
+    "preguntado": "2002334567889:",
+    "encantada": "20001234567789",
+    "fotografía": "3941223446778999:",
+    "poderoso": "20012234456678",
+    "mantiene": "10012346678",
+    "ladrones": "10012245567",
+    "intentó": "27301234567",
+    "sed": "00012",
+    "perdida": "10012345567",
+    "regalos": "10012234456",
+    "imágenes": "13201123345567",
+    "encanto": "10001234567",
+    "permitir": "20012345567",
+    "alerta": "10001123456",
+    "elegido": "20001123345567",
+    "caras": "00012234",
+    "digan": "00012234",
+    "extranjero": "2000124567889:",
+    "rata": "00012234",
+    "instituto": "20001345567789",
+    "convierte": "10012346789",
+    "asco": "00001234",
+    "sales": "00012234",
+    "rica": "00012234",
+    "mayores": "10012224456",
+    "adoro": "10001123345",
+    "impuestos": "10001235678",
+    "debiste": "10012234567",
+    "llamamos": "10023345567",
+    "piscina": "10012345567",
+    "tomamos": "10012234456",
+    "sacado": "10012234456",
+    "sufrir": "10012245",
+    "cómodo": "02112234456",
+    "aviso": "10001123345",
+    "campos": "00012345",
+    "damos": "00012234",
+    "casarte": "10012234567",
+    "existen": "10001123456",
+    "rusos": "00012234",
+    "pagaré": "26312234456",
+    "acabe": "10001123345",
+    "ambulancia": "2000123445678:",
+    "aprendido": "20001134567789",
+    "bendiga": "10012345567",
+    "llegaste": "10023345678",
+    "grado": "00023345",
+    "servicios": "10012345568",
+    "verán": "14212234",
+    "vaca": "00012234",
+    "territorio": "2001224556778:",
+    "buscan": "00012345",
+    "intentaré": "39401234567789",
+    "fácilmente": "0211223456789:",
+    "conocimiento": "30012234456679:;<",
+    "descubierto": "200123455689:;",
+    "darles": "00012345",
+    "llevarme": "10023345678",
+    "estuvimos": "20001234456678",
+    "piedras": "00013356",
+    "reputación": "39412234456679",
+    "perdiste": "10012345678",
+    "imaginación": "4:50112334556778:",
+    "miro": "00012234",
+    "excusa": "10001234456",
+    "últimas": "01101234456",
+    "quédese": "03123345567",
+    "campaña": "10012345567",
+    "parezca": "10012234567",
+    "ayudarlo": "20001113345678",
+    "suficientes": "2001223445789:",
+    "obvio": "00001235",
+    "disparó": "27312345567",
+    "prometí": "27323345567",
+    "subtítulos": "15212345567789",
+    "enseñó": "26301234456",
+    "escritor": "20001245567",
+    "página": "02112234456",
+    "sientas": "00013456",
+    "atrapado": "20001134456678",
+    "autoridad": "30002234456678",
+    "cigarrillos": "2001223446779:",
+    "firmar": "10012345",
+    "japón": "14212234",
+    "paliza": "10012234456",
+    "vuestros": "00013467",
+    "molesto": "10012234567",
+    "recibí": "26312234456",
+    "armario": "10001234457",
+    "instante": "10001345678",
+    "grados": "00023345",
+    "arroz": "10001134",
+    "éstos": "01101234",
+    "cruzar": "10023345",
+    "escribí": "27301245567",
+    "mover": "10012234",
+    "respuestas": "10012346789",
+    "piedad": "10013345",
+    "seamos": "10012223345",
+    "maestra": "10012223467",
+    "líneas": "02112234445",
+    "traiga": "00024456",
+    "comprado": "10012356678",
+    "cámaras": "02112234456",
+    "posibilidades": "4001223445667889::;<",
+    "divorcio": "10012234568",
+    "pasen": "00012234",
+    "prisionero": "2002334667889:",
+    "apareció": "38401123345568",
+    "veas": "00012223",
+    "leyendo": "10012224567",
+    "anterior": "20001234457",
+    "fiebre": "00013356",
+    "déjala": "02112234456",
+    "registro": "10012234578",
+    "ésto": "01101234",
+    "hablarte": "10012245678",
+    "preocuparse": "300233344566789:;",
+    "mueva": "00013345",
+    "decírtelo": "14212234567789",
+    "esposas": "10001234456",
+    "bolas": "00012234",
+    "compró": "16212356",
+    "pacientes": "10012235678",
+    "condición": "28312345568",
+    "acceso": "10001234456",
+    "pasillo": "10012234467",
+    "traes": "00023334",
+    "ciertamente": "200134566789:;",
+    "enseñar": "20001234456",
+    "asistente": "20001123456789",
+    "actriz": "10001245",
+    "tráfico": "03123345567",
+    "nací": "14212234",
+    "faltan": "00012345",
+    "secundaria": "2001223456778:",
+    "chiste": "00023456",
+    "garganta": "10012345678",
+    "asustada": "20001123456678",
+    "creas": "00023334",
+    "enfrente": "10001245678",
+    "museo": "10012234445",
+    "valle": "00012245",
+    "misterio": "10012345568",
+    "podrán": "15212245",
+    "alarma": "10001123456",
+    "encuentran": "10001235689",
+    "ambas": "00001234",
+    "dirás": "14212234",
+    "contesta": "10012345678",
+    "volverás": "27312345567",
+    "cambios": "00012346",
+    "joyas": "00012224",
+    "auxilio": "10002234457",
+    "mantén": "15212345",
+    "zorra": "00012245",
+    "correcta": "10012245678",
+    "sucedido": "20012234456678",
+    "francos": "00023456",
+    "entrega": "10001245567",
+    "ventanas": "10012345567",
+    "ruso": "00012234",
+    "celda": "00012345",
+    "roca": "00012234",
+    "escuchaste": "2000123446789:",
+    "golpes": "00012345",
+    "áfrica": "01101134456",
+    "paredes": "10012234456",
+    "ganador": "20012234456",
+    "cubierta": "10012235678",
+    "mírate": "02112234456",
+    "reales": "10012223345",
+    "serpiente": "10012346789",
+    "biblia": "00012246",
+    "escapó": "26301234456",
+    "metro": "00012245",
+    "terreno": "10012245567",
+    "cuantas": "00013456",
+    "querrá": "16223356",
+    "sacó": "14212234",
+    "meta": "00012234",
+    "fantasmas": "10012345678",
+    "adorable": "20001123345578",
+    "tontos": "00012345",
+    "alegre": "10001123356",
+    "explosión": "28301245568",
+    "cuán": "03113",
+    "corazones": "20012234456678",
+    "deseas": "10012234445",
+    "podían": "14212234445",
+    "berlín": "15212345",
+    "suceder": "20012234456",
+    "circunstancias": "20012345789:;=",
+    "prohibido": "10025567789",
+    "pesado": "10012234456",
+    "celular": "20012234456",
+    "recuerde": "10012235678",
+    "puestos": "00013456",
+    "ambiente": "10001235678",
+    "lograr": "10012245",
+    "entendí": "27301234567",
+    "dejará": "26312234456",
+    "privada": "10023345567",
+    "bebiendo": "10012235678",
+    "dudas": "00012234",
+    "comprendes": "10012356789",
+    "botas": "00012234",
+    "pene": "00012234",
+    "costumbre": "10012345689",
+    "habia": "00012235",
+    "cuadro": "00013356",
+    "experto": "10001234567",
+    "llamaste": "10023345678",
+    "veneno": "10012234456",
+    "partida": "10012345567",
+    "conocimos": "20012234456678",
+    "mostraré": "28312356678",
+    "regresó": "27312245567",
+    "pájaros": "02112234456",
+    "señales": "10012234456",
+    "queríamos": "15223345556678",
+    "bandera": "10012345567",
+    "junta": "00012345",
+    "ciertas": "00013456",
+    "decidió": "27312234457",
+    "combustible": "200123456788:;",
+    "recompensa": "2001223456789:",
+    "organización": "4;50123445667889;",
+    "pensamiento": "200123455689:;",
+    "irán": "13201123",
+    "cáncer": "02112345",
+    "ponerse": "10012234567",
+    "entienden": "10001235678",
+    "deuda": "00013345",
+    "llames": "00023345",
+    "raza": "00012234",
+    "extraños": "10001245567",
+    "juventud": "20012234567",
+    "crecer": "10023345",
+    "comportamiento": "3001234567889;<=>",
+    "reír": "13212223",
+    "rescate": "10012345567",
+    "estarías": "26301234456667",
+    "abogados": "20001123345567",
+    "repito": "10012234456",
+    "vuelven": "00013456",
+    "igualmente": "2000112456789:",
+    "montar": "10012345",
+    "plaza": "00023345",
+    "poca": "00012234",
+    "sentimiento": "200123455689:;",
+    "rumbo": "00012345",
+    "pata": "00012234",
+    "asusta": "10001123456",
+    "decente": "10012234567",
+    "producción": "29323345679",
+    "traté": "15223345",
+    "nacimiento": "2001223445789:",
+    "pondrá": "16212356",
+    "aldea": "10001234445",
+    "parezco": "10012234567",
+    "letra": "00012245",
+    "llevarlo": "10023345678",
+    "echa": "00001134",
+    "biblioteca": "2001224667889:",
+    "marco": "00012345",
+    "explicación": "3:40124556778:",
+    "volvemos": "10012345567",
+    "exterior": "20001234457",
+    "aprendí": "27301134567",
+    "incendio": "10001234568",
+    "atacar": "20001123345",
+    "unión": "14201124",
+    "colores": "10012234456",
+    "desagradable": "300122344677899;<",
+    "apuestas": "10001124567",
+    "distrito": "10012356678",
+    "intentas": "10001234567",
+    "actores": "10001234456",
+    "apellido": "20001123356678",
+    "encantan": "10001234567",
+    "podíamos": "14212234445567",
+    "patio": "00012235",
+    "comercial": "20012234568",
+    "cargos": "00012345",
+    "lentamente": "2001234556789:",
+    "ayudarnos": "20001113345678",
+    "diamantes": "10013345678",
+    "cuéntame": "03113456678",
+    "hijas": "00012234",
+    "mismas": "00012345",
+    "ducha": "00012245",
+    "preparar": "20023345567",
+    "trató": "15223345",
+    "fíjate": "02112234456",
+    "conocerlo": "20012234456789",
+    "mayo": "00012224",
+    "ayudante": "20001113345678",
+    "italiano": "20001123346678",
+    "sabían": "14212234445",
+    "camina": "10012234456",
+    "saludos": "10012234456",
+    "discúlpame": "1521234567889:",
+    "comprender": "20012356789",
+    "matará": "26312234456",
+    "pantalla": "10012345578",
+    "ilegal": "20001123345",
+    "éstas": "01101234",
+    "morirá": "26312234456",
+    "encontrará": "3:40123457889:",
+    "colina": "10012234456",
+    "porquería": "28312356678889",
+    "tranquilos": "10023467789",
+    "cementerio": "2001223456778:",
+    "permítame": "15212345567789",
+    "alas": "00001123",
+    "as": "00001",
+    "habitaciones": "300122344566799:;",
+    "regresaré": "39412245567789",
+    "conductor": "20012345678",
+    "arreglado": "20001134467789",
+    "esperado": "20001234456678",
+    "recibió": "27312234457",
+    "guardar": "10013456",
+    "gritando": "10023345678",
+    "periodista": "2001223556789:",
+    "emocionante": "300011233466789:;",
+    "lento": "00012345",
+    "tripulación": "3:42334556778:",
+    "afortunado": "3000112345667889:",
+    "buscamos": "10012345567",
+    "difíciles": "14212234456678",
+    "sacaste": "10012234567",
+    "usado": "10001123345",
+    "estupidez": "30001234456678",
+    "circo": "00012345",
+    "trabajadores": "300233455677899:;",
+    "quince": "00023456",
+    "cerdos": "00012345",
+    "poderes": "10012234456",
+    "demostrar": "20012234578",
+    "león": "13212223",
+    "orgullosa": "20001234467789",
+    "baila": "00013345",
+    "mentir": "10012345",
+    "ocurra": "10001123356",
+    "aliento": "10001124567",
+    "ocurrir": "20001123356",
+    "tendrías": "16212356667",
+    "patrón": "15212245",
+    "olvidó": "26301234456",
+    "ron": "00012",
+    "ciento": "00013456",
+    "adivina": "20001123345567",
+    "equipaje": "20001134456678",
+    "doctora": "10012345567",
+    "salsa": "00012345",
+    "escritorio": "2000124556778:",
+    "cierre": "00013356",
+    "ciudadanos": "20013345567789",
+    "cajas": "00012234",
+    "traidor": "10024456",
+    "quedes": "00023345",
+    "hagámoslo": "14212234456789",
+    "carter": "10012345",
+    "alquiler": "20001245567",
+    "instrucciones": "2000135678::;<",
+    "atreves": "10001134456",
+    "entren": "00001245",
+    "ponerte": "10012234567",
+    "pensaste": "10012345678",
+    "práctica": "03123456678",
+    "viniendo": "10012235678",
+    "usan": "00001123",
+    "motivos": "10012234456",
+    "pusieron": "10012235567",
+    "empezado": "20001234456678",
+    "españa": "10001234456",
+    "haberle": "10012234567",
+    "celebrar": "20012234467",
+    "trajiste": "10023345678",
+    "duque": "00012245",
+    "límite": "02112234456",
+    "arresto": "10001134567",
+    "eva": "00001123",
+    "huevo": "00013345",
+    "rápida": "02112234456",
+    "permanecer": "30012345567789",
+    "superficie": "2001223456778:",
+    "tono": "00012234",
+    "enseñaré": "38401234456678",
+    "salta": "00012345",
+    "suponía": "26312234456667",
+    "máquinas": "02112245567",
+    "criminales": "20023345567789",
+    "aparentemente": "4000112334567889:;<=",
+    "condado": "10012345567",
+    "religión": "27312234457",
+    "pasaron": "10012234456",
+    "detenido": "20012234456678",
+    "absurdo": "10001234567",
+    "homicidio": "20012234456679",
+    "asesinatos": "30001123345567789",
+    "cultura": "10012345567",
+    "ceremonia": "20012234456679",
+    "salvó": "15212345",
+    "punta": "00012345",
+    "gilipollas": "20012234456689",
+    "pelotas": "10012234456",
+    "anuncio": "10001123457",
+    "mínimo": "02112234456",
+    "nubes": "00012234",
+    "gigante": "10012234567",
+    "gané": "14212234",
+    "presentar": "20023345678",
+    "sacerdote": "20012234567789",
+    "sabría": "15212245556",
+    "charla": "00023456",
+    "sentarse": "10012345678",
+    "dirige": "10012234456",
+    "americana": "30001123345567789",
+    "coincidencia": "200134566789:<",
+    "ratas": "00012234",
+    "venid": "10012234",
+    "carácter": "14212234567",
+    "llévame": "03123345567",
+    "celoso": "10012234456",
+    "césar": "02112234",
+    "ayudó": "25301113345",
+    "barcos": "00012345",
+    "tenerlo": "10012234567",
+    "sesión": "15212235",
+    "quedarnos": "10023345678",
+    "temas": "00012234",
+    "medida": "10012234456",
+    "vende": "00012345",
+    "almas": "00001234",
+    "sofá": "14212234",
+    "matan": "00012234",
+    "franceses": "10023456678",
+    "tratamiento": "200233455689:;",
+    "despertar": "20012345678",
+    "desaparecer": "4001223445667889:",
+    "acepta": "10001123456",
+    "bello": "00012245",
+    "ayudarla": "20001113345678",
+    "sucia": "00012235",
+    "conexión": "27312234457",
+    "rumores": "10012234456",
+    "sincero": "10012345567",
+    "leyenda": "10012224567",
+    "sugiero": "10012235567",
+    "lenguaje": "10012346678",
+    "perdóneme": "15212345567789",
+    "maletas": "10012234456",
+    "despedida": "20012345567789",
+    "clima": "00023345",
+    "llevando": "10023345678",
+    "indio": "00001235",
+    "vinimos": "10012234456",
+    "vecino": "10012234456",
+    "dólar": "02112234",
+    "querrás": "16223356",
+    "pública": "02112245567",
+    "enfadado": "20001234456678",
+    "barato": "10012234456",
+    "español": "20001234456",
+    "antonio": "10001234457",
+    "putas": "00012234",
+    "escondido": "20001234567789",
+    "bebés": "14212234",
+    "decisiones": "20012234457789",
+    "demasiada": "20012234457789",
+    "fea": "00012223",
+    "condenado": "20012345567789",
+    "reserva": "10012234567",
+    "vuestras": "00013467",
+    "tomará": "26312234456",
+    "asombroso": "20001123467789",
+    "dejame": "10012234456",
+    "pánico": "02112234456",
+    "cogido": "10012234456",
+    "estando": "10001234567",
+    "acero": "10001123345",
+    "asegúrate": "25301123345567789",
+    "tratas": "00023345",
+    "cocinar": "20012234456",
+    "helicóptero": "263122344567899:;",
+    "pasaporte": "20012234456789",
+    "gorda": "00012345",
+    "bicicleta": "20012234467789",
+    "cincuenta": "10012346789",
+    "tíos": "02112223",
+    "falsa": "00012345",
+    "ayudaré": "37401113345567",
+    "aguantar": "20001124567",
+    "suba": "00012234",
+    "hacían": "14212234445",
+    "objeto": "10001234456",
+    "llores": "00023345",
+    "atrapar": "20001134456",
+    "escribiendo": "200012455689:;",
+    "coraje": "10012234456",
+    "aceite": "10001124456",
+    "billete": "10012245567",
+    "publicidad": "30012245567789",
+    "botón": "14212234",
+    "cristal": "10023456",
+    "moneda": "10012234456",
+    "conduce": "10012345567",
+    "apesta": "10001123456",
+    "favorita": "20012234456678",
+    "vacía": "14212234445",
+    "opinas": "10001123345",
+    "japoneses": "20012234456678",
+    "septiembre": "1001234679:",
+    "llegaremos": "20023345567789",
+    "sentimos": "10012345567",
+    "sucediendo": "2001223445789:",
+    "tocando": "10012234567",
+    "abandonado": "3000112345667889:",
+    "petróleo": "15212245567778",
+    "archivos": "10001245567",
+    "versión": "16212346",
+    "pozo": "00012234",
+    "echado": "10001134456",
+    "ciudades": "10013345567",
+    "ventaja": "10012345567",
+    "dormitorio": "2001234556778:",
+    "prima": "00023345",
+    "cartera": "10012345567",
+    "muro": "00012234",
+    "mediodía": "27312235567778",
+    "pasas": "00012234",
+    "romántico": "14212234567789",
+    "mueren": "00013345",
+    "funcionó": "28312346678",
+    "maten": "00012234",
+    "alcance": "10001234567",
+    "supo": "00012234",
+    "internacional": "4000123456778::;<",
+    "preocuparte": "300233344566789:;",
+    "competencia": "2001234556789;",
+    "quitar": "10023345",
+    "esclavos": "10001245567",
+    "escándalo": "14201234567789",
+    "metió": "15212235",
+    "tecnología": "3941234556778999:",
+    "verdaderamente": "400123455677899:;<=>",
+    "mete": "00012234",
+    "baje": "00012234",
+    "sobrino": "10012245567",
+    "principios": "10023456679",
+    "ruedas": "00013345",
+    "visitas": "10012234456",
+    "división": "27312234457",
+    "mensajes": "10012345567",
+    "desconocido": "300123455677899:;",
+    "ascensor": "20001234567",
+    "oyó": "13201113",
+    "platos": "00023345",
+    "crema": "00023345",
+    "entrado": "10001245567",
+    "hierro": "00013356",
+    "pastor": "10012345",
+    "razonable": "20012234456689",
+    "miércoles": "03113456678",
+    "tráeme": "03123334456",
+    "hombro": "00012356",
+    "comisión": "27312234457",
+    "ayúdenme": "13201113345678",
+    "calidad": "20012234456",
+    "contaré": "27312345567",
+    "identidad": "30001123456678",
+    "apaga": "10001123345",
+    "alli": "00001134",
+    "palo": "00012234",
+    "moto": "00012234",
+    "detalle": "10012234467",
+    "manzana": "10012345567",
+    "dejando": "10012234567",
+    "preguntando": "200233456789:;",
+    "tocado": "10012234456",
+    "decimos": "10012234456",
+    "encontrarás": "3:40123457889:",
+    "conejo": "10012234456",
+    "pensarlo": "10012345678",
+    "agarra": "10001123356",
+    "actuación": "28301235568",
+    "sentada": "10012345567",
+    "obras": "00001134",
+    "buscaba": "10012345567",
+    "nervios": "00012346",
+    "levantar": "20012234567",
+    "conferencia": "2001234556789;",
+    "junio": "00012235",
+    "cantando": "10012345678",
+    "grano": "00023345",
+    "espía": "14201234445",
+    "atractivo": "20001134567789",
+    "intereses": "20001234456678",
+    "vendrán": "16212356",
+    "darnos": "00012345",
+    "novela": "10012234456",
+    "recibo": "10012234456",
+    "resistencia": "2001223456789;",
+    "imagina": "20001123345567",
+    "transporte": "1002356789:",
+    "frase": "00023345",
+    "delicioso": "20012234457789",
+    "infeliz": "20001234456",
+    "mandó": "15212345",
+    "cinturón": "27312345567",
+    "dragón": "15223345",
+    "peores": "10012223345",
+    "científico": "1621345667889:",
+    "empecemos": "20001234456678",
+    "trabajan": "10023345567",
+    "cantante": "10012345678",
+    "pecados": "10012234456",
+    "disparen": "10012345567",
+    "esperanzas": "20001234456789",
+    "rosas": "00012234",
+    "deba": "00012234",
+    "poli": "00012234",
+    "pasajeros": "20012234456678",
+    "almorzar": "20001234567",
+    "buscarlo": "10012345678",
+    "heridas": "10012234456",
+    "pasaría": "26312234456667",
+    "adecuado": "20001123346678",
+    "queridos": "10023345567",
+    "aguas": "00001124",
+    "países": "13212223345",
+    "daremos": "10012234456",
+    "estuvieron": "20001234457789",
+    "pierdes": "00013456",
+    "vía": "02112223",
+    "cometido": "20012234456678",
+    "función": "16212346",
+    "recibe": "10012234456",
+    "industria": "10001234579",
+    "terminé": "27312345567",
+    "oídos": "12201112234",
+    "señoritas": "20012234456678",
+    "corona": "10012234456",
+    "asalto": "10001123456",
+    "flota": "00023345",
+    "billetes": "10012245567",
+    "gustará": "27312345567",
+    "tina": "00012234",
+    "decían": "14212234445",
+    "sitios": "00012235",
+    "sienten": "00013456",
+    "tómalo": "02112234456",
+    "dejaría": "26312234456667",
+    "político": "14212234456678",
+    "esperemos": "20001234456678",
+    "revisar": "20012234456",
+    "imperio": "10001234457",
+    "llegada": "10023345567",
+    "solitario": "20012234456679",
+    "haberse": "10012234567",
+    "refugio": "10012234457",
+    "empiezo": "10001235567",
+    "jesucristo": "2001223446789:",
+    "rubia": "00012235",
+    "criaturas": "10024456678",
+    "pregúntale": "1522334567889:",
+    "cabaña": "10012234456",
+    "militares": "20012234456678",
+    "siglos": "00012245",
+    "sufrimiento": "200122455689:;",
+    "soporto": "10012234567",
+    "expresión": "28301245568",
+    "fiel": "00013",
+    "moscú": "15212345",
+    "prometiste": "2002334556789:",
+    "secretario": "2001224556778:",
+    "cuartel": "10013456",
+    "soñando": "10012234567",
+    "ejercicio": "20001123456679",
+    "fabuloso": "20012234456678",
+    "básicamente": "021122344566789:;",
+    "gritos": "00023345",
+    "espérame": "14201234456678",
+    "gatos": "00012234",
+    "pico": "00012234",
+    "intente": "10001234567",
+    "túnel": "02112234",
+    "arrestado": "20001134567789",
+    "identificación": "5=60112345667889::;=",
+    "viniera": "10012235567",
+    "rastro": "00012356",
+    "secreta": "10012245567",
+    "díselo": "02112234456",
+    "invitación": "39401234456679",
+    "dejemos": "10012234456",
+    "podria": "00012246",
+    "cañón": "14212234",
+    "alguacil": "20001235567",
+    "risa": "00012234",
+    "bonitas": "10012234456",
+    "traigan": "00024456",
+    "gano": "00012234",
+    "conseguiré": "3:41234557889:",
+    "izquierdo": "10001246789",
+    "desnudo": "10012345567",
+    "grupos": "00023345",
+    "policia": "10012234457",
+    "gastos": "00012345",
+    "conoció": "27312234457",
+    "buscado": "10012345567",
+    "trabajamos": "20023345567789",
+    "once": "00001234",
+    "bromeas": "10023345556",
+    "monte": "00012345",
+    "volvería": "27312345567778",
+    "lanza": "00012345",
+    "preciso": "10023345567",
+    "rueda": "00013345",
+    "viejas": "00013345",
+    "breve": "00023345",
+    "hermosas": "10012345567",
+    "despedido": "20012345567789",
+    "descansa": "10012345678",
+    "autoridades": "3000223445667889:",
+    "contestar": "20012345678",
+    "prácticamente": "0312345667889:;<=",
+    "hallar": "10012245",
+    "disfrutar": "20012356678",
+    "sabíamos": "14212234445567",
+    "dámelo": "02112234456",
+    "tanque": "00012356",
+    "vehículo": "14212234456678",
+    "capacidad": "30012234456678",
+    "bailando": "10013345678",
+    "alcanzar": "20001234567",
+    "darán": "14212234",
+    "extrañas": "10001245567",
+    "viuda": "00013345",
+    "salvado": "10012345567",
+    "audiencia": "10002235679",
+    "salvajes": "10012345567",
+    "robaron": "10012234456",
+    "cuales": "00013345",
+    "orejas": "10001123345",
+    "ingleses": "10001245567",
+    "concurso": "10012345678",
+    "alternativa": "300012345677899:;",
+    "comprende": "10012356789",
+    "planeado": "20023345556678",
+    "gallina": "10012245567",
+    "extraordinario": "400012455567899:;;<>",
+    "depósito": "14212234456678",
+    "maricón": "26312234456",
+    "sabrás": "15212245",
+    "ganamos": "10012234456",
+    "egoísta": "24301123334567",
+    "terminamos": "20012345567789",
+    "decirnos": "10012234567",
+    "desnuda": "10012345567",
+    "vestidos": "10012345567",
+    "mandar": "10012345",
+    "tragedia": "10023345568",
+    "armada": "10001234456",
+    "evitarlo": "20001123345678",
+    "recuerden": "10012235678",
+    "círculo": "02112345567",
+    "golpeó": "26312345556",
+    "gafas": "00012234",
+    "profundamente": "3002334567889:;<=",
+    "dispararon": "20012345567789",
+    "olvido": "10001234456",
+    "payaso": "10012224456",
+    "emoción": "26301123346",
+    "borde": "00012345",
+    "casó": "14212234",
+    "tirado": "10012234456",
+    "sensible": "10012345578",
+    "olvídate": "14201234456678",
+    "existencia": "2000112345678:",
+    "unidades": "20001123345567",
+    "luchando": "10012245678",
+    "clínica": "03123345567",
+    "escape": "10001234456",
+    "barón": "14212234",
+    "incidente": "20001234456789",
+    "conté": "15212345",
+    "actual": "10001235",
+    "secretaria": "2001224556778:",
+    "mejorar": "20012234456",
+    "rancho": "00012356",
+    "trate": "00023345",
+    "significado": "300123455677899:;",
+    "famosa": "10012234456",
+    "míralo": "02112234456",
+    "cima": "00012234",
+    "vendido": "10012345567",
+    "temperatura": "300123455677899:;",
+    "equipos": "10001134456",
+    "empiece": "10001235567",
+    "efectos": "10001123456",
+    "terroristas": "2001224556789:",
+    "medias": "00012235",
+    "pasara": "10012234456",
+    "sagrado": "10012245567",
+    "tio": "00013",
+    "física": "02112234456",
+    "reacción": "27312223457",
+    "revés": "14212234",
+    "llamarte": "10023345678",
+    "golpear": "20012345556",
+    "crímenes": "03123345567",
+    "operaciones": "3000112334556889:",
+    "empleados": "20001245556678",
+    "enviaré": "27301235567",
+    "tigre": "00012245",
+    "monedas": "10012234456",
+    "entregar": "20001245567",
+    "aprecio": "10001134457",
+    "carreras": "10012245567",
+    "regresado": "20012245567789",
+    "hablaste": "10012245678",
+    "destrucción": "2:31235678:",
+    "azules": "10001123345",
+    "patrulla": "10012245578",
+    "pagó": "14212234",
+    "marcas": "00012345",
+    "sabor": "10012234",
+    "voces": "00012234",
+    "josé": "14212234",
+    "perdedor": "20012345567",
+    "ensayo": "10001234446",
+    "sueldo": "00013456",
+    "peleas": "10012234445",
+    "nene": "00012234",
+    "construcción": "2;31246789;",
+    "hacías": "14212234445",
+    "entradas": "10001245567",
+    "científicos": "1621345667889:",
+    "delito": "10012234456",
+    "ofrece": "10001134456",
+    "máscara": "02112345567",
+    "guitarra": "10023345578",
+    "figura": "10012234456",
+    "decide": "10012234456",
+    "bebido": "10012234456",
+    "vuela": "00013345",
+    "corran": "00012245",
+    "conseguimos": "2001234557889:",
+    "llamaron": "10023345567",
+    "tranquilízate": "293234677899:;;<=",
+    "rayo": "00012224",
+    "análisis": "13201123345567",
+    "vendedor": "20012345567",
+    "admitir": "20001234456",
+    "consecuencias": "200123455689:<",
+    "cazar": "10012234",
+    "personalidad": "400123455677899:;",
+    "pusiste": "10012234567",
+    "disparos": "10012345567",
+    "llevarla": "10023345678",
+    "estuvieras": "20001234457789",
+    "pongan": "00012345",
+    "traducción": "29323345679",
+    "presenta": "10023345678",
+    "ví": "02112",
+    "profesión": "28323345568",
+    "pastillas": "10012345578",
+    "servirá": "27312345567",
+    "espacial": "20001234457",
+    "ayudo": "10001113345",
+    "sera": "00012234",
+    "cadáveres": "14212234456678",
+    "disponible": "2001234556779:",
+    "voto": "00012234",
+    "entrando": "10001245678",
+    "habilidad": "30012234456678",
+    "galletas": "10012245567",
+    "contando": "10012345678",
+    "costado": "10012345567",
+    "remedio": "10012234457",
+    "déme": "02112234",
+    "aniversario": "3000112334567889;",
+    "generación": "39412234456679",
+    "personales": "20012345567789",
+    "discos": "00012345",
+    "trozo": "00023345",
+    "políticos": "14212234456678",
+    "marica": "10012234456",
+    "caída": "13212223345",
+    "adultos": "10001123456",
+    "sentarme": "10012345678",
+    "encerrado": "20001234467789",
+    "caos": "00012223",
+    "apostar": "20001123456",
+    "llevaremos": "20023345567789",
+    "vendrás": "16212356",
+    "háblame": "02112245567",
+    "súper": "02112234",
+    "habrías": "15212245556",
+    "seguiré": "27312245567",
+    "pudieras": "10012235567",
+    "abrió": "15201135",
+    "peligrosa": "20012234467789",
+    "amantes": "10001123456",
+    "prostituta": "2002345667889:",
+    "probado": "10023345567",
+    "estúpidos": "14201234456678",
+    "pescar": "10012345",
+    "producto": "10023345678",
+    "auténtico": "14202234567789",
+    "condesa": "10012345567",
+    "equivocas": "20001134456678",
+    "estadounidense": "400012344577899:;<=>",
+    "octubre": "10001234467",
+    "poesía": "25312223345556",
+    "heridos": "10012234456",
+    "preparada": "20023345567789",
+    "electricidad": "400011234677899:;",
+    "seguía": "15212245556",
+    "sonríe": "15212345556",
+    "puesta": "00013456",
+    "llevé": "15223345",
+    "moleste": "10012234567",
+    "consciente": "1001245789:",
+    "pasear": "20012234445",
+    "sepan": "00012234",
+    "salieron": "10012235567",
+    "reverendo": "20012234456789",
+    "perdidos": "10012345567",
+    "sacrificio": "2001224556778:",
+    "propuesta": "10023346789",
+    "amarillo": "20001123345578",
+    "logrado": "10012245567",
+    "primeras": "10023345567",
+    "pedirte": "10012234567",
+    "piezas": "00013345",
+    "experimento": "300012344566789:;",
+    "llamen": "00023345",
+    "emociones": "20001123346678",
+    "costó": "15212345",
+    "hojas": "00012234",
+    "serían": "14212234445",
+    "comisaría": "38412234456678889",
+    "hueso": "00013345",
+    "reconozco": "20012234456789",
+    "rocas": "00012234",
+    "héroes": "02112234445",
+    "conocerla": "20012234456789",
+    "barba": "00012345",
+    "daños": "00012234",
+    "tomes": "00012234",
+    "sorprendente": "20012356789:;<",
+    "quédense": "03123345678",
+    "empleado": "20001245556678",
+    "suyos": "00012224",
+    "toro": "00012234",
+    "habrán": "15212245",
+    "olvidaré": "38401234456678",
+    "comunicación": "4;51223445667889;",
+    "prepara": "10023345567",
+    "francesa": "10023456678",
+    "vigilancia": "2001223445678:",
+    "arreglo": "10001134467",
+    "piénsalo": "03113456678",
+    "colegas": "10012234456",
+    "disparado": "20012345567789",
+    "renunciar": "20012234568",
+    "salgas": "00012345",
+    "suele": "00013345",
+    "discusión": "28312345568",
+    "creado": "10023334456",
+    "encargaré": "39401234567789",
+    "habrían": "15212245556",
+    "tuyos": "00012224",
+    "lealtad": "20012223456",
+    "entré": "15201245",
+    "cubierto": "10012235678",
+    "fondos": "00012345",
+    "mereces": "10012234456",
+    "inocentes": "20001123345678",
+    "volviste": "10012345678",
+    "ánimo": "01101123345",
+    "miraba": "10012234456",
+    "usó": "13201123",
+    "empieces": "10001235567",
+    "champán": "16223456",
+    "algun": "00001234",
+    "estupenda": "20001234456789",
+    "convencido": "2001234567889:",
+    "prometió": "28323345568",
+    "enojada": "20001123345567",
+    "harta": "00012345",
+    "nina": "00012234",
+    "serías": "14212234445",
+    "quietos": "00024456",
+    "gustar": "10012345",
+    "necesite": "20012234456678",
+    "salto": "00012345",
+    "preparando": "2002334556789:",
+    "dejarla": "10012234567",
+    "opciones": "10001235567",
+    "cojones": "10012234456",
+    "reyes": "00012224",
+    "cabina": "10012234456",
+    "haberla": "10012234567",
+    "pudimos": "10012234456",
+    "imaginas": "20001123345567",
+    "cercano": "10012345567",
+    "mataría": "26312234456667",
+    "telegrama": "20012234467789",
+    "pregunte": "10023345678",
+    "requiere": "10012246678",
+    "espaldas": "10001234567",
+    "moverse": "10012234567",
+    "fracaso": "10023345567",
+    "santos": "00012345",
+    "guau": "00014",
+    "pierdo": "00013456",
+    "caminos": "10012234456",
+    "falla": "00012245",
+    "anciano": "10001235567",
+    "quedaba": "10023345567",
+    "encargado": "20001234567789",
+    "centavo": "10012345567",
+    "agrada": "10001134456",
+    "ataques": "10001123356",
+    "corbata": "10012345567",
+    "canto": "00012345",
+    "poema": "10012223345",
+    "sano": "00012234",
+    "intentaba": "20001234567789",
+    "pudieron": "10012235567",
+    "bromas": "00023345",
+    "comen": "00012234",
+    "trucos": "00023345",
+    "comes": "00012234",
+    "fantasía": "27312345567778",
+    "pierdas": "00013456",
+    "madres": "00012245",
+    "velas": "00012234",
+    "francamente": "200234566789:;",
+    "japonés": "26312234456",
+    "empezaron": "20001234456678",
+    "plantas": "00023456",
+    "angeles": "10001234456",
+    "tradición": "28323345568",
+    "apropiado": "20001134457789",
+    "informes": "10001234567",
+    "sufrido": "10012245567",
+    "darse": "00012345",
+    "sentirse": "10012345678",
+    "rezar": "10012234",
+    "móvil": "02112234",
+    "sonar": "10012234",
+    "compasión": "28312345568",
+    "siéntense": "03113456789",
+    "viajes": "00013345",
+    "placa": "00023345",
+    "tokio": "00012235",
+    "prestado": "10023456678",
+    "camarero": "20012234456678",
+    "pendejo": "10012345567",
+    "venimos": "10012234456",
+    "collar": "10012245",
+    "defender": "20012234567",
+    "bastardos": "10012345678",
+    "agradecido": "3000113445667889:",
+    "plano": "00023345",
+    "lanzamiento": "200123455689:;",
+    "dijimos": "10012234456",
+    "invito": "10001234456",
+    "maquillaje": "2001224557889:",
+    "almirante": "20001234456789",
+    "aparecer": "30001123345567",
+    "semejante": "20012234456789",
+    "destruido": "10012357789",
+    "lujo": "00012234",
+    "huelga": "00013456",
+    "saque": "00012245",
+    "caridad": "20012234456",
+    "capaces": "10012234456",
+    "bancos": "00012345",
+    "tendríamos": "16212356667789",
+    "atractiva": "20001134567789",
+    "cabrones": "10012245567",
+    "productor": "20023345678",
+    "funcionará": "3:41234667889:",
+    "entenderlo": "2000123456789:",
+    "investigar": "30001234567789",
+    "colección": "28312234568",
+    "jodida": "10012234456",
+    "fama": "00012234",
+    "maíz": "13212223",
+    "cumplido": "10012356678",
+    "gris": "00023",
+    "jovencita": "20012234567789",
+    "onda": "00001234",
+    "ayudado": "20001113345567",
+    "prefiere": "10023346678",
+    "lleven": "00023345",
+    "molestia": "10012234568",
+    "entendiste": "2000123456789:",
+    "advierto": "10001235678",
+    "toman": "00012234",
+    "familiares": "20012234457789",
+    "resultó": "27312234567",
+    "descubrí": "28312345578",
+    "conociste": "20012234456789",
+    "seco": "00012234",
+    "congreso": "10012356678",
+    "cuarenta": "10013345678",
+    "negativo": "20012234456678",
+    "demasiados": "20012234457789",
+    "tuvieras": "10012235567",
+    "traición": "17224457",
+    "multitud": "20012345567",
+    "macho": "00012245",
+    "civiles": "10012234456",
+    "matarán": "26312234456",
+    "tratan": "00023345",
+    "frecuencia": "1002334678:",
+    "sigamos": "10012234456",
+    "lata": "00012234",
+    "mago": "00012234",
+    "béisbol": "02113456",
+    "usas": "00001123",
+    "dejaremos": "20012234456678",
+    "parientes": "10012235678",
+    "pares": "00012234",
+    "elecciones": "20001123457789",
+    "limpieza": "10012346678",
+    "influencia": "1000124678:",
+    "pediste": "10012234567",
+    "listas": "00012345",
+    "malditas": "10012345567",
+    "acabará": "37401123345567",
+    "enhorabuena": "300011344566799:;",
+    "satisfecho": "2001223456779:",
+    "representa": "2001224556789:",
+    "papas": "00012234",
+    "besar": "10012234",
+    "compañera": "20012345567789",
+    "diera": "00013345",
+    "mías": "02112223",
+    "conducta": "10012345678",
+    "fantástica": "1521234567889:",
+    "prefieres": "10023346678",
+    "bebo": "00012234",
+    "rompe": "00012345",
+    "continúe": "27312345567778",
+    "convertirse": "200123456789:;",
+    "idioma": "10001124456",
+    "cueva": "00013345",
+    "quieta": "00024456",
+    "movimientos": "2001223445789:",
+    "batería": "26312234456667",
+    "técnica": "02112345567",
+    "tanques": "00012356",
+    "lleguemos": "10023356678",
+    "explotar": "20001245567",
+    "tomaste": "10012234567",
+    "barra": "00012245",
+    "enfermos": "10001234567",
+    "engañar": "20001234456",
+    "marchar": "10012356",
+    "cargar": "10012345",
+    "intentamos": "20001234567789",
+    "desaparece": "3001223445667889:",
+    "cuentos": "00013456",
+    "sentencia": "10012345679",
+    "deudas": "00013345",
+    "molestar": "20012234567",
+    "rollo": "00012245",
+    "hoja": "00012234",
+    "muebles": "00013356",
+    "escapado": "20001234456678",
+    "largas": "00012345",
+    "encontrarla": "200012345789:;",
+    "malvado": "10012345567",
+    "aérea": "12201112234445",
+    "embajador": "30001234456678",
+    "artistas": "10001234567",
+    "ministerio": "2001223456778:",
+    "funcionando": "200123466789:;",
+    "explica": "10001245567",
+    "comunista": "20012234456789",
+    "bodas": "00012234",
+    "diciembre": "10012235689",
+    "votos": "00012234",
+    "abiertos": "10001124567",
+    "escribo": "10001245567",
+    "actividad": "30001234456678",
+    "ayudando": "20001113345678",
+    "bajas": "00012234",
+    "mostrarte": "10012356789",
+    "monstruos": "00012468",
+    "antiguos": "10001234457",
+    "fotografías": "3941223446778999:",
+    "lavar": "10012234",
+    "personajes": "20012345567789",
+    "vela": "00012234",
+    "notado": "10012234456",
+    "miente": "00013456",
+    "pediré": "26312234456",
+    "trono": "00023345",
+    "pato": "00012234",
+    "jugo": "00012234",
+    "inténtalo": "14201234567789",
+    "grito": "00023345",
+    "descubrió": "29312345579",
+    "arreglarlo": "2000113446789:",
+    "rutina": "10012234456",
+    "patria": "00012246",
+    "esclavo": "10001245567",
+    "cuente": "00013456",
+    "taller": "10012245",
+    "regresen": "10012245567",
+    "muestras": "00013467",
+    "devolver": "20012234567",
+    "asegurarme": "3000112334556789:",
+    "patas": "00012234",
+    "desayunar": "30012234446678",
+    "gerente": "10012234567",
+    "vacas": "00012234",
+    "acércate": "13201123456678",
+    "sentados": "10012345567",
+    "practicar": "20023456678",
+    "dormida": "10012345567",
+    "celos": "00012234",
+    "aceptado": "20001123456678",
+    "profesora": "20023345567789",
+    "importaba": "20001234567789",
+    "tómate": "02112234456",
+    "alumnos": "10001123456",
+    "pistas": "00012345",
+    "diseño": "10012234456",
+    "actos": "00001234",
+    "vigila": "10012234456",
+    "reporte": "10012234567",
+    "masa": "00012234",
+    "prometida": "20023345567789",
+    "cuartos": "00013456",
+    "guerrero": "10023356678",
+    "tercero": "10012345567",
+    "permitido": "20012345567789",
+    "uñas": "00001123",
+    "ciudadano": "20013345567789",
+    "niebla": "00013356",
+    "ronda": "00012345",
+    "llamarlo": "10023345678",
+    "noviembre": "10012235689",
+    "logro": "00012245",
+    "naranja": "10012234567",
+    "pagará": "26312234456",
+    "restos": "00012345",
+    "viera": "00013345",
+    "refería": "26312234456667",
+    "queria": "00023346",
+    "considerado": "300123455677899:;",
+    "sinceramente": "30012345567789:;<",
+    "garaje": "10012234456",
+    "ingeniero": "20001234457789",
+    "generoso": "20012234456678",
+    "academia": "20001123345568",
+    "jugadores": "20012234456678",
+    "cretino": "10023345567",
+    "recursos": "10012234567",
+    "métete": "02112234456",
+    "buscaré": "27312345567",
+    "archivo": "10001245567",
+    "letras": "00012245",
+    "poeta": "10012223345",
+    "mantenga": "10012345678",
+    "pedimos": "10012234456",
+    "posiblemente": "30012234467789:;<",
+    "ponerle": "10012234567",
+    "dignidad": "20012345567",
+    "logramos": "10012245567",
+    "testamento": "2001234556789:",
+    "infancia": "10001234568",
+    "rota": "00012234",
+    "población": "28312245568",
+    "oscura": "10001234456",
+    "chinos": "00023345",
+    "almacén": "26301234456",
+    "soledad": "20012234456",
+    "siguió": "16212246",
+    "buscarte": "10012345678",
+    "medalla": "10012234467",
+    "olvidaste": "20001234456789",
+    "envié": "15201235",
+    "salía": "14212234445",
+    "armado": "10001234456",
+    "soltero": "10012345567",
+    "llévate": "03123345567",
+    "saldremos": "10012356678",
+    "muéstrame": "03113467789",
+    "ala": "00001123",
+    "únicos": "01101123345",
+    "suma": "00012234",
+    "sistemas": "10012345567",
+    "tiendas": "00013456",
+    "escuadrón": "28301235578",
+    "abrazo": "10001134456",
+    "importar": "20001234567",
+    "dió": "03113",
+    "enterado": "20001234456678",
+    "sorprendido": "200123567899:;",
+    "modales": "10012234456",
+    "sirven": "00012345",
+    "médica": "02112234456",
+    "colgar": "10012345",
+    "típico": "02112234456",
+    "edificios": "20001123345568",
+    "finales": "10012234456",
+    "confundido": "2001234567889:",
+    "ciertos": "00013456",
+    "creyó": "15223335",
+    "vendiendo": "10012346789",
+    "juegas": "00013345",
+    "espíritus": "14201234456678",
+    "oírlo": "12201112345",
+    "límites": "02112234456",
+    "utilizar": "30001123345567",
+    "aprende": "10001134567",
+    "crecido": "10023345567",
+    "dimos": "00012234",
+    "demasiadas": "20012234457789",
+    "botellas": "10012234467",
+    "hablarme": "10012245678",
+    "tristeza": "10023456678",
+    "deporte": "10012234567",
+    "lucas": "00012234",
+    "permiten": "10012345567",
+    "molestes": "10012234567",
+    "recepción": "28312234568",
+    "enviaron": "10001235567",
+    "odias": "00001124",
+    "hacerla": "10012234567",
+    "considera": "20012345567789",
+    "hayamos": "10012224456",
+    "mantente": "10012345678",
+    "progreso": "10023356678",
+    "brindis": "00023456",
+    "medidas": "10012234456",
+    "tocó": "14212234",
+    "peleando": "20012234445678",
+    "reconocer": "30012234456678",
+    "fascinante": "2001234556789:",
+    "región": "15212235",
+    "importan": "10001234567",
+    "arruinar": "20001135567",
+    "terapia": "10012234457",
+    "cómoda": "02112234456",
+    "hoyo": "00012224",
+    "miré": "14212234",
+    "arco": "00001234",
+    "oreja": "10001123345",
+    "pesca": "00012345",
+    "trabajé": "27323345567",
+    "honestamente": "30012234567789:;<",
+    "verdes": "00012345",
+    "intenciones": "2000123456889:",
+    "acostumbrado": "3000112345679::;<",
+    "sentarte": "10012345678",
+    "olas": "00001123",
+    "grita": "00023345",
+    "tarjetas": "10012345567",
+    "eterna": "10001123456",
+    "obligado": "20001134456678",
+    "formar": "10012345",
+    "ordenó": "26301234456",
+    "cambiando": "10012346789",
+    "naves": "00012234",
+    "quedarás": "27323345567",
+    "tabaco": "10012234456",
+    "usamos": "10001123345",
+    "capítulo": "14212234456678",
+    "encontrarme": "200012345789:;",
+    "hacéis": "14212235",
+    "seguirá": "27312245567",
+    "ocuparé": "37401123345567",
+    "selva": "00012345",
+    "ayudas": "10001113345",
+    "cállese": "02112245567",
+    "columna": "10012234567",
+    "enterrado": "20001234467789",
+    "ola": "00001123",
+    "temer": "10012234",
+    "cortado": "10012345567",
+    "impacto": "10001234567",
+    "objetos": "10001234456",
+    "herramientas": "200122455689:;",
+    "marihuana": "20012234457789",
+    "balón": "14212234",
+    "fingir": "10012345",
+    "decírmelo": "14212234567789",
+    "confesión": "28312345568",
+    "ayúdeme": "13201113345567",
+    "jodan": "00012234",
+    "símbolo": "02112345567",
+    "cambie": "00012346",
+    "buscarla": "10012345678",
+    "expediente": "2000123445789:",
+    "escenas": "10001234456",
+    "fresca": "00023456",
+    "petición": "27312234457",
+    "tomaremos": "20012234456678",
+    "amada": "10001123345",
+    "entramos": "10001245567",
+    "participar": "30012345567789",
+    "casco": "00012345",
+    "trajeron": "10023345567",
+    "patatas": "10012234456",
+    "pandilla": "10012345578",
+    "preocupación": "4;52333445667889;",
+    "duermo": "00013456",
+    "advertencia": "2000123456789;",
+    "lleguen": "00023356",
+    "llora": "00023345",
+    "socios": "00012235",
+    "miran": "00012234",
+    "disculparme": "200123456789:;",
+    "presa": "00023345",
+    "estaríamos": "26301234456667789",
+    "pases": "00012234",
+    "camaradas": "20012234456678",
+    "otoño": "10001123345",
+    "estatua": "10001234457",
+    "perrito": "10012245567",
+    "mia": "00013",
+    "violación": "28313345568",
+    "acerques": "10001123467",
+    "actúa": "14201234445",
+    "corredor": "20012245567",
+    "canadá": "26312234456",
+    "temía": "14212234445",
+    "altos": "00001234",
+    "guantes": "00013456",
+    "vaquero": "10012245567",
+    "actuando": "10001235678",
+    "enormes": "10001123456",
+    "sabiendo": "10012235678",
+    "merezco": "10012234567",
+    "citas": "00012234",
+    "pegado": "10012234456",
+    "simpático": "15212345567789",
+    "jaula": "00013345",
+    "incluyendo": "2000124555789:",
+    "funcione": "10012346678",
+    "ratón": "14212234",
+    "período": "14212234445567",
+    "capa": "00012234",
+    "brasil": "10023345",
+    "zapato": "10012234456",
+    "gota": "00012234",
+    "docena": "10012234456",
+    "decías": "14212234445",
+    "habrás": "15212245",
+    "cambian": "00012346",
+    "hombros": "00012356",
+    "casarnos": "10012234567",
+    "reconoce": "20012234456678",
+    "trajes": "00023345",
+    "minas": "00012234",
+    "vomitar": "20012234456",
+    "seguida": "10012245567",
+    "testimonio": "2001234556778:",
+    "jugada": "10012234456",
+    "evento": "10001123456",
+    "suplico": "10012245567",
+    "adivinar": "30001123345567",
+    "administración": "4=50123445679::;=",
+    "alfombra": "10001234578",
+    "productos": "10023345678",
+    "vecindario": "2001223456778:",
+    "niñera": "10012234456",
+    "so": "00012",
+    "presentación": "3;42334567889;",
+    "residencia": "2001223445678:",
+    "subiendo": "10012235678",
+    "oportunidades": "4000112345667889::;<",
+    "conozca": "10012234567",
+    "recientemente": "3001223567889:;<=",
+    "retraso": "10012245567",
+    "pintar": "10012345",
+    "preso": "00023345",
+    "plástico": "03123456678",
+    "marzo": "00012345",
+    "funcionan": "10012346678",
+    "hágalo": "02112234456",
+    "escoger": "20001234456",
+    "seguiremos": "20012245567789",
+    "sindicato": "20012345567789",
+    "sombras": "00012356",
+    "ganando": "10012234567",
+    "cometer": "20012234456",
+    "preguntes": "10023345678",
+    "bondad": "10012345",
+    "temor": "10012234",
+    "profunda": "10023345678",
+    "ropas": "00012234",
+    "físico": "02112234456",
+    "escúcheme": "14201234467789",
+    "cuyo": "00012224",
+    "retrato": "10012245567",
+    "suceda": "10012234456",
+    "ópera": "01101123345",
+    "mencionar": "20012346678",
+    "páginas": "02112234456",
+    "esperad": "20001234456",
+    "muchachas": "10012245578",
+    "nieto": "00013345",
+    "empiezas": "10001235567",
+    "logró": "15212245",
+    "campeonato": "3001234555667889:",
+    "retiro": "10012234456",
+    "sordo": "00012345",
+    "suban": "00012234",
+    "marcos": "00012345",
+    "conviene": "10012346678",
+    "necesitaré": "4:51223445667889:",
+    "arruinado": "20001135567789",
+    "representante": "3001224556789:;<=",
+    "boleto": "10012234456",
+    "niega": "00013345",
+    "doctores": "10012345567",
+    "oxígeno": "13201123345567",
+    "terribles": "10012245578",
+    "liga": "00012234",
+    "creó": "14223334",
+    "cenizas": "10012234456",
+    "terrorista": "2001224556789:",
+    "imaginé": "37401123345567",
+    "compraré": "28312356678",
+    "ave": "00001123",
+    "heroína": "25312234445567",
+    "furioso": "10012235567",
+    "agarrar": "20001123356",
+    "prometes": "10023345567",
+    "sígueme": "02112245567",
+    "bonitos": "10012234456",
+    "callado": "10012245567",
+    "bolsas": "00012345",
+    "mientes": "00013456",
+    "bendición": "28312345568",
+    "pague": "00012245",
+    "porno": "00012345",
+    "dejadme": "10012234567",
+    "pesada": "10012234456",
+    "británico": "15223345567789",
+    "economía": "37401123345567778",
+    "lanzar": "10012345",
+    "deberá": "26312234456",
+    "ensalada": "20001234456678",
+    "quizas": "00023345",
+    "equivoqué": "39401134456689",
+    "consejos": "10012345567",
+    "termino": "10012345567",
+    "equivoca": "20001134456678",
+    "besos": "00012234",
+    "estudiando": "2000123445789:",
+    "documento": "20012234456789",
+    "crece": "00023345",
+    "susto": "00012345",
+    "creído": "14223334456",
+    "saqué": "15212245",
+    "pluma": "00023345",
+    "demanda": "10012234567",
+    "encontrarte": "200012345789:;",
+    "horribles": "10012245578",
+    "comando": "10012234567",
+    "hacernos": "10012234567",
+    "sexuales": "10012235567",
+    "dificil": "20012234456",
+    "prepárate": "15223345567789",
+    "embajada": "20001234456678",
+    "fruta": "00023345",
+    "jugamos": "10012234456",
+    "tiró": "14212234",
+    "manzanas": "10012345567",
+    "volverán": "27312345567",
+    "quinto": "00023456",
+    "aman": "00001123",
+    "abandonó": "38401123456678",
+    "tenerte": "10012234567",
+    "empiezan": "10001235567",
+    "dejara": "10012234456",
+    "firmado": "10012345567",
+    "coca": "00012234",
+    "divertida": "20012234567789",
+    "extranjeros": "2000124567889:",
+    "atender": "20001123456",
+    "bajando": "10012234567",
+    "consiga": "10012345567",
+    "trasera": "10023345567",
+    "préstamo": "03123456678",
+    "quisieras": "10023346678",
+    "vigilando": "20012234456789",
+    "desperté": "28312345678",
+    "pañuelo": "10012235567",
+    "créame": "03123334456",
+    "jefes": "00012234",
+    "prepárense": "1522334556789:",
+    "ataúd": "24301123334",
+    "saluda": "10012234456",
+    "sobra": "00012245",
+    "tensión": "16212346",
+    "aumento": "10002234567",
+    "sentirme": "10012345678",
+    "extremo": "10001245567",
+    "dí": "02112",
+    "odiaba": "10001124456",
+    "enseñado": "20001234456678",
+    "fines": "00012234",
+    "lea": "00012223",
+    "trenes": "00023345",
+    "teme": "00012234",
+    "ofrecer": "20001134456",
+    "atreve": "10001134456",
+    "ocurrirá": "38401123356678",
+    "salve": "00012345",
+    "pulso": "00012345",
+    "detuvo": "10012234456",
+    "bajen": "00012234",
+    "seguí": "15212245",
+    "ocurriendo": "2000112335789:",
+    "cuadros": "00013356",
+    "artes": "00001234",
+    "pensión": "16212346",
+    "camiones": "10012235567",
+    "juguete": "10012245567",
+    "todavia": "10012234457",
+    "cuánta": "03113456",
+    "contarle": "10012345678",
+    "cirugía": "26312234456667",
+    "eternidad": "30001123456678",
+    "sigas": "00012234",
+    "bailarina": "20013345567789",
+    "avenida": "20001123345567",
+    "decidimos": "20012234456678",
+    "pagas": "00012234",
+    "rojas": "00012234",
+    "cobrar": "10012245",
+    "realizar": "30012223345567",
+    "infantil": "20001234567",
+    "ponerlo": "10012234567",
+    "esperabas": "20001234456678",
+    "pavo": "00012234",
+    "juguetes": "10012245567",
+    "custodia": "10012345568",
+    "demuestra": "10012235689",
+    "justamente": "2001234556789:",
+    "golpea": "10012345556",
+    "ultima": "10001234456",
+    "rusa": "00012234",
+    "tomaron": "10012234456",
+    "enciende": "10001235678",
+    "civilización": "4;51223445667889;",
+    "burro": "00012245",
+    "muchísimas": "15212245567789",
+    "democracia": "2001223446778:",
+    "gimnasio": "10012345568",
+    "sabremos": "10012245567",
+    "egipto": "10001123456",
+    "opina": "10001123345",
+    "estadounidenses": "400012344577899:;<=>",
+    "patético": "14212234456678",
+    "consigues": "10012345578",
+    "observa": "10001234567",
+    "revistas": "10012234567",
+    "sucederá": "38412234456678",
+    "fase": "00012234",
+    "ilusión": "26301123346",
+    "debilidad": "30012234456678",
+    "matas": "00012234",
+    "bienes": "00013345",
+    "psiquiatra": "1002335779:",
+    "autor": "10002234",
+    "engañado": "20001234456678",
+    "robando": "10012234567",
+    "dejarás": "26312234456",
+    "probarlo": "10023345678",
+    "duros": "00012234",
+    "eeuu": "20001112223334",
+    "enseñarte": "20001234456789",
+    "detenerlo": "20012234456789",
+    "condena": "10012345567",
+    "saldré": "16212356",
+    "muelle": "00013356",
+    "miró": "14212234",
+    "estatal": "20001234456",
+    "repugnante": "2001223456789:",
+    "asientos": "10001124567",
+    "aterrizar": "30001123356678",
+    "permitiré": "39412345567789",
+    "pierda": "00013456",
+    "vencido": "10012345567",
+    "copias": "00012235",
+    "dibujos": "10012234456",
+    "trabajó": "27323345567",
+    "pechos": "00012245",
+    "cervezas": "10012345567",
+    "desean": "10012234445",
+    "dolores": "10012234456",
+    "causar": "10013345",
+    "mantequilla": "200123455788:;",
+    "pablo": "00012245",
+    "acuerda": "10001124567",
+    "aparato": "20001123345567",
+    "sacarlo": "10012234567",
+    "dirán": "14212234",
+    "copas": "00012234",
+    "plena": "00023345",
+    "sospecha": "10012345578",
+    "ponemos": "10012234456",
+    "cazador": "20012234456",
+    "autopista": "20002234456789",
+    "escapa": "10001234456",
+    "canalla": "10012234467",
+    "informado": "20001234567789",
+    "despejado": "20012345567789",
+    "postre": "00012356",
+    "deseaba": "20012234445567",
+    "concepto": "10012345678",
+    "desarrollo": "2001223446779:",
+    "blancas": "00023456",
+    "contarte": "10012345678",
+    "digno": "00012345",
+    "piensen": "00013456",
+    "esconde": "10001234567",
+    "adulto": "10001123456",
+    "bebidas": "10012234456",
+    "elige": "10001123345",
+    "casé": "14212234",
+    "quema": "00023345",
+    "juramento": "20012234456789",
+    "vampiro": "10012345567",
+    "combinación": "3:41234556778:",
+    "volvieron": "10012346678",
+    "términos": "02112345567",
+    "buscarme": "10012345678",
+    "disfruta": "10012356678",
+    "sangrando": "10012356789",
+    "toalla": "10012223356",
+    "ríe": "02112223",
+    "suelto": "00013456",
+    "dejaba": "10012234456",
+    "autorización": "4;50223445667889;",
+    "negras": "00012245",
+    "andas": "00001234",
+    "llenos": "00023345",
+    "bomberos": "10012345567",
+    "gravedad": "20023345567",
+    "cambiará": "28312346678",
+    "esconder": "20001234567",
+    "dirigir": "20012234456",
+    "enfadada": "20001234456678",
+    "llegaré": "27323345567",
+    "líos": "02112223",
+    "dibujo": "10012234456",
+    "hadas": "00012234",
+    "soñar": "10012234",
+    "marinero": "20012234456678",
+    "convencer": "20012345678",
+    "tortura": "10012345567",
+    "nube": "00012234",
+    "rehenes": "10012234456",
+    "vera": "00012234",
+    "robaste": "10012234567",
+    "chaval": "10023345",
+    "encuentren": "10001235689",
+    "sobrina": "10012245567",
+    "levante": "10012234567",
+    "amables": "10001123356",
+    "ovejas": "10001123345",
+    "violento": "10013345678",
+    "feria": "00012235",
+    "muevan": "00013345",
+    "desafío": "26312234456667",
+    "origen": "10001123345",
+    "vestida": "10012345567",
+    "golpeado": "20012345556678",
+    "constantemente": "300124567899:;<=>",
+    "humilde": "10012234567",
+    "habilidades": "3001223445667889:",
+    "causado": "10013345567",
+    "patada": "10012234456",
+    "escuelas": "10001235567",
+    "equivoco": "20001134456678",
+    "saliste": "10012234567",
+    "comió": "15212235",
+    "ocultar": "20001123456",
+    "normales": "10012345567",
+    "desafortunadamente": "600122344567899:;;<==>?@AB",
+    "nacer": "10012234",
+    "duermes": "00013456",
+    "refuerzos": "10012235678",
+    "pides": "00012234",
+    "cubrir": "10012245",
+    "zorro": "00012245",
+    "jabón": "14212234",
+    "mantengan": "10012345678",
+    "método": "02112234456",
+    "oírme": "12201112345",
+    "harían": "14212234445",
+    "mercancía": "28312345678889",
+    "acento": "10001123456",
+    "escala": "10001234456",
+    "engaño": "10001234456",
+    "tenis": "00012234",
+    "artículos": "14201234456678",
+    "celosa": "10012234456",
+    "diosa": "00013345",
+    "comentarios": "2001223456778:",
+    "miseria": "10012234457",
+    "alla": "00001134",
+    "imaginaba": "30001123345567789",
+    "guerreros": "10023356678",
+    "estructura": "2000124567889:",
+    "gastar": "10012345",
+    "desfile": "10012345567",
+    "registros": "10012234578",
+    "enteré": "26301234456",
+    "importe": "10001234567",
+    "lápiz": "02112234",
+    "tragos": "00023345",
+    "traen": "00023334",
+    "guerras": "00023356",
+    "fortaleza": "20012345567789",
+    "pesa": "00012234",
+    "invitó": "26301234456",
+    "diarios": "00013346",
+    "pondremos": "10012356678",
+    "terriblemente": "3001224557889:;<=",
+    "respiración": "3:41234556778:",
+    "cuero": "00013345",
+    "vano": "00012234",
+    "rojos": "00012234",
+    "fuga": "00012234",
+    "hicieras": "10012235567",
+    "cálmese": "02112345567",
+    "generalmente": "30012234456789:;<",
+    "inconsciente": "20001234679:;<",
+    "metí": "14212234",
+    "usarlo": "10001123456",
+    "toco": "00012234",
+    "grabación": "28323345568",
+    "gane": "00012234",
+    "caen": "00012223",
+    "pacífico": "14212234456678",
+    "horario": "10012234457",
+    "complejo": "10012356678",
+    "maletín": "26312234456",
+    "poderosa": "20012234456678",
+    "conocida": "20012234456678",
+    "acabaron": "20001123345567",
+    "profesionales": "3002334556889::;<",
+    "materia": "10012234457",
+    "regresará": "39412245567789",
+    "cayendo": "10012224567",
+    "positivo": "20012234456678",
+    "entro": "00001245",
+    "chofer": "10023345",
+    "muertes": "00013456",
+    "eléctrica": "13201123467789",
+    "cabra": "00012245",
+    "mentes": "00012345",
+    "enero": "10001123345",
+    "comedor": "20012234456",
+    "república": "14212234467789",
+    "cintas": "00012345",
+    "sabio": "00012235",
+    "apariencia": "2000112334678:",
+    "agallas": "10001123356",
+    "caiga": "00013345",
+    "preguntan": "10023345678",
+    "mezcla": "00012356",
+    "comprendido": "200123567899:;",
+    "coja": "00012234",
+    "reuniones": "10013346678",
+    "ejecución": "38401123345568",
+    "brillantes": "10023356789",
+    "licor": "10012234",
+    "narices": "10012234456",
+    "tomemos": "10012234456",
+    "encontrarán": "3:40123457889:",
+    "enfermedades": "300012345677899:;",
+    "mágico": "02112234456",
+    "reconocimiento": "4001223445667889;<=>",
+    "involucrado": "300012344566899:;",
+    "aguanto": "10001124567",
+    "apagar": "20001123345",
+    "darás": "14212234",
+    "desesperado": "300122345677899:;",
+    "elefante": "20001123345678",
+    "desorden": "10012234567",
+    "supieras": "10012235567",
+    "torneo": "10012345556",
+    "apetito": "20001123345567",
+    "danos": "00012234",
+    "calientes": "10012235678",
+    "observando": "2000123456789:",
+    "orilla": "10001123356",
+    "echó": "14201134",
+    "fenómeno": "14212234456678",
+    "escuchad": "20001234467",
+    "hermosos": "10012345567",
+    "alimentos": "20001123345678",
+    "hubiéramos": "15212235567789",
+    "gatillo": "10012234467",
+    "pida": "00012234",
+    "vendió": "16212346",
+    "mancha": "00012356",
+    "próximos": "03123345567",
+    "sufre": "00012245",
+    "giro": "00012234",
+    "marte": "00012345",
+    "vivió": "15212235",
+    "pegó": "14212234",
+    "pega": "00012234",
+    "jodas": "00012234",
+    "submarino": "20012345567789",
+    "tocas": "00012234",
+    "sabiduría": "38412234456678889",
+    "locales": "10012234456",
+    "policial": "20012234457",
+    "meterte": "10012234567",
+    "riendo": "00013456",
+    "campana": "10012345567",
+    "escuchó": "27301234467",
+    "criada": "00024456",
+    "gesto": "00012345",
+    "imbéciles": "14201234456678",
+    "encontremos": "2000123457889:",
+    "ofreció": "27301134457",
+    "comercio": "10012234568",
+    "ocupados": "20001123345567",
+    "interrumpir": "3000123446789:",
+    "capullo": "10012234467",
+    "creación": "27323334457",
+    "ríes": "02112223",
+    "camiseta": "20012234456678",
+    "comencé": "27312234567",
+    "seca": "00012234",
+    "aburrida": "20001123356678",
+    "gusano": "10012234456",
+    "supiste": "10012234567",
+    "lógica": "02112234456",
+    "oyeron": "10001113345",
+    "callejón": "27312245567",
+    "llegues": "00023356",
+    "excepción": "28301234568",
+    "lectura": "10012345567",
+    "seda": "00012234",
+    "am": "00001",
+    "bebes": "00012234",
+    "atmósfera": "14201234567789",
+    "tratamos": "10023345567",
+    "alemana": "20001123345567",
+    "resuelto": "10012235678",
+    "quemar": "10023345",
+    "esperé": "26301234456",
+    "tarta": "00012345",
+    "recibimos": "20012234456678",
+    "enseña": "10001234456",
+    "ganancias": "10012234568",
+    "terminará": "39412345567789",
+    "repetir": "20012234456",
+    "quisiste": "10023345678",
+    "cosecha": "10012234467",
+    "boletos": "10012234456",
+    "póngase": "02112345567",
+    "escucharme": "2000123446789:",
+    "disciplina": "2001234557889:",
+    "apártate": "13201123456678",
+    "oficio": "10001123346",
+    "pasaré": "26312234456",
+    "cambié": "16212346",
+    "bahía": "14212234445",
+    "oficialmente": "30001123346789:;<",
+    "normas": "00012345",
+    "llegara": "10023345567",
+    "salario": "10012234457",
+    "teléfonos": "14212234456678",
+    "cuya": "00012224",
+    "caí": "13212223",
+    "cuerdas": "00013456",
+    "graves": "00023345",
+    "busque": "00012356",
+    "conversar": "20012345678",
+    "orgullosos": "20001234467789",
+    "súbete": "02112234456",
+    "explicaré": "39401245567789",
+    "colinas": "10012234456",
+    "pelotón": "26312234456",
+    "pasaje": "10012234456",
+    "cortó": "15212345",
+    "est": "00001",
+    "fianza": "00013456",
+    "graciosa": "10023346678",
+    "vería": "14212234445",
+    "misa": "00012234",
+    "carbón": "15212345",
+    "grosero": "10023345567",
+    "queja": "00023345",
+    "marcharse": "10012356789",
+    "cristiano": "10023457789",
+    "misterioso": "2001234556889:",
+    "rapido": "10012234456",
+    "perdemos": "10012345567",
+    "oyen": "00001113",
+    "cuarta": "00013456",
+    "enseñarle": "20001234456789",
+    "verdaderos": "20012345567789",
+    "considerando": "30012345567789:;<",
+    "convertir": "20012345678",
+    "instinto": "10001345678",
+    "cigarro": "10012234467",
+    "negociar": "20012234457",
+    "plazo": "00023345",
+    "pensabas": "10012345567",
+    "confusión": "28312345568",
+    "cojo": "00012234",
+    "planos": "00023345",
+    "orquesta": "10001245678",
+    "mencionó": "28312346678",
+    "llevaría": "27323345567778",
+    "comunistas": "20012234456789",
+    "afecta": "10001123456",
+    "sacarte": "10012234567",
+    "tribu": "00023345",
+    "saludar": "20012234456",
+    "déjate": "02112234456",
+    "horno": "00012345",
+    "atacó": "25301123345",
+    "rabia": "00012235",
+    "pasaste": "10012234567",
+    "espantoso": "20001234567789",
+    "aguarda": "10001124567",
+    "raras": "00012234",
+    "descanse": "10012345678",
+    "cocaína": "25312234445567",
+    "estacionamiento": "400012344577899:<=>?",
+    "aproximadamente": "5000113445667889::;<=>?",
+    "compre": "00012356",
+    "detiene": "10012235567",
+    "pilotos": "10012234456",
+    "alivio": "10001123346",
+    "aca": "00001123",
+    "distinta": "10012345678",
+    "sintió": "16212346",
+    "tubo": "00012234",
+    "dejarán": "26312234456",
+    "aterrizaje": "3000112335667889:",
+    "pagué": "15212245",
+    "revólver": "14212234567",
+    "profundidad": "3002334567889:",
+    "débiles": "02112234456",
+    "novios": "00012235",
+    "presentimiento": "3002334567889;<=>",
+    "araña": "10001123345",
+    "contiene": "10012346678",
+    "echaré": "26301134456",
+    "olvidas": "10001234456",
+    "certeza": "10012345567",
+    "afecto": "10001123456",
+    "consuelo": "10012346678",
+    "recuerdan": "10012235678",
+    "micrófono": "15212245567789",
+    "eterno": "10001123456",
+    "riesgos": "00013456",
+    "vampiros": "10012345567",
+    "huyendo": "10012224567",
+    "mueres": "00013345",
+    "formación": "28312345568",
+    "aves": "00001123",
+    "dirías": "14212234445",
+    "monos": "00012234",
+    "conseguirlo": "200123455789:;",
+    "evidente": "20001123345678",
+    "considerar": "30012345567789",
+    "tareas": "10012234445",
+    "ganan": "00012234",
+    "retrasado": "20012245567789",
+    "moriré": "26312234456",
+    "estrategia": "2000124556778:",
+    "pense": "00012345",
+    "compro": "00012356",
+    "rango": "00012345",
+    "ajá": "13201123",
+    "altas": "00001234",
+    "venden": "00012345",
+    "periodistas": "2001223556789:",
+    "bolsillos": "10012345578",
+    "pesadillas": "20012234456689",
+    "detesto": "10012234567",
+    "menuda": "10012234456",
+    "procedimiento": "3002334556778:;<=",
+    "largos": "00012345",
+    "detenga": "10012234567",
+    "comprobar": "20012356678",
+    "exposición": "39401234456679",
+    "espiritual": "30001234456679",
+    "potencial": "20012234568",
+    "distintas": "10012345678",
+    "numero": "10012234456",
+    "ordeno": "10001234456",
+    "raíces": "13212223345",
+    "interesan": "20001234456678",
+    "arreglaré": "39401134467789",
+    "islas": "00001234",
+    "contentos": "10012345678",
+    "entran": "00001245",
+    "dejad": "10012234",
+    "encender": "20001234567",
+    "nido": "00012234",
+    "preocupen": "20023334456678",
+    "temporal": "20012345567",
+    "usaba": "10001123345",
+    "asegurar": "30001123345567",
+    "leal": "10012223",
+    "maestros": "10012223467",
+    "pueblos": "00013356",
+    "asociación": "39401123346679",
+    "polla": "00012245",
+    "robé": "14212234",
+    "tiros": "00012234",
+    "meterse": "10012234567",
+    "llenar": "10023345",
+    "doña": "00012234",
+    "moderno": "10012234567",
+    "nocturno": "10012345678",
+    "oir": "00002",
+    "hare": "00012234",
+    "resistir": "20012234567",
+    "regimiento": "2001223445789:",
+    "sacaré": "26312234456",
+    "coro": "00012234",
+    "subió": "15212235",
+    "duelo": "00013345",
+    "dificultades": "300122344567899:;",
+    "soñé": "14212234",
+    "ausencia": "10002234568",
+    "eliminar": "30001123345567",
+    "creciendo": "10023346789",
+    "comedia": "10012234457",
+    "graduación": "29323346679",
+    "quedaría": "27323345567778",
+    "texto": "00012345",
+    "mágica": "02112234456",
+    "transmisión": "2:32356778:",
+    "inglesa": "10001245567",
+    "despierte": "10012346789",
+    "matarla": "10012234567",
+    "separados": "20012234456678",
+    "padrino": "10012245567",
+    "investigando": "30001234567789:;<",
+    "fraude": "00024456",
+    "astuto": "10001234456",
+    "jefa": "00012234",
+    "motores": "10012234456",
+    "edición": "26301123346",
+    "suiza": "00013345",
+    "botones": "10012234456",
+    "intentan": "10001234567",
+    "necesidades": "3001223445667889:",
+    "enamorados": "30001123345567789",
+    "rodeado": "20012234445567",
+    "costará": "27312345567",
+    "concentración": "3<4123456899:<",
+    "conspiración": "3;41245667889;",
+    "quemado": "10023345567",
+    "alejado": "20001123345567",
+    "promesas": "10023345567",
+    "acompaño": "20001123456678",
+    "compraste": "10012356789",
+    "filosofía": "38412234456678889",
+    "enfrentar": "20001245678",
+    "moviendo": "10012235678",
+    "entras": "00001245",
+    "actualmente": "200012356789:;",
+    "delicado": "20012234456678",
+    "sospechosos": "2001234557889:",
+    "italianos": "20001123346678",
+    "jovencito": "20012234567789",
+    "pudiéramos": "15212235567789",
+    "gatito": "10012234456",
+    "potencia": "10012234568",
+    "pervertido": "2001234567889:",
+    "bendito": "10012345567",
+    "faltaba": "10012345567",
+    "devolveré": "39412234567789",
+    "necesitaremos": "4001223445667889::;<",
+    "asesina": "20001123345567",
+    "traerme": "10023334567",
+    "vinieras": "10012235567",
+    "dosis": "00012234",
+    "colgado": "10012345567",
+    "franco": "00023456",
+    "mentí": "15212345",
+    "incapaz": "20001234456",
+    "unido": "10001123345",
+    "llevarse": "10023345678",
+    "líderes": "02112234456",
+    "lleves": "00023345",
+    "trampas": "00023456",
+    "presentes": "10023345678",
+    "soportarlo": "2001223456789:",
+    "actividades": "3000123445667889:",
+    "vencer": "10012345",
+    "prométeme": "15223345567789",
+    "ciega": "00013345",
+    "bién": "03113",
+    "deportes": "10012234567",
+    "naciones": "10012235567",
+    "oración": "26301123346",
+    "contactos": "10012345678",
+    "tímido": "02112234456",
+    "magnífica": "15212345567789",
+    "mostrarle": "10012356789",
+    "parejas": "10012234456",
+    "crean": "00023334",
+    "menores": "10012234456",
+    "morirás": "26312234456",
+    "admito": "10001234456",
+    "máxima": "02112234456",
+    "síganme": "02112234567",
+    "danza": "00012345",
+    "comenzamos": "20012234567789",
+    "eche": "00001134",
+    "controla": "10012356678",
+    "juzgado": "10012345567",
+    "oler": "10001123",
+    "levantado": "20012234567789",
+    "pisos": "00012234",
+    "aclarar": "20001134456",
+    "conduciendo": "200123455689:;",
+    "conclusión": "29312356679",
+    "meterme": "10012234567",
+    "secuencia": "10012235679",
+    "programas": "10023356678",
+    "matamos": "10012234456",
+    "sufrió": "16212246",
+    "parto": "00012345",
+    "brilla": "00023356",
+    "exámenes": "13201123345567",
+    "sacas": "00012234",
+    "intentes": "10001234567",
+    "valores": "10012234456",
+    "permíteme": "15212345567789",
+    "mensajero": "20012345567789",
+    "quedaron": "10023345567",
+    "profesores": "20023345567789",
+    "vendo": "00012345",
+    "ayudaría": "37401113345567778",
+    "despedirme": "2001234556789:",
+    "vidrio": "00012246",
+    "acostado": "20001123456678",
+    "beneficio": "20012234456679",
+    "sagrada": "10012245567",
+    "perdieron": "10012346678",
+    "explicarlo": "2000124556789:",
+    "empuja": "10001234456",
+    "deberes": "10012234456",
+    "extremadamente": "400012455677899:;<=>",
+    "hambriento": "1001235789:",
+    "pierden": "00013456",
+    "tabla": "00012245",
+    "maldad": "10012345",
+    "comentario": "2001223456778:",
+    "condicional": "3001234556889:",
+    "juzgar": "10012345",
+    "esperaremos": "3000123445667889:",
+    "mentido": "10012345567",
+    "adecuada": "20001123346678",
+    "dorado": "10012234456",
+    "bandas": "00012345",
+    "dispuesta": "10012346789",
+    "estarían": "26301234456667",
+    "mentirosa": "20012345567789",
+    "honesta": "10012234567",
+    "literalmente": "30012234456789:;<",
+    "métodos": "02112234456",
+    "ponía": "14212234445",
+    "filmar": "10012345",
+    "borracha": "10012245578",
+    "antecedentes": "300012344566789:;",
+    "salva": "00012345",
+    "paro": "00012234",
+    "fuentes": "00013456",
+    "divertirse": "2001223456789:",
+    "acusación": "38401123345568",
+    "presta": "00023456",
+    "secuestro": "10012235689",
+    "mueras": "00013345",
+    "beneficios": "20012234456679",
+    "cierren": "00013356",
+    "quedaremos": "20023345567789",
+    "rodilla": "10012234467",
+    "cuide": "00013345",
+    "pistolas": "10012345567",
+    "algodón": "26301234456",
+    "vendré": "16212356",
+    "ordenado": "20001234456678",
+    "ventas": "00012345",
+    "protege": "10023345567",
+    "colonia": "10012234457",
+    "compañías": "27312345567778",
+    "disposición": "3:41234556778:",
+    "responda": "10012345678",
+    "avisar": "20001123345",
+    "ordenes": "10001234456",
+    "continua": "10012345568",
+    "averiguarlo": "300011233455689:;",
+    "liberar": "20012234456",
+    "quitado": "10023345567",
+    "dispare": "10012345567",
+    "saludable": "20012234456689",
+    "querrías": "16223356667",
+    "rodar": "10012234",
+    "hablará": "27312245567",
+    "comenzado": "20012234567789",
+    "pantano": "10012345567",
+    "hacíamos": "14212234445567",
+    "necesitará": "4:51223445667889:",
+    "moderna": "10012234567",
+    "envío": "14201234445",
+    "bigote": "10012234456",
+    "asesinada": "30001123345567789",
+    "mates": "00012234",
+    "instrumento": "200013566789:;",
+    "atrapados": "20001134456678",
+    "modelos": "10012234456",
+    "soñado": "10012234456",
+    "sabré": "15212245",
+    "distintos": "10012345678",
+    "tiburón": "26312234456",
+    "grasa": "00023345",
+    "matemáticas": "2631223445667889:",
+    "honrado": "10012345567",
+    "traerá": "26323334456",
+    "diamante": "10013345678",
+    "ocasiones": "20001123346678",
+    "informar": "20001234567",
+    "mirado": "10012234456",
+    "encontraba": "2000123457889:",
+    "dieta": "00013345",
+    "cogió": "15212235",
+    "ésas": "01101123",
+    "salvación": "28312345568",
+    "municiones": "20012234457789",
+    "directa": "10012234567",
+    "increíblemente": "263012455566899:;<=>",
+    "excusas": "10001234456",
+    "sabrán": "15212245",
+    "lobos": "00012234",
+    "seriamente": "2001223556789:",
+    "enano": "10001123345",
+    "oriente": "10001124567",
+    "águila": "01101134456",
+    "justa": "00012345",
+    "déjelo": "02112234456",
+    "clásico": "03123345567",
+    "lámpara": "02112345567",
+    "estadio": "10001234457",
+    "quejas": "00023345",
+    "dejarle": "10012234567",
+    "alimentar": "30001123345678",
+    "terminaste": "2001234556789:",
+    "cuentan": "00013456",
+    "torpe": "00012345",
+    "ordenador": "30001234456678",
+    "presupuesto": "200233455689:;",
+    "oido": "00002234",
+    "agujeros": "20001123345567",
+    "agenda": "10001123456",
+    "pegar": "10012234",
+    "alianza": "10001124567",
+    "dedica": "10012234456",
+    "preferido": "20023345567789",
+    "criado": "00024456",
+    "marcho": "00012356",
+    "acompañe": "20001123456678",
+    "ida": "00001123",
+    "armados": "10001234456",
+    "globo": "00023345",
+    "chistes": "00023456",
+    "tales": "00012234",
+    "locas": "00012234",
+    "milagros": "10012234467",
+    "escuchan": "10001234467",
+    "dinos": "00012234",
+    "necesites": "20012234456678",
+    "rebeldes": "10012234567",
+    "tuyas": "00012224",
+    "explosivos": "20001245567789",
+    "estuviese": "20001234457789",
+    "superar": "20012234456",
+    "cajón": "14212234",
+    "quitó": "15223345",
+    "mandado": "10012345567",
+    "lindas": "00012345",
+    "divina": "10012234456",
+    "tirando": "10012234567",
+    "tocaba": "10012234456",
+    "objeción": "27301234457",
+    "olvidarlo": "20001234456789",
+    "lees": "00012223",
+    "riqueza": "10012245567",
+    "enseño": "10001234456",
+    "aéreo": "12201112234445",
+    "receta": "10012234456",
+    "granjero": "10023456678",
+    "valientes": "10012235678",
+    "jodidos": "10012234456",
+    "famosos": "10012234456",
+    "saquen": "00012245",
+    "martillo": "10012345578",
+    "preocupados": "3002333445667889:",
+    "continuación": "3;41234556889;",
+    "volvía": "15212345556",
+    "pásame": "02112234456",
+    "servido": "10012345567",
+    "principales": "2002345667889:",
+    "ésos": "01101123",
+    "pintor": "10012345",
+    "encantó": "27301234567",
+    "pagando": "10012234567",
+    "elementos": "20001123345678",
+    "alcanza": "10001234567",
+    "aquél": "14201134",
+    "lentes": "00012345",
+    "despertado": "2001234567889:",
+    "déjanos": "02112234456",
+    "presentó": "28323345678",
+    "subido": "10012234456",
+    "cañones": "10012234456",
+    "constante": "10012456789",
+    "oculta": "10001123456",
+    "vigilar": "20012234456",
+    "estarlo": "10001234567",
+    "divino": "10012234456",
+    "vapor": "10012234",
+    "comemos": "10012234456",
+    "probando": "10023345678",
+    "independiente": "3000123445678:;<=",
+    "anciana": "10001235567",
+    "disparando": "2001234556789:",
+    "ancianos": "10001235567",
+    "sirvo": "00012345",
+    "pinturas": "10012345567",
+    "piden": "00012234",
+    "ningun": "00012345",
+    "sucios": "00012235",
+    "ginebra": "10012234467",
+    "ofrezco": "10001134567",
+    "regresé": "27312245567",
+    "reconocido": "3001223445667889:",
+    "arranca": "10001134567",
+    "hígado": "02112234456",
+    "apúrense": "13201123345678",
+    "teresa": "10012234456",
+    "barro": "00012245",
+    "gentil": "10012345",
+    "matarnos": "10012234567",
+    "metiste": "10012234567",
+    "ocupo": "10001123345",
+    "griego": "00024456",
+    "hablen": "00012245",
+    "tejado": "10012234456",
+    "trataré": "27323345567",
+    "dentista": "10012345678",
+    "chimenea": "20023345567778",
+    "calcetines": "20012345567789",
+    "pariente": "10012235678",
+    "maneja": "10012234456",
+    "fuéramos": "03113345567",
+    "planeando": "20023345556789",
+    "contaste": "10012345678",
+    "tranquilidad": "300234677899:;",
+    "precios": "00023346",
+    "baños": "00012234",
+    "haciéndolo": "1521223567889:",
+    "galería": "26312234456667",
+    "cocinero": "20012234456678",
+    "cadenas": "10012234456",
+    "posiciones": "20012234457789",
+    "pito": "00012234",
+    "amamos": "10001123345",
+    "tenerla": "10012234567",
+    "detengan": "10012234567",
+    "siguientes": "10012246789",
+    "callar": "10012245",
+    "escriba": "10001245567",
+    "campesinos": "20012345567789",
+    "aprendiste": "2000113456789:",
+    "deténgase": "14212234567789",
+    "lecciones": "10012346678",
+    "molestado": "20012234567789",
+    "razon": "00012234",
+    "cargado": "10012345567",
+    "liberación": "39412234456679",
+    "sufriendo": "10012246789",
+    "confías": "15212345556",
+    "envíe": "14201234445",
+    "doloroso": "20012234456678",
+    "permanente": "2001234556789:",
+    "lastimado": "20012345567789",
+    "escolar": "20001234456",
+    "impedir": "20001234456",
+    "bésame": "02112234456",
+    "levantarse": "2001223456789:",
+    "hueles": "00013345",
+    "reconoces": "20012234456678",
+    "diremos": "10012234456",
+    "leon": "00012223",
+    "encantará": "39401234567789",
+    "vagabundo": "20012234456789",
+    "inteligentes": "300012344566789:;",
+    "suite": "00013345",
+    "observar": "20001234567",
+    "imagínate": "25301123345567789",
+    "odian": "00001124",
+    "busqué": "16212356",
+    "retirada": "20012234456678",
+    "sociales": "10012235567",
+    "saludo": "10012234456",
+    "jugado": "10012234456",
+    "deberia": "10012234457",
+    "vió": "03113",
+    "encuentres": "10001235689",
+    "episodio": "20001123345568",
+    "durar": "10012234",
+    "organizar": "30001234456678",
+    "empresas": "10001245567",
+    "ligero": "10012234456",
+    "champaña": "10023456678",
+    "mátalo": "02112234456",
+    "músculos": "02112345567",
+    "misiles": "10012234456",
+    "dados": "00012234",
+    "obispo": "10001123456",
+    "presentado": "2002334567889:",
+    "herencia": "10012234568",
+    "monje": "00012345",
+    "pavos": "00012234",
+    "cerrados": "10012245567",
+    "atravesar": "30001134456678",
+    "valioso": "10012235567",
+    "tiroteo": "20012234456667",
+    "cordero": "10012345567",
+    "fallado": "10012245567",
+    "sello": "00012245",
+    "aplauso": "10001135567",
+    "pensaré": "27312345567",
+    "mientas": "00013456",
+    "invita": "10001234456",
+    "píldoras": "02112345567",
+    "puño": "00012234",
+    "recoge": "10012234456",
+    "chiflado": "10023356678",
+    "auténtica": "14202234567789",
+    "marea": "10012234445",
+    "gustaria": "10012345568",
+    "estimado": "20001234456678",
+    "disfraz": "10012356",
+    "navaja": "10012234456",
+    "indica": "10001234456",
+    "fracasado": "20023345567789",
+    "injusto": "10001234567",
+    "tremendo": "10023345678",
+    "jungla": "00012356",
+    "espectacular": "400012345677899:;",
+    "confesar": "20012345567",
+    "bobo": "00012234",
+    "marchó": "16212356",
+    "soltera": "10012345567",
+    "pasaremos": "20012234456678",
+    "sabés": "14212234",
+    "descubrimiento": "3001234557889;<=>",
+    "mosca": "00012345",
+    "creerme": "10023334567",
+    "brujas": "00023345",
+    "pretende": "10023345678",
+    "sincera": "10012345567",
+    "preocupas": "20023334456678",
+    "pendiente": "10012346789",
+    "atras": "00001134",
+    "lógico": "02112234456",
+    "conocerle": "20012234456789",
+    "derrota": "10012245567",
+    "can": "00012",
+    "logré": "15212245",
+    "cuentes": "00013456",
+    "molestando": "2001223456789:",
+    "dulzura": "10012345567",
+    "lograste": "10012245678",
+    "aceptarlo": "20001123456789",
+    "lance": "00012345",
+    "heredero": "20012234456678",
+    "cortinas": "10012345567",
+    "toneladas": "20012234456678",
+    "sentiría": "27312345567778",
+    "irak": "10001123",
+    "marcharme": "10012356789",
+    "adolescente": "300011233456789:;",
+    "interesantes": "300012344566789:;",
+    "azar": "10001123",
+    "federales": "20012234456678",
+    "salvaste": "10012345678",
+    "querés": "15223345",
+    "hamburguesa": "200123456899:;",
+    "queden": "00023345",
+    "jodiendo": "10012235678",
+    "barata": "10012234456",
+    "cuidando": "10013345678",
+    "propietario": "2002334667889;",
+    "entendemos": "20001234567789",
+    "llenas": "00023345",
+    "escuches": "10001234467",
+    "ficción": "16212346",
+    "recto": "00012345",
+    "venecia": "10012234457",
+    "cometí": "26312234456",
+    "serpientes": "10012346789",
+    "contratar": "20012356678",
+    "piratas": "10012234456",
+    "mentiste": "10012345678",
+    "rubio": "00012235",
+    "lidiar": "10012235",
+    "recibirá": "38412234456678",
+    "goma": "00012234",
+    "llevara": "10023345567",
+    "valen": "00012234",
+    "ataca": "10001123345",
+    "bosques": "00012356",
+    "mintió": "16212346",
+    "pondría": "16212356667",
+    "conozcas": "10012234567",
+    "andan": "00001234",
+    "obreros": "10001134456",
+    "encendido": "20001234567789",
+    "tapa": "00012234",
+    "avergonzado": "300011234567899:;",
+    "lotería": "26312234456667",
+    "término": "02112345567",
+    "retirarse": "20012234456789",
+    "echaron": "10001134456",
+    "automóvil": "26302234456678",
+    "contarme": "10012345678",
+    "garantizo": "20012234567789",
+    "corea": "10012234445",
+    "cállense": "02112245678",
+    "presentarte": "200233456789:;",
+    "cometió": "27312234457",
+    "tatuaje": "10012235567",
+    "satélite": "14212234456678",
+    "perfil": "10012345",
+    "romano": "10012234456",
+    "veredicto": "20012234456789",
+    "bájate": "02112234456",
+    "creías": "14223334445",
+    "manta": "00012345",
+    "polo": "00012234",
+    "llegarán": "27323345567",
+    "repite": "10012234456",
+    "grabar": "10023345",
+    "mansión": "16212346",
+    "escribiste": "2000124556789:",
+    "espléndido": "1520124567889:",
+    "aceptas": "10001123456",
+    "envidia": "10001234457",
+    "privilegio": "2002334556778:",
+    "vago": "00012234",
+    "aguja": "10001123345",
+    "tortuga": "10012345567",
+    "lavado": "10012234456",
+    "construido": "1001246889:",
+    "obligación": "39401134456679",
+    "entienda": "10001235678",
+    "niveles": "10012234456",
+    "árabe": "01101123345",
+    "culpo": "00012345",
+    "cohete": "10012234456",
+    "llueve": "00024456",
+    "déjale": "02112234456",
+    "debéis": "14212235",
+    "hilo": "00012234",
+    "acerque": "10001123467",
+    "llámeme": "03123345567",
+    "pudieran": "10012235567",
+    "química": "03123345567",
+    "bandidos": "10012345567",
+    "fumo": "00012234",
+    "curar": "10012234",
+    "conflicto": "10012356789",
+    "corresponde": "200122456789:;",
+    "telefónica": "2631223445667889:",
+    "ocupa": "10001123345",
+    "eligió": "26301123346",
+    "votar": "10012234",
+    "conjunto": "10012345678",
+    "huéspedes": "03113456678",
+    "cogí": "14212234",
+    "admiro": "10001234456",
+    "estaciones": "20001234457789",
+    "adora": "10001123345",
+    "especialista": "30001234457789:;<",
+    "preguntaste": "200233456789:;",
+    "forense": "10012234567",
+    "sacaron": "10012234456",
+    "salvador": "20012345567",
+    "candidato": "20012345567789",
+    "literatura": "3001223445667889:",
+    "expertos": "10001234567",
+    "comenzaron": "20012234567789",
+    "roba": "00012234",
+    "rincón": "15212345",
+    "superiores": "20012234457789",
+    "volante": "10012234567",
+    "solicitud": "30012234456678",
+    "casamos": "10012234456",
+    "durará": "26312234456",
+    "marino": "10012234456",
+    "febrero": "10012245567",
+    "aquellas": "10001134467",
+    "existir": "20001123456",
+    "ridícula": "14212234456678",
+    "debías": "14212234445",
+    "brigada": "10023345567",
+    "creíste": "14223334567",
+    "aleluya": "20001123345557",
+    "propongo": "10023345678",
+    "bellas": "00012245",
+    "cobardes": "10012234567",
+    "entremos": "10001245567",
+    "osos": "00001123",
+    "escribes": "10001245567",
+    "impresionado": "3000124556889::;<",
+    "velada": "10012234456",
+    "certificado": "300123455677899:;",
+    "excitante": "20001234456789",
+    "sonreír": "26312345556",
+    "divirtiendo": "200122345689:;",
+    "olviden": "10001234456",
+    "preocupaciones": "4002333445667889;;<=",
+    "ayudarlos": "20001113345678",
+    "descuida": "10012346678",
+    "unirse": "10001123456",
+    "peligrosos": "20012234467789",
+    "conseguiremos": "3001234557889::;<",
+    "adelantado": "3000112334567889:",
+    "borrachos": "10012245578",
+    "cubre": "00012245",
+    "vestuario": "10012346679",
+    "cheques": "00023356",
+    "cumple": "00012356",
+    "hechas": "00012245",
+    "deseando": "20012234445678",
+    "hacha": "00012245",
+    "invitar": "20001234456",
+    "dormía": "15212345556",
+    "sesos": "00012234",
+    "preguntarme": "200233456789:;",
+    "espías": "14201234445",
+    "preocupo": "20023334456678",
+    "suéltalo": "03113456678",
+    "hermanito": "20012345567789",
+    "ajedrez": "20001123356",
+    "quedara": "10023345567",
+    "perspectiva": "200124567899:;",
+    "lograrlo": "10012245678",
+    "músico": "02112234456",
+    "dispararle": "2001234556789:",
+    "semillas": "10012234467",
+    "reto": "00012234",
+    "fuegos": "00013345",
+    "fuma": "00012234",
+    "traducido": "20023345567789",
+    "talvez": "10012345",
+    "raros": "00012234",
+    "desee": "10012234445",
+    "comí": "14212234",
+    "descripción": "2:31235678:",
+    "asesinar": "30001123345567",
+    "trabajador": "30023345567789",
+    "perdonar": "20012345567",
+    "escrita": "10001245567",
+    "células": "02112234456",
+    "sábanas": "02112234456",
+    "decepcionado": "3001223456889::;<",
+    "inocencia": "20001123345679",
+    "timbre": "00012356",
+    "récord": "02112234",
+    "posesión": "27312234457",
+    "generaciones": "300122344566799:;",
+    "jueces": "00013345",
+    "preguntaré": "3:42334567889:",
+    "pagarle": "10012234567",
+    "llamaban": "10023345567",
+    "provisiones": "2002334556889:",
+    "ayuntamiento": "30001113456679:;<",
+    "soga": "00012234",
+    "debimos": "10012234456",
+    "estuvieran": "20001234457789",
+    "juegan": "00013345",
+    "atado": "10001123345",
+    "entraron": "10001245567",
+    "sensacional": "3001234556889:",
+    "caes": "00012223",
+    "cafetería": "38412234456678889",
+    "llamarla": "10023345678",
+    "reunir": "10013345",
+    "agotado": "20001123345567",
+    "produce": "10023345567",
+    "extraordinaria": "400012455567899:;;<>",
+    "rudo": "00012234",
+    "oímos": "12201112234",
+    "talla": "00012245",
+    "verse": "00012345",
+    "destrozado": "2001235667889:",
+    "pila": "00012234",
+    "creerá": "26323334456",
+    "alimento": "20001123345678",
+    "sentar": "10012345",
+    "merecen": "10012234456",
+    "cráneo": "03123345556",
+    "senor": "10012234",
+    "busquen": "00012356",
+    "discúlpenme": "152123456789:;",
+    "habitantes": "20012234456789",
+    "quite": "00023345",
+    "volumen": "10012234456",
+    "toquen": "00012245",
+    "domingos": "10012234567",
+    "girar": "10012234",
+    "tardará": "27312345567",
+    "romanos": "10012234456",
+    "considero": "20012345567789",
+    "beba": "00012234",
+    "llamará": "27323345567",
+    "verlas": "00012345",
+    "pobreza": "10012245567",
+    "británicos": "15223345567789",
+    "pulmones": "10012345567",
+    "hueco": "00013345",
+    "hembra": "00012356",
+    "inusual": "20001123346",
+    "suicidó": "27313345567",
+    "cuidaré": "27313345567",
+    "quinta": "00023456",
+    "brillo": "00023356",
+    "organizado": "3000123445667889:",
+    "gorra": "00012245",
+    "renta": "00012345",
+    "educado": "20001123345567",
+    "sentirlo": "10012345678",
+    "matarlos": "10012234567",
+    "turistas": "10012234567",
+    "ligera": "10012234456",
+    "diente": "00013456",
+    "correctamente": "3001224567889:;<=",
+    "camas": "00012234",
+    "dueños": "00013345",
+    "beca": "00012234",
+    "tristes": "00023456",
+    "sentirás": "27312345567",
+    "novato": "10012234456",
+    "ascenso": "10001234567",
+    "incómodo": "14201234456678",
+    "responsables": "200123456788:;",
+    "facultad": "20012234567",
+    "portero": "10012345567",
+    "mantenerlo": "2001234556789:",
+    "dinamita": "20012234456678",
+    "equilibrio": "2000113445668:",
+    "lastimar": "20012345567",
+    "debamos": "10012234456",
+    "insiste": "10001234567",
+    "cortes": "00012345",
+    "increíbles": "26301245556689",
+    "permanece": "20012345567789",
+    "asesinados": "30001123345567789",
+    "bajó": "14212234",
+    "terminemos": "20012345567789",
+    "escribiré": "39401245567789",
+    "multa": "00012345",
+    "signo": "00012345",
+    "cogeré": "26312234456",
+    "intercambio": "2000123456789;",
+    "espadas": "10001234456",
+    "interesada": "3000123445667889:",
+    "temes": "00012234",
+    "divertirnos": "2001223456789:",
+    "todopoderoso": "4001223445667889::;<",
+    "bañera": "10012234456",
+    "detenerme": "20012234456789",
+    "conservar": "20012345678",
+    "oyendo": "10001113456",
+    "novedad": "20012234456",
+    "viaja": "00013345",
+    "pensaría": "27312345567778",
+    "individuo": "20001234456679",
+    "cómico": "02112234456",
+    "echarle": "10001134567",
+    "acompaña": "20001123456678",
+    "retrocede": "20012245567789",
+    "bajos": "00012234",
+    "vientre": "00013467",
+    "gol": "00012",
+    "lindos": "00012345",
+    "acercarse": "20001123456789",
+    "simples": "00012356",
+    "habríamos": "15212245556678",
+    "huelo": "00013345",
+    "permita": "10012345567",
+    "inversión": "28301234568",
+    "cuñado": "10012234456",
+    "sencilla": "10012345578",
+    "bastantes": "10012345678",
+    "raya": "00012224",
+    "ansioso": "10001235567",
+    "esfuerzos": "10001235678",
+    "fotógrafo": "14212234467789",
+    "hazte": "00012345",
+    "occidental": "30001234456789",
+    "risas": "00012234",
+    "crítica": "03123345567",
+    "bruto": "00023345",
+    "cortesía": "27312345567778",
+    "moriremos": "20012234456678",
+    "árabes": "01101123345",
+    "chau": "00024",
+    "cristianos": "10023457789",
+    "gallinas": "10012245567",
+    "plataforma": "2002334556789:",
+    "caerá": "25312223345",
+    "culpables": "10012345578",
+    "capitan": "10012234456",
+    "malentendido": "3001223456789::;<",
+    "saldrás": "16212356",
+    "probabilidades": "400233455677899:;;<=",
+    "acostarme": "20001123456789",
+    "experimentos": "300012344566789:;",
+    "torta": "00012345",
+    "oírte": "12201112345",
+    "felicito": "20012234456678",
+    "delgado": "10012345567",
+    "gusanos": "10012234456",
+    "vergonzoso": "2001234567889:",
+    "cal": "00012",
+    "cirujano": "20012234456678",
+    "callate": "10012245567",
+    "tela": "00012234",
+    "furia": "00012235",
+    "mostró": "16212356",
+    "siesta": "00013456",
+    "entusiasmo": "2000123445789:",
+    "regresemos": "20012245567789",
+    "aprendiendo": "200011345689:;",
+    "plumas": "00023345",
+    "aceptó": "26301123456",
+    "esperes": "10001234456",
+    "coco": "00012234",
+    "moscas": "00012345",
+    "escocia": "10001234457",
+    "manchas": "00012356",
+    "andré": "15201245",
+    "afueras": "10001124456",
+    "rompí": "15212345",
+    "arregla": "10001134467",
+    "pidieron": "10012235567",
+    "mírala": "02112234456",
+    "vivas": "00012234",
+    "mañanas": "10012234456",
+    "escoria": "10001234457",
+    "ferrocarril": "3001224556779:",
+    "costo": "00012345",
+    "necesitarás": "4:51223445667889:",
+    "investigaciones": "400012345677899:<<=>",
+    "margen": "00012345",
+    "dispuestos": "10012346789",
+    "falda": "00012345",
+    "competir": "20012345567",
+    "contrató": "28312356678",
+    "fumando": "10012234567",
+    "llamaría": "27323345567778",
+    "etapa": "10001123345",
+    "audición": "27302234457",
+    "construyó": "29312467779",
+    "mecánico": "14212234456678",
+    "alfa": "00001234",
+    "verga": "00012345",
+    "merecía": "26312234456667",
+    "esencia": "10001123457",
+    "judía": "14212234445",
+    "inicio": "10001123346",
+    "llover": "10023345",
+    "hacerles": "10012234567",
+    "cruce": "00023345",
+    "bandido": "10012345567",
+    "ocúpate": "13201123345567",
+    "sillas": "00012245",
+    "aliados": "10001124456",
+    "entraste": "10001245678",
+    "ofrecerle": "20001134456789",
+    "choque": "00023356",
+    "generales": "20012234456678",
+    "tierno": "00013456",
+    "inyección": "28301224568",
+    "recibiendo": "2001223445789:",
+    "pasteles": "10012345567",
+    "computadoras": "300123455677899:;",
+    "presos": "00023345",
+    "pruebe": "00024456",
+    "técnico": "02112345567",
+    "hechizo": "10012245567",
+    "llevarnos": "10023345678",
+    "escopeta": "20001234456678",
+    "comience": "10012235678",
+    "sexto": "00012345",
+    "habré": "15212245",
+    "dámela": "02112234456",
+    "hurra": "00012245",
+    "gallo": "00012245",
+    "denme": "00012345",
+    "hara": "00012234",
+    "bárbara": "02112345567",
+    "pelos": "00012234",
+    "ardiendo": "10001235678",
+    "rehén": "14212234",
+    "aventuras": "20001123456678",
+    "separado": "20012234456678",
+    "recorrido": "20012234467789",
+    "levantarme": "2001223456789:",
+    "caballería": "3941223446778999:",
+    "fuí": "03113",
+    "preparen": "10023345567",
+    "viajando": "10013345678",
+    "femenino": "20012234456678",
+    "partidos": "10012345567",
+    "alá": "13201123",
+    "huyó": "14212224",
+    "arriesgado": "2000113567889:",
+    "huye": "00012224",
+    "echas": "00001134",
+    "persiguiendo": "20012345579:;<",
+    "conocías": "26312234456667",
+    "retirado": "20012234456678",
+    "afortunada": "3000112345667889:",
+    "apunta": "10001123456",
+    "morirán": "26312234456",
+    "linterna": "10012345678",
+    "acostarse": "20001123456789",
+    "encontrarnos": "200012345789:;",
+    "almohada": "20001234456678",
+    "falsas": "00012345",
+    "vé": "02112",
+    "sintiendo": "10012346789",
+    "rama": "00012234",
+    "usé": "13201123",
+    "quitarme": "10023345678",
+    "tendrían": "16212356667",
+    "afortunadamente": "5000112345667889::;<=>?",
+    "preocuparme": "300233344566789:;",
+    "bodega": "10012234456",
+    "ebrio": "00001135",
+    "relacionado": "300122344577899:;",
+    "guardián": "17213457",
+    "muertas": "00013456",
+    "gratitud": "20023345567",
+    "responsabilidades": "5001234567889::;<<=>>?@",
+    "ejercito": "20001123456678",
+    "misericordia": "300122344566789:<",
+    "entierro": "10001235578",
+    "invasión": "27301234457",
+    "muestran": "00013467",
+    "conveniente": "200123455689:;",
+    "pensará": "27312345567",
+    "emocional": "30001123346678",
+    "dejarnos": "10012234567",
+    "meto": "00012234",
+    "escudo": "10001234456",
+    "esperábamos": "2630123445667889:",
+    "falsos": "00012345",
+    "masaje": "10012234456",
+    "lejano": "10012234456",
+    "cabe": "00012234",
+    "sándwich": "02112456",
+    "césped": "02112345",
+    "lana": "00012234",
+    "emocionado": "3000112334667889:",
+    "regreses": "10012245567",
+    "despertó": "28312345678",
+    "instrumentos": "200013566789:;",
+    "comidas": "10012234456",
+    "paisaje": "10013345567",
+    "observación": "3:40123456778:",
+    "depresión": "28312245568",
+    "artillería": "3940123446778999:",
+    "cruzado": "10023345567",
+    "crecí": "15223345",
+    "gemelos": "10012234456",
+    "voluntario": "2001223456778:",
+    "fallo": "00012245",
+    "montones": "10012345567",
+    "respetar": "20012345567",
+    "creéis": "14223335",
+    "filas": "00012234",
+    "veis": "00013",
+    "cubo": "00012234",
+    "geniales": "10012235567",
+    "esencial": "20001123457",
+    "negar": "10012234",
+    "concéntrate": "152123456899:;",
+    "ruidos": "00013345",
+    "objetivos": "20001234456678",
+    "polonia": "10012234457",
+    "andaba": "10001234456",
+    "mariscal": "20012234567",
+    "caravana": "20012234456678",
+    "desgraciadamente": "400123566799:;;<=>?@",
+    "imaginado": "30001123345567789",
+    "advertí": "27301234567",
+    "tumbas": "00012345",
+    "ordena": "10001234456",
+    "radiación": "28312235568",
+    "accidentes": "20001234456789",
+    "revisa": "10012234456",
+    "homicidios": "20012234456679",
+    "ácido": "01101123345",
+    "suelen": "00013345",
+    "lesbiana": "10012346678",
+    "leerlo": "10012223456",
+    "identificar": "4000112345667889:",
+    "eventos": "10001123456",
+    "respetable": "2001234556779:",
+    "sentirte": "10012345678",
+    "campanas": "10012345567",
+    "propina": "10023345567",
+    "desgraciados": "200123566799:;",
+    "párate": "02112234456",
+    "grites": "00023345",
+    "acepte": "10001123456",
+    "maravillas": "20012234456689",
+    "bicho": "00012245",
+    "dormí": "15212345",
+    "amarilla": "20001123345578",
+    "cazadores": "20012234456678",
+    "suyas": "00012224",
+    "causó": "15213345",
+    "llamaremos": "20023345567789",
+    "ubicación": "38401123345568",
+    "quedarán": "27323345567",
+    "sugerencia": "2001223445678:",
+    "tomate": "10012234456",
+    "rebelde": "10012234567",
+    "previsto": "10023345678",
+    "mandé": "15212345",
+    "asesinó": "37401123345567",
+    "amiguito": "20001123356678",
+    "comenzando": "2001223456789:",
+    "discutiendo": "200123455689:;",
+    "prioridad": "20024456678",
+    "sonidos": "10012234456",
+    "naciste": "10012234567",
+    "estable": "10001234467",
+    "posibles": "10012234467",
+    "sacarme": "10012234567",
+    "mear": "10012223",
+    "follar": "10012245",
+    "arrogante": "20001134456789",
+    "vendrías": "16212356667",
+    "reza": "00012234",
+    "cagar": "10012234",
+    "expedición": "39401234456679",
+    "hermanita": "20012345567789",
+    "avance": "10001123456",
+    "muñecas": "10012234456",
+    "sostén": "15212345",
+    "niñita": "10012234456",
+    "volviera": "10012346678",
+    "oficinas": "20001123345567",
+    "llevarás": "27323345567",
+    "ruina": "00013345",
+    "escondite": "20001234567789",
+    "basado": "10012234456",
+    "mojado": "10012234456",
+    "respiro": "10012345567",
+    "trates": "00023345",
+    "viena": "00013345",
+    "estabamos": "20001234456678",
+    "atrae": "10001134445",
+    "jamón": "14212234",
+    "botes": "00012234",
+    "insectos": "10001234567",
+    "direcciones": "2001223456889:",
+    "comunicaciones": "4001223445667889;;<=",
+    "sácame": "02112234456",
+    "propiedades": "2002334667889:",
+    "triunfo": "00024567",
+    "entres": "00001245",
+    "vías": "02112223",
+    "manicomio": "20012234456679",
+    "amabilidad": "40001123345567789",
+    "cicatriz": "20012234467",
+    "pipa": "00012234",
+    "acababa": "20001123345567",
+    "éso": "01101123",
+    "insisto": "10001234567",
+    "asistir": "20001123456",
+    "llevarán": "27323345567",
+    "marrón": "15212245",
+    "camarera": "20012234456678",
+    "huella": "00013356",
+    "vivirá": "26312234456",
+    "vacías": "14212234445",
+    "traicionado": "200244577899:;",
+    "expresar": "20001245567",
+    "estreno": "10001245567",
+    "mascota": "10012345567",
+    "regresamos": "20012245567789",
+    "asustaste": "20001123456789",
+    "políticas": "14212234456678",
+    "significaba": "300123455677899:;",
+    "escondidas": "20001234567789",
+    "entrenar": "20001245567",
+    "paró": "14212234",
+    "peste": "00012345",
+    "supervivencia": "30012234567789:;=",
+    "asquerosa": "20001245567789",
+    "mirarme": "10012234567",
+    "ciencias": "00013457",
+    "sierra": "00013356",
+    "moriría": "26312234456667",
+    "ruinas": "00013345",
+    "vasos": "00012234",
+    "abro": "00001134",
+    "granero": "10023345567",
+    "coartada": "20012223456678",
+    "ambición": "27301234457",
+    "declarar": "20012245567",
+    "celebración": "3:41223446778:",
+    "utiliza": "20001123345567",
+    "experiencias": "2000123445789;",
+    "senado": "10012234456",
+    "sentidos": "10012345567",
+    "ultimo": "10001234456",
+    "melodía": "26312234456667",
+    "reservado": "20012234567789",
+    "deténganse": "1421223456789:",
+    "sida": "00012234",
+    "baúl": "13212223",
+    "leones": "10012223345",
+    "consejero": "20012345567789",
+    "demostración": "3;41223457889;",
+    "lenta": "00012345",
+    "técnicamente": "02112345567789:;<",
+    "concierne": "10012346789",
+    "avanzar": "20001123456",
+    "parecerá": "38412234456678",
+    "arrestar": "20001134567",
+    "dedicado": "20012234456678",
+    "conejos": "10012234456",
+    "vosotras": "10012234467",
+    "puñado": "10012234456",
+    "batallón": "27312234467",
+    "estupideces": "3000123445667889:",
+    "sana": "00012234",
+    "coñac": "10012234",
+    "inspiración": "3:40134556778:",
+    "aparecen": "20001123345567",
+    "asustó": "26301123456",
+    "vicepresidente": "400122344677899:;<=>",
+    "muriera": "10012235567",
+    "sacando": "10012234567",
+    "mona": "00012234",
+    "pusimos": "10012234456",
+    "músicos": "02112234456",
+    "sacamos": "10012234456",
+    "insoportable": "300012344567899;<",
+    "vagón": "14212234",
+    "mochila": "10012245567",
+    "oscuras": "10001234456",
+    "atracción": "28301134568",
+    "contratado": "2001235667889:",
+    "respondió": "29312345679",
+    "ponme": "00012345",
+    "sorprendió": "2:31235678:",
+    "torres": "00012245",
+    "levantó": "27312234567",
+    "yenes": "00002234",
+    "evidentemente": "4000112334567889:;<=",
+    "apuro": "10001123345",
+    "mueven": "00013345",
+    "contaba": "10012345567",
+    "cometa": "10012234456",
+    "guardaespaldas": "3001345666789:;<=",
+    "encontraría": "3:40123457889:::;",
+    "asistencia": "2000112345678:",
+    "aprendió": "28301134568",
+    "manejo": "10012234456",
+    "banquete": "10012356678",
+    "establecer": "30001234467789",
+    "fáciles": "02112234456",
+    "amenazas": "20001123345567",
+    "situaciones": "2001223556889:",
+    "oculto": "10001123456",
+    "deshacerse": "2001234556789:",
+    "fórmula": "02112345567",
+    "medicinas": "20012234456678",
+    "firmes": "00012345",
+    "aprovechar": "30001134456689",
+    "venas": "00012234",
+    "persigue": "10012345578",
+    "entere": "10001234456",
+    "atacado": "20001123345567",
+    "especialidad": "400012344577899:;",
+    "necesariamente": "400122344566799:;<=>",
+    "tarzán": "15212345",
+    "convención": "29312345679",
+    "directora": "20012234567789",
+    "hoteles": "10012234456",
+    "tire": "00012234",
+    "atacaron": "20001123345567",
+    "álbum": "01101234",
+    "molestaría": "3941223456778999:",
+    "ahorrar": "20001123356",
+    "gigantes": "10012234567",
+    "venda": "00012345",
+    "mediante": "10012235678",
+    "confidencial": "3001234556789;",
+    "quedando": "10023345678",
+    "pagamos": "10012234456",
+    "parecían": "26312234456667",
+    "agradecer": "30001134456678",
+    "penas": "00012234",
+    "increible": "10001246689",
+    "flecha": "00023356",
+    "virtud": "10012345",
+    "curva": "00012345",
+    "demente": "10012234567",
+    "perdono": "10012345567",
+    "usarla": "10001123456",
+    "limón": "14212234",
+    "compramos": "10012356678",
+    "lamentablemente": "4001223456779::;<=>?",
+    "disfrutando": "200123566789:;",
+    "inferior": "20001234457",
+    "asilo": "10001123345",
+    "entregado": "20001245567789",
+    "deliciosa": "20012234457789",
+    "ordenar": "20001234456",
+    "decida": "10012234456",
+    "desesperación": "4<5122345677899:<",
+    "tomarlo": "10012234567",
+    "prepare": "10023345567",
+    "comprando": "10012356789",
+    "corren": "00012245",
+    "posee": "10012234445",
+    "despedir": "20012345567",
+    "ángulo": "01101234456",
+    "carruaje": "10012246678",
+    "reparar": "20012234456",
+    "enojar": "20001123345",
+    "cancelar": "20012345567",
+    "desear": "20012234445",
+    "soltar": "10012345",
+    "pertenecen": "20012345567789",
+    "duerma": "00013456",
+    "solíamos": "14212234445567",
+    "resiste": "10012234567",
+    "debían": "14212234445",
+    "encantaba": "20001234567789",
+    "irlandés": "27301234567",
+    "incluye": "10001245557",
+    "eternamente": "300011234566789:;",
+    "castigado": "20012345567789",
+    "pirata": "10012234456",
+    "terrorismo": "2001224556789:",
+    "fritas": "00023345",
+    "anos": "00001123",
+    "rodaje": "10012234456",
+    "desesperada": "300122345677899:;",
+    "cruzando": "10023345678",
+    "permites": "10012345567",
+    "fenomenal": "30012234456678",
+    "tiras": "00012234",
+    "reunido": "10013345567",
+    "diviértete": "1521223567889:",
+    "serios": "00012235",
+    "napoleón": "37412234456667",
+    "sorpresas": "10012356678",
+    "garantía": "27312234567778",
+    "hada": "00012234",
+    "agáchate": "13201123356678",
+    "subo": "00012234",
+    "carnicero": "20012345567789",
+    "carajos": "10012234456",
+    "reciente": "10012235678",
+    "toqué": "15212245",
+    "duermas": "00013456",
+    "cayeron": "10012224456",
+    "supuestamente": "3001223567889:;<=",
+    "asumir": "20001123345",
+    "conque": "00012356",
+    "charlar": "10023456",
+    "escuchamos": "20001234467789",
+    "quitarle": "10023345678",
+    "abandona": "20001123456678",
+    "debíamos": "14212234445567",
+    "alboroto": "20001234456678",
+    "sacarle": "10012234567",
+    "comeré": "26312234456",
+    "conseguirás": "3:41234557889:",
+    "buda": "00012234",
+    "rio": "00013",
+    "salchichas": "10012356689",
+    "agarró": "26301123356",
+    "cuchillos": "10012245578",
+    "boxeo": "10012234445",
+    "primos": "00023345",
+    "inútiles": "13201123345567",
+    "intelectual": "3000123445678:",
+    "rana": "00012234",
+    "inventado": "20001234567789",
+    "bienestar": "20013345678",
+    "cercana": "10012345567",
+    "leyó": "14212224",
+    "sirva": "00012345",
+    "taberna": "10012234567",
+    "impulso": "10001234567",
+    "levanten": "10012234567",
+    "retrocedan": "20012245567789",
+    "dicha": "00012245",
+    "llevaste": "10023345678",
+    "comprometido": "3001235667889::;<",
+    "explique": "10001245578",
+    "patadas": "10012234456",
+    "pieles": "00013345",
+    "anuncios": "10001123457",
+    "nucleares": "20012245556678",
+    "tuviéramos": "15212235567789",
+    "venían": "14212234445",
+    "obedecer": "30001123345567",
+    "volved": "10012345",
+    "agárrate": "13201123356678",
+    "desnudos": "10012345567",
+    "ramera": "10012234456",
+    "fijo": "00012234",
+    "rodando": "10012234567",
+    "enséñame": "14201234456678",
+    "grecia": "00023346",
+    "necesaria": "20012234456679",
+    "carros": "00012245",
+    "atento": "10001123456",
+    "creció": "16223346",
+    "cansados": "10012345567",
+    "perfección": "29312345679",
+    "ejecutivo": "30001123345567789",
+    "lloviendo": "10023346789",
+    "orinar": "20001123345",
+    "terminaron": "20012345567789",
+    "cuna": "00012234",
+    "dispositivo": "300123455677899:;",
+    "casaste": "10012234567",
+    "sabias": "00012235",
+    "retirar": "20012234456",
+    "mirá": "14212234",
+    "guardo": "00013456",
+    "conectado": "20012234567789",
+    "solitaria": "20012234456679",
+    "ocuparme": "20001123345678",
+    "cómplice": "02112356678",
+    "atrapada": "20001134456678",
+    "sesenta": "10012234567",
+    "alumno": "10001123456",
+    "femenina": "20012234456678",
+    "conteste": "10012345678",
+    "sinvergüenza": "20012345689:;<",
+    "capturado": "20012345567789",
+    "ocupar": "20001123345",
+    "brisa": "00023345",
+    "violín": "15213345",
+    "bromeo": "10023345556",
+    "menú": "14212234",
+    "tomarme": "10012234567",
+    "decides": "10012234456",
+    "basada": "10012234456",
+    "conquistar": "20012356789",
+    "tirador": "20012234456",
+    "confuso": "10012345567",
+    "descubre": "10012345578",
+    "palos": "00012234",
+    "vístete": "02112345567",
+    "promete": "10023345567",
+    "conocidos": "20012234456678",
+    "pleno": "00023345",
+    "factura": "10012345567",
+    "ardiente": "10001235678",
+    "casaré": "26312234456",
+    "salchicha": "10012356689",
+    "billetera": "20012245567789",
+    "comunes": "10012234456",
+    "extrañé": "27301245567",
+    "sientan": "00013456",
+    "jerusalén": "38412234456678",
+    "combatir": "20012345567",
+    "tiburones": "20012234456678",
+    "trabaje": "10023345567",
+    "salvarte": "10012345678",
+    "madrugada": "20012245567789",
+    "explicarte": "2000124556789:",
+    "usaré": "25301123345",
+    "inventó": "27301234567",
+    "oraciones": "20001123346678",
+    "fingiendo": "10012346789",
+    "dueña": "00013345",
+    "tardaré": "27312345567",
+    "jorge": "00012345",
+    "naturales": "20012234456678",
+    "vecina": "10012234456",
+    "síntomas": "02112345567",
+    "deprimido": "20012245567789",
+    "terremoto": "20012245567789",
+    "grabado": "10023345567",
+    "acostarte": "20001123456789",
+    "convertirme": "200123456789:;",
+    "prepararé": "39423345567789",
+    "filme": "00012345",
+    "pudiese": "10012235567",
+    "gastado": "10012345567",
+    "encontrarse": "200012345789:;",
+    "marqués": "16212356",
+    "tocan": "00012234",
+    "gustaban": "10012345567",
+    "vestir": "10012345",
+    "absoluta": "20001234456678",
+    "vendí": "15212345",
+    "bata": "00012234",
+    "voló": "14212234",
+    "satisfacción": "3;41223456789;",
+    "cambiaron": "10012346678",
+    "pacto": "00012345",
+    "patán": "14212234",
+    "apagado": "20001123345567",
+    "marchado": "10012356678",
+    "temblando": "10012356789",
+    "empezaremos": "3000123445667889:",
+    "ignorante": "20001234456789",
+    "escucharlo": "2000123446789:",
+    "manejando": "20012234456789",
+    "supremo": "10012245567",
+    "navegar": "20012234456",
+    "categoría": "38412234456678889",
+    "bastón": "15212345",
+    "producir": "20023345567",
+    "miento": "00013456",
+    "matarle": "10012234567",
+    "marta": "00012345",
+    "luchador": "20012245567",
+    "rencor": "10012345",
+    "zapatillas": "20012234456689",
+    "caramelos": "20012234456678",
+    "crítico": "03123345567",
+    "what": "00023",
+    "hamburguesas": "200123456899:;",
+    "aprieta": "10001135567",
+    "pónganse": "02112345678",
+    "liberado": "20012234456678",
+    "avanza": "10001123456",
+    "crecen": "00023345",
+    "cuelga": "00013456",
+    "correos": "10012245556",
+    "establo": "10001234467",
+    "declarado": "20012245567789",
+    "bate": "00012234",
+    "norma": "00012345",
+    "elemento": "20001123345678",
+    "mundos": "00012345",
+    "invento": "10001234567",
+    "entendió": "28301234568",
+    "comparado": "20012345567789",
+    "millonario": "2001224556778:",
+    "duró": "14212234",
+    "anillos": "10001123356",
+    "aumentar": "20002234567",
+    "estudiado": "20001234457789",
+    "supermercado": "3001223456789::;<",
+    "dirigida": "20012234456678",
+    "autorizado": "3000223445667889:",
+    "cuidadosamente": "400133455677899:;<=>",
+    "promedio": "10023345568",
+    "abogada": "20001123345567",
+    "suélteme": "03113456678",
+    "explico": "10001245567",
+    "this": "00023",
+    "tenias": "00012235",
+    "saltó": "15212345",
+    "criar": "00024",
+    "interrogatorio": "400012344677899:;;<>",
+    "protegido": "20023345567789",
+    "estrés": "15201245",
+    "comencemos": "20012234567789",
+    "querrán": "16223356",
+    "leíste": "13212223456",
+    "empiecen": "10001235567",
+    "viví": "14212234",
+    "mandaré": "27312345567",
+    "cógelo": "02112234456",
+    "mito": "00012234",
+    "mesas": "00012234",
+    "crucero": "10023345567",
+    "independencia": "30001234456789:;=",
+    "declaro": "10012245567",
+    "antiguas": "10001234457",
+    "crío": "03123334",
+    "historial": "20012345568",
+    "delicada": "20012234456678",
+    "costumbres": "10012345689",
+    "jugaba": "10012234456",
+    "bretaña": "10023345567",
+    "perlas": "00012345",
+    "pensaron": "10012345567",
+    "italiana": "20001123346678",
+    "calzones": "10012345567",
+    "poemas": "10012223345",
+    "bestias": "00012346",
+    "tarda": "00012345",
+    "tomaba": "10012234456",
+    "enfades": "10001234456",
+    "portada": "10012345567",
+    "psicópata": "15223345567789",
+    "contactar": "20012345678",
+    "chistoso": "10023456678",
+    "relámpago": "14212234567789",
+    "tinta": "00012345",
+    "impide": "10001234456",
+    "exacta": "10001123456",
+    "fijado": "10012234456",
+    "maravillosos": "300122344566899:;",
+    "acompañarme": "300011234566789:;",
+    "é": "01101",
+    "baloncesto": "2001223456789:",
+    "tiré": "14212234",
+    "principalmente": "300234566789:;<=>",
+    "guarde": "00013456",
+    "deseado": "20012234445567",
+    "duras": "00012234",
+    "guay": "00014",
+    "leña": "00012234",
+    "acabemos": "20001123345567",
+    "ahorros": "10001123356",
+    "logra": "00012245",
+    "autopsia": "10002234568",
+    "amos": "00001123",
+    "uniformes": "20001123345678",
+    "obtuvo": "10001234456",
+    "ganará": "26312234456",
+    "cuernos": "00013456",
+    "flotando": "10023345678",
+    "doncella": "10012345578",
+    "tradicional": "3002334556889:",
+    "renuncia": "10012234568",
+    "llevaban": "10023345567",
+    "estallar": "20001234467",
+    "dejarlos": "10012234567",
+    "recibiste": "20012234456789",
+    "acostumbrada": "3000112345679::;<",
+    "cerró": "15212245",
+    "masacre": "10012234467",
+    "preciosas": "10023346678",
+    "misteriosa": "2001234556889:",
+    "ofrecido": "20001134456678",
+    "colocar": "20012234456",
+    "sopla": "00012245",
+    "diferencias": "2001223445678:",
+    "pis": "00012",
+    "poderosos": "20012234456678",
+    "debieron": "10012235567",
+    "pongamos": "10012345567",
+    "ocupación": "38401123345568",
+    "cambiarme": "10012346789",
+    "confirmado": "2001234567889:",
+    "infarto": "10001234567",
+    "ejercicios": "20001123456679",
+    "culpar": "10012345",
+    "metiendo": "10012235678",
+    "prudente": "10023345678",
+    "vaqueros": "10012245567",
+    "arrestaron": "20001134567789",
+    "sácalo": "02112234456",
+    "bajado": "10012234456",
+    "valentín": "27312234567",
+    "enterrar": "20001234467",
+    "demostrado": "2001223457889:",
+    "vídeo": "02112234445",
+    "voluntarios": "2001223456778:",
+    "suavemente": "2001334556789:",
+    "contenido": "20012345567789",
+    "guardado": "10013456678",
+    "enseñé": "26301234456",
+    "galaxia": "10012234457",
+    "abiertas": "10001124567",
+    "eco": "00001123",
+    "sugiere": "10012235567",
+    "continente": "2001234556789:",
+    "huésped": "03113456",
+    "disfruten": "10012356678",
+    "claridad": "20023345567",
+    "llevarle": "10023345678",
+    "desaparición": "4;51223445667889;",
+    "presentarles": "200233456789:;",
+    "encaja": "10001234456",
+    "difunto": "10012234567",
+    "existía": "26301123456667",
+    "perderás": "27312345567",
+    "indicado": "20001234456678",
+    "merecido": "20012234456678",
+    "sucias": "00012235",
+    "arreglos": "10001134467",
+    "déjenlo": "02112234567",
+    "insignificante": "400012345677899:;<=>",
+    "molestarte": "2001223456789:",
+    "engañando": "20001234456789",
+    "agradecida": "3000113445667889:",
+    "parlamento": "2001234556789:",
+    "añadir": "20001123345",
+    "premios": "00023346",
+    "ilusiones": "20001123346678",
+    "esperándote": "263012344567899:;",
+    "docenas": "10012234456",
+    "agradecerle": "300011344566789:;",
+    "cacería": "26312234456667",
+    "mozo": "00012234",
+    "bromeaba": "20023345556678",
+    "favores": "10012234456",
+    "matrícula": "15212245567789",
+    "farsa": "00012345",
+    "muñeco": "10012234456",
+    "mayordomo": "20012224567789",
+    "obliga": "10001134456",
+    "antepasados": "3000123445667889:",
+    "mantenerse": "2001234556789:",
+    "disparan": "10012345567",
+    "tiren": "00012234",
+    "oveja": "10001123345",
+    "corra": "00012245",
+    "granada": "10023345567",
+    "saliera": "10012235567",
+    "automático": "2630223445667889:",
+    "solucionar": "30012234457789",
+    "tuviese": "10012235567",
+    "revelar": "20012234456",
+    "llegarás": "27323345567",
+    "líquido": "02112245567",
+    "mudo": "00012234",
+    "asesinaron": "30001123345567789",
+    "traerlo": "10023334567",
+    "trece": "00023345",
+    "dejaras": "10012234456",
+    "deberias": "10012234457",
+    "protector": "20023345678",
+    "limpiando": "10012346789",
+    "queriendo": "10023346789",
+    "casamiento": "2001223445789:",
+    "romántica": "14212234567789",
+    "hablabas": "10012245567",
+    "quedate": "10023345567",
+    "opiniones": "20001123346678",
+    "vientos": "00013456",
+    "arrancar": "20001134567",
+    "manada": "10012234456",
+    "enseñarme": "20001234456789",
+    "olvídelo": "14201234456678",
+    "refrigerador": "400122455677899:;",
+    "persecución": "3:41234556778:",
+    "aparta": "10001123456",
+    "protesta": "10023345678",
+    "abuelita": "20001124456678",
+    "emergencias": "2000112345678:",
+    "atacan": "10001123345",
+    "montaje": "10012345567",
+    "perdedores": "20012345567789",
+    "conseguirá": "3:41234557889:",
+    "sonriendo": "10012346789",
+    "sígame": "02112234456",
+    "excepcional": "3000123456889:",
+    "pelicula": "20012234456678",
+    "extrañar": "20001245567",
+    "conversaciones": "3001234567889;;<=",
+    "cuadra": "00013356",
+    "crecimiento": "200233455689:;",
+    "drogado": "10023345567",
+    "abrí": "14201134",
+    "obsesión": "27301234457",
+    "cerradas": "10012245567",
+    "institución": "3:40134556778:",
+    "excelentes": "20001234456789",
+    "mula": "00012234",
+    "aprobación": "39401134456679",
+    "frágil": "03123345",
+    "perderé": "27312345567",
+    "mariposa": "20012234456678",
+    "bici": "00012234",
+    "paloma": "10012234456",
+    "suelte": "00013456",
+    "sudor": "10012234",
+    "trágico": "03123345567",
+    "nietos": "00013345",
+    "inicial": "20001123346",
+    "perdonen": "10012345567",
+    "invitada": "20001234456678",
+    "costillas": "10012345578",
+    "quedaste": "10023345678",
+    "vestíbulo": "15212345567789",
+    "empezaste": "20001234456789",
+    "fundación": "28312345568",
+    "limpias": "00012346",
+    "ingresos": "10001245567",
+    "durmió": "16212346",
+    "mutuamente": "2001223556789:",
+    "únicamente": "0110112334556789:",
+    "decidieron": "20012234457789",
+    "enfermería": "3940123456778999:",
+    "traficante": "2002334556789:",
+    "ocurren": "10001123356",
+    "terraza": "10012245567",
+    "sirena": "10012234456",
+    "sirviente": "10012346789",
+    "mares": "00012234",
+    "arreglaremos": "300011344677899:;",
+    "acabé": "25301123345",
+    "escritura": "20001245567789",
+    "juegues": "00013356",
+    "periodo": "10012235567",
+    "arde": "00001234",
+    "etiqueta": "20001123356678",
+    "llévalo": "03123345567",
+    "religioso": "20012234457789",
+    "círculos": "02112345567",
+    "frito": "00023345",
+    "reparto": "10012234567",
+    "vehículos": "14212234456678",
+    "llegaría": "27323345567778",
+    "resfriado": "10012357789",
+    "lloras": "00023345",
+    "noté": "14212234",
+    "sirvientes": "10012346789",
+    "condenados": "20012345567789",
+    "sumamente": "20012234456789",
+    "delincuente": "200122345689:;",
+    "divierte": "10012235678",
+    "caigo": "00013345",
+    "habernos": "10012234567",
+    "centímetros": "1521234556779:",
+    "zar": "00012",
+    "estupido": "20001234456678",
+    "zonas": "00012234",
+    "cargada": "10012345567",
+    "signos": "00012345",
+    "enseñe": "10001234456",
+    "barriga": "10012245567",
+    "arriesgar": "20001135678",
+    "presentarme": "200233456789:;",
+    "llegaba": "10023345567",
+    "comprarme": "10012356789",
+    "ofender": "20001123456",
+    "disfrute": "10012356678",
+    "cerradura": "20012245567789",
+    "suene": "00013345",
+    "pendientes": "10012346789",
+    "manejarlo": "20012234456789",
+    "tomaría": "26312234456667",
+    "maravillosas": "300122344566899:;",
+    "barrera": "10012245567",
+    "preparo": "10023345567",
+    "significan": "20012345567789",
+    "envían": "14201234445",
+    "postura": "10012345567",
+    "dolares": "10012234456",
+    "necesitabas": "3001223445667889:",
+    "provecho": "10023345578",
+    "aprisa": "10001134456",
+    "convento": "10012345678",
+    "suicida": "10013345567",
+    "alturas": "10001234456",
+    "ayudan": "10001113345",
+    "traidores": "10024456678",
+    "agradecería": "4:50113445667889:::;",
+    "tardar": "10012345",
+    "desaparecieron": "4001223445667889;;<=",
+    "camisas": "10012234456",
+    "infantería": "3940123456778999:",
+    "salvarme": "10012345678",
+    "hablábamos": "15212245567789",
+    "entregó": "27301245567",
+    "practicando": "200234566789:;",
+    "disparé": "27312345567",
+    "artificiales": "300012344566799:;",
+    "dolió": "15212235",
+    "obligó": "26301134456",
+    "monta": "00012345",
+    "lavandería": "3941223456778999:",
+    "envíen": "14201234445",
+    "dude": "00012234",
+    "empezaba": "20001234456678",
+    "atraparon": "20001134456678",
+    "arroyo": "10001134446",
+    "olvidaba": "20001234456678",
+    "lorenzo": "10012234567",
+    "aconsejo": "20001123456678",
+    "eché": "14201134",
+    "detendrá": "28312234578",
+    "visitantes": "20012234456789",
+    "diligencia": "2001223445678:",
+    "operadora": "30001123345567789",
+    "compartimos": "2001234567889:",
+    "legales": "10012234456",
+    "debas": "00012234",
+    "dorada": "10012234456",
+    "ríos": "02112223",
+    "intentaron": "20001234567789",
+    "aiguien": "00002246",
+    "prostitutas": "2002345667889:",
+    "estúpidas": "14201234456678",
+    "decís": "14212234",
+    "reservas": "10012234567",
+    "creería": "26323334456667",
+    "sujetos": "10012234456",
+    "pretendes": "10023345678",
+    "construyendo": "20012467779:;<",
+    "fallar": "10012245",
+    "protegerte": "2002334556789:",
+    "cavar": "10012234",
+    "desprecio": "10012356679",
+    "acercan": "10001123456",
+    "plaga": "00023345",
+    "aló": "13201123",
+    "proyectos": "10023335678",
+    "separación": "39412234456679",
+    "asegurarse": "3000112334556789:",
+    "regaló": "26312234456",
+    "esconderse": "2000123456789:",
+    "cuidadoso": "20013345567789",
+    "sonaba": "10012234456",
+    "acusa": "10001123345",
+    "rápidos": "02112234456",
+    "públicas": "02112245567",
+    "recordaré": "39412234567789",
+    "encantar": "20001234567",
+    "escolta": "10001234567",
+    "legalmente": "2001223456789:",
+    "recuperado": "3001223445667889:",
+    "nace": "00012234",
+    "mantienen": "10012346678",
+    "dormiste": "10012345678",
+    "científica": "1621345667889:",
+    "incendios": "10001234568",
+    "traía": "14223334445",
+    "pollos": "00012245",
+    "monja": "00012345",
+    "atrevas": "10001134456",
+    "declaraciones": "3001224556778::;<",
+    "avanzando": "20001123456789",
+    "peinado": "10013345567",
+    "marcar": "10012345",
+    "mande": "00012345",
+    "contratos": "10012356678",
+    "sentirá": "27312345567",
+    "batallas": "10012234467",
+    "joya": "00012224",
+    "capilla": "10012234467",
+    "preocupaba": "3002333445667889:",
+    "identificado": "4000112345667889::;<",
+    "perderte": "10012345678",
+    "perderemos": "20012345567789",
+    "atentamente": "300011234566789:;",
+    "alcanzado": "20001234567789",
+    "agradecimiento": "4000113445667889;<=>",
+    "interpretación": "4=50123457889::;=",
+    "pondrás": "16212356",
+    "cepillo": "10012234467",
+    "hábito": "02112234456",
+    "muros": "00012234",
+    "duermen": "00013456",
+    "consulta": "10012345678",
+    "anunciar": "20001123457",
+    "anual": "10001124",
+    "constitución": "3;41245667889;",
+    "quemó": "15223345",
+    "cambiamos": "10012346678",
+    "nocturna": "10012345678",
+    "barras": "00012245",
+    "televisor": "30012234456678",
+    "desconocida": "300123455677899:;",
+    "pillado": "10012245567",
+    "hubieses": "10012235567",
+    "herir": "10012234",
+    "aumenta": "10002234567",
+    "despegue": "10012345578",
+    "varón": "14212234",
+    "cambias": "00012346",
+    "halcón": "15212345",
+    "dispares": "10012345567",
+    "materiales": "20012234457789",
+    "fino": "00012234",
+    "paquetes": "10012245567",
+    "elefantes": "20001123345678",
+    "culto": "00012345",
+    "bichos": "00012245",
+    "adolescentes": "300011233456789:;",
+    "mierdas": "00013456",
+    "fabulosa": "20012234456678",
+    "acordamos": "20001123456678",
+    "calzoncillos": "200123456788:;",
+    "jodidamente": "300122344566789:;",
+    "argumento": "20001234456789",
+    "atrevido": "20001134456678",
+    "barril": "10012245",
+    "llamados": "10023345567",
+    "concreto": "10012356678",
+    "hospitales": "20012345567789",
+    "capturar": "20012345567",
+    "engañó": "26301234456",
+    "abras": "00001134",
+    "cross": "00023",
+    "devuélveme": "1521223567889:",
+    "inventar": "20001234567",
+    "pagarás": "26312234456",
+    "pareciera": "20012234457789",
+    "destruyó": "28312356668",
+    "enamoré": "37401123345567",
+    "milla": "00012245",
+    "pretendo": "10023345678",
+    "meten": "00012234",
+    "pegarle": "10012234567",
+    "preocupan": "20023334456678",
+    "timón": "14212234",
+    "corrió": "16212246",
+    "perderá": "27312345567",
+    "posada": "10012234456",
+    "eléctrico": "13201123467789",
+    "volvimos": "10012345567",
+    "ballena": "10012245567",
+    "hacienda": "10012235678",
+    "órganos": "01101234456",
+    "rechazado": "20012245567789",
+    "temen": "00012234",
+    "furiosa": "10012235567",
+    "sonó": "14212234",
+    "cocinera": "20012234456678",
+    "mínima": "02112234456",
+    "conociera": "20012234457789",
+    "confirmar": "20012345678",
+    "autógrafo": "14202234467789",
+    "cuái": "03114",
+    "recomiendo": "2001223445789:",
+    "tráelo": "03123334456",
+    "víbora": "02112234456",
+    "anteojos": "20001234445567",
+    "transferencia": "20023567789:;=",
+    "ciegos": "00013345",
+    "despegar": "20012345567",
+    "religiosa": "20012234457789",
+    "alquilar": "20001245567",
+    "reportero": "20012234567789",
+    "sentarnos": "10012345678",
+    "intimidad": "30001234456678",
+    "pobrecito": "20012245567789",
+    "coman": "00012234",
+    "séptimo": "02112345567",
+    "sobrevivió": "3:41224556778:",
+    "parecería": "38412234456678889",
+    "avisado": "20001123345567",
+    "comas": "00012234",
+    "tentación": "28312345568",
+    "desconocidos": "300123455677899:;",
+    "actúas": "14201234445",
+    "falleció": "28312245568",
+    "controlado": "2001235667889:",
+    "quitarte": "10023345678",
+    "técnicas": "02112345567",
+    "rompiste": "10012345678",
+    "denuncia": "10012234568",
+    "intenso": "10001234567",
+    "campesino": "20012345567789",
+    "valga": "00012345",
+    "sospechas": "10012345578",
+    "farmacia": "10012345568",
+    "creando": "10023334567",
+    "comerciales": "2001223456889:",
+    "entiendas": "10001235678",
+    "papás": "14212234",
+    "secuestrado": "200122356899:;",
+    "gancho": "00012356",
+    "furgoneta": "20012345567789",
+    "sentiste": "10012345678",
+    "comiste": "10012234567",
+    "negó": "14212234",
+    "recuperación": "4;51223445667889;",
+    "salidas": "10012234456",
+    "separarnos": "20012234456789",
+    "comienzan": "10012235678",
+    "dígales": "02112234456",
+    "hondo": "00012345",
+    "fantasías": "27312345567778",
+    "echando": "10001134567",
+    "ayudarles": "20001113345678",
+    "vuelan": "00013345",
+    "marciales": "10012346678",
+    "sirvió": "16212346",
+    "héctor": "02112345",
+    "ricardo": "10012234567",
+    "físicamente": "021122344566789:;",
+    "armar": "10001234",
+    "adicto": "10001123456",
+    "soviética": "15212235567789",
+    "sorprendería": "3;4123567899:;;;<",
+    "deberás": "26312234456",
+    "mantenido": "20012345567789",
+    "armadura": "20001234456678",
+    "marcado": "10012345567",
+    "prestar": "10023456",
+    "describir": "20012356678",
+    "embarazo": "20001234456678",
+    "cortas": "00012345",
+    "medicamentos": "300122344566789:;",
+    "enfermeras": "20001234567789",
+    "metieron": "10012235567",
+    "ansiedad": "20001235567",
+    "cueste": "00013456",
+    "práctico": "03123456678",
+    "pagarme": "10012234567",
+    "planetas": "10023345567",
+    "complicada": "2001235667889:",
+    "cachorro": "10012245578",
+    "acusaciones": "3000112334556889:",
+    "destruye": "10012356668",
+    "japonesa": "20012234456678",
+    "daban": "00012234",
+    "consiguen": "10012345578",
+    "arquitecto": "2000124556789:",
+    "lecho": "00012245",
+    "cantan": "00012345",
+    "delincuentes": "200122345689:;",
+    "pausa": "00013345",
+    "orina": "10001123345",
+    "irlanda": "10001234567",
+    "tijeras": "10012234456",
+    "cartero": "10012345567",
+    "desperdicio": "2001234567889;",
+    "iniciar": "20001123346",
+    "musica": "10012234456",
+    "latín": "14212234",
+    "atiende": "10001124567",
+    "supuse": "10012234456",
+    "verduras": "10012345567",
+    "especies": "10001234457",
+    "costar": "10012345",
+    "haríamos": "14212234445567",
+    "suicidarse": "2001334556789:",
+    "firmó": "15212345",
+    "averigua": "20001123345568",
+    "mordió": "16212346",
+    "caramelo": "20012234456678",
+    "cásate": "02112234456",
+    "ratones": "10012234456",
+    "hábil": "02112234",
+    "terminan": "10012345567",
+    "escucharon": "20001234467789",
+    "bares": "00012234",
+    "echarme": "10001134567",
+    "pentágono": "15212345567789",
+    "contéstame": "1521234567889:",
+    "seguid": "10012245",
+    "malvada": "10012345567",
+    "frutas": "00023345",
+    "registrado": "2001223457889:",
+    "mencionado": "2001234667889:",
+    "quítame": "03123345567",
+    "exige": "10001123345",
+    "mortales": "10012345567",
+    "aléjense": "13201123345678",
+    "convertirá": "3:41234567889:",
+    "tronco": "00023456",
+    "particularmente": "40012345567789:;<=>?",
+    "activo": "10001234456",
+    "abuso": "10001123345",
+    "moveos": "10012234445",
+    "traseros": "10023345567",
+    "tranquilamente": "300234677899:;<=>",
+    "explicarle": "2000124556789:",
+    "católica": "14212234456678",
+    "gritó": "15223345",
+    "corazon": "10012234456",
+    "entrevistas": "2000124556789:",
+    "novias": "00012235",
+    "tímida": "02112234456",
+    "cálmense": "02112345678",
+    "dedicas": "10012234456",
+    "acercando": "20001123456789",
+    "respirando": "2001234556789:",
+    "recordarlo": "2001223456789:",
+    "seguirán": "27312245567",
+    "estudia": "10001234457",
+    "hormigas": "10012345567",
+    "internos": "10001234567",
+    "levanto": "10012234567",
+    "interno": "10001234567",
+    "cargando": "10012345678",
+    "asado": "10001123345",
+    "moisés": "15213345",
+    "favoritos": "20012234456678",
+    "dirijo": "10012234456",
+    "profeta": "10023345567",
+    "cantaba": "10012345567",
+    "creían": "14223334445",
+    "griegos": "00024456",
+    "inspección": "29301345679",
+    "acercó": "26301123456",
+    "armonía": "26301234456667",
+    "equivocados": "3000113445667889:",
+    "paraguas": "10012234457",
+    "muérete": "03113345567",
+    "devuelve": "10012235678",
+    "doscientos": "10012346789",
+    "discursos": "10012345678",
+    "esclava": "10001245567",
+    "encendida": "20001234567789",
+    "asustes": "10001123456",
+    "bandeja": "10012345567",
+    "cristiana": "10023457789",
+    "aterrador": "30001123356678",
+    "efectivamente": "4000112345667889:;<=",
+    "oscuros": "10001234456",
+    "tarado": "10012234456",
+    "explorar": "20001245567",
+    "arruinó": "27301135567",
+    "podrido": "10012245567",
+    "sendero": "10012345567",
+    "pasajero": "20012234456678",
+    "pidas": "00012234",
+    "planea": "10023345556",
+    "mudó": "14212234",
+    "cambiaría": "28312346678889",
+    "sacaremos": "20012234456678",
+    "escogido": "20001234456678",
+    "humanas": "10012234456",
+    "contraseña": "2001235667889:",
+    "corrupción": "29312245679",
+    "polaco": "10012234456",
+    "cortina": "10012345567",
+    "mantenerme": "2001234556789:",
+    "interna": "10001234567",
+    "hicieran": "10012235567",
+    "salvé": "15212345",
+    "perdería": "27312345567778",
+    "nieta": "00013345",
+    "necesitábamos": "3841223445667889::;<",
+    "tuvieran": "10012235567",
+    "generador": "30012234456678",
+    "matanza": "10012234567",
+    "gordos": "00012345",
+    "explicaciones": "3000124556778::;<",
+    "cohetes": "10012234456",
+    "muestre": "00013467",
+    "asustar": "20001123456",
+    "mantuvo": "10012345567",
+    "generosa": "20012234456678",
+    "exteriores": "20001234457789",
+    "apresúrate": "2630113445667889:",
+    "dirigen": "10012234456",
+    "martín": "15212345",
+    "paja": "00012234",
+    "estribor": "20001245567",
+    "elegí": "25301123345",
+    "abejas": "10001123345",
+    "perdon": "00012345",
+    "mantenerte": "2001234556789:",
+    "infección": "28301234568",
+    "sencillamente": "3001234557889:;<=",
+    "latas": "00012234",
+    "linea": "10012234445",
+    "unico": "10001123345",
+    "sombreros": "10012356678",
+    "envidio": "10001234457",
+    "claras": "00023345",
+    "regresaste": "2001224556789:",
+    "demora": "10012234456",
+    "referencia": "2001223445678:",
+    "alba": "00001234",
+    "pólvora": "02112345567",
+    "inmortal": "20001234567",
+    "ayudes": "10001113345",
+    "ies": "00002",
+    "pertenezco": "2001234556789:",
+    "mide": "00012234",
+    "facil": "10012234",
+    "hallamos": "10012245567",
+    "regresas": "10012245567",
+    "hablaron": "10012245567",
+    "mandaron": "10012345567",
+    "hablara": "10012245567",
+    "coordenadas": "3001222345667889:",
+    "zoológico": "25312223345567789",
+    "sacan": "00012234",
+    "permitió": "28312345568",
+    "guante": "00013456",
+    "fumas": "00012234",
+    "porfavor": "20012345567",
+    "paracaídas": "37412234456667789",
+    "peluca": "10012234456",
+    "descubrieron": "200123455799:;",
+    "detén": "14212234",
+    "habiendo": "10012235678",
+    "importará": "39401234567789",
+    "presentaré": "3:42334567889:",
+    "ganarse": "10012234567",
+    "golpeando": "20012345556789",
+    "sacarla": "10012234567",
+    "enteró": "26301234456",
+    "quitaron": "10023345567",
+    "marineros": "20012234456678",
+    "regresaremos": "300122455677899:;",
+    "lamentable": "2001223456779:",
+    "despreciable": "200123566799;<",
+    "ayudé": "25301113345",
+    "contestó": "28312345678",
+    "reciben": "10012234456",
+    "parados": "10012234456",
+    "pabellón": "27312234467",
+    "viajado": "10013345567",
+    "subtitulos": "20012345567789",
+    "uses": "00001123",
+    "borrar": "10012245",
+    "duquesa": "10012245567",
+    "valía": "14212234445",
+    "ofendido": "20001123456678",
+    "directores": "20012234567789",
+    "escúchenme": "1420123446789:",
+    "falló": "15212245",
+    "congelado": "20012345567789",
+    "entenderá": "39401234567789",
+    "montado": "10012345567",
+    "paramos": "10012234456",
+    "raíz": "13212223",
+    "cosquillas": "10012356689",
+    "chao": "00023334",
+    "silencioso": "2001223456889:",
+    "tomarte": "10012234567",
+    "pagaron": "10012234456",
+    "botín": "14212234",
+    "deshazte": "10012345678",
+    "dada": "00012234",
+    "orfanato": "20001234456678",
+    "comprarte": "10012356789",
+    "cortos": "00012345",
+    "insulto": "10001234567",
+    "visiones": "10012235567",
+    "cifras": "00012245",
+    "futura": "10012234456",
+    "natal": "10012234",
+    "próximas": "03123345567",
+    "bendita": "10012345567",
+    "granjeros": "10023456678",
+    "localizar": "30012234456678",
+    "garras": "00012245",
+    "morimos": "10012234456",
+    "exhibición": "39401134456679",
+    "podia": "00012235",
+    "detención": "28312234568",
+    "libra": "00012245",
+    "trueno": "00024456",
+    "movido": "10012234456",
+    "sobrio": "00012246",
+    "contador": "20012345567",
+    "labor": "10012234",
+    "abuelos": "10001124456",
+    "trigo": "00023345",
+    "cooperación": "4:51222334556778:",
+    "novelas": "10012234456",
+    "evolución": "38401123345568",
+    "cuerno": "00013456",
+    "surgió": "16212346",
+    "entretenimiento": "400012455677899:<=>?",
+    "senos": "00012234",
+    "atacando": "20001123345678",
+    "serviría": "27312345567778",
+    "impaciente": "2000123445789:",
+    "mantendré": "29312345689",
+    "régimen": "02112234456",
+    "mexicano": "20012234456678",
+    "deseamos": "20012234445567",
+    "helada": "10012234456",
+    "maridos": "10012234456",
+    "frases": "00023345",
+    "británica": "15223345567789",
+    "bombardeo": "20012345678889",
+    "tropa": "00023345",
+    "volverse": "10012345678",
+    "vigilante": "20012234456789",
+    "pasarme": "10012234567",
+    "cosita": "10012234456",
+    "lastima": "10012345567",
+    "puros": "00012234",
+    "reflejo": "10012245567",
+    "creerás": "26323334456",
+    "frenos": "00023345",
+    "lazo": "00012234",
+    "galleta": "10012245567",
+    "abren": "00001134",
+    "madura": "10012234456",
+    "plomo": "00023345",
+    "catorce": "10012234567",
+    "rabino": "10012234456",
+    "doler": "10012234",
+    "estudié": "27301234457",
+    "afortunados": "3000112345667889:",
+    "levántese": "14212234567789",
+    "matones": "10012234456",
+    "boxeador": "30012234445567",
+    "recado": "10012234456",
+    "milán": "14212234",
+    "mapas": "00012234",
+    "resumen": "10012234456",
+    "respetos": "10012345567",
+    "apoyar": "20001123335",
+    "relojes": "10012234456",
+    "nadando": "10012234567",
+    "delgada": "10012345567",
+    "mascotas": "10012345567",
+    "encontrarle": "200012345789:;",
+    "provocar": "20023345567",
+    "unir": "10001123",
+    "mantenimiento": "3001234556778:;<=",
+    "chatarra": "10023345578",
+    "pascua": "00012346",
+    "busquemos": "10012356678",
+    "aceptaré": "38401123456678",
+    "colgando": "10012345678",
+    "márchate": "02112356678",
+    "guardas": "00013456",
+    "masas": "00012234",
+    "camarote": "20012234456678",
+    "ofensiva": "20001123456678",
+    "cambiaste": "10012346789",
+    "pm": "00022",
+    "larguémonos": "1621235667889:",
+    "balcón": "15212345",
+    "acelera": "20001123345567",
+    "privacidad": "30023345567789",
+    "sonando": "10012234567",
+    "barca": "00012345",
+    "investigador": "400012345677899:;",
+    "exijo": "10001123345",
+    "creyendo": "10023335678",
+    "norteamericano": "5001234555667889::;<<=>",
+    "veros": "00012234",
+    "aparezca": "20001123345678",
+    "chicle": "00023356",
+    "enseñando": "20001234456789",
+    "acordado": "20001123456678",
+    "cobertura": "20012234567789",
+    "olvidemos": "20001234456678",
+    "manga": "00012345",
+    "trataron": "10023345567",
+    "velo": "00012234",
+    "conocieron": "20012234457789",
+    "santidad": "20012345567",
+    "suéltala": "03113456678",
+    "saldría": "16212356667",
+    "tremenda": "10023345678",
+    "empacar": "20001234456",
+    "perras": "00012245",
+    "restaurantes": "200123466789:;",
+    "áreas": "01101123334",
+    "satanás": "26312234456",
+    "traten": "00023345",
+    "completar": "20012356678",
+    "tesoros": "10012234456",
+    "carreteras": "20012245567789",
+    "simpática": "15212345567789",
+    "invité": "26301234456",
+    "bailas": "00013345",
+    "cómodos": "02112234456",
+    "comprensión": "2:31235678:",
+    "supongamos": "20012234567789",
+    "nomás": "14212234",
+    "toallas": "10012223356",
+    "estropeado": "3000124556777889:",
+    "respeta": "10012345567",
+    "fruto": "00023345",
+    "piérdete": "03113456678",
+    "ensayar": "20001234446",
+    "rescatar": "20012345567",
+    "aroma": "10001123345",
+    "perímetro": "14212234456689",
+    "grandeza": "10023456678",
+    "delantera": "20012234567789",
+    "escoge": "10001234456",
+    "presentarle": "200233456789:;",
+    "yate": "00002234",
+    "sofía": "14212234445",
+    "abres": "00001134",
+    "ingenioso": "20001234457789",
+    "cortaron": "10012345567",
+    "sentó": "15212345",
+    "atardecer": "30001123456678",
+    "consideración": "4<5123455677899:<",
+    "palma": "00012345",
+    "interpretar": "3000123457889:",
+    "rezo": "00012234",
+    "suéltenme": "03113456789",
+    "filmando": "10012345678",
+    "quítese": "03123345567",
+    "sostener": "20012345567",
+    "molino": "10012234456",
+    "sentamos": "10012345567",
+    "surf": "00012",
+    "perdonado": "20012345567789",
+    "cuan": "00013",
+    "reunirse": "10013345678",
+    "refugiados": "20012234457789",
+    "verificar": "30012234456678",
+    "hogares": "10012234456",
+    "cargamento": "2001234556789:",
+    "bloqueo": "10023356667",
+    "saldrán": "16212356",
+    "payasos": "10012224456",
+    "atascado": "20001123456678",
+    "pajarito": "20012234456678",
+    "reciba": "10012234456",
+    "bando": "00012345",
+    "litros": "00012245",
+    "sobrevivientes": "3001224556778:;<=",
+    "ponla": "00012345",
+    "dirigido": "20012234456678",
+    "chaleco": "10023345567",
+    "molestias": "10012234568",
+    "agradecerte": "300011344566789:;",
+    "cría": "03123334",
+    "cualidades": "20013345567789",
+    "viviente": "10012235678",
+    "traerte": "10023334567",
+    "provincia": "10023345679",
+    "mocoso": "10012234456",
+    "ponernos": "10012234567",
+    "despejen": "10012345567",
+    "circuito": "10012346678",
+    "atajo": "10001123345",
+    "juntar": "10012345",
+    "examinar": "30001123345567",
+    "pedo": "00012234",
+    "besarte": "10012234567",
+    "perteneces": "20012345567789",
+    "permítanme": "1521234556789:",
+    "descansen": "10012345678",
+    "noto": "00012234",
+    "teorías": "25312223345556",
+    "alabado": "20001123345567",
+    "moverte": "10012234567",
+    "preciosos": "10023346678",
+    "termines": "10012345567",
+    "nerviosos": "10012346678",
+    "paulo": "00013345",
+    "recta": "00012345",
+    "reducir": "20012234456",
+    "podrias": "00012246",
+    "escritores": "20001245567789",
+    "mandan": "00012345",
+    "ilegales": "20001123345567",
+    "tobillo": "10012234467",
+    "jinete": "10012234456",
+    "conocernos": "20012234456789",
+    "convertí": "28312345678",
+    "separar": "20012234456",
+    "sujeta": "10012234456",
+    "implica": "10001245567",
+    "matara": "10012234456",
+    "billar": "10012245",
+    "mantengo": "10012345678",
+    "pondrán": "16212356",
+    "llévatelo": "03123345567789",
+    "solías": "14212234445",
+    "odiar": "10001124",
+    "cierro": "00013356",
+    "usaremos": "20001123345567",
+    "funciones": "10012346678",
+    "juana": "00013345",
+    "enviando": "10001235678",
+    "suaves": "00013345",
+    "buque": "00012245",
+    "aceptamos": "20001123456678",
+    "atrapa": "10001134456",
+    "descuento": "10012346789",
+    "angustia": "10001234568",
+    "bajaré": "26312234456",
+    "jura": "00012234",
+    "pais": "00013",
+    "cuervo": "00013456",
+    "unidas": "10001123345",
+    "hablaban": "10012245567",
+    "atraer": "20001134445",
+    "entendía": "27301234567778",
+    "documental": "30012234456789",
+    "convirtiendo": "20012345679:;<",
+    "disculpo": "10012345678",
+    "huido": "00013345",
+    "mirarte": "10012234567",
+    "escuchame": "20001234467789",
+    "consiste": "10012345678",
+    "ábrelo": "01101134456",
+    "divertirme": "2001223456789:",
+    "apártense": "13201123456789",
+    "engañarme": "20001234456789",
+    "rotos": "00012234",
+    "besado": "10012234456",
+    "explotó": "27301245567",
+    "apoya": "10001123335",
+    "sobrevivido": "300122455677899:;",
+    "estancia": "10001234568",
+    "descubrimos": "2001234557889:",
+    "lanzó": "15212345",
+    "creador": "20023334456",
+    "mejorando": "20012234456789",
+    "operar": "20001123345",
+    "pedirme": "10012234567",
+    "servirle": "10012345678",
+    "bebamos": "10012234456",
+    "despidieron": "2001234556889:",
+    "realista": "20012223345678",
+    "discutimos": "20012345567789",
+    "aseguraré": "49501123345567789",
+    "enseñaron": "20001234456678",
+    "bloque": "00023356",
+    "pasemos": "10012234456",
+    "emboscada": "20001234567789",
+    "caía": "13212223334",
+    "exceso": "10001234456",
+    "acuéstate": "14201124567789",
+    "pulgar": "10012345",
+    "vivían": "14212234445",
+    "vil": "00012",
+    "agarré": "26301123356",
+    "disparaste": "2001234556789:",
+    "celestial": "20012234568",
+    "comisionado": "300122344577899:;",
+    "ciclo": "00012245",
+    "descansando": "200123456789:;",
+    "placas": "00023345",
+    "determinar": "30012234567789",
+    "cesar": "10012234",
+    "década": "02112234456",
+    "colapso": "10012234567",
+    "afganistán": "39401234456789",
+    "admitirlo": "20001234456789",
+    "encárgate": "14201234567789",
+    "sospecho": "10012345578",
+    "sueña": "00013345",
+    "cigarros": "10012234467",
+    "causas": "00013345",
+    "mejora": "10012234456",
+    "chantaje": "10023456678",
+    "engaña": "10001234456",
+    "escondida": "20001234567789",
+    "queramos": "10023345567",
+    "vistas": "00012345",
+    "coges": "00012234",
+    "turco": "00012345",
+    "cuestiones": "10013457789",
+    "eminencia": "20001123345679",
+    "golfo": "00012345",
+    "extranjera": "2000124567889:",
+    "renuncio": "10012234568",
+    "horizonte": "20012234456789",
+    "muerde": "00013456",
+    "pálido": "02112234456",
+    "separamos": "20012234456678",
+    "recorrer": "20012234467",
+    "anochecer": "30001123356678",
+    "obsesionado": "300012344577899:;",
+    "recibes": "10012234456",
+    "hallé": "15212245",
+    "solían": "14212234445",
+    "ofrecen": "10001134456",
+    "perseguir": "20012345578",
+    "reno": "00012234",
+    "rechazar": "20012245567",
+    "harina": "10012234456",
+    "aleja": "10001123345",
+    "dijeras": "10012234456",
+    "cardenal": "20012345567",
+    "rompiendo": "10012346789",
+    "helados": "10012234456",
+    "salid": "10012234",
+    "hermandad": "20012345678",
+    "moverme": "10012234567",
+    "cruza": "00023345",
+    "tejido": "10012234456",
+    "escocés": "26301234456",
+    "confíe": "15212345556",
+    "escondiendo": "200012345689:;",
+    "déjalos": "02112234456",
+    "publicar": "20012245567",
+    "únicas": "01101123345",
+    "carreta": "10012245567",
+    "reportaje": "20012234567789",
+    "compañia": "10012345568",
+    "representación": "4=51224556789::;=",
+    "estelar": "20001234456",
+    "notar": "10012234",
+    "curado": "10012234456",
+    "nana": "00012234",
+    "escribía": "27301245567778",
+    "amé": "13201123",
+    "encerrada": "20001234467789",
+    "dibujar": "20012234456",
+    "histórico": "15212345567789",
+    "conocimientos": "30012234456679:;<",
+    "frio": "00024",
+    "mostrado": "10012356678",
+    "convertirte": "200123456789:;",
+    "interesados": "3000123445667889:",
+    "pellejo": "10012245567",
+    "corrí": "15212245",
+    "valentía": "27312234567778",
+    "eramos": "10001123345",
+    "bailes": "00013345",
+    "afectado": "20001123456678",
+    "lastimarte": "2001234556789:",
+    "anteriores": "20001234457789",
+    "avergonzada": "300011234567899:;",
+    "viviré": "26312234456",
+    "dominio": "10012234457",
+    "bailarín": "27313345567",
+    "dudar": "10012234",
+    "confundida": "2001234567889:",
+    "limonada": "20012234456678",
+    "aparecido": "30001123345567789",
+    "entrenado": "20001245567789",
+    "tambor": "10012345",
+    "cambiarlo": "10012346789",
+    "quemando": "10023345678",
+    "avísame": "13201123345567",
+    "comprometida": "3001235667889::;<",
+    "perfectos": "10012345678",
+    "condenada": "20012345567789",
+    "refresco": "10012245678",
+    "eventualmente": "3000112345789:;<=",
+    "desgraciada": "200123566799:;",
+    "comeremos": "20012234456678",
+    "quienquiera": "100245799:;",
+    "declaró": "27312245567",
+    "crueldad": "10024567",
+    "ensayos": "10001234446",
+    "pala": "00012234",
+    "ríen": "02112223",
+    "intentaste": "2000123456789:",
+    "encontrara": "2000123457889:",
+    "instalaciones": "3000134556778::;<",
+    "mérito": "02112234456",
+    "enviaste": "10001235678",
+    "fideos": "10012234445",
+    "munición": "27312234457",
+    "cicatrices": "20012234467789",
+    "trozos": "00023345",
+    "dormiré": "27312345567",
+    "admirador": "30001234456678",
+    "significar": "30012345567789",
+    "dondequiera": "200123455799:;",
+    "olvidamos": "20001234456678",
+    "roban": "00012234",
+    "admite": "10001234456",
+    "nevera": "10012234456",
+    "amarte": "10001123456",
+    "veloz": "10012234",
+    "setenta": "10012234567",
+    "necesitaría": "4:51223445667889:::;",
+    "enfrentarse": "200012456789:;",
+    "llevarlos": "10023345678",
+    "infiel": "10001235",
+    "ondas": "00001234",
+    "tomates": "10012234456",
+    "póngame": "02112345567",
+    "aspectos": "10001234567",
+    "discreción": "29312356679",
+    "freno": "00023345",
+    "ajo": "00001123",
+    "remoto": "10012234456",
+    "convierta": "10012346789",
+    "camilla": "10012234467",
+    "bailamos": "10013345567",
+    "cuestan": "00013456",
+    "integridad": "30001234467789",
+    "informa": "10001234567",
+    "inesperado": "3000112345667889:",
+    "revisión": "27312234457",
+    "amenazó": "37401123345567",
+    "duérmete": "03113456678",
+    "haced": "10012234",
+    "ballenas": "10012245567",
+    "billones": "10012245567",
+    "santuario": "10012346679",
+    "abeja": "10001123345",
+    "tocarme": "10012234567",
+    "non": "00012",
+    "tomarse": "10012234567",
+    "impuesto": "10001235678",
+    "corporación": "3:41234556778:",
+    "gripe": "00023345",
+    "permitirá": "39412345567789",
+    "patear": "20012234445",
+    "órbita": "01101234456",
+    "acepté": "26301123456",
+    "fábricas": "02112245567",
+    "agarre": "10001123356",
+    "ramas": "00012234",
+    "hallado": "10012245567",
+    "opuesto": "10001124567",
+    "fija": "00012234",
+    "lena": "00012234",
+    "tránsito": "03123456678",
+    "ocuparse": "20001123345678",
+    "fugitivo": "20012234456678",
+    "ca": "00012",
+    "llamara": "10023345567",
+    "estuviéramos": "273012344577899:;",
+    "empezaré": "38401234456678",
+    "abriré": "26301134456",
+    "pertenecía": "3941234556778999:",
+    "peleamos": "20012234445567",
+    "pagarán": "26312234456",
+    "usaste": "10001123456",
+    "echen": "00001134",
+    "calendario": "2001223456778:",
+    "consecuencia": "200123455689:<",
+    "destruida": "10012357789",
+    "pañales": "10012234456",
+    "hacerlos": "10012234567",
+    "cemento": "10012234567",
+    "retroceder": "30012245567789",
+    "suelten": "00013456",
+    "obstante": "10001345678",
+    "subí": "14212234",
+    "basa": "00012234",
+    "cancha": "00012356",
+    "tardado": "10012345567",
+    "devuelvo": "10012235678",
+    "fusión": "15212235",
+    "púdrete": "02112245567",
+    "basurero": "20012234456678",
+    "suministros": "2001223445679:",
+    "códigos": "02112234456",
+    "recordaba": "20012234567789",
+    "limpios": "00012346",
+    "calibre": "10012234467",
+    "enteras": "10001234456",
+    "fina": "00012234",
+    "protocolo": "20023345567789",
+    "hawai": "00012235",
+    "abrázame": "14201134456678",
+    "agresión": "27301134457",
+    "camello": "10012234467",
+    "selección": "28312234568",
+    "ancho": "00001245",
+    "comunicado": "3001223445667889:",
+    "rodea": "10012234445",
+    "hospitalidad": "400123455677899:;",
+    "avisaré": "37401123345567",
+    "adoran": "10001123345",
+    "corres": "00012245",
+    "burla": "00012345",
+    "incluido": "10001246678",
+    "filete": "10012234456",
+    "dándole": "02112345567",
+    "captura": "10012345567",
+    "urgencia": "10001234568",
+    "quitas": "00023345",
+    "besa": "00012234",
+    "acondicionado": "400011234566799:;;<=",
+    "norteamericanos": "5001234555667889::;<<=>",
+    "cálido": "02112234456",
+    "ignorar": "20001234456",
+    "grabando": "10023345678",
+    "nueces": "00013345",
+    "láser": "02112234",
+    "és": "01101",
+    "dispárale": "15212345567789",
+    "fronteras": "10023456678",
+    "quítense": "03123345678",
+    "asusté": "26301123456",
+    "sirvienta": "10012346789",
+    "divertirte": "2001223456789:",
+    "trabajaré": "39423345567789",
+    "precisa": "10023345567",
+    "evidencias": "20001123345679",
+    "canales": "10012234456",
+    "protesto": "10023345678",
+    "asumo": "10001123345",
+    "libremente": "2001224556789:",
+    "insecto": "10001234567",
+    "niñez": "10012234",
+    "coloca": "10012234456",
+    "abandono": "20001123456678",
+    "gritaba": "10023345567",
+    "apuros": "10001123345",
+    "provoca": "10023345567",
+    "hierbas": "00013456",
+    "buscaremos": "20012345567789",
+    "pérdidas": "02112345567",
+    "insistió": "28301234568",
+    "abandonada": "3000112345667889:",
+    "cerrando": "10012245678",
+    "jardinero": "20012345567789",
+    "háganlo": "02112234567",
+    "utilizado": "30001123345567789",
+    "hambrientos": "1001235789:",
+    "atraparlo": "20001134456789",
+    "destinado": "20012345567789",
+    "tia": "00013",
+    "básico": "02112234456",
+    "facilidad": "30012234456678",
+    "acercarme": "20001123456789",
+    "avanzado": "20001123456678",
+    "cargas": "00012345",
+    "recuerdes": "10012235678",
+    "dominar": "20012234456",
+    "yardas": "00002345",
+    "arruinaste": "2000113556789:",
+    "pensaban": "10012345567",
+    "grandote": "10023456678",
+    "suenas": "00013345",
+    "salvarlo": "10012345678",
+    "pensábamos": "15212345567789",
+    "enviamos": "10001235567",
+    "banquero": "10012356678",
+    "sabrías": "15212245556",
+    "pregúntele": "1522334567889:",
+    "instintos": "10001345678",
+    "creencias": "10023334568",
+    "violenta": "10013345678",
+    "acabando": "20001123345678",
+    "sólido": "02112234456",
+    "extraterrestres": "3000124556779:;=>",
+    "fichas": "00012245",
+    "clásica": "03123345567",
+    "obligaciones": "300011344566799:;",
+    "esperaban": "20001234456678",
+    "máscaras": "02112345567",
+    "tubos": "00012234",
+    "agradecemos": "3000113445667889:",
+    "hipoteca": "20012234456678",
+    "luchado": "10012245567",
+    "estrictamente": "3000124567889:;<=",
+    "conforme": "10012345678",
+    "cebolla": "10012234467",
+    "burdel": "10012345",
+    "calmado": "10012345567",
+    "poste": "00012345",
+    "pretendía": "28323345678889",
+    "honestidad": "30012234567789",
+    "rebaño": "10012234456",
+    "acontecimientos": "4000112345667889;<=>",
+    "díganme": "02112234567",
+    "financiero": "2001223456889:",
+    "decirse": "10012234567",
+    "vendes": "00012345",
+    "excursión": "28301234568",
+    "calvo": "00012345",
+    "primaria": "10023345568",
+    "usen": "00001123",
+    "suecia": "00013346",
+    "apestoso": "20001123456678",
+    "mejilla": "10012234467",
+    "gasolinera": "3001223445667889:",
+    "psicología": "3942334556778999:",
+    "seguidores": "20012245567789",
+    "drácula": "03123345567",
+    "maricas": "10012234456",
+    "telefono": "20012234456678",
+    "palanca": "10012234567",
+    "establecido": "300012344677899:;",
+    "flaco": "00023345",
+    "tormentas": "10012345678",
+    "perdidas": "10012345567",
+    "subiré": "26312234456",
+    "sorprendida": "200123567899:;",
+    "pobrecita": "20012245567789",
+    "gotas": "00012234",
+    "perpetua": "10012345568",
+    "nudos": "00012234",
+    "iniciativa": "3000112334667889:",
+    "levantarte": "2001223456789:",
+    "usualmente": "2000112456789:",
+    "relájese": "14212234456678",
+    "mueves": "00013345",
+    "medallas": "10012234467",
+    "clavo": "00023345",
+    "universitario": "4000112334567889::;=",
+    "rastros": "00012356",
+    "arre": "00001134",
+    "persiguen": "10012345578",
+    "continuamente": "3001234556889:;<=",
+    "talentos": "10012234567",
+    "alterado": "20001234456678",
+    "núcleo": "02112245556",
+    "anfitrión": "28301234468",
+    "usaron": "10001123345",
+    "aceptan": "10001123456",
+    "decido": "10012234456",
+    "llamarle": "10023345678",
+    "hipócrita": "14212234467789",
+    "rehabilitación": "5=61223445667889::;=",
+    "oía": "12201112223",
+    "forman": "00012345",
+    "perderlo": "10012345678",
+    "suprema": "10012245567",
+    "indican": "10001234456",
+    "digitales": "20012234456678",
+    "codo": "00012234",
+    "ladrillos": "10012245578",
+    "tontas": "00012345",
+    "serias": "00012235",
+    "anteriormente": "3000123445789:;<=",
+    "viviremos": "20012234456678",
+    "mostrarles": "10012356789",
+    "luchamos": "10012245567",
+    "tenso": "00012345",
+    "curiosa": "10012235567",
+    "vacíos": "14212234445",
+    "trajimos": "10023345567",
+    "amuleto": "20001123345567",
+    "realizado": "30012223345567789",
+    "revolucionario": "400122344566799:;;<>",
+    "funcionado": "2001234667889:",
+    "derrotar": "20012245567",
+    "alrededores": "3000123445667889:",
+    "enojes": "10001123345",
+    "frijoles": "10023345567",
+    "cuñada": "10012234456",
+    "pensara": "10012345567",
+    "derrotado": "20012245567789",
+    "modesto": "10012234567",
+    "tómala": "02112234456",
+    "cuaderno": "10013345678",
+    "resultar": "20012234567",
+    "rebelión": "27312234457",
+    "metida": "10012234456",
+    "distinguir": "20012345689",
+    "huracán": "26312234456",
+    "sinceridad": "30012345567789",
+    "conocerlos": "20012234456789",
+    "escucharte": "2000123446789:",
+    "masculino": "20012345567789",
+    "acompañar": "30001123456678",
+    "echamos": "10001134456",
+    "ancestros": "10001234578",
+    "mecanismo": "20012234456789",
+    "cera": "00012234",
+    "estanque": "10001234578",
+    "proa": "00023334",
+    "infinito": "20001234456678",
+    "negativa": "20012234456678",
+    "alojamiento": "300011233455689:;",
+    "jardines": "10012345567",
+    "tigres": "00012245",
+    "bonos": "00012234",
+    "artístico": "14201234567789",
+    "satisfacer": "30012234567789",
+    "novedades": "20012234456678",
+    "rechazo": "10012245567",
+    "deberán": "26312234456",
+    "dificultad": "30012234456789",
+    "vivian": "00012235",
+    "comerciante": "200122345689:;",
+    "asegurado": "30001123345567789",
+    "mostrarme": "10012356789",
+    "generosidad": "4001223445667889:",
+    "entorno": "10001234567",
+    "ayuden": "10001113345",
+    "amabas": "10001123345",
+    "conclusiones": "200123566799:;",
+    "pesados": "10012234456",
+    "cuchara": "10012245567",
+    "contárselo": "1521234567889:",
+    "cortaré": "27312345567",
+    "tramando": "10023345678",
+    "cintura": "10012345567",
+    "frances": "00023456",
+    "pagarlo": "10012234567",
+    "peligrosas": "20012234467789",
+    "ventajas": "10012345567",
+    "continúen": "27312345567778",
+    "cálculos": "02112345567",
+    "ignorancia": "2000123445678:",
+    "rostros": "00012356",
+    "detenerlos": "20012234456789",
+    "mantendrá": "29312345689",
+    "consentimiento": "3001234567889;<=>",
+    "cometiendo": "2001223445789:",
+    "partió": "16212346",
+    "apreciar": "20001134457",
+    "seguirme": "10012245678",
+    "ochenta": "10001134567",
+    "reconocí": "38412234456678",
+    "ideales": "20001123334456",
+    "mataran": "10012234456",
+    "defensor": "20012234567",
+    "concha": "00012356",
+    "soñaba": "10012234456",
+    "emocionada": "3000112334667889:",
+    "yerno": "00002345",
+    "suponer": "20012234456",
+    "controles": "10012356678",
+    "tripas": "00023345",
+    "puerco": "00013456",
+    "espuma": "10001234456",
+    "decidiste": "20012234456789",
+    "taxista": "10012234567",
+    "ausente": "10002234567",
+    "confieso": "10012346678",
+    "despido": "10012345567",
+    "enterar": "20001234456",
+    "ingeniería": "3940123445778999:",
+    "misiones": "10012235567",
+    "conocéis": "26312234457",
+    "abrid": "10001134",
+    "celebrando": "2001223446789:",
+    "declara": "10012245567",
+    "sepamos": "10012234456",
+    "avanzada": "20001123456678",
+    "comete": "10012234456",
+    "expulsado": "20001234567789",
+    "adelanto": "20001123345678",
+    "asamblea": "20001123467778",
+    "creerán": "26323334456",
+    "diputado": "20012234456678",
+    "agregar": "20001134456",
+    "devuelto": "10012235678",
+    "rezando": "10012234567",
+    "descarga": "10012345678",
+    "volado": "10012234456",
+    "dispararé": "39412345567789",
+    "puños": "00012234",
+    "diálogo": "03113345567",
+    "autobuses": "20002234456678",
+    "cante": "00012345",
+    "helicópteros": "263122344567899:;",
+    "entregue": "10001245578",
+    "gemelas": "10012234456",
+    "ofrecerte": "20001134456789",
+    "paguen": "00012245",
+    "repita": "10012234456",
+    "escuchaba": "20001234467789",
+    "documentación": "4<5122344567899:<",
+    "detuvieron": "20012234457789",
+    "comamos": "10012234456",
+    "administrador": "4000123445679::;<",
+    "conseguirte": "200123455789:;",
+    "hallaron": "10012245567",
+    "sillón": "15212245",
+    "superado": "20012234456678",
+    "atentos": "10001123456",
+    "acuérdate": "14201124567789",
+    "faro": "00012234",
+    "públicos": "02112245567",
+    "disfruto": "10012356678",
+    "asegurarnos": "3000112334556789:",
+    "semilla": "10012234467",
+    "matón": "14212234",
+    "enlace": "10001234456",
+    "mejorado": "20012234456678",
+    "necesitaban": "3001223445667889:",
+    "seríamos": "14212234445567",
+    "semestre": "10012234578",
+    "sta": "00023",
+    "comprendí": "29312356789",
+    "oposición": "38401123345568",
+    "inventé": "27301234567",
+    "alambre": "10001123467",
+    "pantalón": "27312345567",
+    "católico": "14212234456678",
+    "pídele": "02112234456",
+    "sacrificios": "2001224556778:",
+    "misil": "10012234",
+    "tocarlo": "10012234567",
+    "fijamente": "20012234456789",
+    "quitaré": "27323345567",
+    "casará": "26312234456",
+    "abrimos": "10001134456",
+    "gorila": "10012234456",
+    "envuelto": "10001235678",
+    "arregle": "10001134467",
+    "opino": "10001123345",
+    "sentaos": "10012345556",
+    "participación": "4<5123455677899:<",
+    "ejércitos": "13201123456678",
+    "valiosa": "10012235567",
+    "tendréis": "16212357",
+    "hubiesen": "10012235567",
+    "químicos": "03123345567",
+    "asustando": "20001123456789",
+    "atrasado": "20001134456678",
+    "disponibles": "2001234556779:",
+    "pésimo": "02112234456",
+    "siguieron": "10012246678",
+    "pasarán": "26312234456",
+    "mueran": "00013345",
+    "contamos": "10012345567",
+    "bragas": "00023345",
+    "baba": "00012234",
+    "comprarlo": "10012356789",
+    "subtitulado": "300123455677899:;",
+    "casita": "10012234456",
+    "halla": "00012245",
+    "llámalo": "03123345567",
+    "mojada": "10012234456",
+    "económica": "25301123345567789",
+    "arrepiento": "2000113445789:",
+    "enseñan": "10001234456",
+    "orgasmo": "10001234567",
+    "duelen": "00013345",
+    "abismo": "10001123456",
+    "proteja": "10023345567",
+    "feroz": "10012234",
+    "golpearon": "20012345556678",
+    "alimenta": "20001123345678",
+    "blusa": "00023345",
+    "violar": "10013345",
+    "evacuación": "39401123346679",
+    "preparé": "27323345567",
+    "ética": "01101123345",
+    "cuido": "00013345",
+    "fascista": "10012345678",
+    "acabaré": "37401123345567",
+    "prácticas": "03123456678",
+    "moviéndose": "1521223567889:",
+    "pescador": "20012345567",
+    "acérquense": "1320112346789:",
+    "prefieren": "10023346678",
+    "cantas": "00012345",
+    "irías": "13201123334",
+    "apague": "10001123356",
+    "lazos": "00012234",
+    "papito": "10012234456",
+    "placeres": "10023345567",
+    "perdonarme": "2001234556789:",
+    "apertura": "20001123456678",
+    "caña": "00012234",
+    "corría": "15212245556",
+    "terminaré": "39412345567789",
+    "pecadores": "20012234456678",
+    "suegra": "00013356",
+    "nuca": "00012234",
+    "explicarme": "2000124556789:",
+    "valla": "00012245",
+    "dobles": "00012245",
+    "metan": "00012234",
+    "peleado": "20012234445567",
+    "convincente": "200123456789:;",
+    "ruega": "00013345",
+    "convenció": "29312345679",
+    "cuadras": "00013356",
+    "españoles": "20001234456678",
+    "aborto": "10001123456",
+    "funcionario": "2001234667889;",
+    "dramático": "15223345567789",
+    "meteré": "26312234456",
+    "mostrador": "20012356678",
+    "relajarte": "20012234456789",
+    "pensarán": "27312345567",
+    "deprimente": "2001224556789:",
+    "facturas": "10012345567",
+    "cobre": "00012245",
+    "pensarás": "27312345567",
+    "habiar": "10012235",
+    "lote": "00012234",
+    "oportuno": "20001123456678",
+    "arturo": "10001234456",
+    "sermón": "15212345",
+    "prohibida": "10025567789",
+    "atómica": "13201123345567",
+    "agradables": "20001134456689",
+    "gustos": "00012345",
+    "defecto": "10012234567",
+    "proceder": "20023345567",
+    "bóveda": "02112234456",
+    "ganaron": "10012234456",
+    "retira": "10012234456",
+    "casera": "10012234456",
+    "chulo": "00023345",
+    "conozcan": "10012234567",
+    "agresivo": "20001134456678",
+    "ayudaste": "20001113345678",
+    "tías": "02112223",
+    "desesperadamente": "500122345677899:;;<=>?@",
+    "anormal": "20001123456",
+    "llévala": "03123345567",
+    "nativos": "10012234456",
+    "enseñarles": "20001234456789",
+    "callarte": "10012245678",
+    "convierten": "10012346789",
+    "estrado": "10001245567",
+    "aficionado": "3000112334667889:",
+    "apuntando": "20001123456789",
+    "creyeron": "10023335567",
+    "éxtasis": "01101234456",
+    "iluminación": "4:50112334556778:",
+    "marcharte": "10012356789",
+    "sábados": "02112234456",
+    "explorador": "30001245567789",
+    "colchón": "16212356",
+    "tenerlos": "10012234567",
+    "feas": "00012223",
+    "preguntaron": "2002334567889:",
+    "lavabo": "10012234456",
+    "forastero": "20012234567789",
+    "callada": "10012245567",
+    "escondes": "10001234567",
+    "regresan": "10012245567",
+    "encontrarlos": "200012345789:;",
+    "sensato": "10012345567",
+    "entrará": "27301245567",
+    "aparecerá": "49501123345567789",
+    "homosexuales": "300122344566799:;",
+    "distante": "10012345678",
+    "gobernar": "20012234567",
+    "déjenos": "02112234456",
+    "dobla": "00012245",
+    "votación": "27312234457",
+    "inconveniente": "3000123456778:;<=",
+    "apodo": "10001123345",
+    "rapidez": "20012234456",
+    "ternura": "10012345567",
+    "lunático": "14212234456678",
+    "lodo": "00012234",
+    "yace": "00002234",
+    "arreglará": "39401134467789",
+    "catástrofe": "1421223457889:",
+    "brindar": "10023456",
+    "precisión": "28323345568",
+    "embarazoso": "3000123445667889:",
+    "profecía": "27323345567778",
+    "pulgadas": "10012345567",
+    "proviene": "10023346678",
+    "normalidad": "30012345567789",
+    "practica": "10023456678",
+    "comiencen": "10012235678",
+    "calabozo": "20012234456678",
+    "levanté": "27312234567",
+    "retorno": "10012234567",
+    "chupa": "00023345",
+    "preparación": "3:42334556778:",
+    "asombrosa": "20001123467789",
+    "caderas": "10012234456",
+    "emperatriz": "30001234456689",
+    "repentinamente": "400122345677899:;<=>",
+    "contrabando": "200123566789:;",
+    "defectos": "10012234567",
+    "peligros": "10012234467",
+    "confiado": "10012346678",
+    "nudo": "00012234",
+    "tratos": "00023345",
+    "conciertos": "10012346789",
+    "empujar": "20001234456",
+    "deshacerme": "2001234556789:",
+    "lloro": "00023345",
+    "disculpan": "10012345678",
+    "forzado": "10012345567",
+    "besarme": "10012234567",
+    "fíjese": "02112234456",
+    "debiera": "10012235567",
+    "comía": "14212234445",
+    "terminada": "20012345567789",
+    "luto": "00012234",
+    "cortada": "10012345567",
+    "paces": "00012234",
+    "empuje": "10001234456",
+    "musulmanes": "20012234567789",
+    "servidor": "20012345567",
+    "agujas": "10001123345",
+    "ingenieros": "20001234457789",
+    "podés": "14212234",
+    "torno": "00012345",
+    "malvados": "10012345567",
+    "extiende": "10001235678",
+    "asustados": "20001123456678",
+    "predicador": "30023345567789",
+    "exclusiva": "20001245567789",
+    "maligno": "10012234567",
+    "desarrollar": "3001223446779:",
+    "cortando": "10012345678",
+    "corras": "00012245",
+    "intentaremos": "300012345677899:;",
+    "veinticinco": "200134566789:;",
+    "ayudara": "20001113345567",
+    "fanático": "14212234456678",
+    "internacionales": "4000123456778::;<<=>",
+    "gramos": "00023345",
+    "echan": "00001134",
+    "adán": "13201123",
+    "cocinando": "20012234456789",
+    "explicado": "20001245567789",
+    "terminen": "10012345567",
+    "aprobado": "20001134456678",
+    "frasco": "00023456",
+    "interruptor": "3000123446789:",
+    "glorioso": "10023346678",
+    "casarás": "26312234456",
+    "pintado": "10012345567",
+    "ganarme": "10012234567",
+    "finca": "00012345",
+    "sacerdotes": "20012234567789",
+    "esclavitud": "30001245567789",
+    "precaución": "29323346679",
+    "ganaremos": "20012234456678",
+    "fanáticos": "14212234456678",
+    "correspondencia": "300122456789:;<=?",
+    "dejémoslo": "14212234456789",
+    "económico": "25301123345567789",
+    "cubiertos": "10012235678",
+    "entrego": "10001245567",
+    "cambies": "00012346",
+    "frías": "03123334",
+    "lila": "00012234",
+    "mentales": "10012345567",
+    "ciervo": "00013456",
+    "palomas": "10012234456",
+    "perla": "00012345",
+    "soplón": "15212245",
+    "optimista": "20001234456789",
+    "nápoles": "02112234456",
+    "gimnasia": "10012345568",
+    "separa": "10012234456",
+    "detengas": "10012234567",
+    "trofeo": "10023345556",
+    "atrapó": "26301134456",
+    "concedido": "20012345567789",
+    "pasaportes": "20012234456789",
+    "interese": "20001234456678",
+    "villano": "10012245567",
+    "monumento": "20012234456789",
+    "activa": "10001234456",
+    "abriendo": "10001135678",
+    "mirándome": "14212234567789",
+    "arregló": "27301134467",
+    "cuidarme": "10013345678",
+    "salvavidas": "20012345567789",
+    "obstáculo": "15201345567789",
+    "reunidos": "10013345567",
+    "rejas": "00012234",
+    "tomada": "10012234456",
+    "creíamos": "14223334445567",
+    "ático": "01101123345",
+    "porche": "00012356",
+    "finge": "00012345",
+    "acompañaré": "4:50112345667889:",
+    "ponerla": "10012234567",
+    "moría": "14212234445",
+    "unica": "10001123345",
+    "acusados": "20001123345567",
+    "cuarentena": "2001334567889:",
+    "maletero": "20012234456678",
+    "arreglando": "2000113446789:",
+    "theo": "00023334",
+    "protegerme": "2002334556789:",
+    "gabinete": "20012234456678",
+    "lema": "00012234",
+    "paseando": "20012234445678",
+    "vendas": "00012345",
+    "cangrejo": "10012356678",
+    "cumplió": "17212357",
+    "porcentaje": "2001234567889:",
+    "prestas": "00023456",
+    "profundas": "10023345678",
+    "reconoció": "39412234456679",
+    "detras": "00012245",
+    "clubes": "00023345",
+    "echemos": "10001134456",
+    "olvidarte": "20001234456789",
+    "cuidará": "27313345567",
+    "vieras": "00013345",
+    "enviaremos": "20001235567789",
+    "corté": "15212345",
+    "cocodrilo": "20012234467789",
+    "llanto": "00023456",
+    "fieles": "00013345",
+    "veían": "13212223334",
+    "enfrenta": "10001245678",
+    "robos": "00012234",
+    "compadre": "10012345578",
+    "paranoico": "20012234457789",
+    "llévenselo": "0312334567889:",
+    "invertir": "20001234567",
+    "amorosa": "20001123345567",
+    "apretar": "20001134456",
+    "comenzará": "39412234567789",
+    "contable": "10012345578",
+    "cardíaco": "15212345556678",
+    "asustas": "10001123456",
+    "plana": "00023345",
+    "dieciséis": "27313345568",
+    "árbitro": "01101234467",
+    "creativo": "20023334456678",
+    "buenísimo": "15213345567789",
+    "arca": "00001234",
+    "pasto": "00012345",
+    "arbustos": "10001234567",
+    "sospechar": "20012345578",
+    "atrapan": "10001134456",
+    "pálida": "02112234456",
+    "aceptaría": "38401123456678889",
+    "ganaré": "26312234456",
+    "lucía": "14212234445",
+    "esperma": "10001234567",
+    "celebrarlo": "2001223446789:",
+    "apaguen": "10001123356",
+    "exagerando": "3000112334556789:",
+    "tiraste": "10012234567",
+    "enseñaste": "20001234456789",
+    "póquer": "02112245",
+    "borda": "00012345",
+    "corrientes": "10012246789",
+    "privados": "10023345567",
+    "comprobado": "2001235667889:",
+    "individuos": "20001234456679",
+    "ahogado": "20001123345567",
+    "subterráneo": "2831234557889:::;",
+    "masiva": "10012234456",
+    "protegiendo": "200233455689:;",
+    "legado": "10012234456",
+    "buzón": "14212234",
+    "bárbaro": "02112345567",
+    "atrevo": "10001134456",
+    "escaparse": "20001234456789",
+    "fusil": "10012234",
+    "sutil": "10012234",
+    "venderlo": "10012345678",
+    "carteles": "10012345567",
+    "dirigía": "26312234456667",
+    "eliminado": "30001123345567789",
+    "incorrecto": "2000123446789:",
+    "aburrimiento": "30001123356679:;<",
+    "compran": "00012356",
+    "yanqui": "00002356",
+    "acostar": "20001123456",
+    "apropiada": "20001134457789",
+    "capataz": "20012234456",
+    "aprendes": "10001134567",
+    "apartamentos": "300011234566789:;",
+    "saltando": "10012345678",
+    "sastre": "00012356",
+    "molestarme": "2001223456789:",
+    "registrar": "20012234578",
+    "devuelva": "10012235678",
+    "injusticia": "2000123456778:",
+    "planear": "20023345556",
+    "subes": "00012234",
+    "pagarte": "10012234567",
+    "sincronizado": "3001235667889::;<",
+    "arañas": "10001123345",
+    "subasta": "10012234567",
+    "romperé": "27312345567",
+    "miramos": "10012234456",
+    "representar": "3001224556789:",
+    "monjes": "00012345",
+    "grandiosa": "10023457789",
+    "libera": "10012234456",
+    "mienten": "00013456",
+    "nombrado": "10012356678",
+    "inofensivo": "3000112334567889:",
+    "hostil": "10012345",
+    "ocurriera": "20001123357789",
+    "marsella": "10012345578",
+    "definición": "39412234456679",
+    "ocupe": "10001123345",
+    "crezca": "00023456",
+    "táctica": "02112345567",
+    "campeones": "20012345556678",
+    "huelen": "00013345",
+    "creamos": "10023334456",
+    "comprarle": "10012356789",
+    "golpeé": "26312345556",
+    "díganos": "02112234456",
+    "evita": "10001123345",
+    "repentino": "20012234567789",
+    "visitarme": "20012234456789",
+    "morena": "10012234456",
+    "casero": "10012234456",
+    "entregas": "10001245567",
+    "marchas": "00012356",
+    "competición": "3:41234556778:",
+    "popa": "00012234",
+    "quiza": "00023345",
+    "langosta": "10012345678",
+    "equivocó": "38401134456678",
+    "olla": "00001134",
+    "invitarte": "20001234456789",
+    "sexualmente": "200122356789:;",
+    "tolerar": "20012234456",
+    "encargarme": "2000123456789:",
+    "diseñado": "20012234456678",
+    "legítimo": "14212234456678",
+    "desnudas": "10012345567",
+    "atlántico": "14201134567789",
+    "ingenio": "10001234457",
+    "reírse": "13212223456",
+    "recomendación": "4<5122344567899:<",
+    "iniciales": "20001123346678",
+    "decepción": "28312234568",
+    "librería": "27312245567778",
+    "variar": "10012235",
+    "racista": "10012234567",
+    "girando": "10012234567",
+    "buscarle": "10012345678",
+    "sustancia": "10012345679",
+    "hongos": "00012345",
+    "rodeados": "20012234445567",
+    "ambicioso": "20001234457789",
+    "culos": "00012234",
+    "discreto": "10012356678",
+    "protagonista": "30023345567789:;<",
+    "aparición": "38401123345568",
+    "reglamento": "2001224556789:",
+    "conserje": "10012345678",
+    "homenaje": "20012234456678",
+    "cuidarte": "10013345678",
+    "encargará": "39401234567789",
+    "papeleo": "20012234456667",
+    "baterías": "26312234456667",
+    "figuras": "10012234456",
+    "ejecutado": "30001123345567789",
+    "cuéntanos": "03113456678",
+    "empezará": "38401234456678",
+    "conduzco": "10012345678",
+    "dedico": "10012234456",
+    "morfina": "10012345567",
+    "juvenil": "20012234456",
+    "traslado": "10023456678",
+    "ejemplar": "20001123467",
+    "esperará": "38401234456678",
+    "probemos": "10023345567",
+    "solicito": "20012234456678",
+    "nino": "00012234",
+    "desaparecida": "4001223445667889::;<",
+    "ganso": "00012345",
+    "trompeta": "10023456678",
+    "morirse": "10012234567",
+    "patos": "00012234",
+    "mostaza": "10012345567",
+    "cerebros": "10012234467",
+    "altamente": "20001234456789",
+    "picante": "10012234567",
+    "ingenuo": "10001234457",
+    "vuelos": "00013345",
+    "nasa": "00012234",
+    "seguirás": "27312245567",
+    "escogió": "27301234457",
+    "reúne": "13212223345",
+    "misterios": "10012345568",
+    "deportivo": "20012234567789",
+    "vestirme": "10012345678",
+    "maniobra": "10012235578",
+    "hemorragia": "2001223446778:",
+    "babor": "10012234",
+    "pelean": "10012234445",
+    "humedad": "20012234456",
+    "túneles": "02112234456",
+    "dígamelo": "02112234456678",
+    "banca": "00012345",
+    "célula": "02112234456",
+    "respire": "10012345567",
+    "levantes": "10012234567",
+    "molestó": "27312234567",
+    "notable": "10012234467",
+    "aprenderás": "39401134567789",
+    "turista": "10012234567",
+    "subimos": "10012234456",
+    "mirarlo": "10012234567",
+    "múltiples": "02112345578",
+    "acera": "10001123345",
+    "ano": "00001123",
+    "distracción": "2:31235678:",
+    "positiva": "20012234456678",
+    "estafa": "10001234456",
+    "locuras": "10012234456",
+    "elegiste": "20001123345678",
+    "hombrecito": "2001235667889:",
+    "acabarás": "37401123345567",
+    "tesis": "00012234",
+    "pureza": "10012234456",
+    "suceden": "10012234456",
+    "noventa": "10012234567",
+    "monasterio": "2001223456778:",
+    "húmedo": "02112234456",
+    "cambiaré": "28312346678",
+    "burbujas": "10012345567",
+    "toros": "00012234",
+    "interesaba": "3000123445667889:",
+    "zumo": "00012234",
+    "empresario": "2000124556778:",
+    "buscó": "15212345",
+    "quiebra": "00024467",
+    "portado": "10012345567",
+    "lanzado": "10012345567",
+    "utilizando": "3000112334556789:",
+    "causando": "10013345678",
+    "sacrificar": "30012245567789",
+    "testificar": "30012345567789",
+    "firmas": "00012345",
+    "rendirse": "10012345678",
+    "surge": "00012345",
+    "traerla": "10023334567",
+    "tribunales": "20023345567789",
+    "margarita": "20012345567789",
+    "enrique": "10001234467",
+    "himno": "00012345",
+    "defenderse": "2001223456789:",
+    "tocino": "10012234456",
+    "bajamos": "10012234456",
+    "cerramos": "10012245567",
+    "yegua": "00002235",
+    "enojo": "10001123345",
+    "vendemos": "10012345567",
+    "suenan": "00013345",
+    "salvará": "27312345567",
+    "pagos": "00012234",
+    "panza": "00012345",
+    "cólera": "02112234456",
+    "obrero": "10001134456",
+    "pagaría": "26312234456667",
+    "encarga": "10001234567",
+    "eches": "00001134",
+    "ostras": "00001245",
+    "americanas": "30001123345567789",
+    "humillación": "3:41223446778:",
+    "presiento": "10023346789",
+    "consiguieron": "200123455799:;",
+    "dragones": "10023345567",
+    "respecta": "10012345678",
+    "medicación": "39412234456679",
+    "digna": "00012345",
+    "arreglé": "27301134467",
+    "delitos": "10012234456",
+    "tragar": "10023345",
+    "perdamos": "10012345567",
+    "lancha": "00012356",
+    "uvas": "00001123",
+    "ardilla": "10001234467",
+    "matarás": "26312234456",
+    "experimentar": "400012344566789:;",
+    "huérfanos": "03113456678",
+    "respóndeme": "1521234567889:",
+    "escalar": "20001234456",
+    "lré": "03123",
+    "excita": "10001234456",
+    "conquista": "10012356789",
+    "originales": "30001123345567789",
+    "muda": "00012234",
+    "terrestre": "10012245689",
+    "género": "02112234456",
+    "tomara": "10012234456",
+    "existido": "20001123456678",
+    "comprobarlo": "200123566789:;",
+    "afrontar": "20001134567",
+    "satisfecha": "2001223456779:",
+    "daga": "00012234",
+    "grúa": "03123334",
+    "flujo": "00023345",
+    "haberlos": "10012234567",
+    "internado": "20001234567789",
+    "marchando": "10012356789",
+    "apretado": "20001134456678",
+    "complace": "10012356678",
+    "española": "20001234456678",
+    "tramposo": "10023456678",
+    "bota": "00012234",
+    "destruyendo": "200123566689:;",
+    "arruinando": "2000113556789:",
+    "necesarios": "20012234456679",
+    "asustan": "10001123456",
+    "motocicleta": "300122344566899:;",
+    "hostia": "00012346",
+    "perfectas": "10012345678",
+    "ocultando": "20001123456789",
+    "salvarla": "10012345678",
+    "mudamos": "10012234456",
+    "mataremos": "20012234456678",
+    "cachorros": "10012245578",
+    "químico": "03123345567",
+    "sostiene": "10012346678",
+    "honestos": "10012234567",
+    "dure": "00012234",
+    "cooperar": "30012223345567",
+    "rastrear": "20012356667",
+    "cuidados": "10013345567",
+    "bagdad": "10012345",
+    "rompa": "00012345",
+    "absurda": "10001234567",
+    "separe": "10012234456",
+    "intuición": "28301235568",
+    "pastilla": "10012345578",
+    "desaparecen": "3001223445667889:",
+    "prestarme": "10023456789",
+    "caros": "00012234",
+    "cogiste": "10012234567",
+    "palomitas": "20012234456678",
+    "conocían": "26312234456667",
+    "apunten": "10001123456",
+    "chispa": "00023456",
+    "volverme": "10012345678",
+    "pagaremos": "20012234456678",
+    "contarles": "10012345678",
+    "congresista": "200123566789:;",
+    "conducía": "27312345567778",
+    "escaparon": "20001234456678",
+    "cenamos": "10012234456",
+    "quité": "15223345",
+    "aislamiento": "200023455689:;",
+    "hágame": "02112234456",
+    "míreme": "02112234456",
+    "traicionó": "29324457789",
+    "muévase": "03113345567",
+    "holanda": "10012234567",
+    "garantizar": "30012234567789",
+    "colocado": "20012234456678",
+    "vayámonos": "14212224456678",
+    "intervención": "3;40123456789;",
+    "bloqueado": "20023356667789",
+    "tos": "00012",
+    "cortés": "15212345",
+    "pruébalo": "04124456678",
+    "morder": "10012345",
+    "rompo": "00012345",
+    "lastimó": "27312345567",
+    "seguiría": "27312245567778",
+    "entenderás": "39401234567789",
+    "traigas": "00024456",
+    "salte": "00012345",
+    "tinieblas": "10012235578",
+    "simpatía": "27312345567778",
+    "negado": "10012234456",
+    "miserables": "20012234456689",
+    "bromea": "10023345556",
+    "afirma": "10001123456",
+    "tacto": "00012345",
+    "sueltes": "00013456",
+    "marchaos": "10012356667",
+    "acompañado": "3000112345667889:",
+    "productores": "2002334567889:",
+    "monjas": "00012345",
+    "mudarse": "10012234567",
+    "acosté": "26301123456",
+    "estabais": "10001234457",
+    "décadas": "02112234456",
+    "nombrar": "10012356",
+    "lesbianas": "10012346678",
+    "específico": "2630123445667889:",
+    "tablas": "00012245",
+    "síndrome": "02112356678",
+    "recogeré": "38412234456678",
+    "propone": "10023345567",
+    "desperdiciar": "3001234567889;",
+    "legión": "15212235",
+    "redonda": "10012234567",
+    "estais": "00001235",
+    "fresas": "00023345",
+    "asesor": "20001123345",
+    "canasta": "10012234567",
+    "tambores": "10012345567",
+    "granadas": "10023345567",
+    "escondió": "28301234568",
+    "ordene": "10001234456",
+    "vals": "00012",
+    "continúan": "27312345567778",
+    "quiten": "00023345",
+    "vivirás": "26312234456",
+    "quedaras": "10023345567",
+    "globos": "00023345",
+    "electrónico": "273011234677899:;",
+    "monseñor": "20012345567",
+    "cinturones": "20012345567789",
+    "informó": "27301234567",
+    "cierran": "00013356",
+    "cantidades": "20012345567789",
+    "lloraba": "10023345567",
+    "escritora": "20001245567789",
+    "discutirlo": "2001234556789:",
+    "manifestación": "4<5122344567899:<",
+    "mostrando": "10012356789",
+    "veterinario": "3001223445667889;",
+    "caíste": "13212223456",
+    "promoción": "28323345568",
+    "definitiva": "3001223445667889:",
+    "crié": "04124",
+    "técnicos": "02112345567",
+    "escapando": "20001234456789",
+    "oponente": "20001123345678",
+    "reportes": "10012234567",
+    "asegura": "20001123345567",
+    "retire": "10012234456",
+    "ayudarás": "37401113345567",
+    "esconderte": "2000123456789:",
+    "afirmativo": "3000112345667889:",
+    "pasados": "10012234456",
+    "suspendido": "2001234567889:",
+    "cogiendo": "10012235678",
+    "recupere": "20012234456678",
+    "yanquis": "00002356",
+    "alegres": "10001123356",
+    "movió": "15212235",
+    "salmón": "15212345",
+    "darías": "14212234445",
+    "fraternidad": "3002334567889:",
+    "inmediata": "20001234457789",
+    "sensibilidad": "400123455677899:;",
+    "espejos": "10001234456",
+    "mermelada": "20012345567789",
+    "puñetazo": "20012234456678",
+    "creencia": "10023334568",
+    "adoraba": "20001123345567",
+    "pimienta": "10012235678",
+    "mantienes": "10012346678",
+    "verónica": "14212234456678",
+    "impresionar": "3000124556889:",
+    "aislado": "10002345567",
+    "regresaron": "20012245567789",
+    "gustara": "10012345567",
+    "sirves": "00012345",
+    "cansé": "15212345",
+    "suéter": "03113345",
+    "búfalo": "02112234456",
+    "leeré": "25312223345",
+    "unirme": "10001123456",
+    "rompieron": "10012346678",
+    "abrirá": "26301134456",
+    "usada": "10001123345",
+    "soporta": "10012234567",
+    "resaca": "10012234456",
+    "tregua": "00023346",
+    "satán": "14212234",
+    "entraré": "27301245567",
+    "ingreso": "10001245567",
+    "funcionarios": "2001234667889;",
+    "vanidad": "20012234456",
+    "repetirlo": "20012234456789",
+    "cazando": "10012234567",
+    "parecemos": "20012234456678",
+    "demandas": "10012234567",
+    "regresando": "2001224556789:",
+    "vinos": "00012234",
+    "estima": "10001234456",
+    "leve": "00012234",
+    "aceptará": "38401123456678",
+    "traerle": "10023334567",
+    "espantosa": "20001234567789",
+    "dieciocho": "10013346689",
+    "distinguido": "200123456899:;",
+    "ocupará": "37401123345567",
+    "similares": "20012234456678",
+    "presidenta": "2002334556789:",
+    "cora": "00012234",
+    "favoritas": "20012234456678",
+    "dejarías": "26312234456667",
+    "tara": "00012234",
+    "valer": "10012234",
+    "probaré": "27323345567",
+    "luchas": "00012245",
+    "blando": "00023456",
+    "deberiamos": "20012234457789",
+    "picado": "10012234456",
+    "trabajadora": "300233455677899:;",
+    "desaparezca": "300122344566789:;",
+    "disfrutado": "2001235667889:",
+    "marchen": "00012356",
+    "herramienta": "200122455689:;",
+    "celdas": "00012345",
+    "elija": "10001123345",
+    "quinientos": "10023346789",
+    "apágalo": "13201123345567",
+    "flanco": "00023456",
+    "bromear": "20023345556",
+    "hijita": "10012234456",
+    "construyeron": "200124677799:;",
+    "unida": "10001123345",
+    "viajero": "10013345567",
+    "leyendas": "10012224567",
+    "alejandro": "20001123345689",
+    "sientate": "10013456678",
+    "anota": "10001123345",
+    "fallecido": "20012245567789",
+    "movernos": "10012234567",
+    "enseñas": "10001234456",
+    "guapas": "00013345",
+    "carnaval": "20012345567",
+    "holandés": "27312234567",
+    "afeitar": "20001124456",
+    "violentos": "10013345678",
+    "lograron": "10012245567",
+    "exitoso": "20001123345567",
+    "paraguay": "20012234458",
+}
@@ -0,0 +1,332 @@
+# -------------------------------------------------------------------------------------
+# Copyright (C) 2009 TIP: Text & Information Processing (http://tip.dis.ulpgc.es)
+# Copyright (c) 2020 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Table-driven implementation of the syllabification rules in ``engine``.
+
+The rules engine walks a ``WordProgress`` cursor through ``onset``, ``nucleus`` and
+``coda``. This module applies exactly the same rules, but it first maps the whole
+word to a string of character classes with a single ``str.translate`` call and then
+makes one pass over it with plain integer indices. The result is identical to the
+one of ``engine.parse_word``, which is checked against the golden word list in the
+test suite.
+"""
+
+import re
+
+from .charclass import (
+    ACCENTED_CLASSES,
+    CHAR_CLASSES,
+    CLOSED_ACCENTED,
+    CLOSED_CLASSES,
+    INVALID,
+    ONSET_CLASSES,
+    OPEN_ACCENTED,
+    OPEN_CLASSES,
+    RAW_VOWEL_CLASSES,
+    VOWEL_CLASSES,
+    Y_CONSONANT,
+    H,
+)
+from .errors import ErrorKind, HyphenatorError, InvalidWord
+from .models import SyllabifiedWord, Syllable
+from .util import find_invalid_chars
+
+# A 'y' followed by a vowel acts as a consonant, otherwise it acts as a vowel
+_Y_AS_CONSONANT = re.compile("y(?=[aAiI])")
+
+# Consonant pairs that start a syllable when they are followed by a vowel
+INSEPARABLE_DIGRAPHS = frozenset(("ll", "ch", "rr"))
+ONSET_CLUSTERS = frozenset(
+    ("gl", "cl", "kl", "bl", "vl", "pl", "fl", "tl", "gr", "cr", "kr", "br", "vr", "pr", "fr", "tr", "dr")
+)
+# Consonant pairs that start a syllable when they are preceded by another consonant
+ONSET_CLUSTERS_AFTER_CONSONANT = frozenset(("pt", "ct", "cn", "ps", "mn", "gn", "ft", "pn", "cz", "tz", "ts"))
+
+FRONT_VOWELS = frozenset("eiéí")
+
+
+def classify(word: str) -> str:
+    """
+    Map a lowercase word to its string of character classes.
+
+    Each character of the result describes the character in the same position of the
+    word. The 'y' is resolved according to its context.
+    """
+    classes = word.translate(CHAR_CLASSES)
+    if "y" in classes:
+        classes = _Y_AS_CONSONANT.sub(Y_CONSONANT, classes)
+    return classes
+
+
+def scan(word: str) -> tuple[list[int], int, int, int | None]:
+    """
+    Find the syllable structure of a word.
+
+    Returns:
+        A tuple with:
+          - A flat list with three positions per syllable: the start of the onset,
+            the start of the nucleus and the start of the coda. Each syllable ends
+            where the next one starts, and the last item is the end of the word.
+          - A bit mask with the syllables that contain a graphical accent.
+          - The index of the stressed syllable.
+          - The position of the graphical accent, if any.
+    """
+    w = word.lower()
+    return scan_classified(w, classify(w))
+
+
+def scan_checked(word: str) -> tuple[list[int], int, int, int | None] | InvalidWord:
+    """
+    Same as ``scan``, but validate the word in the same pass, without raising.
+
+    The character classes are used to validate the word, so the full validation only
+    runs when they contain invalid letters or there is a 'ü'.
+
+    Returns:
+        The output of ``scan``, or an InvalidWord if the word is not a valid Spanish
+        word.
+    """
+    w = word.lower()
+    cls = classify(w)
+    if INVALID in cls or "ü" in w:
+        invalid = find_invalid_chars(word)
+        if invalid is not None:
+            return invalid
+    scanned = _scan(w, cls)
+    if scanned is None:
+        return InvalidWord(word, ErrorKind.NO_NUCLEUS, "Nucleus expects a vowel!")
+    return scanned
+
+
+def scan_valid(word: str) -> tuple[list[int], int, int, int | None]:
+    """Same as ``scan``, but raise HyphenatorError if the word is not a valid Spanish word"""
+    scanned = scan_checked(word)
+    if isinstance(scanned, InvalidWord):
+        raise scanned.error()
+    return scanned
+
+
+def try_scan(word: str) -> tuple[list[int], int, int, int | None] | None:
+    """Same as ``scan_checked``, but return None for words that are not valid"""
+    scanned = scan_checked(word)
+    return None if isinstance(scanned, InvalidWord) else scanned
+
+
+def scan_classified(w: str, cls: str) -> tuple[list[int], int, int, int | None]:
+    """Same as ``scan``, for a lowercase word and its character classes"""
+    scanned = _scan(w, cls)
+    if scanned is None:
+        raise HyphenatorError("Nucleus expects a vowel!", w)
+    return scanned
+
+
+def _scan(w: str, cls: str) -> tuple[list[int], int, int, int | None] | None:  # noqa: C901
+    """Same as ``scan_classified``, but return None when a syllable has no nucleus"""
+    n = len(w)
+    vowels = VOWEL_CLASSES
+    onset_classes = ONSET_CLASSES
+    marks: list[int] = []
+    accented_mask = 0
+    accent = None
+    stress_found = False
+    stressed = None
+    num_syl = 0
+    p = 0
+
+    while p < n:
+        start = p
+
+        # ---- Onset: all initial consonants (in the case of y, only the first)
+        while p < n and cls[p] in onset_classes:
+            p += 1
+        if 0 < p < n:
+            last_two = w[p - 1 : p + 1]
+            if last_two == "qu" or last_two == "gü" or (last_two == "gu" and p + 1 < n and w[p + 1] in FRONT_VOWELS):
+                p += 1
+        nucleus_start = p
+
+        # ---- Nucleus
+        while p < n:  # Single pass, used for its early exits
+            if cls[p] == Y_CONSONANT:
+                # 'y' acting as consonant, move past it
+                p += 1
+                if p >= n:
+                    break
+            first = cls[p]
+            if first not in vowels:
+                return None
+            if first in ACCENTED_CLASSES:
+                accent = p
+                stress_found = True
+            p += 1
+            if first == CLOSED_ACCENTED:
+                # An accented closed vowel breaks a possible diphthong
+                break
+            found_h = p < n and cls[p] == H
+            if found_h:
+                p += 1
+            if p >= n:
+                break
+            second = cls[p]
+            if second not in vowels:
+                break
+            if second in OPEN_CLASSES:
+                if first in OPEN_CLASSES:  # Two open vowels can't form a syllable
+                    if found_h:
+                        p -= 1
+                    break
+                if second == OPEN_ACCENTED:
+                    accent = p
+                    stress_found = True
+                p += 1
+            elif second == CLOSED_ACCENTED:
+                accent = p
+                if first in CLOSED_CLASSES:  # diphthong
+                    stress_found = True
+                    p += 1
+                elif found_h:
+                    p -= 1
+                break
+            else:
+                if p + 1 < n and cls[p + 1] in vowels:
+                    # Vowel - closed vowel - vowel is never a triphthong
+                    if found_h:
+                        p -= 1
+                    break
+                if w[p] != w[p - 1]:
+                    p += 1
+                break
+            # Third vowel?
+            if p >= n:
+                break
+            if w[p] in "ui":
+                p += 1  # Triphthong
+            if p == n - 1 and w[p] == "y":
+                p += 1
+            break
+        coda_start = p
+
+        # ---- Coda
+        if p < n and cls[p] not in vowels:
+            if p == n - 1:
+                p = n
+            elif cls[p + 1] in vowels:
+                pass  # A single consonant between vowels starts the next syllable
+            elif p >= n - 2:
+                if w[p + 1] != "y":
+                    p = n
+            else:
+                c1 = w[p]
+                c2 = w[p + 1]
+                c3 = w[p + 2]
+                if cls[p + 2] in vowels:
+                    digraph = c1 + c2
+                    if digraph in INSEPARABLE_DIGRAPHS or (c2 == "h" and c1 not in "sr"):
+                        pass
+                    elif c2 == "y":
+                        if cls[p + 1] == Y_CONSONANT:
+                            p += 1
+                    elif digraph not in ONSET_CLUSTERS:
+                        p += 1
+                elif p >= n - 3:
+                    if c2 != "y" or cls[p + 1] == Y_CONSONANT:
+                        if c3 == "y":
+                            p += 1
+                        else:
+                            p = n
+                elif c2 == "y" and cls[p + 1] != Y_CONSONANT:
+                    p += 1
+                elif c2 + c3 in ONSET_CLUSTERS_AFTER_CONSONANT or c3 in "lry" or c2 + c3 == "ch":
+                    p += 1
+                else:
+                    p += 2
+
+        marks += (start, nucleus_start, coda_start)
+        if accent is not None and start <= accent < p:
+            accented_mask |= 1 << num_syl
+        num_syl += 1
+        if stress_found and stressed is None:
+            stressed = num_syl - 1
+
+    if not num_syl:
+        # An empty word
+        return None
+    marks.append(n)
+    if stressed is None:
+        stressed = stress_by_rules(w, cls, num_syl)
+    return marks, accented_mask, stressed, accent
+
+
+def stress_by_rules(w: str, cls: str, num_syl: int) -> int:
+    """Find the stressed syllable of a word without graphical accent"""
+    if num_syl == 1:
+        return 0
+    end = w[-1]
+    prev = w[-2]
+    if end == "y":
+        # y preceded by a vowel is treated as a consonant
+        return num_syl - 1 if cls[-2] in RAW_VOWEL_CLASSES or prev == "y" else num_syl - 2
+    if cls[-1] in RAW_VOWEL_CLASSES or (end in "ns" and cls[-2] in RAW_VOWEL_CLASSES):
+        return num_syl - 2
+    return num_syl - 1
+
+
+def build_result(
+    word: str,
+    marks: list[int],
+    accented_mask: int,
+    stressed: int,
+    accent: int | None,
+    pool: dict[tuple, Syllable] | None = None,
+) -> SyllabifiedWord:
+    """
+    Build a SyllabifiedWord out of the output of ``scan``.
+
+    Syllables are immutable, so when a pool is given, syllables that are equal to one
+    in the pool are shared instead of created again, and new ones are added to it.
+    """
+    syllables = []
+    for index, i in enumerate(range(0, len(marks) - 1, 3)):
+        start, nucleus_start, coda_start, end = marks[i : i + 4]
+        fields = (
+            word[start:nucleus_start],
+            word[nucleus_start:coda_start],
+            word[coda_start:end],
+            bool(accented_mask >> index & 1),
+            index == stressed,
+        )
+        if pool is None:
+            syllables.append(Syllable(*fields))
+            continue
+        syllable = pool.get(fields)
+        if syllable is None:
+            syllable = pool[fields] = Syllable(*fields)
+        syllables.append(syllable)
+    return SyllabifiedWord(word, tuple(syllables), stressed, accent)
+
+
+def parse_word(word: str) -> SyllabifiedWord:
+    """Syllabify a word with the compiled engine. The word is not validated."""
+    return build_result(word, *scan(word))
+
+
+def parse_valid_word(word: str) -> SyllabifiedWord:
+    """Validate and syllabify a word with the compiled engine, in a single pass"""
+    return build_result(word, *scan_valid(word))
@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Long-running daemon that syllabifies words sent over a Unix domain socket.
+
+Starting Python and importing the library takes much longer than syllabifying a
+word, so scripts that run the command once per word spend most of their time
+starting up. A daemon pays that cost once, and the command forwards its words to it
+when it is running and ``$PYLABEADOR_DAEMON`` is set.
+
+The protocol is line based, in UTF-8. Clients send one word per line, and the daemon
+answers each line with the hyphenated word, or with '!' followed by the error
+message if the word is not valid, in the same order. Clients can send many lines
+before reading the answers.
+
+The socket is ``$PYLABEADOR_SOCKET`` if set, otherwise ``pylabeador-UID.sock`` in
+``$XDG_RUNTIME_DIR``, or ``pylabeador-UID/daemon.sock`` in the temporary directory.
+The directory of the default socket must be accessible only by the user that runs
+the daemon, and the one in the temporary directory is created so. The socket itself
+is created accessible only by that user, and clients only talk to daemons run by
+their own user, so words and answers never cross users. Clients are in
+``pylabeador.daemonclient``.
+
+Examples:
+    >>> import os, tempfile, threading
+    >>> from pylabeador.daemonclient import connect_daemon
+    >>> path = os.path.join(tempfile.mkdtemp(), "pylabeador.sock")
+    >>> server = make_daemon(path)
+    >>> threading.Thread(target=server.serve_forever, daemon=True).start()
+    >>> with connect_daemon(path) as client:
+    ...     client.hyphenate("casa")
+    'ca-sa'
+    >>> server.shutdown()
+"""
+
+import os
+import socket
+import socketserver
+import sys
+
+from .api import syllabify_with_details
+from .daemonclient import ERROR_MARK, check_private_directory, connect_daemon, default_socket_path
+from .errors import HyphenatorError
+
+RECV_SIZE = 64 * 1024
+
+
+def _answer_line(line: bytes) -> bytes:
+    """Syllabify the word in a line of a request, and return the line of the answer"""
+    word = line.rstrip(b"\r").decode("utf-8", errors="replace")
+    try:
+        answer = syllabify_with_details(word).hyphenated
+    except HyphenatorError as e:
+        answer = ERROR_MARK + str(e)
+    return answer.encode() + b"\n"
+
+
+class DaemonHandler(socketserver.BaseRequestHandler):
+    """Answer the lines sent by a client until it closes the connection"""
+
+    def handle(self):
+        pending = b""
+        while data := self.request.recv(RECV_SIZE):
+            lines = (pending + data).split(b"\n")
+            pending = lines.pop()
+            if lines:
+                # All the lines received so far are answered at once
+                self.request.sendall(b"".join(_answer_line(line) for line in lines))
+
+
+# Unix sockets are not available on every platform, and the daemon cannot run there
+_UnixServer = getattr(socketserver, "ThreadingUnixStreamServer", socketserver.TCPServer)
+
+
+class DaemonServer(_UnixServer):
+    """Server of the daemon, with a thread per client"""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        # Created private, instead of changing its mode after it is bound and reachable
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+
+def make_daemon(path: str | None = None) -> DaemonServer:
+    """
+    Create the server of a daemon, listening on a Unix socket but not yet serving.
+
+    A socket file left behind by a daemon that is no longer running is replaced.
+
+    Args:
+        path: The socket, ``default_socket_path()`` by default, whose directory is
+            created if needed and must be private.
+
+    Raises:
+        OSError: When another daemon is already listening on the socket, or the
+            directory of the default socket is not private.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not available on this platform")
+    if path is None:
+        path = default_socket_path()
+        directory = os.path.dirname(path)
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+        check_private_directory(directory)
+    if os.path.exists(path):
+        client = connect_daemon(path)
+        if client is not None:
+            client.close()
+            raise OSError(f"A daemon is already running on {path}")
+        os.unlink(path)
+    return DaemonServer(path, DaemonHandler)
+
+
+def serve_daemon(path: str | None = None) -> None:
+    """Serve clients until interrupted, and remove the socket when done"""
+    with make_daemon(path) as server:
+        print(f"Listening on {server.server_address}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(server.server_address)
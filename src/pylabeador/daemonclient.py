@@ -0,0 +1,190 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Client of the daemon in ``pylabeador.daemon``.
+
+This module is used by the command to find out whether a daemon is running and to
+forward words to it, before anything else is loaded, so it only imports the
+standard modules it needs. The library is only loaded if a word is invalid, to
+raise its error.
+"""
+
+from collections.abc import Iterable
+from itertools import islice
+import os
+import socket
+import stat
+
+# Not typing.TYPE_CHECKING, which would import typing. Type checkers take any
+# TYPE_CHECKING as true.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .errors import HyphenatorError
+
+SOCKET_ENV = "PYLABEADOR_SOCKET"
+# Number of words sent by a client before reading their answers
+DEFAULT_CHUNK_SIZE = 1024
+# Seconds that a client waits for the daemon before giving up on it
+DEFAULT_TIMEOUT = 5.0
+ERROR_MARK = "!"
+
+
+def default_socket_path() -> str:
+    """Return the path of the socket of the daemon, see ``pylabeador.daemon``"""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if directory:
+        return os.path.join(directory, f"pylabeador-{os.getuid()}.sock")
+    import tempfile
+
+    # The temporary directory is shared, so the socket goes in a private directory in it
+    return os.path.join(tempfile.gettempdir(), f"pylabeador-{os.getuid()}", "daemon.sock")
+
+
+def check_private_directory(directory: str) -> None:
+    """
+    Check that a directory belongs to the current user, and only they can access it.
+
+    Raises:
+        PermissionError: When it does not.
+    """
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} must be a directory that only its owner can access")
+
+
+def _peer_uid(sock: socket.socket, path: str) -> int:
+    """Return the user of the process at the other end of a Unix socket"""
+    if hasattr(socket, "SO_PEERCRED"):
+        import struct
+
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        return struct.unpack("3i", creds)[1]
+    # Without credentials, trust the owner of the socket file, which only its owner can replace
+    return os.stat(path).st_uid
+
+
+def _error(message: str) -> "HyphenatorError":
+    from .errors import HyphenatorError
+
+    return HyphenatorError(message)
+
+
+def _invalid_word_error(word: str) -> "HyphenatorError":
+    from .util import find_invalid_chars
+
+    return find_invalid_chars(word).error()  # type: ignore[union-attr]
+
+
+class DaemonClient:
+    """Connection to a running daemon"""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._reader.close()
+        self._sock.close()
+
+    def hyphenate_many(
+        self, words: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "Iterator[str | HyphenatorError]":
+        """
+        Hyphenate words in the daemon.
+
+        Words are sent in chunks, and the answers to each chunk are read before the
+        next one is sent, so that neither side blocks on a full socket.
+
+        Yields:
+            The hyphenated words, or the HyphenatorError of each invalid word, in the
+            same order as the input.
+
+        Raises:
+            OSError: When the connection to the daemon fails.
+        """
+        words = iter(words)
+        while chunk := list(islice(words, chunk_size)):
+            # Line breaks would split a word in two lines, but they are not valid in a
+            # word anyway, so those words are answered here
+            broken = ["\n" in word or "\r" in word for word in chunk]
+            request = "".join(f"{word}\n" for word, is_broken in zip(chunk, broken, strict=True) if not is_broken)
+            self._sock.sendall(request.encode())
+            for word, is_broken in zip(chunk, broken, strict=True):
+                if is_broken:
+                    yield _invalid_word_error(word)
+                    continue
+                line = self._reader.readline()
+                if not line.endswith(b"\n"):
+                    raise ConnectionError("The daemon closed the connection")
+                answer = line[:-1].decode()
+                yield _error(answer[1:]) if answer.startswith(ERROR_MARK) else answer
+
+    def hyphenate(self, word: str) -> str:
+        """
+        Hyphenate a word in the daemon.
+
+        Raises:
+            HyphenatorError: If the word is not a valid Spanish word.
+        """
+        res = next(self.hyphenate_many([word]))
+        if not isinstance(res, str):
+            raise res
+        return res
+
+
+def connect_daemon(path: str | None = None, timeout: float = DEFAULT_TIMEOUT) -> DaemonClient | None:
+    """
+    Connect to a running daemon.
+
+    Args:
+        path: The socket, ``default_socket_path()`` by default.
+        timeout: Seconds to wait for each answer from the daemon.
+
+    Only daemons run by the current user are connected to, so that no other user can
+    read the words or answer them.
+
+    Returns:
+        A client connected to the daemon, or None if no daemon of the current user
+        is running.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    path = path or default_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        if _peer_uid(sock, path) != os.getuid():
+            sock.close()
+            return None
+    except OSError:
+        sock.close()
+        return None
+    return DaemonClient(sock)
@@ -18,35 +18,37 @@
 # along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
 # -------------------------------------------------------------------------------------
 
+from .charclass import CLASS_OF, ONSET_CLASSES
 from .errors import HyphenatorError
 from .models import VowelType, WordProgress
-from .util import CONSONANTS, is_vowel
+from .util import is_vowel
 
-CONSONANTS_BAR_Y = CONSONANTS - set("y")
+CONSONANTS_BAR_Y = frozenset(c for c, cls in CLASS_OF.items() if cls in ONSET_CLASSES)
 
 
 def parse_word(word: str) -> WordProgress:
     word_progress = WordProgress(word)
 
     while not word_progress.ended:
-        syllable = word_progress.add_syllable()
         start_pos = word_progress.pos
 
         # All initial consonants belong to the onset (in the case of y, only the first)
-        syllable.onset = onset(word_progress)
-        syllable.nucleus = nucleus(word_progress)
-        syllable.coda = coda(word_progress)
+        syllable_onset = onset(word_progress)
+        syllable_nucleus = nucleus(word_progress)
+        syllable_coda = coda(word_progress)
 
         end_pos = word_progress.pos
-        syllable.accented = word_progress.accent is not None and start_pos <= word_progress.accent < end_pos
+        accented = word_progress.accent is not None and start_pos <= word_progress.accent < end_pos
+        word_progress.add_syllable(syllable_onset, syllable_nucleus, syllable_coda, accented)
 
         num_syl = len(word_progress.syllables)
         if word_progress.stress_found and word_progress.stressed is None:
             word_progress.stressed = num_syl - 1
 
-    word_progress.stressed = find_stressed_syllable(word_progress)
-    word_progress.syllables[word_progress.stressed].stressed = True
-    word_progress.stress_found = True
+    if not word_progress.syllables:
+        # An empty word
+        raise HyphenatorError("Nucleus expects a vowel!", word)
+    word_progress.mark_stressed(find_stressed_syllable(word_progress))
     return word_progress
 
 
@@ -17,6 +17,37 @@
 # along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
 # -------------------------------------------------------------------------------------
 
+from dataclasses import dataclass
+from enum import Enum
+
 
 class HyphenatorError(Exception):
     pass
+
+
+class ErrorKind(Enum):
+    """Why a word could not be syllabified"""
+
+    INVALID_LETTER = "invalid letter"
+    MISPLACED_DIAERESIS = "misplaced ü"
+    NO_NUCLEUS = "no nucleus"
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidWord:
+    """
+    Result for a word that could not be syllabified, returned instead of raising.
+
+    Attributes:
+        original: The word.
+        kind: Why it could not be syllabified.
+        message: The message of the HyphenatorError that would have been raised.
+    """
+
+    original: str
+    kind: ErrorKind
+    message: str
+
+    def error(self) -> HyphenatorError:
+        """Return the exception for this error, to be raised by the caller"""
+        return HyphenatorError(self.message)
@@ -0,0 +1,311 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Machine-readable serialization of whole syllabification results.
+
+Three formats are available, all of them with one record per word:
+
+    jsonl  One JSON object per line, with the same fields as SyllabifiedWord and
+           Syllable, plus the hyphenated word.
+    tsv    Tab separated columns, after a header line: the word, the hyphenated word,
+           the onsets, nuclei and codas of the syllables, whether each syllable has
+           a graphical accent (0 or 1), the stressed syllable and the position of
+           the accent, empty if none. Per-syllable columns are joined with "-".
+    bin    A magic string and a version, followed by one record per word, with all
+           integers as little-endian u16: the length of the UTF-8 word, the number
+           of syllables, the stressed syllable, the accent position (0xFFFF for
+           none), the word itself, the positions returned by ``compiled.scan`` and a
+           bit mask of the accented syllables, one bit per syllable. Words longer
+           than ``BIN_MAX_LENGTH`` bytes in UTF-8 do not fit in a record.
+
+Every format can be read back into SyllabifiedWord objects with ``read_results``.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+import json
+import struct
+from typing import IO
+
+from . import compiled
+from .errors import HyphenatorError
+from .models import SyllabifiedWord, Syllable
+
+DEFAULT_BATCH_SIZE = 8192
+
+BIN_MAGIC = b"PYLABSYL"
+BIN_VERSION = 1
+BIN_HEADER = struct.Struct("<8sH")
+BIN_RECORD = struct.Struct("<HHHH")
+_NONE = 0xFFFF
+# Longest word, in UTF-8 bytes, whose length and positions fit in the u16 of a record
+BIN_MAX_LENGTH = 0xFFFF
+
+TSV_COLUMNS = ("word", "hyphenated", "onsets", "nuclei", "codas", "accented", "stressed", "accent")
+
+
+def marks_of(res: SyllabifiedWord) -> tuple[list[int], int]:
+    """Return the syllable marks and the accented syllables mask of a result, as ``compiled.scan`` does"""
+    marks = []
+    mask = 0
+    pos = 0
+    for index, syllable in enumerate(res.syllables):
+        nucleus_start = pos + len(syllable.onset)
+        coda_start = nucleus_start + len(syllable.nucleus)
+        marks += (pos, nucleus_start, coda_start)
+        pos = coda_start + len(syllable.coda)
+        if syllable.accented:
+            mask |= 1 << index
+    marks.append(pos)
+    return marks, mask
+
+
+class ResultFormat(ABC):
+    """A serialization format, for writing and reading syllabification results"""
+
+    name = ""
+    binary = False
+
+    def header(self) -> str | bytes:
+        return b"" if self.binary else ""
+
+    @abstractmethod
+    def encode(self, res: SyllabifiedWord) -> str | bytes:
+        """Serialize one result into a whole record"""
+
+    @abstractmethod
+    def read(self, stream: IO) -> Iterator[SyllabifiedWord]:
+        """Read back the results written in this format"""
+
+
+def result_to_dict(res: SyllabifiedWord) -> dict:
+    """Return a result as plain data, with the same fields as SyllabifiedWord and Syllable, plus the hyphenated word"""
+    return {
+        "original": res.original,
+        "hyphenated": res.hyphenated,
+        "syllables": [
+            {
+                "onset": s.onset,
+                "nucleus": s.nucleus,
+                "coda": s.coda,
+                "accented": s.accented,
+                "stressed": s.stressed,
+            }
+            for s in res.syllables
+        ],
+        "stressed": res.stressed,
+        "accented": res.accented,
+    }
+
+
+class JsonLinesFormat(ResultFormat):
+    name = "jsonl"
+
+    def encode(self, res: SyllabifiedWord) -> str:
+        return json.dumps(result_to_dict(res), ensure_ascii=False) + "\n"
+
+    def read(self, stream: IO[str]) -> Iterator[SyllabifiedWord]:
+        for line in stream:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            syllables = tuple(Syllable(**syllable) for syllable in record["syllables"])
+            yield SyllabifiedWord(record["original"], syllables, record["stressed"], record["accented"])
+
+
+class TsvFormat(ResultFormat):
+    name = "tsv"
+
+    def header(self) -> str:
+        return "\t".join(TSV_COLUMNS) + "\n"
+
+    def encode(self, res: SyllabifiedWord) -> str:
+        syllables = res.syllables
+        return (
+            "\t".join(
+                (
+                    res.original,
+                    res.hyphenated,
+                    "-".join(s.onset for s in syllables),
+                    "-".join(s.nucleus for s in syllables),
+                    "-".join(s.coda for s in syllables),
+                    "-".join("1" if s.accented else "0" for s in syllables),
+                    str(res.stressed),
+                    "" if res.accented is None else str(res.accented),
+                )
+            )
+            + "\n"
+        )
+
+    def read(self, stream: IO[str]) -> Iterator[SyllabifiedWord]:
+        for line_no, line in enumerate(stream):
+            line = line.rstrip("\n")
+            if not line or (line_no == 0 and line.split("\t") == list(TSV_COLUMNS)):
+                continue
+            word, _, onsets, nuclei, codas, accented, stressed, accent = line.split("\t")
+            index = int(stressed)
+            syllables = tuple(
+                Syllable(onset, nucleus, coda, flag == "1", i == index)
+                for i, (onset, nucleus, coda, flag) in enumerate(
+                    zip(onsets.split("-"), nuclei.split("-"), codas.split("-"), accented.split("-"), strict=True)
+                )
+            )
+            yield SyllabifiedWord(word, syllables, index, int(accent) if accent else None)
+
+
+def encode_scan(word: str, marks: list[int], accented_mask: int, stressed: int, accent: int | None) -> bytes:
+    """
+    Pack the output of ``compiled.scan`` for a word into a binary record.
+
+    Raises:
+        HyphenatorError: When the word is longer than ``BIN_MAX_LENGTH`` bytes in
+            UTF-8, before anything is packed.
+    """
+    key = word.encode()
+    if len(key) > BIN_MAX_LENGTH:
+        raise HyphenatorError(f"Words longer than {BIN_MAX_LENGTH} bytes cannot be stored in the binary format")
+    num_syl = len(marks) // 3
+    return b"".join(
+        (
+            BIN_RECORD.pack(len(key), num_syl, stressed, _NONE if accent is None else accent),
+            key,
+            struct.pack(f"<{len(marks)}H", *marks),
+            accented_mask.to_bytes((num_syl + 7) // 8, "little"),
+        )
+    )
+
+
+def decode_records(data: bytes) -> Iterator[SyllabifiedWord]:
+    """Unpack a buffer of binary records, without the header"""
+    view = memoryview(data)
+    offset = 0
+    size = len(data)
+    while offset < size:
+        key_len, num_syl, stressed, accent = BIN_RECORD.unpack_from(view, offset)
+        offset += BIN_RECORD.size
+        word = str(view[offset : offset + key_len], "utf-8")
+        offset += key_len
+        num_marks = 3 * num_syl + 1
+        marks = list(struct.unpack_from(f"<{num_marks}H", view, offset))
+        offset += 2 * num_marks
+        mask_len = (num_syl + 7) // 8
+        mask = int.from_bytes(view[offset : offset + mask_len], "little")
+        offset += mask_len
+        yield compiled.build_result(word, marks, mask, stressed, None if accent == _NONE else accent)
+
+
+class BinaryFormat(ResultFormat):
+    name = "bin"
+    binary = True
+
+    def header(self) -> bytes:
+        return BIN_HEADER.pack(BIN_MAGIC, BIN_VERSION)
+
+    def encode(self, res: SyllabifiedWord) -> bytes:
+        marks, mask = marks_of(res)
+        return encode_scan(res.original, marks, mask, res.stressed, res.accented)  # type: ignore[arg-type]
+
+    def read(self, stream: IO[bytes]) -> Iterator[SyllabifiedWord]:
+        header = stream.read(BIN_HEADER.size)
+        if len(header) != BIN_HEADER.size or BIN_HEADER.unpack(header) != (BIN_MAGIC, BIN_VERSION):
+            raise ValueError("The data is not in the pylabeador binary format")
+        while info := stream.read(BIN_RECORD.size):
+            key_len, num_syl, _, _ = BIN_RECORD.unpack(info)
+            rest = stream.read(key_len + 2 * (3 * num_syl + 1) + (num_syl + 7) // 8)
+            yield from decode_records(info + rest)
+
+
+FORMATS: dict[str, ResultFormat] = {fmt.name: fmt for fmt in (JsonLinesFormat(), TsvFormat(), BinaryFormat())}
+
+
+def _get_format(name: str) -> ResultFormat:
+    try:
+        return FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown format {name}, expected one of {', '.join(FORMATS)}") from None
+
+
+def write_results(
+    out: IO, results: Iterable[SyllabifiedWord], format: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Serialize syllabification results, writing them in batches of records.
+
+    Args:
+        out: A text stream, or a binary one for the "bin" format.
+        results: The results to write.
+        format: One of "jsonl", "tsv" or "bin".
+        batch_size: Number of records written at a time.
+
+    Returns:
+        The number of records written.
+
+    Raises:
+        HyphenatorError: When a word is too long for the binary format. Every record
+            before it is written, and no part of it.
+
+    Examples:
+        >>> import io, pylabeador
+        >>> out = io.StringIO()
+        >>> write_results(out, [pylabeador.syllabify_with_details("casa")], "tsv")
+        1
+        >>> out.getvalue().splitlines()[1]
+        'casa\\tca-sa\\tc-s\\ta-a\\t-\\t0-0\\t0\\t'
+    """
+    writer = RecordWriter(out, format, batch_size)
+    try:
+        for res in results:
+            writer.write(res)
+    finally:
+        writer.flush()
+    return writer.count
+
+
+class RecordWriter:
+    """Serialize results one by one, writing them to a stream in batches of records"""
+
+    def __init__(self, out: IO, format: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.out = out
+        self.format = _get_format(format)
+        self.batch_size = batch_size
+        self.batch: list = [self.format.header()]
+        self.count = 0
+
+    def write(self, res: SyllabifiedWord) -> None:
+        self.batch.append(self.format.encode(res))
+        self.count += 1
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.batch:
+            self.out.write((b"" if self.format.binary else "").join(self.batch))
+            self.batch.clear()
+        self.out.flush()
+
+
+def read_results(stream: IO, format: str) -> Iterator[SyllabifiedWord]:
+    """
+    Read back results written with ``write_results``.
+
+    Args:
+        stream: A text stream, or a binary one for the "bin" format.
+        format: One of "jsonl", "tsv" or "bin".
+    """
+    return _get_format(format).read(stream)
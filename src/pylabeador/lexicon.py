@@ -0,0 +1,153 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Lexicon of words whose syllabification overrides the one given by the rules.
+
+A lexicon is written as text, one word per line followed by its syllables separated
+by hyphens, such as ``transatlántico trans-a-tlán-ti-co``. Blank lines and lines
+starting with '#' are ignored. The onset, nucleus and coda of each syllable and the
+stressed syllable are worked out with the same rules as any other word.
+
+Lexicons are indexed in the format of the cache files, a hash table in which a
+lookup costs the same whatever the size of the lexicon. They can be compiled to a
+file, with ``build_lexicon_file``, which is then mapped in memory and shared between
+processes, or loaded straight from the text.
+"""
+
+from collections.abc import Iterable, Iterator
+import os
+
+from .cachefile import MAGIC, MAX_LENGTH, CacheFile, build_image, pack_record, write_image
+from .charclass import ACCENTED_CLASSES, VOWEL_CLASSES
+from .compiled import classify, scan_checked, stress_by_rules
+from .errors import InvalidWord
+from .util import find_invalid_chars
+
+
+def parse_lexicon(lines: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    """
+    Read the entries of a lexicon written as text.
+
+    Yields:
+        Tuples with each lowercase word and its syllables.
+
+    Raises:
+        ValueError: When an entry is not valid, with the number of its line.
+    """
+    for line_no, line in enumerate(lines, start=1):
+        parts = line.split()
+        if not parts or parts[0].startswith("#"):
+            continue
+        if len(parts) != 2:
+            raise ValueError(f"Line {line_no}: expected a word and its syllables, got {line.strip()!r}")
+        word, hyphenated = parts[0].lower(), parts[1].lower()
+        syllables = hyphenated.split("-")
+        if "".join(syllables) != word or not all(syllables):
+            raise ValueError(f"Line {line_no}: {hyphenated!r} is not a hyphenation of {word!r}")
+        invalid = find_invalid_chars(word)
+        if invalid is not None:
+            raise ValueError(f"Line {line_no}: {invalid.message}")
+        yield word, syllables
+
+
+def _syllable_marks(syllable: str, start: int) -> tuple[int, int, int]:
+    """Find where the nucleus and coda of a syllable start, as positions in the word"""
+    scanned = scan_checked(syllable)
+    if not isinstance(scanned, InvalidWord) and len(scanned[0]) == 4:
+        onset, nucleus, coda, _ = scanned[0]
+        return start + onset, start + nucleus, start + coda
+    # The rules would split it, so the nucleus goes from the first vowel to the last one
+    vowels = [i for i, cls in enumerate(classify(syllable)) if cls in VOWEL_CLASSES]
+    if not vowels:
+        return start, start + len(syllable), start + len(syllable)
+    return start, start + vowels[0], start + vowels[-1] + 1
+
+
+def lexicon_record(word: str, syllables: list[str]) -> tuple[list[int], int, int, int | None]:
+    """
+    Work out the syllable structure of a lexicon entry.
+
+    Returns:
+        The same tuple as ``compiled.scan``.
+    """
+    classes = classify(word)
+    marks: list[int] = []
+    accented_mask = 0
+    accent = None
+    stressed = None
+    pos = 0
+    for index, syllable in enumerate(syllables):
+        marks += _syllable_marks(syllable, pos)
+        end = pos + len(syllable)
+        for i in range(pos, end):
+            if classes[i] in ACCENTED_CLASSES:
+                accent = i
+                accented_mask |= 1 << index
+                if stressed is None:
+                    stressed = index
+        pos = end
+    marks.append(pos)
+    if stressed is None:
+        stressed = stress_by_rules(word, classes, len(syllables))
+    return marks, accented_mask, stressed, accent
+
+
+def _lexicon_records(lines: Iterable[str]) -> dict[bytes, bytes]:
+    records = {}
+    for word, syllables in parse_lexicon(lines):
+        key = word.encode()
+        if len(key) > MAX_LENGTH or len(syllables) > 32:
+            raise ValueError(f"The word {word} is too long for a lexicon")
+        records[key] = pack_record(key, *lexicon_record(word, syllables))
+    return records
+
+
+def build_lexicon_file(path: str | os.PathLike, lines: Iterable[str]) -> int:
+    """
+    Compile a lexicon written as text into a file that can be mapped in memory.
+
+    Args:
+        path: The file to write. It is replaced atomically if it exists.
+        lines: The lines of the lexicon.
+
+    Returns:
+        The number of words in the lexicon.
+    """
+    records = _lexicon_records(lines)
+    write_image(path, build_image(records))
+    return len(records)
+
+
+def load_lexicon(path: str | os.PathLike) -> CacheFile:
+    """
+    Open a lexicon, either compiled with ``build_lexicon_file`` or written as text.
+
+    Compiled lexicons are mapped in memory. Text ones are indexed in memory.
+
+    Examples:
+        >>> lexicon = load_lexicon("overrides.txt")
+        >>> lexicon["Transatlántico"].hyphenated
+        'Trans-a-tlán-ti-co'
+    """
+    with open(path, "rb") as fin:
+        compiled_file = fin.read(len(MAGIC)) == MAGIC
+    if compiled_file:
+        return CacheFile(path)
+    with open(path, encoding="utf-8") as fin:
+        return CacheFile.from_bytes(build_image(_lexicon_records(fin)), str(path))
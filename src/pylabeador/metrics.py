@@ -0,0 +1,203 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Runtime metrics of the syllabification calls, with Prometheus text exposition.
+
+A MetricsRegistry counts the words syllabified by single-word and batch calls, the
+invalid words by kind, and the latency of single-word calls in a histogram. Each
+thread updates its own set of counters, without locks, and the sets of all threads
+are added up when the metrics are read. When a thread ends, its counters are added
+to those of the threads that have ended before, so the memory used and the time to
+read the metrics depend on the number of live threads only.
+
+Metrics are collected only while enabled with ``api.enable_metrics``.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable
+import threading
+from time import perf_counter_ns
+import weakref
+
+from .errors import ErrorKind, HyphenatorError, InvalidWord
+from .util import find_invalid_chars
+
+# Upper bounds of the latency histogram buckets, in seconds. The last bucket, +Inf,
+# is implicit.
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2)
+_BUCKET_BOUNDS_NS = tuple(round(bound * 1e9) for bound in LATENCY_BUCKETS)
+_KINDS = tuple(ErrorKind)
+_KIND_INDEX = {kind: i for i, kind in enumerate(_KINDS)}
+
+
+class _Shard:
+    """Counters updated by a single thread"""
+
+    __slots__ = ("single", "batch", "errors", "buckets", "latency_ns")
+
+    def __init__(self):
+        self.single = 0
+        self.batch = 0
+        # Lists instead of dicts, so that they never change size while being read
+        self.errors = [0] * len(_KINDS)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_ns = 0
+
+    def add(self, other: "_Shard") -> None:
+        """Add the counters of another shard to these"""
+        self.single += other.single
+        self.batch += other.batch
+        self.errors = [total + count for total, count in zip(self.errors, other.errors, strict=True)]
+        self.buckets = [total + count for total, count in zip(self.buckets, other.buckets, strict=True)]
+        self.latency_ns += other.latency_ns
+
+
+class _ThreadEnd:
+    """Kept in a thread-local, which drops it when the thread ends"""
+
+    __slots__ = ("__weakref__",)
+
+
+def _error_kind(word: str) -> ErrorKind:
+    """Find out why a word raised a HyphenatorError"""
+    invalid = find_invalid_chars(word) if isinstance(word, str) else None
+    return ErrorKind.NO_NUCLEUS if invalid is None else invalid.kind
+
+
+class MetricsRegistry:
+    """Counters of the syllabification calls, kept per thread and added up on read"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: set[_Shard] = set()
+        # Counters of the threads that have ended
+        self._ended = _Shard()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            end = self._local.end = _ThreadEnd()
+            with self._lock:
+                self._shards.add(shard)
+            # A weak reference, so that the threads that are alive do not keep the registry alive
+            weakref.finalize(end, MetricsRegistry._thread_ended, weakref.ref(self), shard)
+            return shard
+
+    @staticmethod
+    def _thread_ended(registry_ref: "weakref.ref[MetricsRegistry]", shard: _Shard) -> None:
+        registry = registry_ref()
+        if registry is None:
+            return
+        with registry._lock:
+            registry._shards.discard(shard)
+            registry._ended.add(shard)
+
+    def observe(self, function: Callable, word: str):
+        """Call function(word), counting the word, its latency and its error, if any"""
+        shard = self._shard()
+        start = perf_counter_ns()
+        try:
+            return function(word)
+        except HyphenatorError:
+            shard.errors[_KIND_INDEX[_error_kind(word)]] += 1
+            raise
+        finally:
+            elapsed = perf_counter_ns() - start
+            shard.single += 1
+            shard.latency_ns += elapsed
+            shard.buckets[bisect_left(_BUCKET_BOUNDS_NS, elapsed)] += 1
+
+    def count_batch_result(self, res) -> None:
+        """Count a result of a batch call"""
+        shard = self._shard()
+        shard.batch += 1
+        if isinstance(res, InvalidWord):
+            shard.errors[_KIND_INDEX[res.kind]] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Add up the counters of all the threads.
+
+        Returns:
+            A dict with the number of words from single and batch calls, the errors
+            by kind, the count of each latency bucket, not cumulative, and the total
+            latency in seconds.
+        """
+        total = _Shard()
+        with self._lock:
+            total.add(self._ended)
+            for shard in self._shards:
+                total.add(shard)
+        return {
+            "words": {"single": total.single, "batch": total.batch},
+            "errors": dict(zip(_KINDS, total.errors, strict=True)),
+            "latency_buckets": total.buckets,
+            "latency_seconds": total.latency_ns / 1e9,
+        }
+
+    def render_prometheus(self, cache: tuple[int, int, int | None, int] | None = None) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            cache: The statistics of the result cache, as returned by
+                ``api.cache_info``, or None if there is no cache.
+        """
+        data = self.snapshot()
+        lines = [
+            "# HELP pylabeador_words_total Words syllabified, by kind of call.",
+            "# TYPE pylabeador_words_total counter",
+        ]
+        lines += [f'pylabeador_words_total{{call="{call}"}} {count}' for call, count in data["words"].items()]
+        lines += [
+            "# HELP pylabeador_errors_total Words that are not valid Spanish words, by reason.",
+            "# TYPE pylabeador_errors_total counter",
+        ]
+        lines += [
+            f'pylabeador_errors_total{{kind="{kind.name.lower()}"}} {count}' for kind, count in data["errors"].items()
+        ]
+        if cache is not None:
+            hits, misses, _, size = cache
+            lines += [
+                "# HELP pylabeador_cache_hits_total Words found in the result cache.",
+                "# TYPE pylabeador_cache_hits_total counter",
+                f"pylabeador_cache_hits_total {hits}",
+                "# HELP pylabeador_cache_misses_total Words not found in the result cache.",
+                "# TYPE pylabeador_cache_misses_total counter",
+                f"pylabeador_cache_misses_total {misses}",
+                "# HELP pylabeador_cache_size Words in the result cache.",
+                "# TYPE pylabeador_cache_size gauge",
+                f"pylabeador_cache_size {size}",
+            ]
+        lines += [
+            "# HELP pylabeador_syllabify_seconds Latency of single-word syllabification calls.",
+            "# TYPE pylabeador_syllabify_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), data["latency_buckets"], strict=True):
+            cumulative += count
+            lines.append(f'pylabeador_syllabify_seconds_bucket{{le="{bound}"}} {cumulative}')
+        lines += [
+            f"pylabeador_syllabify_seconds_sum {data['latency_seconds']}",
+            f"pylabeador_syllabify_seconds_count {cumulative}",
+        ]
+        return "\n".join(lines) + "\n"
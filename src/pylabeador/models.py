@@ -17,35 +17,46 @@
 # along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
 # -------------------------------------------------------------------------------------
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
-from .util import is_vowel
+# Results are immutable and slotted, so that they can be shared and kept in large
+# numbers. Derived strings are computed on first access and then remembered in a
+# field that is not part of the comparison nor the representation.
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Syllable:
     onset: str = ""
     nucleus: str = ""
     coda: str = ""
     accented: bool = False
     stressed: bool = False
+    _value: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
-    def value(self):
-        return f"{self.onset}{self.nucleus}{self.coda}"
+    def value(self) -> str:
+        if self._value is None:
+            object.__setattr__(self, "_value", f"{self.onset}{self.nucleus}{self.coda}")
+        return self._value  # type: ignore[return-value]
+
+    def __reduce__(self):
+        return type(self), (self.onset, self.nucleus, self.coda, self.accented, self.stressed)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyllabifiedWord:
     original: str
-    syllables: list[Syllable]
+    syllables: tuple[Syllable, ...]
     stressed: int | None = None
     accented: int | None = None
+    _hyphenated: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
-    def hyphenated(self):
-        return "-".join(s.value for s in self.syllables)
+    def hyphenated(self) -> str:
+        if self._hyphenated is None:
+            object.__setattr__(self, "_hyphenated", "-".join(s.value for s in self.syllables))
+        return self._hyphenated  # type: ignore[return-value]
 
     def hyphenate(self, with_stressed=False):
         def value(s):
@@ -53,6 +64,9 @@ class SyllabifiedWord:
 
         return "-".join(value(s) for s in self.syllables)
 
+    def __reduce__(self):
+        return type(self), (self.original, self.syllables, self.stressed, self.accented)
+
 
 @dataclass
 class WordProgress:
@@ -129,11 +143,16 @@ class WordProgress:
             if len(list(filter(None, (s.stressed for s in self.syllables)))) != 1:
                 raise ValueError("Multiple stressed syllables")
 
-    def add_syllable(self):
-        syllable = Syllable()
+    def add_syllable(self, onset="", nucleus="", coda="", accented=False):
+        syllable = Syllable(onset, nucleus, coda, accented)
         self.syllables.append(syllable)
         return syllable
 
+    def mark_stressed(self, index: int):
+        self.stressed = index
+        self.syllables[index] = replace(self.syllables[index], stressed=True)
+        self.stress_found = True
+
     @property
     def current_syllable(self):
         if self.syllables:
@@ -145,7 +164,7 @@ class WordProgress:
             raise ValueError("Word is not ended")
         if not self.stress_found:
             raise ValueError("Stress is not found")
-        return SyllabifiedWord(self.original_word, self.syllables, self.stressed, self.accent)
+        return SyllabifiedWord(self.original_word, tuple(self.syllables), self.stressed, self.accent)
 
 
 class VowelType(Enum):
@@ -156,14 +175,10 @@ class VowelType(Enum):
 
     @classmethod
     def from_char(cls, c) -> "VowelType":
-        if c.lower() == "y":
-            # 'y' when acting as vowel behaves like 'i' (closed vowel)
-            return cls.CLOSED
-        if is_vowel(c):
-            for val in cls:
-                if c in val.value:
-                    return val
-        raise ValueError(f"{c} is not a vowel")
+        try:
+            return _VOWEL_TYPES[c]
+        except KeyError:
+            raise ValueError(f"{c} is not a vowel") from None
 
     @property
     def has_accent(self):
@@ -176,3 +191,8 @@ class VowelType(Enum):
     @property
     def is_open(self):
         return self in (self.OPEN_WITH_ACCENT, self.OPEN)
+
+
+_VOWEL_TYPES = {c: vowel_type for vowel_type in VowelType for c in vowel_type.value}
+# 'y' when acting as vowel behaves like 'i' (closed vowel)
+_VOWEL_TYPES["y"] = _VOWEL_TYPES["Y"] = VowelType.CLOSED
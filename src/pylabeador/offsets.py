@@ -0,0 +1,220 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Compact results that only keep where the syllables start, and which one is stressed.
+
+These are meant for storing the results of many words, where building a
+SyllabifiedWord with its Syllable objects for each of them is too expensive.
+"""
+
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import struct
+import sys
+
+from .api import lookup_sources, scan_with_lookups
+from .errors import HyphenatorError, InvalidWord
+
+_PACKED_HEADER = struct.Struct("<II")
+_NO_ACCENT = -1
+
+# Longest word whose breaks fit in the 16-bit unsigned integers they are stored as
+MAX_WORD_LENGTH = 0xFFFF
+
+
+@dataclass(frozen=True, slots=True)
+class SyllableBreaks:
+    """
+    Syllable structure of a word, as the positions where its syllables start.
+
+    The first syllable always starts at 0, so that position is not stored.
+    """
+
+    breaks: array
+    stressed: int
+    accent: int | None = None
+
+    @property
+    def num_syllables(self) -> int:
+        return len(self.breaks) + 1
+
+    def split(self, word: str) -> list[str]:
+        """Split the word these breaks were computed for into its syllables"""
+        bounds = [0, *self.breaks, len(word)]
+        return [word[start:end] for start, end in zip(bounds, bounds[1:], strict=False)]
+
+    def hyphenate(self, word: str, separator: str = "-") -> str:
+        """Join the syllables of the word these breaks were computed for"""
+        return separator.join(self.split(word))
+
+
+def too_long_error(word: str) -> HyphenatorError | None:
+    """Return the error for a word too long to store its breaks, or None if it is not"""
+    if len(word) <= MAX_WORD_LENGTH:
+        return None
+    return HyphenatorError(f"Words longer than {MAX_WORD_LENGTH} characters cannot be stored as syllable breaks")
+
+
+def _scan_valid(word: str, sources: tuple) -> tuple[list[int], int, int, int | None]:
+    error = too_long_error(word)
+    if error is not None:
+        raise error
+    scanned = scan_with_lookups(word, sources)
+    if isinstance(scanned, InvalidWord):
+        raise scanned.error()
+    return scanned
+
+
+def _breaks_from_marks(marks: list[int]) -> array:
+    return array("H", marks[3:-1:3])
+
+
+def syllabify_offsets(word: str) -> SyllableBreaks:
+    """
+    Syllabify a word and return only where its syllables start.
+
+    Args:
+        word: The word to syllabify.
+
+    Returns:
+        A SyllableBreaks with the positions of the syllable breaks, the index of the
+        stressed syllable and the position of the graphical accent.
+
+    Raises:
+        HyphenatorError: When the word is not a valid Spanish word, or is longer than
+            ``MAX_WORD_LENGTH`` characters.
+
+    Examples:
+        >>> import pylabeador
+        >>> pylabeador.syllabify_offsets("canción")
+        SyllableBreaks(breaks=array('H', [3]), stressed=1, accent=5)
+    """
+    marks, _, stressed, accent = _scan_valid(word, lookup_sources())
+    return SyllableBreaks(_breaks_from_marks(marks), stressed, accent)
+
+
+class PackedBreaks(Sequence[SyllableBreaks]):
+    """
+    Syllable breaks of many words, stored in a few contiguous arrays.
+
+    Attributes:
+        breaks: The syllable breaks of all the words, one after the other.
+        index: Where the breaks of each word start in ``breaks``, plus a final entry
+            with the total number of breaks.
+        stressed: The stressed syllable of each word.
+        accents: The position of the graphical accent of each word, -1 for none.
+
+    Breaks are positions within their word, stored as 16-bit unsigned integers, so
+    words must be at most ``MAX_WORD_LENGTH`` characters long. Accents are stored as 32-bit signed
+    integers, so that -1 fits along any position.
+    """
+
+    __slots__ = ("breaks", "index", "stressed", "accents")
+
+    def __init__(self):
+        self.breaks = array("H")
+        self.index = array("I", [0])
+        self.stressed = array("H")
+        self.accents = array("i")
+
+    def append(self, breaks: Iterable[int], stressed: int, accent: int | None) -> None:
+        self.breaks.extend(breaks)
+        self.index.append(len(self.breaks))
+        self.stressed.append(stressed)
+        self.accents.append(_NO_ACCENT if accent is None else accent)
+
+    def __len__(self) -> int:
+        return len(self.stressed)
+
+    def __getitem__(self, item):  # type: ignore[override]
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("PackedBreaks index out of range")
+        accent = self.accents[item]
+        return SyllableBreaks(
+            self.breaks[self.index[item] : self.index[item + 1]],
+            self.stressed[item],
+            None if accent == _NO_ACCENT else accent,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PackedBreaks):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def _arrays(self) -> tuple[array, ...]:
+        return self.index, self.breaks, self.stressed, self.accents
+
+    def to_bytes(self) -> bytes:
+        """Serialize the arrays, little-endian, into a single buffer"""
+        parts = [_PACKED_HEADER.pack(len(self), len(self.breaks))]
+        for arr in self._arrays():
+            if sys.byteorder == "big":
+                arr = array(arr.typecode, arr)
+                arr.byteswap()
+            parts.append(arr.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PackedBreaks":
+        """Load the arrays serialized with ``to_bytes``"""
+        count, num_breaks = _PACKED_HEADER.unpack_from(data)
+        packed = cls()
+        offset = _PACKED_HEADER.size
+        for arr, length in zip(packed._arrays(), (count + 1, num_breaks, count, count), strict=True):
+            del arr[:]
+            size = arr.itemsize * length
+            arr.frombytes(data[offset : offset + size])
+            if sys.byteorder == "big":
+                arr.byteswap()
+            offset += size
+        if offset != len(data):
+            raise ValueError("The data does not contain packed syllable breaks")
+        return packed
+
+
+def pack_offsets(words: Iterable[str]) -> PackedBreaks:
+    """
+    Syllabify many words, storing only their syllable breaks in contiguous arrays.
+
+    Args:
+        words: The words to syllabify.
+
+    Raises:
+        HyphenatorError: When a word is not a valid Spanish word, or is longer than
+            ``MAX_WORD_LENGTH`` characters.
+
+    Examples:
+        >>> import pylabeador
+        >>> packed = pylabeador.pack_offsets(["casa", "canción"])
+        >>> packed.breaks, packed.index
+        (array('H', [2, 3]), array('I', [0, 1, 2]))
+        >>> packed[1].hyphenate("canción")
+        'can-ción'
+    """
+    packed = PackedBreaks()
+    sources = lookup_sources()
+    for word in words:
+        marks, _, stressed, accent = _scan_valid(word, sources)
+        packed.append(marks[3:-1:3], stressed, accent)
+    return packed
@@ -0,0 +1,164 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Syllabification of large word lists in a pool of worker processes.
+
+The input is split into chunks that are sent to the workers. Each worker returns the
+syllable breaks of its chunk packed in a single buffer, see ``PackedBreaks``, so very
+little has to be pickled on the way back. Results are yielded in the input order.
+
+Workers look words up in the same lexicon, prefix index, word table and cache file as
+the batch functions, see ``api.get_lookups``. They are sent to each worker when
+the pool starts: mapped files are mapped again by the workers, and the rest is
+copied.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+
+from .api import get_lookups, lookup_sources, scan_with_lookups, set_lookups
+from .errors import HyphenatorError, InvalidWord
+from .formats import decode_records, encode_scan
+from .models import SyllabifiedWord
+from .offsets import PackedBreaks, SyllableBreaks, too_long_error
+
+DEFAULT_CHUNK_SIZE = 2048
+
+# Number of chunks per worker that are sent ahead of the ones being written out
+CHUNKS_AHEAD = 4
+
+
+def _syllabify_chunk(words: list[str]) -> tuple[bytes, list[tuple[int, HyphenatorError]]]:
+    """Syllabify a chunk of words, in a worker process"""
+    packed = PackedBreaks()
+    errors = []
+    sources = lookup_sources()
+    for i, word in enumerate(words):
+        error = too_long_error(word)
+        if error is not None:
+            errors.append((i, error))
+            continue
+        scanned = scan_with_lookups(word, sources)
+        if isinstance(scanned, InvalidWord):
+            errors.append((i, scanned.error()))
+            continue
+        marks, _, stressed, accent = scanned
+        packed.append(marks[3:-1:3], stressed, accent)
+    return packed.to_bytes(), errors
+
+
+def _chunk_results(words: list[str], data: bytes, errors: list[tuple[int, HyphenatorError]]):
+    """Pair the words of a chunk with their results, in the parent process"""
+    packed = PackedBreaks.from_bytes(data)
+    breaks, index, stressed, accents = packed.breaks, packed.index, packed.stressed, packed.accents
+    failed = dict(errors)
+    valid = 0
+    for i, word in enumerate(words):
+        if failed and i in failed:
+            yield word, failed[i]
+            continue
+        accent = accents[valid]
+        yield (
+            word,
+            SyllableBreaks(breaks[index[valid] : index[valid + 1]], stressed[valid], None if accent < 0 else accent),
+        )
+        valid += 1
+
+
+def _syllabify_chunk_details(words: list[str]) -> tuple[bytes, list[tuple[int, HyphenatorError]]]:
+    """Syllabify a chunk of words into binary records with all the details, in a worker process"""
+    records = []
+    errors = []
+    sources = lookup_sources()
+    for i, word in enumerate(words):
+        scanned = scan_with_lookups(word, sources)
+        if isinstance(scanned, InvalidWord):
+            errors.append((i, scanned.error()))
+            continue
+        try:
+            records.append(encode_scan(word, *scanned))
+        except HyphenatorError as e:
+            errors.append((i, e))
+    return b"".join(records), errors
+
+
+def _chunk_details(words: list[str], data: bytes, errors: list[tuple[int, HyphenatorError]]):
+    """Pair the words of a chunk with their detailed results, in the parent process"""
+    failed = dict(errors)
+    results = decode_records(data)
+    for i, word in enumerate(words):
+        yield word, failed[i] if failed and i in failed else next(results)
+
+
+def _run_in_pool(words: Iterable[str], jobs: int | None, chunk_size: int, work, collect) -> Iterator:
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs < 1:
+        raise ValueError("The number of jobs must be at least 1")
+    words = iter(words)
+    ahead = CHUNKS_AHEAD * jobs
+    with ProcessPoolExecutor(max_workers=jobs, initializer=set_lookups, initargs=(get_lookups(),)) as executor:
+        pending: deque = deque()
+        while True:
+            while len(pending) < ahead and (chunk := list(islice(words, chunk_size))):
+                pending.append((chunk, executor.submit(work, chunk)))
+            if not pending:
+                break
+            chunk, future = pending.popleft()
+            yield from collect(chunk, *future.result())
+
+
+def syllabify_offsets_parallel(
+    words: Iterable[str], jobs: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, SyllableBreaks | HyphenatorError]]:
+    """
+    Syllabify many words in parallel, in a pool of worker processes.
+
+    Workers always use the compiled engine, which gives the same results as the rules
+    engine, after looking the word up as the batch functions do. The input is consumed
+    lazily, and only a few chunks per worker are in flight at any time, so the memory
+    used does not depend on the number of words.
+
+    Args:
+        words: The words to syllabify.
+        jobs: Number of worker processes, the number of CPUs by default.
+        chunk_size: Number of words sent to a worker at a time.
+
+    Yields:
+        Tuples with each word and its syllable breaks, or the HyphenatorError raised
+        for it if it is not a valid Spanish word or is longer than
+        ``offsets.MAX_WORD_LENGTH`` characters, in the same order as the input.
+    """
+    return _run_in_pool(words, jobs, chunk_size, _syllabify_chunk, _chunk_results)
+
+
+def syllabify_with_details_parallel(
+    words: Iterable[str], jobs: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, SyllabifiedWord | HyphenatorError]]:
+    """
+    Same as ``syllabify_offsets_parallel``, but yield whole SyllabifiedWord results.
+
+    Workers send their results back as records of the binary format in ``formats``,
+    so words longer than ``formats.BIN_MAX_LENGTH`` bytes in UTF-8 are answered with
+    a HyphenatorError.
+    """
+    return _run_in_pool(words, jobs, chunk_size, _syllabify_chunk_details, _chunk_details)
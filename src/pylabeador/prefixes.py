@@ -0,0 +1,214 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Syllabification that keeps prefixes whole when the rest of the word is a word.
+
+Prefixed words are split by the rules as if the prefix were not there, so
+*transatlántico* becomes *tran-sa-tlán-ti-co* instead of *trans-a-tlán-ti-co*. A
+PrefixIndex knows a set of prefixes, compiled into a trie, and a set of stems, the
+words that can follow them. Walking the trie along the word finds, in one left to
+right probe, every prefix the word starts with, and the longest one followed by a
+known stem marks a morphological boundary. The prefix and the stem are then
+syllabified apart and their syllables joined.
+
+Only prefixes that end in a consonant are useful, since a prefix that ends in a
+vowel is split from the stem by the rules anyway. Whether a word is prefixed can
+only be guessed from the stems, which is why this mode is opt-in: *exacto* would be
+split as *ex-ac-to* if *acto* is a stem.
+"""
+
+from collections.abc import Callable, Container, Iterable
+import os
+
+from .cachefile import MAGIC, CacheFile
+from .compiled import classify, scan_checked, stress_by_rules
+from .errors import HyphenatorError, InvalidWord
+from .models import SyllabifiedWord, Syllable
+from .util import find_invalid_chars
+
+DEFAULT_PREFIXES = (
+    "circun",
+    "des",
+    "dis",
+    "en",
+    "ex",
+    "hiper",
+    "in",
+    "inter",
+    "mal",
+    "pos",
+    "post",
+    "sub",
+    "super",
+    "trans",
+    "tras",
+)
+
+# Shortest stem that is split from a prefix, so that short words such as "ano" do
+# not turn "enano" into "en-a-no"
+DEFAULT_MIN_STEM = 4
+
+
+def load_stems(path: str | os.PathLike) -> Container[str]:
+    """
+    Open a stem index, either a cache file or a word list with one word per line.
+
+    Cache files are mapped in memory. The first word of each line of a word list is
+    taken, skipping blank lines, comments and words that are not valid Spanish words.
+    """
+    with open(path, "rb") as fin:
+        cache_file = fin.read(len(MAGIC)) == MAGIC
+    if cache_file:
+        return CacheFile(path)
+    stems = set()
+    with open(path, encoding="utf-8") as fin:
+        for line in fin:
+            parts = line.split(maxsplit=1)
+            if parts and not parts[0].startswith("#") and find_invalid_chars(parts[0]) is None:
+                stems.add(parts[0].lower())
+    return frozenset(stems)
+
+
+class PrefixIndex:
+    """
+    Prefixes compiled into a trie, and the stems that can follow them.
+
+    Args:
+        stems: The words that are split from a prefix, lowercase. Any container
+            works, such as a set or a CacheFile.
+        prefixes: The prefixes, lowercase.
+        min_stem: Shortest stem, in letters, that is split from a prefix.
+    """
+
+    def __init__(
+        self, stems: Container[str], prefixes: Iterable[str] = DEFAULT_PREFIXES, min_stem: int = DEFAULT_MIN_STEM
+    ):
+        self.stems = stems
+        self.min_stem = min_stem
+        # The trie is a list of states, each one a dict from letters to states. The
+        # root is state 0. States in which a prefix ends are kept apart.
+        transitions: list[dict[str, int]] = [{}]
+        ends = set()
+        for prefix in prefixes:
+            state = 0
+            for c in prefix.lower():
+                following = transitions[state].get(c)
+                if following is None:
+                    following = transitions[state][c] = len(transitions)
+                    transitions.append({})
+                state = following
+            ends.add(state)
+        self._transitions = tuple(transitions)
+        self._ends = frozenset(ends)
+
+    def find_boundary(self, word: str) -> int:
+        """
+        Find where the stem of a prefixed word starts.
+
+        Returns:
+            The length of the longest prefix followed by a known stem, or 0 if the
+            word is not prefixed.
+
+        Examples:
+            >>> PrefixIndex({"atlántico"}).find_boundary("Transatlántico")
+            5
+        """
+        w = word.lower()
+        limit = len(w) - self.min_stem
+        transitions, ends, stems = self._transitions, self._ends, self.stems
+        state = 0
+        boundary = 0
+        for i, c in enumerate(w):
+            if i >= limit:
+                break
+            state = transitions[state].get(c)  # type: ignore[assignment]
+            if state is None:
+                break
+            if state in ends and w[i + 1 :] in stems:
+                boundary = i + 1
+        return boundary
+
+    def parse(self, word: str, parse: Callable[[str], SyllabifiedWord]) -> SyllabifiedWord | None:
+        """
+        Syllabify a prefixed word, parsing the prefix and the stem apart.
+
+        Args:
+            word: The word to syllabify.
+            parse: The engine that syllabifies each part.
+
+        Returns:
+            The syllabified word, or None if it is not prefixed and has to be
+            syllabified as a whole.
+        """
+        boundary = self.find_boundary(word)
+        if not boundary:
+            return None
+        try:
+            head = parse(word[:boundary])
+            tail = parse(word[boundary:])
+        except HyphenatorError:
+            # Let the whole word be reported instead of one of its parts
+            return None
+        return join_parts(word, head, tail)
+
+    def scan(self, word: str) -> tuple[list[int], int, int, int | None] | None:
+        """
+        Same as ``parse``, with the compiled engine and without building the result.
+
+        Returns:
+            The same tuple as ``compiled.scan`` for the whole word, or None if it is
+            not prefixed.
+        """
+        boundary = self.find_boundary(word)
+        if not boundary:
+            return None
+        head = scan_checked(word[:boundary])
+        tail = scan_checked(word[boundary:])
+        if isinstance(head, InvalidWord) or isinstance(tail, InvalidWord):
+            return None
+        head_marks, head_mask, _, _ = head
+        tail_marks, tail_mask, tail_stressed, tail_accent = tail
+        head_syl = len(head_marks) // 3
+        marks = head_marks[:-1] + [mark + boundary for mark in tail_marks]
+        if tail_accent is not None:
+            return marks, head_mask | tail_mask << head_syl, head_syl + tail_stressed, boundary + tail_accent
+        w = word.lower()
+        return marks, head_mask | tail_mask << head_syl, stress_by_rules(w, classify(w), len(marks) // 3), None
+
+
+def join_parts(word: str, head: SyllabifiedWord, tail: SyllabifiedWord) -> SyllabifiedWord:
+    """
+    Join the syllables of a prefix and a stem into the result for the whole word.
+
+    Prefixes are never stressed, so the word is stressed where the accent of the
+    stem is, or where the rules say for the whole word if there is none.
+    """
+    num_syl = len(head.syllables) + len(tail.syllables)
+    if tail.accented is not None:
+        accent = len(head.original) + tail.accented
+        stressed = len(head.syllables) + tail.stressed  # type: ignore[operator]
+    else:
+        accent = None
+        w = word.lower()
+        stressed = stress_by_rules(w, classify(w), num_syl)
+    syllables = tuple(
+        Syllable(s.onset, s.nucleus, s.coda, s.accented, index == stressed)
+        for index, s in enumerate(head.syllables + tail.syllables)
+    )
+    return SyllabifiedWord(word, syllables, stressed, accent)
@@ -0,0 +1,239 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Opt-in profiling of the stages of the rules engine.
+
+When profiling is enabled, the stage functions of ``engine`` (onset, nucleus, coda
+and the search for the stressed syllable) and ``engine.parse_word`` itself are
+replaced by timed versions that count calls and the time spent in each of them. The
+paths taken through the nucleus and the coda are counted too, worked out from the
+section that each stage returns and the letters around it:
+
+    nucleus.monophthong, nucleus.diphthong, nucleus.triphthong
+                            Number of vowels in the nucleus.
+    nucleus.y_vowel         The nucleus has a y acting as a vowel.
+    nucleus.y_consonant     A y acting as a consonant was passed over.
+    nucleus.h_inside        The nucleus has an h between vowels, as in prohi-bir.
+    nucleus.h_split         The next syllable starts with an h and a vowel, as in a-ho-ra.
+    nucleus.hiatus          The next syllable starts with a vowel, as in le-er.
+    coda.empty              No coda before the next syllable.
+    coda.final              The coda reaches the end of the word.
+    coda.before_digraph     The next syllable starts with ll, ch or rr.
+    coda.before_cluster     The next syllable starts with an inseparable pair, as in tr or bl.
+    coda.before_consonant   Any other coda.
+
+When profiling is disabled the original functions are put back, so the engine runs
+exactly the same code as if this module did not exist. Only the rules engine is
+profiled, the compiled engine has no stages.
+
+Profiling is meant for looking into a corpus, not for production: the counters are
+not protected against concurrent updates from several threads.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+import contextlib
+from dataclasses import dataclass, field
+import json
+import os
+from time import perf_counter_ns
+
+from . import engine
+from .charclass import VOWEL_CLASSES, Y_CONSONANT, Y_VOWEL, H
+from .compiled import ONSET_CLUSTERS, classify
+from .models import WordProgress
+
+STAGES = ("onset", "nucleus", "coda", "find_stressed_syllable")
+_VOWEL_COUNTS = {1: "nucleus.monophthong", 2: "nucleus.diphthong", 3: "nucleus.triphthong"}
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Number of calls to a stage and the time spent in it, in nanoseconds"""
+
+    calls: int = 0
+    total_ns: int = 0
+
+
+@dataclass(slots=True)
+class EngineProfile:
+    """Statistics collected while profiling the rules engine"""
+
+    words: StageStats = field(default_factory=StageStats)
+    stages: dict[str, StageStats] = field(default_factory=lambda: {name: StageStats() for name in STAGES})
+    branches: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> dict:
+        """Return the profile as plain data, ready to be serialized as JSON"""
+        return {
+            "words": {"calls": self.words.calls, "total_ns": self.words.total_ns},
+            "stages": {name: {"calls": s.calls, "total_ns": s.total_ns} for name, s in self.stages.items()},
+            "branches": dict(sorted(self.branches.items())),
+        }
+
+    def report(self) -> str:
+        """
+        Format the profile as a text table.
+
+        The share of each stage is relative to the time spent in parse_word, which
+        also includes the bookkeeping between stages.
+        """
+        total = self.words.total_ns or 1
+        lines = [f"{'stage':<24} {'calls':>10} {'total ms':>10} {'avg µs':>8} {'share':>6}"]
+        for name, stats in (("parse_word", self.words), *self.stages.items()):
+            avg = stats.total_ns / stats.calls / 1000 if stats.calls else 0
+            lines.append(
+                f"{name:<24} {stats.calls:>10} {stats.total_ns / 1e6:>10.2f} {avg:>8.2f} {stats.total_ns / total:>6.1%}"
+            )
+        lines.append("")
+        lines.append(f"{'branch':<24} {'count':>10}")
+        lines.extend(f"{name:<24} {count:>10}" for name, count in sorted(self.branches.items()))
+        return "\n".join(lines)
+
+    def write_json(self, path: str | os.PathLike) -> None:
+        with open(path, "w", encoding="utf-8") as fout:
+            json.dump(self.to_dict(), fout, indent=2)
+            fout.write("\n")
+
+
+def _nucleus_branches(word: WordProgress, section: str, branches: Counter) -> None:
+    end = word.pos
+    classes = classify(word.word)
+    nucleus = classes[end - len(section) : end]
+    vowels = sum(cls in VOWEL_CLASSES for cls in nucleus)
+    if vowels in _VOWEL_COUNTS:
+        branches[_VOWEL_COUNTS[vowels]] += 1
+    if Y_VOWEL in nucleus:
+        branches["nucleus.y_vowel"] += 1
+    if Y_CONSONANT in nucleus:
+        branches["nucleus.y_consonant"] += 1
+    if H in nucleus:
+        branches["nucleus.h_inside"] += 1
+    following = classes[end : end + 1]
+    if following == H and classes[end + 1 : end + 2] in VOWEL_CLASSES:
+        branches["nucleus.h_split"] += 1
+    elif following in VOWEL_CLASSES:
+        branches["nucleus.hiatus"] += 1
+
+
+def _coda_branches(word: WordProgress, section: str, branches: Counter) -> None:
+    if word.ended:
+        branches["coda.final" if section else "coda.empty"] += 1
+    elif not section:
+        branches["coda.empty"] += 1
+    else:
+        onset = word.word[word.pos : word.pos + 2]
+        if onset in ("ll", "ch", "rr"):
+            branches["coda.before_digraph"] += 1
+        elif onset in ONSET_CLUSTERS:
+            branches["coda.before_cluster"] += 1
+        else:
+            branches["coda.before_consonant"] += 1
+
+
+_BRANCHES: dict[str, Callable[[WordProgress, str, Counter], None]] = {
+    "nucleus": _nucleus_branches,
+    "coda": _coda_branches,
+}
+
+
+def _timed(function: Callable, stats: StageStats, branches: Counter | None = None, count=None) -> Callable:
+    """Wrap a stage so that it updates its statistics"""
+
+    def timed(word):
+        start = perf_counter_ns()
+        res = function(word)
+        stats.total_ns += perf_counter_ns() - start
+        stats.calls += 1
+        if count is not None:
+            count(word, res, branches)
+        return res
+
+    timed.__wrapped__ = function  # type: ignore[attr-defined]
+    return timed
+
+
+_originals: dict[str, Callable] | None = None
+_profile: EngineProfile | None = None
+
+
+def enable_profiling() -> EngineProfile:
+    """
+    Start profiling the rules engine, with a new, empty profile.
+
+    Returns:
+        The profile, which is updated as words are syllabified.
+
+    Examples:
+        >>> import pylabeador
+        >>> profile = enable_profiling()
+        >>> pylabeador.hyphenate("ahora")
+        'a-ho-ra'
+        >>> disable_profiling().stages["nucleus"].calls
+        3
+    """
+    global _originals, _profile
+    if _originals is None:
+        _originals = {name: getattr(engine, name) for name in ("parse_word", *STAGES)}
+    _profile = profile = EngineProfile()
+    for name in STAGES:
+        setattr(engine, name, _timed(_originals[name], profile.stages[name], profile.branches, _BRANCHES.get(name)))
+    engine.parse_word = _timed(_originals["parse_word"], profile.words)
+    return profile
+
+
+def disable_profiling() -> EngineProfile | None:
+    """
+    Stop profiling, putting the original functions of the engine back.
+
+    Returns:
+        The profile collected since profiling was enabled, if it was.
+    """
+    global _originals, _profile
+    if _originals is not None:
+        for name, function in _originals.items():
+            setattr(engine, name, function)
+    profile = _profile
+    _originals = _profile = None
+    return profile
+
+
+def get_profile() -> EngineProfile | None:
+    """Return the profile being collected, if profiling is enabled"""
+    return _profile
+
+
+@contextlib.contextmanager
+def profiling() -> Iterator[EngineProfile]:
+    """
+    Profile the rules engine within a block.
+
+    Examples:
+        >>> import pylabeador
+        >>> with profiling() as profile:
+        ...     pylabeador.hyphenate("construir")
+        'cons-truir'
+        >>> profile.branches["coda.before_cluster"]
+        1
+    """
+    profile = enable_profiling()
+    try:
+        yield profile
+    finally:
+        disable_profiling()
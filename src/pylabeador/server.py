@@ -0,0 +1,337 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+HTTP service with JSON endpoints, built on the standard library.
+
+The server runs in a single process, so the engine, the result cache, the lexicon
+and the prefix index are loaded once and stay warm across requests. Each connection
+is served in its own thread and kept alive between requests (HTTP/1.1).
+
+Endpoints:
+
+    GET  /syllabify?word=W   Whole result of a word, as in the jsonl format.
+    POST /syllabify          Same, for a JSON body such as {"word": "casa"}.
+    POST /batch              Results of {"words": [...]}, in order, with an error
+                             object in place of each invalid word. With
+                             "details": false, the hyphenated words only.
+    POST /text               Hyphenation of {"text": "...", "separator": "-"}.
+    GET  /health             Status, version and engine in use.
+    GET  /metrics            Request counts and latencies, and the library metrics
+                             if enabled, in the Prometheus text format.
+
+Invalid words get a 422 response from /syllabify. Every response carries its
+processing time in a Server-Timing header, and the access log shows it too.
+
+Examples:
+    >>> import json, threading, urllib.request
+    >>> server = make_server("127.0.0.1", 0, quiet=True)
+    >>> threading.Thread(target=server.serve_forever, daemon=True).start()
+    >>> url = f"http://127.0.0.1:{server.server_port}/syllabify?word=casa"
+    >>> json.load(urllib.request.urlopen(url))["hyphenated"]
+    'ca-sa'
+    >>> server.shutdown()
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import sys
+import threading
+from time import perf_counter
+import traceback
+from urllib.parse import parse_qs, urlsplit
+
+from .__version__ import __version__
+from .api import get_engine, render_metrics, syllabify_with_details, syllabify_with_details_many
+from .errors import HyphenatorError, InvalidWord
+from .formats import result_to_dict
+from .text import hyphenate_text
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+# Upper bounds of the request latency histogram buckets, in seconds. The last
+# bucket, +Inf, is implicit.
+REQUEST_BUCKETS = (1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1, 1.0)
+
+JSON_TYPE = "application/json"
+METRICS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestError(Exception):
+    """A request that cannot be served, with the status to answer it with"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class RequestStats:
+    """Number of requests by endpoint and status, and a histogram of their latencies"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.buckets = [0] * (len(REQUEST_BUCKETS) + 1)
+        self.seconds = 0.0
+
+    def observe(self, path: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self.requests[path, status] += 1
+            self.buckets[bisect_left(REQUEST_BUCKETS, seconds)] += 1
+            self.seconds += seconds
+
+    def render_prometheus(self) -> str:
+        """Render the statistics in the Prometheus text exposition format"""
+        with self._lock:
+            requests = sorted(self.requests.items())
+            buckets = list(self.buckets)
+            seconds = self.seconds
+        lines = [
+            "# HELP pylabeador_http_requests_total HTTP requests served, by endpoint and status.",
+            "# TYPE pylabeador_http_requests_total counter",
+        ]
+        lines += [
+            f'pylabeador_http_requests_total{{path="{path}",status="{status}"}} {count}'
+            for (path, status), count in requests
+        ]
+        lines += [
+            "# HELP pylabeador_http_request_seconds Time taken to answer HTTP requests.",
+            "# TYPE pylabeador_http_request_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip((*REQUEST_BUCKETS, "+Inf"), buckets, strict=True):
+            cumulative += count
+            lines.append(f'pylabeador_http_request_seconds_bucket{{le="{bound}"}} {cumulative}')
+        lines += [
+            f"pylabeador_http_request_seconds_sum {seconds}",
+            f"pylabeador_http_request_seconds_count {cumulative}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _error_dict(res: InvalidWord) -> dict:
+    return {"original": res.original, "error": res.message, "kind": res.kind.name.lower()}
+
+
+def _parse_json(body: bytes) -> dict:
+    try:
+        data = json.loads(body)
+    except ValueError as e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"The body is not valid JSON: {e}") from None
+    if not isinstance(data, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object")
+    return data
+
+
+def _get_field(data: dict, name: str, kind: type, default=None):
+    value = data.get(name, default)
+    if not isinstance(value, kind):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"'{name}' must be a {kind.__name__}")
+    return value
+
+
+def _syllabify_endpoint(query: dict, body: bytes | None) -> tuple[HTTPStatus, dict]:
+    if body is None:
+        words = query.get("word")
+        if not words:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Missing the 'word' parameter")
+        word = words[0]
+    else:
+        word = _get_field(_parse_json(body), "word", str)
+    try:
+        return HTTPStatus.OK, result_to_dict(syllabify_with_details(word))
+    except HyphenatorError:
+        # Only invalid words take this path, to find out why they are invalid
+        return HTTPStatus.UNPROCESSABLE_ENTITY, _error_dict(next(syllabify_with_details_many([word], errors="return")))
+
+
+def _batch_endpoint(query: dict, body: bytes | None) -> tuple[HTTPStatus, dict]:
+    data = _parse_json(body or b"")
+    words = _get_field(data, "words", list)
+    if not all(isinstance(word, str) for word in words):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "'words' must be a list of strings")
+    details = _get_field(data, "details", bool, True)
+    encode = result_to_dict if details else lambda res: res.hyphenated
+    return HTTPStatus.OK, {
+        "results": [
+            _error_dict(res) if isinstance(res, InvalidWord) else encode(res)
+            for res in syllabify_with_details_many(words, errors="return")
+        ]
+    }
+
+
+def _text_endpoint(query: dict, body: bytes | None) -> tuple[HTTPStatus, dict]:
+    data = _parse_json(body or b"")
+    text = _get_field(data, "text", str)
+    separator = _get_field(data, "separator", str, "-")
+    return HTTPStatus.OK, {"text": "".join(hyphenate_text(text, separator))}
+
+
+def _health_endpoint(query: dict, body: bytes | None) -> tuple[HTTPStatus, dict]:
+    return HTTPStatus.OK, {"status": "ok", "version": __version__, "engine": get_engine()}
+
+
+# Endpoints by path, with the methods they accept
+ENDPOINTS = {
+    "/syllabify": (_syllabify_endpoint, ("GET", "POST")),
+    "/batch": (_batch_endpoint, ("POST",)),
+    "/text": (_text_endpoint, ("POST",)),
+    "/health": (_health_endpoint, ("GET",)),
+    "/metrics": (None, ("GET",)),
+}
+
+
+class SyllabifyHandler(BaseHTTPRequestHandler):
+    """Answer the requests to the endpoints of the service"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"pylabeador/{__version__}"
+    server: "SyllabifyServer"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _read_body(self) -> bytes | None:
+        if self.command == "GET":
+            return None
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            raise RequestError(HTTPStatus.LENGTH_REQUIRED, "Chunked bodies are not supported, send a Content-Length")
+        try:
+            length = int(self.headers["Content-Length"])
+        except (TypeError, ValueError):
+            raise RequestError(HTTPStatus.LENGTH_REQUIRED, "Missing or invalid Content-Length") from None
+        if length < 0:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"The body is larger than {MAX_BODY_SIZE} bytes")
+        self._body_read = True
+        return self.rfile.read(length)
+
+    def _skip_body(self) -> None:
+        """
+        Skip the body of a request answered without reading it, so that it is not taken as the next request.
+
+        When its length is not known, or it is too large, the connection is closed instead.
+        """
+        if self._body_read:
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if "Transfer-Encoding" in self.headers or not 0 <= length <= MAX_BODY_SIZE:
+            self.close_connection = True
+        elif length:
+            self.rfile.read(length)
+
+    def _respond(self, path: str) -> tuple[HTTPStatus, str, bytes]:
+        endpoint, methods = ENDPOINTS.get(path, (None, None))
+        if methods is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"No endpoint at {path}")
+        if self.command not in methods:
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"{path} accepts {', '.join(methods)}")
+        body = self._read_body()
+        if endpoint is None:
+            text = self.server.stats.render_prometheus() + render_metrics()
+            return HTTPStatus.OK, METRICS_TYPE, text.encode()
+        status, data = endpoint(parse_qs(urlsplit(self.path).query), body)
+        return status, JSON_TYPE, json.dumps(data, ensure_ascii=False).encode()
+
+    def _handle(self):
+        start = perf_counter()
+        path = urlsplit(self.path).path
+        self._body_read = False
+        try:
+            status, content_type, payload = self._respond(path)
+        except RequestError as e:
+            status, content_type = e.status, JSON_TYPE
+            payload = json.dumps({"error": str(e)}, ensure_ascii=False).encode()
+            self._skip_body()
+        except Exception:
+            self.log_error("Error answering %s\n%s", self.requestline, traceback.format_exc())
+            status, content_type = HTTPStatus.INTERNAL_SERVER_ERROR, JSON_TYPE
+            payload = json.dumps({"error": "Internal server error"}).encode()
+            # The body may not have been read, so the connection cannot be reused
+            self.close_connection = True
+        elapsed = perf_counter() - start
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Server-Timing", f"app;dur={elapsed * 1000:.3f}")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        if status == HTTPStatus.METHOD_NOT_ALLOWED:
+            self.send_header("Allow", ", ".join(ENDPOINTS[path][1]))
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.stats.observe(path if path in ENDPOINTS else "other", status, elapsed)
+        self.log_message('"%s" %d %d %.3fms', self.requestline, status, len(payload), elapsed * 1000)
+
+    def log_request(self, code="-", size="-"):
+        # Requests are logged once answered, with their latency
+        pass
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class SyllabifyServer(ThreadingHTTPServer):
+    """HTTP server of the service, with a thread per connection"""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], quiet: bool = False):
+        super().__init__(address, SyllabifyHandler)
+        self.quiet = quiet
+        self.stats = RequestStats()
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, quiet: bool = False) -> SyllabifyServer:
+    """
+    Create a server of the service, bound to an address but not yet serving.
+
+    The server uses the engine, cache, lexicon and prefix index set up in ``api``
+    when requests arrive. Call ``serve_forever`` to start serving, and ``shutdown``
+    from another thread to stop.
+
+    Args:
+        host: The address to listen on.
+        port: The port to listen on, 0 for any free one, then in ``server_port``.
+        quiet: Do not write the access log on stderr.
+    """
+    return SyllabifyServer((host, port), quiet)
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, quiet: bool = False) -> None:
+    """Serve requests until interrupted"""
+    with make_server(host, port, quiet) as server:
+        print(f"Serving on http://{host}:{server.server_port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,274 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Insertion of soft hyphens (U+00AD) at syllable breaks, for HTML and EPUB pipelines.
+
+Soft hyphens are invisible unless the renderer breaks the line at them. Breaks that
+would leave too short a fragment at either side of the hyphen are skipped.
+
+HTML is transformed as a stream: markup, comments and entities are copied as they
+are, the content of elements such as ``<pre>`` and ``<code>`` is left alone, and
+only the words in the remaining text get soft hyphens.
+"""
+
+from collections.abc import Iterator
+import re
+
+from . import compiled
+from .api import lookup_sources, scan_with_lookups
+from .errors import InvalidWord
+from .models import SyllabifiedWord
+from .text import DEFAULT_CHUNK_SIZE, TEXT_MEMO_SIZE, TextSource, read_chunks, tokenize
+
+SOFT_HYPHEN = "\u00ad"
+DEFAULT_MIN_LEFT = 2
+DEFAULT_MIN_RIGHT = 2
+
+# Elements whose content is never hyphenated
+SKIP_ELEMENTS = frozenset(("pre", "code", "kbd", "samp", "script", "style", "textarea"))
+
+# Start of markup: a tag, closing tag, comment, doctype, CDATA or processing instruction
+_MARKUP_START = re.compile(r"<[A-Za-z/!?]")
+_TAG_NAME = re.compile(r"</?([A-Za-z][\w:.-]*)")
+# A run of letters, possibly with entities in it, such as Espa&ntilde;a
+_WORDISH = re.compile(r"(?:[^\W\d_]|&#?\w+;)+")
+
+
+def soft_hyphenate_word(
+    res: SyllabifiedWord,
+    min_left: int = DEFAULT_MIN_LEFT,
+    min_right: int = DEFAULT_MIN_RIGHT,
+    hyphen: str = SOFT_HYPHEN,
+) -> str:
+    """
+    Join the syllables of a word with soft hyphens.
+
+    Args:
+        res: The syllabified word.
+        min_left: Minimum number of letters before a hyphen.
+        min_right: Minimum number of letters after a hyphen.
+        hyphen: The string to insert at each break.
+
+    Examples:
+        >>> import pylabeador
+        >>> soft_hyphenate_word(pylabeador.syllabify_with_details("ahora"), hyphen="|")
+        'aho|ra'
+    """
+    length = len(res.original)
+    pieces = []
+    pos = 0
+    for syllable in res.syllables:
+        if pieces and pos >= min_left and length - pos >= min_right:
+            pieces.append(hyphen)
+        value = syllable.value
+        pieces.append(value)
+        pos += len(value)
+    return "".join(pieces)
+
+
+class _WordHyphenator:
+    """Soft-hyphenate words, remembering the most frequent ones"""
+
+    def __init__(self, min_left: int, min_right: int, hyphen: str):
+        self.min_left = min_left
+        self.min_right = min_right
+        self.hyphen = hyphen
+        self.memo: dict[str, str] = {}
+        self.sources = lookup_sources()
+
+    def __call__(self, word: str) -> str:
+        try:
+            return self.memo[word]
+        except KeyError:
+            pass
+        scanned = scan_with_lookups(word, self.sources)
+        if isinstance(scanned, InvalidWord):
+            res = word
+        else:
+            res = soft_hyphenate_word(compiled.build_result(word, *scanned), self.min_left, self.min_right, self.hyphen)
+        if len(self.memo) >= TEXT_MEMO_SIZE:
+            self.memo.clear()
+        self.memo[word] = res
+        return res
+
+
+def soft_hyphenate_text(
+    text: TextSource,
+    min_left: int = DEFAULT_MIN_LEFT,
+    min_right: int = DEFAULT_MIN_RIGHT,
+    hyphen: str = SOFT_HYPHEN,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Insert soft hyphens in the words of a plain text.
+
+    Args:
+        text: A string, a file-like object or an iterable of strings.
+        min_left: Minimum number of letters before a hyphen.
+        min_right: Minimum number of letters after a hyphen.
+        hyphen: The string to insert at each break.
+        chunk_size: Number of characters read at a time from file-like objects.
+
+    Yields:
+        Pieces of the transformed text.
+    """
+    hyphenate = _WordHyphenator(min_left, min_right, hyphen)
+    for span, is_word in tokenize(text, chunk_size):
+        yield hyphenate(span) if is_word else span
+
+
+def _hyphenate_html_text(text: str, hyphenate: _WordHyphenator) -> str:
+    """Hyphenate the words of a piece of HTML text, leaving entities alone"""
+    pieces = []
+    pos = 0
+    for match in _WORDISH.finditer(text):
+        start, end = match.span()
+        pieces.append(text[pos:start])
+        word = match.group()
+        # Words with entities in them are left as they are
+        pieces.append(word if "&" in word else hyphenate(word))
+        pos = end
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def _trailing_wordish(buf: str, pos: int) -> int:
+    """Return where the word or entity that may continue in the next chunk starts"""
+    start = len(buf)
+    while start > pos and (buf[start - 1].isalnum() or buf[start - 1] in "_&#;"):
+        start -= 1
+    return start
+
+
+def _closing_tag_start(buf: str, pos: int, element: str) -> int:
+    """Return where the closing tag of element may start at the end of buf, or its length if it cannot"""
+    start = buf.rfind("<", pos)
+    if start < 0:
+        return len(buf)
+    tail = buf[start:].lower()
+    closing = f"</{element}"
+    if closing.startswith(tail) or (tail.startswith(closing) and tail[len(closing) :].isspace()):
+        return start
+    return len(buf)
+
+
+def _markup_end(buf: str, start: int) -> int:
+    """Return the end of the markup that starts at start, or -1 if it is incomplete"""
+    if buf.startswith("<!--", start):
+        end = buf.find("-->", start + 4)
+        return -1 if end < 0 else end + 3
+    if buf.startswith("<![CDATA[", start):
+        end = buf.find("]]>", start + 9)
+        return -1 if end < 0 else end + 3
+    pos = start + 1
+    while True:
+        end = buf.find(">", pos)
+        if end < 0:
+            return -1
+        equals = buf.find("=", pos, end)
+        if equals < 0:
+            return end + 1
+        # A quoted attribute value may contain ">", so look for the end after it
+        pos = equals + 1
+        while pos < len(buf) and buf[pos].isspace():
+            pos += 1
+        if pos == len(buf):
+            return -1
+        if buf[pos] in "\"'":
+            pos = buf.find(buf[pos], pos + 1) + 1
+            if pos == 0:
+                return -1
+
+
+def soft_hyphenate_html(  # noqa: C901
+    html: TextSource,
+    min_left: int = DEFAULT_MIN_LEFT,
+    min_right: int = DEFAULT_MIN_RIGHT,
+    hyphen: str = SOFT_HYPHEN,
+    skip_elements: frozenset[str] = SKIP_ELEMENTS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Insert soft hyphens in the text of an HTML or XHTML document.
+
+    The document is processed as a stream, holding in memory only the current chunk
+    and any construct that crosses its end.
+
+    Args:
+        html: A string, a file-like object or an iterable of strings.
+        min_left: Minimum number of letters before a hyphen.
+        min_right: Minimum number of letters after a hyphen.
+        hyphen: The string to insert at each break.
+        skip_elements: Names of the elements whose content is left unchanged.
+        chunk_size: Number of characters read at a time from file-like objects.
+
+    Yields:
+        Pieces of the transformed document.
+
+    Examples:
+        >>> "".join(soft_hyphenate_html("<p>Ahora <code>variable</code></p>", hyphen="|"))
+        '<p>Aho|ra <code>variable</code></p>'
+    """
+    hyphenate = _WordHyphenator(min_left, min_right, hyphen)
+    skipping = None  # Name of the element whose content is being skipped
+    skip_end = None  # Closing tag of that element
+    buf = ""
+    for chunk in read_chunks(html, chunk_size):
+        buf = buf + chunk if buf else chunk
+        pos = 0
+        size = len(buf)
+        while pos < size:
+            if skipping:
+                match = skip_end.search(buf, pos)  # type: ignore[union-attr]
+                if match:
+                    yield buf[pos : match.end()]
+                    pos = match.end()
+                    skipping = skip_end = None
+                    continue
+                keep = _closing_tag_start(buf, pos, skipping)
+                yield buf[pos:keep]
+                pos = keep
+                break
+            match = _MARKUP_START.search(buf, pos)
+            if not match:
+                # Keep what could be the beginning of a word or a tag
+                text_end = size - 1 if buf.endswith("<") else _trailing_wordish(buf, pos)
+                if text_end > pos:
+                    yield _hyphenate_html_text(buf[pos:text_end], hyphenate)
+                pos = text_end
+                break
+            if match.start() > pos:
+                yield _hyphenate_html_text(buf[pos : match.start()], hyphenate)
+                pos = match.start()
+            end = _markup_end(buf, pos)
+            if end < 0:
+                break
+            tag = buf[pos:end]
+            yield tag
+            pos = end
+            name = _TAG_NAME.match(tag)
+            if name and not tag.startswith("</") and not tag.endswith("/>"):
+                element = name.group(1).lower()
+                if element in skip_elements:
+                    skipping = element
+                    skip_end = re.compile(rf"</{re.escape(element)}\s*>", re.IGNORECASE)
+        buf = buf[pos:]
+    if buf:
+        # Whatever is left is an unterminated construct or the last word
+        yield buf if skipping or buf.startswith("<") else _hyphenate_html_text(buf, hyphenate)
@@ -0,0 +1,173 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Syllabification of running text.
+
+Text is split into word spans, runs of letters, and everything else. Word spans
+that are valid Spanish words are syllabified, with the compiled engine after
+looking them up as the batch functions do, and all the other spans are passed
+through unchanged. Input can be a string, a file-like object, which is read in
+chunks, or any iterable of strings, such as the lines of a file.
+"""
+
+from collections.abc import Iterable, Iterator
+import re
+from typing import TextIO
+
+from . import compiled
+from .api import lookup_sources, scan_with_lookups
+from .errors import InvalidWord
+from .models import SyllabifiedWord, Syllable
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of distinct words remembered while processing a text. The memory is
+# discarded when full.
+TEXT_MEMO_SIZE = 65536
+
+# A run of letters, in any alphabet
+WORD_RE = re.compile(r"[^\W\d_]+")
+
+TextSource = str | TextIO | Iterable[str]
+
+
+def read_chunks(text: TextSource, chunk_size: int) -> Iterator[str]:
+    if isinstance(text, str):
+        yield text
+    elif hasattr(text, "read"):
+        while chunk := text.read(chunk_size):
+            yield chunk
+    else:
+        yield from text
+
+
+def tokenize(text: TextSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[str, bool]]:
+    """
+    Split text into word and non-word spans.
+
+    Words are never split, even when they cross the boundary between two chunks of
+    the input. Consecutive non-word spans may be yielded separately.
+
+    Args:
+        text: A string, a file-like object or an iterable of strings.
+        chunk_size: Number of characters read at a time from file-like objects.
+
+    Yields:
+        Tuples with a span of text and whether it is a word.
+
+    Examples:
+        >>> list(tokenize("¡Hola, mundo!"))
+        [('¡', False), ('Hola', True), (', ', False), ('mundo', True), ('!', False)]
+    """
+    pending = ""
+    for chunk in read_chunks(text, chunk_size):
+        if pending:
+            chunk = pending + chunk
+            pending = ""
+        pos = 0
+        size = len(chunk)
+        for match in WORD_RE.finditer(chunk):
+            start, end = match.span()
+            if start > pos:
+                yield chunk[pos:start], False
+            if end == size:
+                # The word may continue in the next chunk
+                pending = match.group()
+            else:
+                yield match.group(), True
+            pos = end
+        if pos < size:
+            yield chunk[pos:], False
+    if pending:
+        yield pending, True
+
+
+def syllabify_text(
+    text: TextSource, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, SyllabifiedWord | None]]:
+    """
+    Syllabify the words in a text.
+
+    Args:
+        text: A string, a file-like object or an iterable of strings.
+        chunk_size: Number of characters read at a time from file-like objects.
+
+    Yields:
+        Tuples with a span of text and its syllabification, which is None for spans
+        that are not words or are not valid Spanish words. Joining all the spans gives
+        back the original text.
+
+    Examples:
+        >>> [(span, res and res.stressed) for span, res in syllabify_text("Un camión.")]
+        [('Un', 0), (' ', None), ('camión', 1), ('.', None)]
+    """
+    results: dict[str, SyllabifiedWord | None] = {}
+    pool: dict[tuple, Syllable] = {}
+    sources = lookup_sources()
+    for span, is_word in tokenize(text, chunk_size):
+        if not is_word:
+            yield span, None
+            continue
+        try:
+            res = results[span]
+        except KeyError:
+            scanned = scan_with_lookups(span, sources)
+            res = None if isinstance(scanned, InvalidWord) else compiled.build_result(span, *scanned, pool)
+            if len(results) >= TEXT_MEMO_SIZE:
+                results.clear()
+                pool.clear()
+            results[span] = res
+        yield span, res
+
+
+def hyphenate_text(text: TextSource, separator: str = "-", chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Hyphenate the words in a text, leaving everything else unchanged.
+
+    Args:
+        text: A string, a file-like object or an iterable of strings.
+        separator: The string to insert between syllables.
+        chunk_size: Number of characters read at a time from file-like objects.
+
+    Yields:
+        Pieces of the hyphenated text.
+
+    Examples:
+        >>> "".join(hyphenate_text("El pingüino, en 2025, no sabía leer."))
+        'El pin-güi-no, en 2025, no sa-bí-a le-er.'
+    """
+    results: dict[str, str] = {}
+    sources = lookup_sources()
+    for span, is_word in tokenize(text, chunk_size):
+        if not is_word:
+            yield span
+            continue
+        try:
+            yield results[span]
+        except KeyError:
+            scanned = scan_with_lookups(span, sources)
+            if isinstance(scanned, InvalidWord):
+                res = span
+            else:
+                starts = scanned[0][3:-1:3]
+                res = separator.join(span[a:b] for a, b in zip([0, *starts], [*starts, len(span)], strict=True))
+            if len(results) >= TEXT_MEMO_SIZE:
+                results.clear()
+            results[span] = res
+            yield res
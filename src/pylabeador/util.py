@@ -17,12 +17,17 @@
 # along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
 # -------------------------------------------------------------------------------------
 
-VOWELS = set("aáeéiíoóuúü")
-CONSONANTS = set("bcdfghjklmnñpqrstvwxyz")
-LETTERS = VOWELS.union(CONSONANTS)
+from .charclass import CLASS_OF, LETTERS, VOWELS
+from .errors import ErrorKind, InvalidWord
+
+CONSONANTS = LETTERS - VOWELS
 
 _NOT_PASSED = "-N/A-"
 
+# Whether each letter is a vowel, None for 'y', which depends on the letter after it
+_IS_VOWEL: dict[str | None, bool | None] = {c: c in VOWELS for c in CLASS_OF}
+_IS_VOWEL["y"] = None
+
 
 def is_vowel(v: str | None, letter_after: str | None = _NOT_PASSED):
     """
@@ -31,30 +36,51 @@ def is_vowel(v: str | None, letter_after: str | None = _NOT_PASSED):
     - 'y' acts as CONSONANT when followed by a vowel
     - 'y' acts as VOWEL otherwise (including when followed by consonant or at word boundaries)
     """
-    if v == "y":
+    res = _IS_VOWEL.get(v, False)
+    if res is None:
         if letter_after == _NOT_PASSED:
             return False
         return letter_after not in VOWELS
-    return v in VOWELS
+    return res
 
 
-def check_word_for_spanish_chars(word):
+def find_invalid_chars(word: str) -> InvalidWord | None:
     """
-    Check if a word contains only valid Spanish characters.
+    Look for letters that are not valid in Spanish, and return what is wrong with them.
 
     Some characters are valid in Spanish only in specific contexts, such as 'ü'
-    in 'güe' or 'güi'.
-    """
-
-    from .errors import HyphenatorError
+    in 'güe' or 'güi'. Every 'ü' in the word is checked.
 
+    Returns:
+        None if the word only has valid letters, an InvalidWord otherwise.
+    """
     word_lower = word.lower()
     bad_letters = set(word_lower) - LETTERS
     if bad_letters:
-        raise HyphenatorError(f"The word {word} contains invalid letters in Spanish: {bad_letters}")
-    if "ü" in word_lower:
-        pos = word_lower.find("ü")
+        return InvalidWord(
+            word, ErrorKind.INVALID_LETTER, f"The word {word} contains invalid letters in Spanish: {bad_letters}"
+        )
+    pos = word_lower.find("ü")
+    while pos >= 0:
         follows_g = pos > 0 and word_lower[pos - 1] == "g"
-        folowed_by_ei = pos + 1 < len(word_lower) and word_lower[pos + 1] in "eiéí"
-        if not follows_g or not folowed_by_ei:
-            raise HyphenatorError(f"The word {word} does not seem to be Spanish, where ü can only appear in güe or güi")
+        followed_by_ei = pos + 1 < len(word_lower) and word_lower[pos + 1] in "eiéí"
+        if not follows_g or not followed_by_ei:
+            return InvalidWord(
+                word,
+                ErrorKind.MISPLACED_DIAERESIS,
+                f"The word {word} does not seem to be Spanish, where ü can only appear in güe or güi",
+            )
+        pos = word_lower.find("ü", pos + 1)
+    return None
+
+
+def check_word_for_spanish_chars(word):
+    """
+    Check if a word contains only valid Spanish characters.
+
+    Raises:
+        HyphenatorError: When it does not, see ``find_invalid_chars``.
+    """
+    invalid = find_invalid_chars(word)
+    if invalid is not None:
+        raise invalid.error()
@@ -0,0 +1,238 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+"""
+Tables of precompiled results for the most frequent words, generated as Python modules.
+
+A few thousand words make up most of any Spanish text. A word table holds their
+results in a dict, built ahead of time, so that looking one of them up is a single
+dict lookup and the engine does not run at all. Tables are Python modules, written
+by ``build_word_table`` or ``pylabeador build-word-table``, so loading one is as fast
+as importing its bytecode.
+
+The package comes with a table of common words, ``COMMON_WORDS_PATH``, generated
+from ``test/spanish-hyphens.txt`` with::
+
+    pylabeador build-word-table src/pylabeador/commonwords.py test/spanish-hyphens.txt
+
+The module of a table defines ``FORMAT``, the version of the format, and ``WORDS``,
+a dict from each lowercase word to its packed result: a string with one character
+per number, the code point being the number plus ``OFFSET``. The numbers are the
+stressed syllable, the position of the graphical accent plus one (zero for none),
+the accented syllable plus one (zero for none) and the marks returned by
+``compiled.scan``, but for the first and the last ones, which are always zero and
+the length of the word.
+
+Loading a table runs its module, so only load tables from trusted sources.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+import os
+
+from . import compiled
+from .cachefile import MAX_LENGTH, write_image
+from .errors import InvalidWord
+from .models import SyllabifiedWord
+
+FORMAT = 1
+OFFSET = 0x30
+
+COMMON_WORDS_PATH = os.path.join(os.path.dirname(__file__), "commonwords.py")
+
+HEADER = '''\
+# Generated by pylabeador build-word-table, do not edit.
+"""Precompiled results of {count} words, see pylabeador.wordtable"""
+
+FORMAT = {format}
+
+WORDS = {{
+'''
+
+
+def pack_entry(word: str) -> str | None:
+    """
+    Syllabify a word and pack its result for a word table.
+
+    Returns:
+        The packed result, or None if the word is not valid or cannot be packed.
+    """
+    scanned = compiled.scan_checked(word)
+    if isinstance(scanned, InvalidWord) or len(word) > MAX_LENGTH:
+        return None
+    marks, accented_mask, stressed, accent = scanned
+    accented = accented_mask.bit_length()
+    if accented_mask != (1 << accented >> 1):
+        # More than one accented syllable, which only happens in made-up words
+        return None
+    numbers = [stressed, 0 if accent is None else accent + 1, accented, *marks[1:-1]]
+    return "".join(chr(OFFSET + number) for number in numbers)
+
+
+def unpack_entry(word: str, packed: str) -> tuple[list[int], int, int, int | None]:
+    """
+    Unpack the result of a word from a word table.
+
+    Returns:
+        The same tuple as ``compiled.scan``.
+    """
+    stressed, accent, accented, *marks = [ord(c) - OFFSET for c in packed]
+    marks.insert(0, 0)
+    marks.append(len(word))
+    return marks, 1 << accented >> 1, stressed, accent - 1 if accent else None
+
+
+def table_entries(words: Iterable[str], limit: int | None = None) -> dict[str, str]:
+    """
+    Pack the results of the words of a word table.
+
+    Args:
+        words: The words to store, the most frequent ones first. Repeated words,
+            words that are not valid and words that cannot be packed are skipped.
+        limit: Maximum number of words to store, all of them by default.
+
+    Returns:
+        The packed result of each lowercase word.
+    """
+    entries: dict[str, str] = {}
+    for word in words:
+        if limit is not None and len(entries) >= limit:
+            break
+        word = word.lower()
+        if word in entries:
+            continue
+        packed = pack_entry(word)
+        if packed is not None:
+            entries[word] = packed
+    return entries
+
+
+def _quoted(text: str) -> str:
+    # Neither words nor packed results contain quotes, so only the quotes change
+    return f'"{repr(text)[1:-1]}"'
+
+
+def table_source(entries: dict[str, str]) -> str:
+    """Write the source of the module of a word table"""
+    lines = [HEADER.format(count=len(entries), format=FORMAT)]
+    lines += (f"    {_quoted(word)}: {_quoted(packed)},\n" for word, packed in entries.items())
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def build_word_table(path: str | os.PathLike, words: Iterable[str], limit: int | None = None) -> int:
+    """
+    Syllabify a list of words and write their results as the module of a word table.
+
+    Args:
+        path: The module to write. It is replaced atomically if it exists.
+        words: The words to store, the most frequent ones first.
+        limit: Maximum number of words to store, all of them by default.
+
+    Returns:
+        The number of words stored.
+    """
+    entries = table_entries(words, limit)
+    write_image(path, table_source(entries).encode())
+    return len(entries)
+
+
+class WordTable(Mapping[str, SyllabifiedWord]):
+    """
+    Read-only mapping of the words of a word table to their syllabification.
+
+    Lookups are case insensitive. Results are immutable, so the result of each word
+    is built once, the first time it is looked up as it is in the table, and then the
+    same object is returned.
+
+    Examples:
+        >>> table = load_word_table()
+        >>> table["Casa"].hyphenated
+        'Ca-sa'
+    """
+
+    def __init__(self, words: dict[str, str], path: str | os.PathLike = "<memory>"):
+        self.path = path
+        self._words = words
+        self._results: dict[str, SyllabifiedWord] = {}
+
+    def scan(self, word: str) -> tuple[list[int], int, int, int | None] | None:
+        """Return the same tuple as ``compiled.scan`` for a word, or None if it is not in the table"""
+        packed = self._words.get(word) or self._words.get(word.lower())
+        return None if packed is None else unpack_entry(word, packed)
+
+    def get(self, word: str, default=None):  # type: ignore[override]
+        """Return the syllabification of a word, or default if it is not in the table"""
+        res = self._results.get(word)
+        if res is not None:
+            return res
+        scanned = self.scan(word)
+        if scanned is None:
+            return default
+        res = compiled.build_result(word, *scanned)
+        if word in self._words:
+            self._results[word] = res
+        return res
+
+    def __getitem__(self, word: str) -> SyllabifiedWord:
+        res = self.get(word)
+        if res is None:
+            raise KeyError(word)
+        return res
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and word.lower() in self._words
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __reduce__(self):
+        # The built results are not worth pickling
+        return WordTable, (self._words, self.path)
+
+
+def load_word_table(path: str | os.PathLike = COMMON_WORDS_PATH) -> WordTable:
+    """
+    Load the word table in a module written by ``build_word_table``.
+
+    The module is compiled to bytecode, and cached, as any other module.
+
+    Args:
+        path: The module, the table of common words that comes with the package by
+            default.
+
+    Raises:
+        ValueError: When the module is not a word table.
+    """
+    from importlib.machinery import SourceFileLoader
+    from importlib.util import module_from_spec, spec_from_loader
+
+    loader = SourceFileLoader("pylabeador_word_table", os.fspath(path))
+    module = module_from_spec(spec_from_loader(loader.name, loader))  # type: ignore[arg-type]
+    error = ValueError(f"{path} is not a pylabeador word table")
+    try:
+        loader.exec_module(module)
+    except OSError:
+        raise
+    except Exception as e:
+        raise error from e
+    if getattr(module, "FORMAT", None) != FORMAT or not isinstance(getattr(module, "WORDS", None), dict):
+        raise error
+    return WordTable(module.WORDS, path)
@@ -0,0 +1,183 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import gc
+
+import pytest
+
+import pylabeador
+from pylabeador import aio
+from pylabeador.aio import Batcher, _text_chunks
+
+from .utils import spanish_common_words
+
+GOLDEN = [word for word, *_ in spanish_common_words()]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_module_functions():
+    async def main():
+        assert await aio.hyphenate_many(["casa", "perro"]) == ["ca-sa", "pe-rro"]
+        assert await aio.syllabify_many(["encuentro"]) == [["en", "cuen", "tro"]]
+        res = await aio.syllabify_with_details("canción")
+        assert res == pylabeador.syllabify_with_details("canción")
+        assert await aio.hyphenate_text("El pingüino no sabía leer.") == "El pin-güi-no no sa-bí-a le-er."
+
+    run(main())
+
+
+def test_golden_words_in_chunks():
+    async def main():
+        async with Batcher(chunk_size=100, max_batch_size=250) as batcher:
+            results = await batcher.syllabify_with_details_many(GOLDEN)
+            assert batcher.batches >= len(GOLDEN) // 250
+        return results
+
+    assert run(main()) == list(pylabeador.syllabify_with_details_many(GOLDEN))
+
+
+def test_concurrent_requests_are_batched():
+    async def main():
+        async with Batcher(max_delay=0.05) as batcher:
+            results = await asyncio.gather(*(batcher.syllabify_with_details(word) for word in GOLDEN[:200]))
+            return results, batcher.batches
+
+    results, batches = run(main())
+    assert [res.original for res in results] == GOLDEN[:200]
+    assert batches < 10
+
+
+def test_errors():
+    async def main():
+        async with Batcher() as batcher:
+            with pytest.raises(pylabeador.HyphenatorError):
+                await batcher.syllabify_with_details("r2d2")
+            with pytest.raises(pylabeador.HyphenatorError):
+                await batcher.hyphenate_many(["casa", "r2d2"])
+            res = await batcher.hyphenate_many(["casa", "qub"], errors="return")
+            assert res[0] == "ca-sa"
+            assert res[1].kind is pylabeador.ErrorKind.NO_NUCLEUS
+            with pytest.raises(ValueError):
+                await batcher.hyphenate_many(["casa"], errors="ignore")
+
+    run(main())
+
+
+def test_backpressure():
+    async def main():
+        async with Batcher(max_pending=2, max_batch_size=1, concurrency=1, chunk_size=1) as batcher:
+            results = await asyncio.gather(*(batcher.hyphenate_many([word]) for word in GOLDEN[:50]))
+            assert batcher._queue.qsize() == 0
+            return results
+
+    assert run(main()) == [[pylabeador.hyphenate(word)] for word in GOLDEN[:50]]
+
+
+def test_event_loop_is_not_blocked():
+    async def main():
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        async with Batcher(ThreadPoolExecutor(1), chunk_size=100) as batcher:
+            await batcher.hyphenate_many(GOLDEN)
+        done = True
+        await task
+        return ticks
+
+    # The ticker runs at least once between chunks
+    assert run(main()) >= len(GOLDEN) // 100
+
+
+def test_process_executor():
+    async def main():
+        with ProcessPoolExecutor(2) as executor:
+            async with Batcher(executor, chunk_size=500) as batcher:
+                return await batcher.hyphenate_many(GOLDEN[:2000]), await batcher.hyphenate_text("hola mundo")
+
+    hyphenated, text = run(main())
+    assert hyphenated == [pylabeador.hyphenate(word) for word in GOLDEN[:2000]]
+    assert text == "ho-la mun-do"
+
+
+def test_process_executor_uses_the_lexicon(tmp_path):
+    lexicon = tmp_path / "lexicon.txt"
+    lexicon.write_text("transatlántico trans-a-tlán-ti-co\n", encoding="utf-8")
+
+    async def main(executor):
+        async with Batcher(executor) as batcher:
+            return await batcher.hyphenate_many(["transatlántico"]), await batcher.hyphenate_text("un transatlántico")
+
+    pylabeador.use_lexicon(lexicon)
+    executor = aio.process_executor(2)
+    # The workers are started later, but take the lexicon in use when the pool was created
+    pylabeador.use_lexicon(None)
+    with executor:
+        assert run(main(executor)) == (["trans-a-tlán-ti-co"], "un trans-a-tlán-ti-co")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 16, 1000])
+def test_text_chunks_do_not_cut_words(chunk_size):
+    text = "Había una vez\nun transatlántico enorme, en 2025.  Fin"
+    chunks = list(_text_chunks(text, chunk_size))
+    assert "".join(chunks) == text
+    words = text.split()
+    for chunk in chunks:
+        for word in chunk.split():
+            assert any(word in original for original in words)
+    assert run(aio.hyphenate_text(text, chunk_size=chunk_size)) == "".join(pylabeador.hyphenate_text(text))
+
+
+def test_default_batchers_do_not_keep_loops_alive():
+    for _ in range(5):
+        assert run(aio.hyphenate_many(["casa"])) == ["ca-sa"]
+    gc.collect()
+    assert len(aio._default_batchers) == 0
+
+
+def test_invalid_batcher():
+    with pytest.raises(ValueError):
+        Batcher(max_batch_size=0)
+    with pytest.raises(ValueError, match="chunk size"):
+        run(Batcher().hyphenate_text("hola", chunk_size=0))
+    with pytest.raises(ValueError, match="chunk size"):
+        run(aio.hyphenate_text("hola", chunk_size=0))
+
+
+def test_close_while_collecting_a_batch():
+    async def main():
+        batcher = Batcher(max_delay=1.0)
+        request = asyncio.create_task(batcher.hyphenate_many(["casa"]))
+        await asyncio.sleep(0.05)
+        await batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(request, 1.0)
+
+    run(main())
@@ -0,0 +1,111 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import pytest
+
+import pylabeador
+from pylabeador.api import DEFAULT_ENGINE, ENGINES
+
+from .utils import spanish_common_words
+
+GOLDEN = list(spanish_common_words())
+
+
+def test_batch_matches_single_word_api():
+    words = [word for word, *_ in GOLDEN]
+    results = list(pylabeador.syllabify_with_details_many(words))
+    assert results == [pylabeador.syllabify_with_details(word) for word in words]
+
+
+def test_syllabify_many():
+    assert list(pylabeador.syllabify_many(["encuentro", "Güero"])) == [["en", "cuen", "tro"], ["Güe", "ro"]]
+
+
+def test_hyphenate_many():
+    assert list(pylabeador.hyphenate_many(["encuentro", "casa"])) == ["en-cuen-tro", "ca-sa"]
+
+
+def test_batch_is_lazy():
+    def words():
+        yield "casa"
+        raise AssertionError("Consumed too early")
+
+    results = pylabeador.hyphenate_many(words())
+    assert next(results) == "ca-sa"
+
+
+def test_batch_shares_results_and_syllables():
+    first, second, third = pylabeador.syllabify_with_details_many(["casa", "casa", "cama"])
+    assert first is second
+    assert first.syllables[0] is third.syllables[0]
+
+
+@pytest.mark.parametrize(
+    "word, message",
+    [
+        ("hello123", "invalid letters"),
+        ("güero pingüino", "invalid letters"),
+        ("müsica", "ü can only appear in güe or güi"),
+    ],
+)
+def test_batch_invalid_word(word, message):
+    results = pylabeador.hyphenate_many(["casa", word, "perro"])
+    assert next(results) == "ca-sa"
+    with pytest.raises(pylabeador.HyphenatorError, match=message):
+        next(results)
+
+
+def test_batch_returns_errors():
+    words = ["casa", "hello123", "müsica", "qub", "casa", "hello123"]
+    results = list(pylabeador.syllabify_with_details_many(words, errors="return"))
+    kinds = [res.kind if isinstance(res, pylabeador.InvalidWord) else res.hyphenated for res in results]
+    assert kinds == [
+        "ca-sa",
+        pylabeador.ErrorKind.INVALID_LETTER,
+        pylabeador.ErrorKind.MISPLACED_DIAERESIS,
+        pylabeador.ErrorKind.NO_NUCLEUS,
+        "ca-sa",
+        pylabeador.ErrorKind.INVALID_LETTER,
+    ]
+    assert results[1].original == "hello123"
+    assert "invalid letters" in results[1].message
+    assert list(pylabeador.hyphenate_many(["qub", "casa"], errors="return"))[1] == "ca-sa"
+    assert isinstance(next(pylabeador.syllabify_many(["müsica"], errors="return")), pylabeador.InvalidWord)
+
+
+def test_batch_no_nucleus_raises():
+    with pytest.raises(pylabeador.HyphenatorError, match="Nucleus expects a vowel"):
+        list(pylabeador.hyphenate_many(["qub"]))
+
+
+def test_empty_word_is_an_error():
+    (res,) = pylabeador.syllabify_with_details_many([""], errors="return")
+    assert res.kind == pylabeador.ErrorKind.NO_NUCLEUS
+    for engine in ENGINES:
+        pylabeador.set_engine(engine)
+        try:
+            with pytest.raises(pylabeador.HyphenatorError, match="Nucleus expects a vowel"):
+                pylabeador.hyphenate("")
+        finally:
+            pylabeador.set_engine(DEFAULT_ENGINE)
+
+
+def test_batch_unknown_errors_mode():
+    with pytest.raises(ValueError):
+        list(pylabeador.hyphenate_many(["casa"], errors="ignore"))
@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import dataclasses
+
+import pytest
+
+import pylabeador
+from pylabeador import CacheInfo
+
+
+@pytest.fixture
+def cache():
+    pylabeador.enable_cache(maxsize=2)
+    yield
+    pylabeador.disable_cache()
+
+
+def test_cache_disabled_by_default():
+    pylabeador.disable_cache()
+    pylabeador.syllabify("casa")
+    assert pylabeador.cache_info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_cache_hits_and_misses(cache):
+    first = pylabeador.syllabify_with_details("casa")
+    second = pylabeador.syllabify_with_details("casa")
+    assert first is second
+    assert pylabeador.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_cache_covers_syllabify_and_hyphenate(cache):
+    assert pylabeador.syllabify("perro") == ["pe", "rro"]
+    assert pylabeador.hyphenate("perro") == "pe-rro"
+    assert pylabeador.cache_info().hits == 1
+
+
+def test_cache_evicts_least_recently_used(cache):
+    first = pylabeador.syllabify_with_details("uno")
+    pylabeador.syllabify_with_details("dos")
+    pylabeador.syllabify_with_details("uno")
+    pylabeador.syllabify_with_details("tres")  # evicts "dos"
+    assert pylabeador.syllabify_with_details("uno") is first
+    pylabeador.syllabify_with_details("dos")
+    assert pylabeador.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+
+def test_cache_clear(cache):
+    pylabeador.syllabify_with_details("casa")
+    pylabeador.cache_clear()
+    assert pylabeador.cache_info() == CacheInfo(0, 0, 2, 0)
+
+
+def test_cache_does_not_store_errors(cache):
+    for _ in range(2):
+        with pytest.raises(pylabeador.HyphenatorError):
+            pylabeador.syllabify_with_details("hello123")
+    assert pylabeador.cache_info().currsize == 0
+
+
+def test_invalid_cache_size():
+    with pytest.raises(ValueError, match="positive"):
+        pylabeador.enable_cache(0)
+
+
+def test_cached_results_are_immutable(cache):
+    res = pylabeador.syllabify_with_details("casa")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        res.syllables[0].stressed = False  # type: ignore[misc]
+    assert isinstance(res.syllables, tuple)
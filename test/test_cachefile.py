@@ -0,0 +1,107 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+import pylabeador
+from pylabeador import CacheFile, build_cache_file
+from pylabeador.__main__ import main
+
+from .utils import spanish_common_words
+
+GOLDEN = list(spanish_common_words())
+
+
+@pytest.fixture(scope="module")
+def golden_cache(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cache") / "golden.cache"
+    build_cache_file(path, (word for word, *_ in GOLDEN))
+    with CacheFile(path) as cache:
+        yield cache
+
+
+@pytest.fixture
+def cache_in_use(tmp_path):
+    path = tmp_path / "words.cache"
+    build_cache_file(path, ["casa", "Actuáis"])
+    yield pylabeador.use_cache_file(path)
+    pylabeador.use_cache_file(None)
+
+
+def test_cache_file_has_golden_words(golden_cache):
+    assert len(golden_cache) == len({word.lower() for word, *_ in GOLDEN})
+    for word, hyphenated, stressed, accent_pos in GOLDEN:
+        res = golden_cache[word]
+        assert res == pylabeador.syllabify_with_details(word)
+        assert (res.hyphenated, res.stressed, res.accented) == (hyphenated, stressed, accent_pos)
+
+
+def test_cache_file_lookup_is_case_insensitive(golden_cache):
+    res = golden_cache["CASA"]
+    assert res.hyphenated == "CA-SA"
+    assert "Casa" in golden_cache
+
+
+def test_cache_file_miss(golden_cache):
+    assert golden_cache.get("transatlántico") is None
+    assert "hello123" not in golden_cache
+    with pytest.raises(KeyError):
+        golden_cache["transatlántico"]
+
+
+def test_cache_file_iterates_over_keys(golden_cache):
+    assert set(golden_cache) == {word.lower() for word, *_ in GOLDEN}
+
+
+def test_cache_file_skips_invalid_words(tmp_path):
+    path = tmp_path / "words.cache"
+    assert build_cache_file(path, ["casa", "hello123", "Casa", "müsica"]) == 1
+    with CacheFile(path) as cache:
+        assert list(cache) == ["casa"]
+
+
+def test_not_a_cache_file(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("casa\n")
+    with pytest.raises(ValueError, match="not a pylabeador cache file"):
+        CacheFile(path)
+
+
+def test_use_cache_file(cache_in_use):
+    with patch("pylabeador.api._parse", side_effect=AssertionError("Should not parse")):
+        assert pylabeador.hyphenate("Actuáis") == "Ac-tuáis"
+    assert pylabeador.hyphenate("perro") == "pe-rro"
+    with pytest.raises(pylabeador.HyphenatorError):
+        pylabeador.hyphenate("hello123")
+
+
+def test_cli_build_and_use_cache(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("# Some words\ncasa ca-sa 0 -\n\nperro\n")
+    cache_path = tmp_path / "words.cache"
+    with patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+        main(["pylabeador", "build-cache", str(cache_path), str(words)])
+    assert "Stored 2 words" in mock_stderr.getvalue()
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--cache-file", str(cache_path), "perro", "gato"])
+    pylabeador.use_cache_file(None)
+    assert mock_stdout.getvalue().split() == ["pe-rro", "ga-to"]
@@ -0,0 +1,62 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import pytest
+
+from pylabeador import charclass
+from pylabeador.models import VowelType
+from pylabeador.util import CONSONANTS, LETTERS, VOWELS, is_vowel
+
+
+def test_every_letter_has_one_class():
+    assert set(charclass.CLASS_OF) == LETTERS == VOWELS | CONSONANTS
+    assert "".join(sorted(VOWELS)) == "aeiouáéíóúü"
+    for c, cls in charclass.CLASS_OF.items():
+        assert chr(ord(c)).translate(charclass.CHAR_CLASSES) == cls
+
+
+@pytest.mark.parametrize("c", ["A", "1", " ", "ç", "́"])
+def test_other_characters_are_invalid(c):
+    assert c.translate(charclass.CHAR_CLASSES) == charclass.INVALID
+
+
+@pytest.mark.parametrize("c", sorted(charclass.CLASS_OF))
+def test_is_vowel_agrees_with_table(c):
+    assert is_vowel(c) is (charclass.CLASS_OF[c] in charclass.RAW_VOWEL_CLASSES)
+
+
+@pytest.mark.parametrize(
+    "c, expected",
+    [
+        ("a", VowelType.OPEN),
+        ("ó", VowelType.OPEN_WITH_ACCENT),
+        ("ü", VowelType.CLOSED),
+        ("í", VowelType.CLOSED_WITH_ACCENT),
+        ("y", VowelType.CLOSED),
+        ("Y", VowelType.CLOSED),
+    ],
+)
+def test_vowel_type_from_char(c, expected):
+    assert VowelType.from_char(c) is expected
+
+
+@pytest.mark.parametrize("c", ["b", "h", "A", "1"])
+def test_vowel_type_from_char_not_a_vowel(c):
+    with pytest.raises(ValueError):
+        VowelType.from_char(c)
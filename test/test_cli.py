@@ -23,7 +23,15 @@ from unittest.mock import patch
 
 import pytest
 
+import pylabeador
 from pylabeador.__main__ import main
+from pylabeador.cli import syllabify_words
+
+
+@pytest.fixture
+def cache_restored():
+    yield
+    pylabeador.disable_cache()
 
 
 def test_cli_normal_operation():
@@ -60,7 +68,127 @@ def test_cli_invalid_u_diaeresis_error():
 
 
 def test_cli_keyboard_interrupt():
-    with patch("pylabeador.__main__.syllabify_with_details", side_effect=KeyboardInterrupt):
+    with patch("pylabeador.cli.syllabify_with_details", side_effect=KeyboardInterrupt):
         with pytest.raises(SystemExit) as exc_info:
             main(["pylabeador", "casa"])
         assert cast(SystemExit, exc_info.value).code == -1
+
+
+def test_cli_compiled_engine():
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--engine", "compiled", "casa", "Actuáis"])
+    pylabeador.set_engine("rules")
+    assert mock_stdout.getvalue().split() == ["ca-sa", "Ac-tuáis"]
+
+
+def test_cli_cache_size(cache_restored):
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--cache-size", "8", "casa", "casa"])
+    info = pylabeador.cache_info()
+    assert mock_stdout.getvalue().split() == ["ca-sa", "ca-sa"]
+    assert (info.hits, info.maxsize) == (1, 8)
+
+
+def test_cli_words_from_stdin():
+    stdin = io.StringIO("casa\n\n# comment\nperro ladrador\n")
+    with patch("sys.stdin", stdin), patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "árbol", "-"])
+    assert mock_stdout.getvalue() == "ár-bol\nca-sa\npe-rro\n"
+
+
+def test_cli_input_file(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("camión\ncanción\n", encoding="utf-8")
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--input", str(words), "-i", str(words)])
+    assert mock_stdout.getvalue().split() == ["ca-mión", "can-ción"] * 2
+
+
+def test_cli_no_words():
+    with patch("sys.stderr", new_callable=io.StringIO):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["pylabeador"])
+    assert cast(SystemExit, exc_info.value).code == 2
+
+
+def test_cli_stops_at_first_error():
+    stdin = io.StringIO("casa\nmüsica\nperro\n")
+    with (
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", new_callable=io.StringIO) as mock_stdout,
+        patch("sys.stderr", new_callable=io.StringIO),
+    ):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["pylabeador", "-"])
+    assert cast(SystemExit, exc_info.value).code == 1
+    assert mock_stdout.getvalue() == "ca-sa\n"
+
+
+def test_cli_keep_going():
+    stdin = io.StringIO("casa\nmüsica\nperro\nhello1\n")
+    with (
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", new_callable=io.StringIO) as mock_stdout,
+        patch("sys.stderr", new_callable=io.StringIO) as mock_stderr,
+    ):
+        assert main(["pylabeador", "--keep-going", "-"]) == 1
+    assert mock_stdout.getvalue() == "ca-sa\npe-rro\n"
+    errors = mock_stderr.getvalue().splitlines()
+    assert [error.split(": ")[:2] for error in errors] == [["Error", "<stdin>:2"], ["Error", "<stdin>:4"]]
+
+
+def test_syllabify_words_writes_in_batches():
+    out = io.StringIO()
+    words = [(None, "casa")] * 5
+    with patch.object(out, "write", wraps=out.write) as write:
+        assert syllabify_words(words, keep_going=False, out=out, batch_size=2) == 0
+    assert write.call_count == 3
+    assert out.getvalue() == "ca-sa\n" * 5
+
+
+def test_cli_jobs():
+    stdin = io.StringIO("casa\nmüsica\nperro\n" * 10)
+    with (
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", new_callable=io.StringIO) as mock_stdout,
+        patch("sys.stderr", new_callable=io.StringIO) as mock_stderr,
+    ):
+        assert main(["pylabeador", "--jobs", "2", "-k", "-"]) == 1
+    assert mock_stdout.getvalue() == "ca-sa\npe-rro\n" * 10
+    assert mock_stderr.getvalue().splitlines()[1].startswith("Error: <stdin>:5: ")
+
+
+def test_cli_jobs_word_too_long():
+    with (
+        patch("sys.stdout", new_callable=io.StringIO) as mock_stdout,
+        patch("sys.stderr", new_callable=io.StringIO) as mock_stderr,
+    ):
+        assert main(["pylabeador", "--jobs", "2", "-k", "casa", "ca" * 40_000, "perro"]) == 1
+    assert mock_stdout.getvalue() == "ca-sa\npe-rro\n"
+    assert "longer than 65535 characters" in mock_stderr.getvalue()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_format_bin_word_too_long(jobs):
+    stdout = io.TextIOWrapper(io.BytesIO())
+    with patch("sys.stdout", stdout), patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+        assert main(["pylabeador", "--format", "bin", "--jobs", jobs, "-k", "casa", "ca" * 40_000, "perro"]) == 1
+    results = list(pylabeador.read_results(io.BytesIO(stdout.buffer.getvalue()), "bin"))
+    assert [res.hyphenated for res in results] == ["ca-sa", "pe-rro"]
+    assert "binary format" in mock_stderr.getvalue()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_format_jsonl(jobs):
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--format", "jsonl", "--jobs", jobs, "casa", "camión"])
+    results = list(pylabeador.read_results(io.StringIO(mock_stdout.getvalue()), "jsonl"))
+    assert results == list(pylabeador.syllabify_with_details_many(["casa", "camión"]))
+
+
+def test_cli_format_bin():
+    stdout = io.TextIOWrapper(io.BytesIO())
+    with patch("sys.stdout", stdout):
+        main(["pylabeador", "-f", "bin", "casa", "camión"])
+    results = list(pylabeador.read_results(io.BytesIO(stdout.buffer.getvalue()), "bin"))  # type: ignore[attr-defined]
+    assert [res.hyphenated for res in results] == ["ca-sa", "ca-mión"]
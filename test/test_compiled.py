@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import itertools
+import random
+
+import pytest
+
+import pylabeador
+from pylabeador import compiled, engine
+from pylabeador.errors import HyphenatorError
+
+from .utils import parametrize_with_words_from, spanish_common_words
+
+
+@pytest.fixture
+def compiled_engine():
+    pylabeador.set_engine("compiled")
+    yield
+    pylabeador.set_engine("rules")
+
+
+@parametrize_with_words_from(spanish_common_words())
+def test_compiled_hyphenation_of_common_words(word, hyphenated, stressed, accent_pos):
+    res = compiled.parse_word(word)
+    assert res == engine.parse_word(word).to_result()
+    assert res.hyphenated == hyphenated
+    assert res.stressed == stressed
+    assert res.accented == accent_pos
+
+
+def parse_or_error(parse, word):
+    try:
+        return parse(word)
+    except HyphenatorError as e:
+        return e.args[0]
+
+
+def test_compiled_matches_rules_on_random_words():
+    rng = random.Random(20250101)  # noqa: S311
+    alphabet = "aeiouáéíóúübcdfghjklmnñpqrstvwxyzyhq"
+    for _ in range(20000):
+        word = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+        expected = parse_or_error(lambda w: engine.parse_word(w).to_result(), word)
+        assert parse_or_error(compiled.parse_word, word) == expected, word
+
+
+@pytest.mark.parametrize("word", ["".join(p) for p in itertools.product("ayuhíe", repeat=4)])
+def test_compiled_matches_rules_on_vowel_sequences(word):
+    assert compiled.parse_word(word) == engine.parse_word(word).to_result()
+
+
+def test_classify():
+    assert compiled.classify("ayer") == "aYak"
+    assert compiled.classify("muy") == "kiy"
+    assert compiled.classify("canción") == "kakkiAk"
+    assert compiled.classify("país") == "kaIk"
+    assert compiled.classify("a1") == "a?"
+    assert compiled.classify("ahumar") == "ahikak"
+
+
+def test_select_engine(compiled_engine):
+    assert pylabeador.get_engine() == "compiled"
+    res = pylabeador.syllabify_with_details("Actuáis")
+    assert res.hyphenated == "Ac-tuáis"
+    assert res.stressed == 1
+    assert res.accented == 4
+
+
+def test_select_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        pylabeador.set_engine("magic")
+    assert pylabeador.get_engine() == "rules"
+
+
+def test_compiled_engine_validates_words(compiled_engine):
+    with pytest.raises(HyphenatorError, match="invalid letters"):
+        pylabeador.syllabify("hello123")
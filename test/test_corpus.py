@@ -0,0 +1,166 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+from collections import Counter
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+# The tools are scripts with their own dependencies, which may not be installed
+pytest.importorskip("click")
+pytest.importorskip("rich")
+
+from click.testing import CliRunner  # noqa: E402
+
+CORPUS_PATH = Path(__file__).resolve().parent.parent / "tools" / "corpus.py"
+
+TEXT = "La casa y el perro. El perro de la casa,\nla canción del perro müsica y\nel camión " * 20
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    spec = importlib.util.spec_from_file_location("corpus", CORPUS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return path
+
+
+def expected_counts():
+    return Counter(word for word in TEXT.lower().replace(".", " ").replace(",", " ").split() if word != "müsica")
+
+
+def read_output(path: Path) -> list[tuple[str, int]]:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("# word")
+    return [(word, int(count)) for word, count, *_ in (line.split("\t") for line in lines[1:])]
+
+
+def test_merge_counts(corpus):
+    streams = [iter([("a", 1), ("c", 2)]), iter([("a", 3), ("b", 1)]), iter([("c", 1)])]
+    assert list(corpus.merge_counts(streams)) == [("a", 4), ("b", 1), ("c", 3)]
+
+
+def test_spilling_counter(corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(corpus, "MAX_RUNS", 2)
+    counter = corpus.SpillingCounter(tmp_path)
+    expected: Counter = Counter()
+    for words in (["casa", "perro"], ["casa"], ["gato", "casa"]):
+        counter.counts.update(words)
+        expected.update(words)
+        old_runs = counter.spill()
+        assert not counter.counts
+    # The third run made them too many, so they were merged into one
+    assert old_runs == ["run-000000.tsv", "run-000001.tsv", "run-000002.tsv"]
+    assert counter.runs == ["run-000003.tsv"]
+    counter.counts.update(["perro", "árbol"])
+    expected.update(["perro", "árbol"])
+    assert list(counter.items()) == sorted(expected.items())
+
+
+def test_by_frequency(corpus, tmp_path):
+    rows = [(5, "b\n"), (300, "c\n"), (5, "a\n"), (1 << 40, "d\n"), (1, "e\n")]
+    lines = list(corpus.by_frequency(rows, tmp_path, max_rows=2))
+    # Most frequent first, spilled runs and all, and ties by row
+    assert lines == ["d\n", "c\n", "a\n", "b\n", "e\n"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["sorted-000000.tsv", "sorted-000001.tsv"]
+
+
+def test_count(corpus, tmp_path, input_path):
+    output = tmp_path / "words.tsv"
+    result = CliRunner().invoke(corpus.main, [str(input_path), "-o", str(output), "--max-words", "3"])
+    assert result.exit_code == 0, result.output
+    rows = read_output(output)
+    assert dict(rows) == expected_counts()
+    assert [count for _, count in rows] == sorted(expected_counts().values(), reverse=True)
+    assert not (tmp_path / "words.tsv.work").exists()
+
+
+def test_resume_from_checkpoint(corpus, tmp_path, input_path, monkeypatch):
+    # Small reads, and a checkpoint after each of them
+    monkeypatch.setattr(corpus, "READ_SIZE", 100)
+    save_checkpoint = corpus.CorpusCounter.save_checkpoint
+    saved = 0
+
+    def interrupted(self):
+        nonlocal saved
+        save_checkpoint(self)
+        saved += 1
+        if saved == 3:
+            raise KeyboardInterrupt
+
+    output = tmp_path / "words.tsv"
+    work_dir = tmp_path / "work"
+    args = [str(input_path), "-o", str(output), "-w", str(work_dir), "--max-words", "2", "--order", "word"]
+    with monkeypatch.context() as mp:
+        mp.setattr(corpus.CorpusCounter, "save_checkpoint", interrupted)
+        result = CliRunner().invoke(corpus.main, args)
+    assert result.exit_code == 130
+    state = json.loads((work_dir / corpus.CHECKPOINT_NAME).read_text(encoding="utf-8"))
+    data = input_path.read_bytes()
+    # The checkpoint is at a word boundary, with the words up to it counted
+    assert 0 < state["offset"] < len(data)
+    assert data[state["offset"] - 1 : state["offset"]] in (b" ", b"\n")
+    assert state["tokens"] == len(corpus.WORD_RE.findall(data[: state["offset"]].decode().lower()))
+
+    result = CliRunner().invoke(corpus.main, [*args, "--resume"])
+    assert result.exit_code == 0, result.output
+    assert read_output(output) == sorted(expected_counts().items())
+    assert not work_dir.exists()
+
+
+def test_checkpoint_needs_resume(corpus, tmp_path, input_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    (work_dir / corpus.CHECKPOINT_NAME).write_text("{}", encoding="utf-8")
+    result = CliRunner().invoke(corpus.main, [str(input_path), "-o", str(tmp_path / "out.tsv"), "-w", str(work_dir)])
+    assert result.exit_code == 1
+    assert "use --resume" in result.output
+
+
+def test_remove_work_files(corpus, tmp_path):
+    for name in ("checkpoint.json", "run-000001.tsv", "sorted-000000.tsv", "out.tsv.tmp", "notes.txt", "run.txt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    corpus.remove_work_files(tmp_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["notes.txt", "run.txt"]
+
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    (work_dir / "run-000000.tsv").write_text("x", encoding="utf-8")
+    corpus.remove_work_files(work_dir)
+    assert not work_dir.exists()
+
+
+def test_non_empty_work_dir_is_refused(corpus, tmp_path, input_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    (work_dir / "notes.txt").write_text("keep me", encoding="utf-8")
+    result = CliRunner().invoke(corpus.main, [str(input_path), "-o", str(tmp_path / "out.tsv"), "-w", str(work_dir)])
+    assert result.exit_code == 1
+    assert "is not empty" in result.output
+    assert (work_dir / "notes.txt").read_text(encoding="utf-8") == "keep me"
+    assert not (tmp_path / "out.tsv").exists()
@@ -0,0 +1,217 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+import os
+import socket
+import stat
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import pylabeador
+from pylabeador.__main__ import DAEMON_ENV, main
+from pylabeador.daemon import make_daemon
+from pylabeador.daemonclient import SOCKET_ENV, connect_daemon, default_socket_path
+
+from .utils import spanish_common_words
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+
+
+@pytest.fixture
+def socket_path():
+    # Socket paths are limited to about a hundred bytes, too few for tmp_path
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "pylabeador.sock")
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = make_daemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_hyphenate(daemon, socket_path):
+    with connect_daemon(socket_path) as client:
+        assert client.hyphenate("canción") == "can-ción"
+        assert client.hyphenate("perro") == "pe-rro"
+
+
+def test_invalid_word(daemon, socket_path):
+    with connect_daemon(socket_path) as client:
+        with pytest.raises(pylabeador.HyphenatorError, match="invalid letters"):
+            client.hyphenate("r2d2")
+        # The connection is still usable
+        assert client.hyphenate("casa") == "ca-sa"
+
+
+def test_hyphenate_many_in_chunks(daemon, socket_path):
+    words = [(word, hyphenated) for word, hyphenated, *_ in spanish_common_words()]
+    with connect_daemon(socket_path) as client:
+        results = list(client.hyphenate_many((word for word, _ in words), chunk_size=100))
+    assert results == [hyphenated for _, hyphenated in words]
+
+
+def test_line_breaks_in_words(daemon, socket_path):
+    with connect_daemon(socket_path) as client:
+        casa, broken, perro = client.hyphenate_many(["casa", "ca\nsa", "perro"])
+    assert (casa, perro) == ("ca-sa", "pe-rro")
+    assert isinstance(broken, pylabeador.HyphenatorError)
+
+
+def test_pipelined_lines(daemon, socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(socket_path)
+        # A request split in the middle of a line
+        sock.sendall(b"casa\nca")
+        sock.sendall("nción\r\nr2d2\n".encode())
+        reader = sock.makefile("rb")
+        answers = [reader.readline().decode() for _ in range(3)]
+    assert answers[:2] == ["ca-sa\n", "can-ción\n"]
+    assert answers[2].startswith("!The word r2d2")
+
+
+def test_socket_is_private(daemon, socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_no_daemon(socket_path):
+    assert connect_daemon(socket_path) is None
+
+
+def test_stale_socket_is_replaced(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(socket_path)
+    server = make_daemon(socket_path)
+    server.server_close()
+
+
+def test_only_one_daemon(daemon, socket_path):
+    with pytest.raises(OSError, match="already running"):
+        make_daemon(socket_path)
+
+
+def test_default_socket_path(monkeypatch, tmp_path):
+    monkeypatch.setenv(SOCKET_ENV, "/run/custom.sock")
+    assert default_socket_path() == "/run/custom.sock"
+    monkeypatch.delenv(SOCKET_ENV)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == f"/run/user/1000/pylabeador-{os.getuid()}.sock"
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    assert default_socket_path() == f"{tmp_path}/pylabeador-{os.getuid()}/daemon.sock"
+
+
+def test_default_socket_directory_is_private(monkeypatch):
+    monkeypatch.delenv(SOCKET_ENV, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    with tempfile.TemporaryDirectory() as directory:
+        monkeypatch.setattr(tempfile, "tempdir", directory)
+        private = os.path.join(directory, f"pylabeador-{os.getuid()}")
+        make_daemon().server_close()
+        assert stat.S_IMODE(os.stat(private).st_mode) == 0o700
+        os.chmod(private, 0o755)  # noqa: S103
+        with pytest.raises(PermissionError, match="only its owner"):
+            make_daemon()
+
+
+def test_daemons_of_other_users_are_ignored(daemon, socket_path):
+    with patch("pylabeador.daemonclient._peer_uid", return_value=os.getuid() + 1):
+        assert connect_daemon(socket_path) is None
+
+
+def test_cli_forwards_to_daemon(daemon, socket_path, monkeypatch):
+    monkeypatch.setenv(SOCKET_ENV, socket_path)
+    monkeypatch.setenv(DAEMON_ENV, "1")
+    # Nothing is syllabified in process
+    with patch("pylabeador.cli.syllabify_with_details", side_effect=AssertionError):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            assert main(["pylabeador", "casa", "perro"]) == 0
+        assert mock_stdout.getvalue() == "ca-sa\npe-rro\n"
+
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            with patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+                assert main(["pylabeador", "-k", "casa", "r2d2", "perro"]) == 1
+        assert mock_stdout.getvalue() == "ca-sa\npe-rro\n"
+        assert "r2d2" in mock_stderr.getvalue()
+
+        with patch("sys.stderr", new_callable=io.StringIO):
+            with pytest.raises(SystemExit):
+                main(["pylabeador", "casa", "r2d2"])
+
+
+@pytest.mark.parametrize(
+    "argv, env",
+    [
+        (["pylabeador", "--no-daemon", "casa"], {DAEMON_ENV: "1"}),
+        (["pylabeador", "--format", "tsv", "casa"], {DAEMON_ENV: "1"}),
+        (["pylabeador", "casa"], {}),
+    ],
+)
+def test_cli_does_not_forward(daemon, socket_path, monkeypatch, argv, env):
+    monkeypatch.setenv(SOCKET_ENV, socket_path)
+    monkeypatch.delenv(DAEMON_ENV, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    with patch("pylabeador.daemonclient.DaemonClient.hyphenate_many", side_effect=AssertionError):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            assert main(argv) == 0
+    assert "ca-sa" in mock_stdout.getvalue()
+
+
+def test_cli_falls_back_without_daemon(socket_path, monkeypatch):
+    monkeypatch.setenv(SOCKET_ENV, socket_path)
+    monkeypatch.setenv(DAEMON_ENV, "1")
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        assert main(["pylabeador", "casa"]) == 0
+    assert mock_stdout.getvalue() == "ca-sa\n"
+
+
+@pytest.mark.parametrize(
+    "answers",
+    [
+        [TimeoutError("timed out")],
+        [ConnectionError("The daemon closed the connection")],
+        [UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")],
+        ["ca-sa", "ga-to"],
+    ],
+)
+def test_cli_falls_back_when_the_daemon_fails(daemon, socket_path, monkeypatch, answers):
+    monkeypatch.setenv(SOCKET_ENV, socket_path)
+    monkeypatch.setenv(DAEMON_ENV, "1")
+
+    def hyphenate_many(words):
+        for answer in answers:
+            if isinstance(answer, Exception):
+                raise answer
+            yield answer
+
+    with patch("pylabeador.daemonclient.DaemonClient.hyphenate_many", side_effect=hyphenate_many):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            assert main(["pylabeador", "casa", "perro"]) == 0
+    assert mock_stdout.getvalue() == "ca-sa\npe-rro\n"
@@ -0,0 +1,113 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+import json
+
+import pytest
+
+import pylabeador
+from pylabeador.formats import BIN_MAX_LENGTH, FORMATS, ResultFormat, marks_of
+
+from .utils import spanish_common_words
+
+WORDS = [word for word, *_ in spanish_common_words()]
+
+
+def _stream(fmt, data=None):
+    if FORMATS[fmt].binary:
+        return io.BytesIO(data or b"")
+    return io.StringIO(data or "")
+
+
+@pytest.mark.parametrize("fmt", sorted(FORMATS))
+def test_round_trip(fmt):
+    expected = list(pylabeador.syllabify_with_details_many(WORDS))
+    out = _stream(fmt)
+    assert pylabeador.write_results(out, expected, fmt, batch_size=100) == len(WORDS)
+    assert list(pylabeador.read_results(_stream(fmt, out.getvalue()), fmt)) == expected
+
+
+@pytest.mark.parametrize("fmt", sorted(FORMATS))
+def test_empty_output(fmt):
+    out = _stream(fmt)
+    assert pylabeador.write_results(out, [], fmt) == 0
+    assert list(pylabeador.read_results(_stream(fmt, out.getvalue()), fmt)) == []
+
+
+def test_marks_of_matches_scan():
+    for word in ("Construcción", "aéreo", "pingüino", "ahuyentar"):
+        marks, mask, _, _ = pylabeador.compiled.scan(word)
+        assert marks_of(pylabeador.syllabify_with_details(word)) == (marks, mask)
+
+
+def test_jsonl_record():
+    out = io.StringIO()
+    pylabeador.write_results(out, [pylabeador.syllabify_with_details("camión")], "jsonl")
+    record = json.loads(out.getvalue())
+    assert record["hyphenated"] == "ca-mión"
+    assert (record["stressed"], record["accented"]) == (1, 4)
+    assert record["syllables"][1] == {"onset": "m", "nucleus": "ió", "coda": "n", "accented": True, "stressed": True}
+
+
+def test_tsv_record():
+    out = io.StringIO()
+    pylabeador.write_results(out, [pylabeador.syllabify_with_details("aéreo")], "tsv")
+    header, record = out.getvalue().splitlines()
+    assert header.split("\t")[0] == "word"
+    assert record.split("\t") == ["aéreo", "a-é-re-o", "--r-", "a-é-e-o", "---", "0-1-0-0", "1", "1"]
+
+
+def test_binary_bad_header():
+    with pytest.raises(ValueError):
+        list(pylabeador.read_results(io.BytesIO(b"PYLABEAD\x01\x00"), "bin"))
+
+
+def test_binary_word_too_long():
+    # Two bytes per á in UTF-8
+    longest = "cá" * (BIN_MAX_LENGTH // 3)
+    results = [pylabeador.syllabify_with_details(word) for word in ("casa", longest, longest + "cá", "perro")]
+    out = io.BytesIO()
+    with pytest.raises(pylabeador.HyphenatorError, match=f"longer than {BIN_MAX_LENGTH} bytes"):
+        pylabeador.write_results(out, results, "bin", batch_size=1)
+    # Every record before the long word is written whole
+    assert list(pylabeador.read_results(io.BytesIO(out.getvalue()), "bin")) == results[:2]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        pylabeador.write_results(io.StringIO(), [], "xml")
+
+
+def test_formats_must_encode_and_read():
+    class HeaderOnly(ResultFormat):
+        name = "header"
+
+    with pytest.raises(TypeError):
+        HeaderOnly()
+
+
+def test_writes_in_batches():
+    out = io.StringIO()
+    results = [pylabeador.syllabify_with_details("casa")] * 5
+    with pytest.MonkeyPatch.context() as mp:
+        writes = []
+        mp.setattr(out, "write", writes.append)
+        pylabeador.write_results(out, results, "jsonl", batch_size=2)
+    assert len(writes) == 3
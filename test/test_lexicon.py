@@ -0,0 +1,130 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+import pylabeador
+from pylabeador import build_lexicon_file, load_lexicon
+from pylabeador.__main__ import main
+
+LEXICON = """\
+# Prefixes kept whole
+transatlántico trans-a-tlán-ti-co
+subrayar sub-ra-yar
+
+desértico de-sér-ti-co
+"""
+
+
+@pytest.fixture
+def lexicon_text(tmp_path):
+    path = tmp_path / "lexicon.txt"
+    path.write_text(LEXICON, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def lexicon_in_use(lexicon_text):
+    yield pylabeador.use_lexicon(lexicon_text)
+    pylabeador.use_lexicon(None)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_load_lexicon(lexicon_text, tmp_path, compiled):
+    path = lexicon_text
+    if compiled:
+        path = tmp_path / "lexicon.bin"
+        assert build_lexicon_file(path, LEXICON.splitlines()) == 3
+    with load_lexicon(path) as lexicon:
+        assert len(lexicon) == 3
+        res = lexicon["Transatlántico"]
+        assert res.hyphenated == "Trans-a-tlán-ti-co"
+        assert [s.value for s in res.syllables] == ["Trans", "a", "tlán", "ti", "co"]
+        assert (res.stressed, res.accented) == (2, 8)
+        assert res.syllables[0].coda == "ns"
+        assert "casa" not in lexicon
+
+
+def test_lexicon_stress_by_rules(lexicon_text):
+    with load_lexicon(lexicon_text) as lexicon:
+        res = lexicon["subrayar"]
+    assert res.hyphenated == "sub-ra-yar"
+    assert (res.stressed, res.accented) == (2, None)
+
+
+def test_use_lexicon(lexicon_in_use):
+    assert pylabeador.hyphenate("transatlántico") == "trans-a-tlán-ti-co"
+    assert pylabeador.hyphenate("casa") == "ca-sa"
+    assert pylabeador.get_lexicon() is lexicon_in_use
+    pylabeador.use_lexicon(None)
+    assert pylabeador.get_lexicon() is None
+    assert pylabeador.hyphenate("transatlántico") == "tran-sa-tlán-ti-co"
+
+
+def test_lexicon_is_checked_before_the_engine(lexicon_in_use):
+    with patch("pylabeador.api._parse", side_effect=AssertionError("Should not parse")):
+        assert pylabeador.hyphenate("Desértico") == "De-sér-ti-co"
+
+
+def test_lexicon_in_batches(lexicon_in_use):
+    results = pylabeador.syllabify_with_details_many(["transatlántico", "casa", "transatlántico"])
+    assert [res.hyphenated for res in results] == ["trans-a-tlán-ti-co", "ca-sa", "trans-a-tlán-ti-co"]
+
+
+def test_lexicon_in_every_entry_point(lexicon_in_use):
+    text = "Un transatlántico."
+    assert "".join(pylabeador.hyphenate_text(text)) == "Un trans-a-tlán-ti-co."
+    assert [res.hyphenated for _, res in pylabeador.syllabify_text(text) if res] == ["Un", "trans-a-tlán-ti-co"]
+    assert "".join(pylabeador.soft_hyphenate_text(text, hyphen="|")) == "Un trans|a|tlán|ti|co."
+    html = "<p>Un transatlántico.</p>"
+    assert "".join(pylabeador.soft_hyphenate_html(html, hyphen="|")) == "<p>Un trans|a|tlán|ti|co.</p>"
+    assert pylabeador.syllabify_offsets("transatlántico").hyphenate("transatlántico") == "trans-a-tlán-ti-co"
+    assert pylabeador.pack_offsets(["transatlántico"])[0].hyphenate("transatlántico") == "trans-a-tlán-ti-co"
+    ((_, res),) = pylabeador.syllabify_offsets_parallel(["transatlántico"], jobs=1)
+    assert res.hyphenate("transatlántico") == "trans-a-tlán-ti-co"
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("casa", "Line 1: expected a word and its syllables"),
+        ("casa ca-so", "Line 1: 'ca-so' is not a hyphenation of 'casa'"),
+        ("casa ca--sa", "Line 1: 'ca--sa' is not a hyphenation of 'casa'"),
+        ("ca1sa ca1-sa", "Line 1: "),
+    ],
+)
+def test_invalid_lexicon(tmp_path, line, message):
+    path = tmp_path / "lexicon.txt"
+    path.write_text(line + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        load_lexicon(path)
+
+
+def test_cli_build_and_use_lexicon(lexicon_text, tmp_path):
+    path = tmp_path / "lexicon.bin"
+    with patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+        main(["pylabeador", "build-lexicon", str(path), str(lexicon_text)])
+    assert "Stored 3 words" in mock_stderr.getvalue()
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--lexicon", str(path), "transatlántico", "gato"])
+    pylabeador.use_lexicon(None)
+    assert mock_stdout.getvalue().split() == ["trans-a-tlán-ti-co", "ga-to"]
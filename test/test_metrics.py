@@ -0,0 +1,129 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import threading
+
+import pytest
+
+import pylabeador
+from pylabeador import ErrorKind
+from pylabeador.metrics import LATENCY_BUCKETS
+
+
+@pytest.fixture
+def metrics():
+    pylabeador.disable_cache()
+    yield pylabeador.enable_metrics()
+    pylabeador.disable_metrics()
+
+
+def test_metrics_are_disabled_by_default():
+    assert pylabeador.api.get_metrics() is None
+    assert pylabeador.render_metrics() == ""
+
+
+def test_single_calls(metrics):
+    pylabeador.hyphenate("casa")
+    pylabeador.syllabify("perro")
+    with pytest.raises(pylabeador.HyphenatorError):
+        pylabeador.hyphenate("r2d2")
+    with pytest.raises(pylabeador.HyphenatorError):
+        pylabeador.hyphenate("qub")
+    data = metrics.snapshot()
+    assert data["words"] == {"single": 4, "batch": 0}
+    assert data["errors"] == {ErrorKind.INVALID_LETTER: 1, ErrorKind.MISPLACED_DIAERESIS: 0, ErrorKind.NO_NUCLEUS: 1}
+    assert sum(data["latency_buckets"]) == 4
+    assert len(data["latency_buckets"]) == len(LATENCY_BUCKETS) + 1
+    assert data["latency_seconds"] > 0
+
+
+def test_batch_calls(metrics):
+    words = ["casa", "casa", "pingüino", "agüa", "r2d2"]
+    assert len(list(pylabeador.syllabify_with_details_many(words, errors="return"))) == 5
+    data = metrics.snapshot()
+    assert data["words"] == {"single": 0, "batch": 5}
+    assert data["errors"][ErrorKind.MISPLACED_DIAERESIS] == 1
+    assert data["errors"][ErrorKind.INVALID_LETTER] == 1
+    assert sum(data["latency_buckets"]) == 0
+
+
+def test_threads_are_added_up(metrics):
+    def work():
+        for _ in range(100):
+            pylabeador.hyphenate("casa")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pylabeador.hyphenate("casa")
+    assert metrics.snapshot()["words"]["single"] == 401
+
+
+def test_ended_threads_are_folded(metrics):
+    def work():
+        pylabeador.hyphenate("casa")
+        list(pylabeador.hyphenate_many(["perro"]))
+
+    for _ in range(200):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    assert len(metrics._shards) <= 1
+    assert metrics.snapshot()["words"] == {"single": 200, "batch": 200}
+
+
+def test_enable_again_starts_from_zero(metrics):
+    pylabeador.hyphenate("casa")
+    assert pylabeador.enable_metrics().snapshot()["words"]["single"] == 0
+
+
+def test_render_prometheus(metrics):
+    pylabeador.hyphenate("casa")
+    with pytest.raises(pylabeador.HyphenatorError):
+        pylabeador.hyphenate("r2d2")
+    lines = pylabeador.render_metrics().splitlines()
+    assert 'pylabeador_words_total{call="single"} 2' in lines
+    assert 'pylabeador_errors_total{kind="invalid_letter"} 1' in lines
+    assert 'pylabeador_syllabify_seconds_bucket{le="+Inf"} 2' in lines
+    assert "pylabeador_syllabify_seconds_count 2" in lines
+    assert not any(line.startswith("pylabeador_cache") for line in lines)
+    # Every sample comes after the HELP and TYPE of its metric
+    types = {line.split()[2]: line.split()[3] for line in lines if line.startswith("# TYPE")}
+    for line in lines:
+        if not line.startswith("#"):
+            name = line.split("{")[0].split()[0]
+            base = name.removesuffix("_bucket").removesuffix("_sum").removesuffix("_count")
+            assert name in types or types.get(base) == "histogram"
+    buckets = [int(line.split()[-1]) for line in lines if line.startswith("pylabeador_syllabify_seconds_bucket")]
+    assert buckets == sorted(buckets)
+
+
+def test_render_cache_metrics(metrics):
+    pylabeador.enable_cache(8)
+    try:
+        pylabeador.hyphenate("casa")
+        pylabeador.hyphenate("casa")
+        lines = pylabeador.render_metrics().splitlines()
+    finally:
+        pylabeador.disable_cache()
+    assert "pylabeador_cache_hits_total 1" in lines
+    assert "pylabeador_cache_misses_total 1" in lines
+    assert "pylabeador_cache_size 1" in lines
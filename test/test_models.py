@@ -0,0 +1,71 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+import pylabeador
+from pylabeador import SyllabifiedWord, Syllable
+
+
+@pytest.fixture
+def result():
+    return pylabeador.syllabify_with_details("canción")
+
+
+def test_results_have_no_instance_dict(result):
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(result.syllables[0], "__dict__")
+
+
+def test_derived_strings_are_computed_once(result):
+    assert result.hyphenated is result.hyphenated
+    assert result.syllables[1].value is result.syllables[1].value
+
+
+def test_cached_strings_do_not_affect_equality(result):
+    other = pylabeador.syllabify_with_details("canción")
+    assert result.hyphenated == "can-ción"
+    assert result == other
+    assert hash(result) == hash(other)
+
+
+def test_repr_does_not_include_cached_strings():
+    syllable = Syllable("c", "a", "n")
+    assert syllable.value == "can"
+    assert repr(syllable) == "Syllable(onset='c', nucleus='a', coda='n', accented=False, stressed=False)"
+
+
+@pytest.mark.parametrize("clone", [pickle.loads, copy.deepcopy], ids=["pickle", "deepcopy"])
+def test_results_can_be_copied(result, clone):
+    result.hyphenated  # noqa: B018
+    data = pickle.dumps(result) if clone is pickle.loads else result
+    other = clone(data)
+    assert other == result
+    assert other.hyphenated == "can-ción"
+
+
+def test_results_are_frozen(result):
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.stressed = 0  # type: ignore[misc]
+    assert dataclasses.replace(result.syllables[0], stressed=True).value == "can"
+    assert isinstance(result, SyllabifiedWord)
@@ -0,0 +1,93 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+from array import array
+
+import pytest
+
+import pylabeador
+from pylabeador import PackedBreaks, SyllableBreaks
+from pylabeador.offsets import MAX_WORD_LENGTH
+
+from .utils import spanish_common_words
+
+GOLDEN = list(spanish_common_words())
+
+
+def test_syllabify_offsets():
+    res = pylabeador.syllabify_offsets("Construcción")
+    assert res == SyllableBreaks(array("H", [4, 8]), stressed=2, accent=10)
+    assert res.num_syllables == 3
+    assert res.split("Construcción") == ["Cons", "truc", "ción"]
+    assert res.hyphenate("Construcción", "·") == "Cons·truc·ción"
+
+
+def test_syllabify_offsets_single_syllable():
+    res = pylabeador.syllabify_offsets("sol")
+    assert res == SyllableBreaks(array("H"), stressed=0)
+    assert res.split("sol") == ["sol"]
+
+
+def test_pack_offsets_matches_golden_words():
+    words = [word for word, *_ in GOLDEN]
+    packed = pylabeador.pack_offsets(words)
+    assert len(packed) == len(words)
+    assert len(packed.index) == len(words) + 1
+    for res, (word, hyphenated, stressed, accent_pos) in zip(packed, GOLDEN, strict=True):
+        assert res.hyphenate(word) == hyphenated
+        assert (res.stressed, res.accent) == (stressed, accent_pos)
+
+
+def test_packed_breaks_access():
+    packed = pylabeador.pack_offsets(["casa", "canción", "sol"])
+    assert packed[-1] == SyllableBreaks(array("H"), 0)
+    assert [b.stressed for b in packed[:2]] == [0, 1]
+    with pytest.raises(IndexError):
+        packed[3]
+
+
+def test_packed_breaks_serialization():
+    packed = pylabeador.pack_offsets(["casa", "canción", "Actuáis"])
+    data = packed.to_bytes()
+    assert PackedBreaks.from_bytes(data) == packed
+    with pytest.raises(ValueError):
+        PackedBreaks.from_bytes(data[:-2])
+
+
+def test_packed_breaks_long_word():
+    word = "ca" * 20_000 + "sá"
+    packed = pylabeador.pack_offsets([word])
+    assert packed[0].accent == len(word) - 1
+    assert PackedBreaks.from_bytes(packed.to_bytes()) == packed
+
+
+def test_offsets_word_too_long():
+    word = "ca" * (MAX_WORD_LENGTH // 2 + 1)
+    with pytest.raises(pylabeador.HyphenatorError, match="longer than 65535"):
+        pylabeador.syllabify_offsets(word)
+    with pytest.raises(pylabeador.HyphenatorError, match="longer than 65535"):
+        pylabeador.pack_offsets(["casa", word])
+    assert len(pylabeador.pack_offsets([word[:MAX_WORD_LENGTH]]).breaks) == MAX_WORD_LENGTH // 2 - 1
+
+
+def test_offsets_invalid_word():
+    with pytest.raises(pylabeador.HyphenatorError, match="invalid letters"):
+        pylabeador.syllabify_offsets("hello123")
+    with pytest.raises(pylabeador.HyphenatorError, match="güe or güi"):
+        pylabeador.pack_offsets(["casa", "müsica"])
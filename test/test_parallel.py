@@ -0,0 +1,104 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+import pickle
+
+import pytest
+
+import pylabeador
+from pylabeador import HyphenatorError, SyllableBreaks
+from pylabeador.api import lookup_sources
+from pylabeador.wordtable import pack_entry
+
+from .utils import spanish_common_words
+
+GOLDEN = list(spanish_common_words())
+
+
+def test_parallel_matches_golden_words():
+    words = [word for word, *_ in GOLDEN]
+    results = list(pylabeador.syllabify_offsets_parallel(words, jobs=2, chunk_size=100))
+    assert [word for word, _ in results] == words
+    for (word, res), (_, hyphenated, stressed, accent_pos) in zip(results, GOLDEN, strict=True):
+        assert isinstance(res, SyllableBreaks)
+        assert res.hyphenate(word) == hyphenated
+        assert (res.stressed, res.accent) == (stressed, accent_pos)
+
+
+def test_parallel_errors_keep_their_place():
+    words = ["casa", "hello1", "müsica", "perro"] * 3
+    results = list(pylabeador.syllabify_offsets_parallel(words, jobs=2, chunk_size=3))
+    assert [word for word, _ in results] == words
+    outcome = [res.hyphenate(word) if isinstance(res, SyllableBreaks) else type(res) for word, res in results]
+    assert outcome == ["ca-sa", HyphenatorError, HyphenatorError, "pe-rro"] * 3
+    assert "invalid letters" in str(results[1][1])
+
+
+def test_parallel_empty_input():
+    assert list(pylabeador.syllabify_offsets_parallel([], jobs=2)) == []
+
+
+def test_parallel_invalid_jobs():
+    with pytest.raises(ValueError):
+        list(pylabeador.syllabify_offsets_parallel(["casa"], jobs=0))
+
+
+def test_parallel_details_match_golden_words():
+    words = [word for word, *_ in GOLDEN] + ["hello1"]
+    results = list(pylabeador.syllabify_with_details_parallel(words, jobs=2, chunk_size=500))
+    assert [word for word, _ in results] == words
+    assert [res for _, res in results[:-1]] == list(pylabeador.syllabify_with_details_many(words[:-1]))
+    assert isinstance(results[-1][1], HyphenatorError)
+
+
+@pytest.fixture
+def lookups(tmp_path):
+    lexicon = tmp_path / "lexicon.txt"
+    lexicon.write_text("desértico de-sér-ti-co\n", encoding="utf-8")
+    # A table entry that differs from the rules shows whether the table is used
+    table = tmp_path / "table.py"
+    table.write_text(f"FORMAT = 1\nWORDS = {{'camión': {pack_entry('camion')!r}}}\n", encoding="utf-8")
+    cache = tmp_path / "words.cache"
+    pylabeador.build_cache_file(cache, ["casa"])
+    pylabeador.use_lexicon(lexicon)
+    pylabeador.use_prefixes({"rayar"})
+    pylabeador.use_word_table(table)
+    pylabeador.use_cache_file(cache)
+    yield
+    pylabeador.use_lexicon(None)
+    pylabeador.use_prefixes(None)
+    pylabeador.use_word_table(None)
+    pylabeador.use_cache_file(None)
+
+
+def test_parallel_uses_the_same_lookups_as_batches(lookups):
+    words = ["desértico", "subrayar", "camión", "casa", "hello1"]
+    serial = list(pylabeador.syllabify_with_details_many(words, errors="return"))
+    assert [res.hyphenated for res in serial[:-1]] == ["de-sér-ti-co", "sub-ra-yar", "ca-mión", "ca-sa"]
+    assert serial[2].accented is None
+    results = list(pylabeador.syllabify_with_details_parallel(words, jobs=2, chunk_size=2))
+    assert [res for _, res in results[:-1]] == serial[:-1]
+    offsets = list(pylabeador.syllabify_offsets_parallel(words, jobs=2, chunk_size=2))
+    assert [res.hyphenate(word) for word, res in offsets[:-1]] == [res.hyphenated for res in serial[:-1]]
+
+
+def test_lookup_sources_can_be_pickled(lookups):
+    sources = pickle.loads(pickle.dumps(lookup_sources()))  # noqa: S301
+    assert [type(source).__name__ for source in sources] == ["CacheFile", "PrefixIndex", "WordTable", "CacheFile"]
+    for word in ("desértico", "subrayar", "camión", "casa"):
+        assert pylabeador.api.lookup_scan(word, sources) == pylabeador.api.lookup_scan(word, lookup_sources())
@@ -0,0 +1,177 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import asyncio
+import io
+import itertools
+from unittest.mock import patch
+
+import pytest
+
+import pylabeador
+from pylabeador import PrefixIndex, aio, build_cache_file
+from pylabeador.__main__ import main
+from pylabeador.api import ENGINES
+from pylabeador.compiled import build_result
+from pylabeador.prefixes import DEFAULT_PREFIXES
+
+from .utils import spanish_common_words
+
+STEMS = {"atlántico", "rayar", "esperado", "orden", "guerra", "pues", "ano"}
+
+
+@pytest.fixture
+def prefixes_in_use():
+    yield pylabeador.use_prefixes(STEMS)
+    pylabeador.use_prefixes(None)
+
+
+@pytest.mark.parametrize(
+    "word, boundary",
+    [
+        ("transatlántico", 5),
+        ("Subrayar", 3),
+        ("postguerra", 4),
+        ("desorden", 3),
+        ("desordenado", 0),
+        ("enano", 0),
+        ("casa", 0),
+        ("trans", 0),
+    ],
+)
+def test_find_boundary(word, boundary):
+    assert PrefixIndex(STEMS).find_boundary(word) == boundary
+
+
+def test_longest_prefix_wins():
+    index = PrefixIndex({"tguerra", "guerra"})
+    assert index.find_boundary("postguerra") == 4
+
+
+def test_min_stem():
+    assert PrefixIndex(STEMS, min_stem=3).find_boundary("enano") == 2
+
+
+def test_custom_prefixes():
+    index = PrefixIndex({"orden"}, prefixes=["contra"])
+    assert index.find_boundary("contraorden") == 6
+    assert index.find_boundary("desorden") == 0
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize(
+    "word, hyphenated, stressed, accent",
+    [
+        ("transatlántico", "trans-a-tlán-ti-co", 2, 8),
+        ("Subrayar", "Sub-ra-yar", 2, None),
+        ("inesperado", "in-es-pe-ra-do", 3, None),
+        ("desorden", "des-or-den", 1, None),
+        ("despues", "des-pues", 0, None),
+        ("enano", "e-na-no", 1, None),
+        ("casa", "ca-sa", 0, None),
+    ],
+)
+def test_prefixed_words(prefixes_in_use, engine, word, hyphenated, stressed, accent):
+    pylabeador.set_engine(engine)
+    try:
+        res = pylabeador.syllabify_with_details(word)
+    finally:
+        pylabeador.set_engine("rules")
+    assert (res.hyphenated, res.stressed, res.accented) == (hyphenated, stressed, accent)
+    assert [s.stressed for s in res.syllables] == [i == stressed for i in range(len(res.syllables))]
+
+
+def test_scan_matches_parse():
+    golden = [word for word, *_ in spanish_common_words()]
+    index = PrefixIndex({word.lower() for word in golden})
+    for prefix, word in zip(itertools.cycle(DEFAULT_PREFIXES), golden):
+        word = prefix + word
+        res = index.parse(word, ENGINES["rules"])
+        scanned = index.scan(word)
+        assert (res is None) == (scanned is None)
+        if res is not None:
+            assert build_result(word, *scanned) == res
+
+
+def test_prefixes_off():
+    assert pylabeador.use_prefixes(None) is None
+    assert pylabeador.hyphenate("transatlántico") == "tran-sa-tlán-ti-co"
+
+
+def test_prefixes_in_batches(prefixes_in_use):
+    words = ["transatlántico", "casa", "subrayar"]
+    single = [pylabeador.syllabify_with_details(word) for word in words]
+    assert list(pylabeador.syllabify_with_details_many(words)) == single
+
+
+def test_prefixes_in_every_entry_point(prefixes_in_use):
+    text = "Un transatlántico."
+    assert "".join(pylabeador.hyphenate_text(text)) == "Un trans-a-tlán-ti-co."
+    assert "".join(pylabeador.soft_hyphenate_html(f"<p>{text}</p>", hyphen="|")) == "<p>Un trans|a|tlán|ti|co.</p>"
+    assert pylabeador.syllabify_offsets("transatlántico").hyphenate("transatlántico") == "trans-a-tlán-ti-co"
+    assert pylabeador.pack_offsets(["subrayar"])[0].hyphenate("subrayar") == "sub-ra-yar"
+    words = ["transatlántico", "casa", "subrayar"] * 3
+    results = pylabeador.syllabify_with_details_parallel(words, jobs=2, chunk_size=2)
+    assert [res for _, res in results] == [pylabeador.syllabify_with_details(word) for word in words]
+
+    async def hyphenate_in_processes():
+        with aio.process_executor(2) as executor:
+            async with aio.Batcher(executor) as batcher:
+                return await batcher.hyphenate_text(text)
+
+    assert asyncio.run(hyphenate_in_processes()) == "Un trans-a-tlán-ti-co."
+
+
+def test_cli_stems_in_parallel(tmp_path):
+    path = tmp_path / "stems.txt"
+    path.write_text("atlántico\n", encoding="utf-8")
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--stems", str(path), "--jobs", "2", "transatlántico", "gato"])
+    pylabeador.use_prefixes(None)
+    assert mock_stdout.getvalue().split() == ["trans-a-tlán-ti-co", "ga-to"]
+
+
+def test_invalid_words_with_prefixes(prefixes_in_use):
+    with pytest.raises(pylabeador.HyphenatorError):
+        pylabeador.hyphenate("trans4tlántico")
+
+
+@pytest.mark.parametrize("cache_file", [False, True])
+def test_stems_from_file(tmp_path, cache_file):
+    words = ["# Stems", "atlántico", "", "rayar 1234", "r2d2"]
+    path = tmp_path / "stems.txt"
+    path.write_text("\n".join(words), encoding="utf-8")
+    if cache_file:
+        path = tmp_path / "stems.cache"
+        build_cache_file(path, ["atlántico", "rayar"])
+    index = pylabeador.use_prefixes(path)
+    try:
+        assert "rayar" in index.stems
+        assert pylabeador.hyphenate("subrayar") == "sub-ra-yar"
+    finally:
+        pylabeador.use_prefixes(None)
+
+
+def test_cli_stems(tmp_path):
+    path = tmp_path / "stems.txt"
+    path.write_text("atlántico\n", encoding="utf-8")
+    with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+        main(["pylabeador", "--stems", str(path), "transatlántico", "gato"])
+    pylabeador.use_prefixes(None)
+    assert mock_stdout.getvalue().split() == ["trans-a-tlán-ti-co", "ga-to"]
@@ -0,0 +1,122 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+import pylabeador
+from pylabeador import engine
+from pylabeador.__main__ import main
+from pylabeador.profiling import STAGES, disable_profiling, enable_profiling, get_profile, profiling
+
+ORIGINALS = {name: getattr(engine, name) for name in ("parse_word", *STAGES)}
+
+
+@pytest.fixture(autouse=True)
+def no_profiling():
+    # Cached words never reach the engine
+    pylabeador.disable_cache()
+    yield
+    disable_profiling()
+    assert {name: getattr(engine, name) for name in ORIGINALS} == ORIGINALS
+
+
+def test_disabled_profiling_leaves_the_engine_alone():
+    assert get_profile() is None
+    assert disable_profiling() is None
+    enable_profiling()
+    assert engine.nucleus is not ORIGINALS["nucleus"]
+    assert engine.nucleus.__wrapped__ is ORIGINALS["nucleus"]
+    disable_profiling()
+    assert {name: getattr(engine, name) for name in ORIGINALS} == ORIGINALS
+
+
+def test_stage_counts():
+    with profiling() as profile:
+        assert pylabeador.hyphenate("construir") == "cons-truir"
+        assert pylabeador.hyphenate("casa") == "ca-sa"
+    assert profile.words.calls == 2
+    assert {name: stats.calls for name, stats in profile.stages.items()} == {
+        "onset": 4,
+        "nucleus": 4,
+        "coda": 4,
+        "find_stressed_syllable": 2,
+    }
+    assert all(stats.total_ns > 0 for stats in profile.stages.values())
+    assert profile.words.total_ns >= sum(stats.total_ns for stats in profile.stages.values())
+    # Nothing is counted once profiling is over
+    pylabeador.hyphenate("casa")
+    assert profile.words.calls == 2
+
+
+@pytest.mark.parametrize(
+    "word, branches",
+    [
+        ("casa", {"nucleus.monophthong": 2, "coda.empty": 2, "coda.final": 0}),
+        ("cuidado", {"nucleus.diphthong": 1, "nucleus.monophthong": 2}),
+        ("buey", {"nucleus.triphthong": 1}),
+        ("ahora", {"nucleus.h_split": 1}),
+        ("prohibir", {"nucleus.h_inside": 1}),
+        ("leer", {"nucleus.hiatus": 1, "coda.final": 1}),
+        ("rey", {"nucleus.diphthong": 1, "nucleus.y_vowel": 1}),
+        ("ayer", {"nucleus.y_consonant": 1}),
+        ("calle", {"coda.before_digraph": 0, "coda.empty": 2}),
+        ("construir", {"coda.before_cluster": 1, "coda.final": 1}),
+        ("perno", {"coda.before_consonant": 1}),
+    ],
+)
+def test_branches(word, branches):
+    with profiling() as profile:
+        pylabeador.syllabify(word)
+    for name, count in branches.items():
+        assert profile.branches[name] == count, name
+
+
+def test_compiled_engine_is_not_profiled():
+    pylabeador.set_engine("compiled")
+    try:
+        with profiling() as profile:
+            pylabeador.hyphenate("casa")
+    finally:
+        pylabeador.set_engine("rules")
+    assert profile.words.calls == 0
+
+
+def test_report(tmp_path):
+    with profiling() as profile:
+        pylabeador.hyphenate("construir")
+    report = profile.report()
+    for name in ("parse_word", *STAGES, "coda.before_cluster"):
+        assert name in report
+    path = tmp_path / "profile.json"
+    profile.write_json(path)
+    data = json.loads(path.read_text())
+    assert data == profile.to_dict()
+    assert data["stages"]["nucleus"]["calls"] == 2
+    assert data["branches"]["coda.before_cluster"] == 1
+
+
+def test_cli_profile():
+    with patch("sys.stdout", new_callable=io.StringIO), patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+        main(["pylabeador", "--profile", "casa"])
+    assert "nucleus.monophthong" in mock_stderr.getvalue()
+    assert get_profile() is None
@@ -0,0 +1,244 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import http.client
+import json
+import threading
+from unittest.mock import patch
+from urllib.parse import quote
+
+import pytest
+
+import pylabeador
+from pylabeador.formats import result_to_dict
+from pylabeador.server import MAX_BODY_SIZE, make_server
+
+from .utils import spanish_common_words
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = make_server("127.0.0.1", 0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+@pytest.fixture
+def conn(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+    yield conn
+    conn.close()
+
+
+def request(conn, method, path, body=None):
+    headers = {}
+    if body is not None:
+        body = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    conn.request(method, path, body, headers)
+    response = conn.getresponse()
+    data = response.read()
+    if response.getheader("Content-Type") == "application/json":
+        data = json.loads(data)
+    return response, data
+
+
+def test_syllabify_get(conn):
+    response, data = request(conn, "GET", "/syllabify?word=canci%C3%B3n")
+    assert response.status == 200
+    assert data == result_to_dict(pylabeador.syllabify_with_details("canción"))
+
+
+def test_syllabify_post(conn):
+    response, data = request(conn, "POST", "/syllabify", {"word": "casa"})
+    assert response.status == 200
+    assert data["hyphenated"] == "ca-sa"
+    assert data["stressed"] == 0
+
+
+def test_syllabify_invalid_word(conn):
+    response, data = request(conn, "GET", "/syllabify?word=r2d2")
+    assert response.status == 422
+    assert data["original"] == "r2d2"
+    assert data["kind"] == "invalid_letter"
+    assert data["error"]
+
+
+def test_empty_word(conn):
+    response, data = request(conn, "POST", "/syllabify", {"word": ""})
+    assert response.status == 422
+    assert data["kind"] == "no_nucleus"
+    response, data = request(conn, "POST", "/batch", {"words": ["", "casa"], "details": False})
+    assert response.status == 200
+    assert data["results"][1] == "ca-sa"
+
+
+def test_unexpected_error(conn):
+    with patch("pylabeador.server.syllabify_with_details", side_effect=RuntimeError("boom")):
+        response, data = request(conn, "GET", "/syllabify?word=casa")
+    assert response.status == 500
+    assert data == {"error": "Internal server error"}
+    assert response.getheader("Connection") == "close"
+
+
+def test_batch_matches_golden_list(conn):
+    words = [(word, hyphenated) for word, hyphenated, *_ in spanish_common_words()]
+    response, data = request(conn, "POST", "/batch", {"words": [word for word, _ in words], "details": False})
+    assert response.status == 200
+    assert data["results"] == [hyphenated for _, hyphenated in words]
+
+
+def test_batch_with_details_and_errors(conn):
+    response, data = request(conn, "POST", "/batch", {"words": ["casa", "müsica", "perro"]})
+    assert response.status == 200
+    casa, musica, perro = data["results"]
+    assert casa == result_to_dict(pylabeador.syllabify_with_details("casa"))
+    assert musica["kind"] == "misplaced_diaeresis"
+    assert perro["hyphenated"] == "pe-rro"
+
+
+def test_text(conn):
+    response, data = request(conn, "POST", "/text", {"text": "La casa, 42 perros.", "separator": "·"})
+    assert response.status == 200
+    assert data == {"text": "La ca·sa, 42 pe·rros."}
+
+
+@pytest.mark.parametrize(
+    "method, path, body, status",
+    [
+        ("GET", "/nowhere", None, 404),
+        ("GET", "/batch", None, 405),
+        ("GET", "/syllabify", None, 400),
+        ("POST", "/batch", {"words": "casa"}, 400),
+        ("POST", "/batch", {"words": ["casa", 1]}, 400),
+        ("POST", "/batch", [], 400),
+        ("POST", "/text", {"text": "casa", "separator": 1}, 400),
+    ],
+)
+def test_bad_requests(conn, method, path, body, status):
+    response, data = request(conn, method, path, body)
+    assert response.status == status
+    assert data["error"]
+
+
+def test_invalid_json(conn):
+    conn.request("POST", "/batch", b"{not json")
+    response = conn.getresponse()
+    assert response.status == 400
+    assert "JSON" in json.loads(response.read())["error"]
+
+
+def test_body_too_large(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+    conn.putrequest("POST", "/batch")
+    conn.putheader("Content-Length", str(MAX_BODY_SIZE + 1))
+    conn.endheaders()
+    response = conn.getresponse()
+    assert response.status == 413
+    assert response.getheader("Connection") == "close"
+    conn.close()
+
+
+def test_keep_alive(conn):
+    for word in ("casa", "perro", "canción"):
+        response, data = request(conn, "GET", f"/syllabify?word={quote(word)}")
+        assert response.status == 200
+        assert not response.will_close
+    # Still the first socket
+    first_socket = conn.sock
+    request(conn, "POST", "/syllabify", {"word": "árbol"})
+    assert conn.sock is first_socket
+
+
+@pytest.mark.parametrize("method, path", [("POST", "/nowhere"), ("POST", "/health"), ("GET", "/batch")])
+def test_keep_alive_after_errors(conn, method, path):
+    # The body of a request answered without reading it is not taken as the next request
+    response, _ = request(conn, method, path, {"words": ["casa"]})
+    assert response.status in (404, 405)
+    assert not response.will_close
+    first_socket = conn.sock
+    response, data = request(conn, "GET", "/health")
+    assert response.status == 200
+    assert data["status"] == "ok"
+    assert conn.sock is first_socket
+
+
+@pytest.mark.parametrize(
+    "headers, status",
+    [({"Transfer-Encoding": "chunked"}, 411), ({"Content-Length": "-1"}, 400)],
+)
+def test_unknown_body_length_closes_the_connection(server, headers, status):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+    conn.putrequest("POST", "/batch")
+    for name, value in headers.items():
+        conn.putheader(name, value)
+    conn.endheaders()
+    response = conn.getresponse()
+    assert response.status == status
+    assert response.getheader("Connection") == "close"
+    conn.close()
+
+
+def test_server_timing_header(conn):
+    response, _ = request(conn, "GET", "/health")
+    name, duration = response.getheader("Server-Timing").split(";dur=")
+    assert name == "app"
+    assert float(duration) >= 0
+
+
+def test_health(conn):
+    response, data = request(conn, "GET", "/health")
+    assert response.status == 200
+    assert data == {"status": "ok", "version": pylabeador.__version__, "engine": pylabeador.get_engine()}
+
+
+def test_metrics(conn):
+    request(conn, "GET", "/health")
+    response, text = request(conn, "GET", "/metrics")
+    assert response.status == 200
+    assert response.getheader("Content-Type").startswith("text/plain")
+    lines = text.decode().splitlines()
+    assert any(line.startswith('pylabeador_http_requests_total{path="/health",status="200"}') for line in lines)
+    count = next(line for line in lines if line.startswith("pylabeador_http_request_seconds_count"))
+    assert int(count.split()[1]) >= 1
+
+
+def test_concurrent_connections(server):
+    errors = []
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+        try:
+            for _ in range(20):
+                response, data = request(conn, "POST", "/batch", {"words": ["casa", "perro"], "details": False})
+                if response.status != 200 or data["results"] != ["ca-sa", "pe-rro"]:
+                    errors.append(data)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
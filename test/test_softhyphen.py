@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+
+import pytest
+
+import pylabeador
+from pylabeador import SOFT_HYPHEN, soft_hyphenate_html, soft_hyphenate_text, soft_hyphenate_word
+
+HTML = """\
+<!DOCTYPE html>
+<html lang="es"><head><title>Capítulo primero</title>
+<style>p.cuadrado { margin: 0 }</style></head>
+<body>
+<!-- comentario sin separar -->
+<p class="cuadrado">Ahora la Espa&ntilde;a caballeresca &amp; <em>aventurera</em>.</p>
+<pre>código  preformateado</pre><CODE>variable</CODE>
+<p>Fin<br/>a</p>
+</body></html>
+"""
+
+EXPECTED = """\
+<!DOCTYPE html>
+<html lang="es"><head><title>Ca|pí|tu|lo pri|me|ro</title>
+<style>p.cuadrado { margin: 0 }</style></head>
+<body>
+<!-- comentario sin separar -->
+<p class="cuadrado">Aho|ra la Espa&ntilde;a ca|ba|lle|res|ca &amp; <em>aven|tu|re|ra</em>.</p>
+<pre>código  preformateado</pre><CODE>variable</CODE>
+<p>Fin<br/>a</p>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize(
+    "word, min_left, min_right, expected",
+    [
+        ("ahora", 2, 2, "aho|ra"),
+        ("ahora", 1, 1, "a|ho|ra"),
+        ("aéreo", 2, 2, "aé|reo"),
+        ("caballeresca", 3, 3, "caba|lle|resca"),
+        ("sol", 1, 1, "sol"),
+    ],
+)
+def test_soft_hyphenate_word(word, min_left, min_right, expected):
+    res = pylabeador.syllabify_with_details(word)
+    assert soft_hyphenate_word(res, min_left, min_right, hyphen="|") == expected
+
+
+def test_soft_hyphen_is_the_default():
+    assert "".join(soft_hyphenate_text("camión")) == f"ca{SOFT_HYPHEN}mión"
+
+
+def test_soft_hyphenate_text():
+    text = "Ahora, 3 naïve caballeros."
+    assert "".join(soft_hyphenate_text(text, hyphen="|")) == "Aho|ra, 3 naïve ca|ba|lle|ros."
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 13, 4096])
+def test_soft_hyphenate_html(chunk_size):
+    res = "".join(soft_hyphenate_html(io.StringIO(HTML), hyphen="|", chunk_size=chunk_size))
+    assert res == EXPECTED
+
+
+def test_soft_hyphenate_html_skip_elements():
+    html = "<p>caballero</p><em>caballero</em>"
+    res = "".join(soft_hyphenate_html(html, hyphen="|", skip_elements=frozenset({"em"})))
+    assert res == "<p>ca|ba|lle|ro</p><em>caballero</em>"
+
+
+def test_soft_hyphenate_html_skipped_content_is_not_held():
+    chunks = ["<pre>a < b", *["caballero " * 10] * 1000, "</P", "RE >caballero"]
+    pieces = list(soft_hyphenate_html(iter(chunks), hyphen="|"))
+    assert max(len(piece) for piece in pieces) < 200
+    assert "".join(pieces) == "".join(chunks[:-1]) + "RE >ca|ba|lle|ro"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 4096])
+def test_soft_hyphenate_html_quoted_attributes(chunk_size):
+    html = """<p title="a > caballero" data-x='b>c' lang = "es">caballero</p><a href=x>caballero</a>"""
+    res = "".join(soft_hyphenate_html(html, hyphen="|", chunk_size=chunk_size))
+    assert res == html.replace(">caballero<", ">ca|ba|lle|ro<")
+
+
+@pytest.mark.parametrize(
+    "html",
+    ["<p>caballero <unterminated", "<pre>caballero", "caballero <", "<!-- caballero", '<p title="a > caballero'],
+)
+def test_soft_hyphenate_html_unterminated(html):
+    res = "".join(soft_hyphenate_html(html, hyphen="|", chunk_size=4))
+    assert res.replace("|", "") == html
+    assert html.count("caballero") == res.count("caballero") + res.count("ca|ba|lle|ro")
@@ -19,8 +19,9 @@
 
 import pytest
 
-from pylabeador.errors import HyphenatorError
-from pylabeador.util import check_word_for_spanish_chars
+from pylabeador import compiled
+from pylabeador.errors import ErrorKind, HyphenatorError, InvalidWord
+from pylabeador.util import check_word_for_spanish_chars, find_invalid_chars
 
 
 @pytest.mark.parametrize(
@@ -52,6 +53,11 @@ from pylabeador.util import check_word_for_spanish_chars
         ("güo", "ü can only appear in güe or güi"),
         ("gü", "ü can only appear in güe or güi"),
         ("büggy", "ü can only appear in güe or güi"),
+        # Every ü is checked, not only the first one
+        ("pingüinoü", "ü can only appear in güe or güi"),
+        ("agüero müsica", "invalid letters"),
+        ("agüerogüa", "ü can only appear in güe or güi"),
+        ("agüerogüi", None),
     ],
 )
 def test_check_word_for_spanish_chars(word, expected_error_substring):
@@ -64,3 +70,33 @@ def test_check_word_for_spanish_chars(word, expected_error_substring):
         with pytest.raises(HyphenatorError) as exc_info:
             check_word_for_spanish_chars(word)
         assert expected_error_substring in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "word, kind",
+    [
+        ("pingüino", None),
+        ("r2d2", ErrorKind.INVALID_LETTER),
+        ("agüerogüa", ErrorKind.MISPLACED_DIAERESIS),
+    ],
+)
+def test_find_invalid_chars(word, kind):
+    invalid = find_invalid_chars(word)
+    assert (invalid and invalid.kind) == kind
+
+
+@pytest.mark.parametrize(
+    "word, kind",
+    [
+        ("r2d2", ErrorKind.INVALID_LETTER),
+        ("agüerogüa", ErrorKind.MISPLACED_DIAERESIS),
+        ("qub", ErrorKind.NO_NUCLEUS),
+        ("Aquh", ErrorKind.NO_NUCLEUS),
+    ],
+)
+def test_scan_checked_errors(word, kind):
+    res = compiled.scan_checked(word)
+    assert isinstance(res, InvalidWord)
+    assert (res.original, res.kind) == (word, kind)
+    with pytest.raises(HyphenatorError):
+        compiled.scan_valid(word)
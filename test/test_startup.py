@@ -0,0 +1,107 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pylabeador
+from pylabeador import __main__ as entry
+from pylabeador import cli
+
+SRC_DIR = Path(pylabeador.__file__).resolve().parent.parent
+
+# Budgets of import time, in microseconds as reported by python -X importtime. They
+# are several times what is measured on a laptop (about 3 ms and 50 ms), so that only
+# a module imported eagerly by mistake, not a slow machine, makes the tests fail.
+IMPORT_BUDGET_US = 25_000
+ONE_WORD_BUDGET_US = 200_000
+
+
+def import_times(*args: str, env: dict[str, str] | None = None) -> tuple[set[str], int]:
+    """
+    Run Python with -X importtime, and return what it imported after starting up.
+
+    Returns:
+        The names of the modules imported, and the time spent importing them in
+        microseconds.
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), **(env or {})}
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args], env=env, capture_output=True, text=True, check=True
+    )
+    modules = set()
+    total = 0
+    started = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == "site":
+            # Everything before is the start of the interpreter
+            started = True
+        elif started:
+            modules.add(name.strip())
+            if not name.startswith("  "):
+                total += int(cumulative)
+    return modules, total
+
+
+def test_import_is_lazy():
+    modules, total = import_times("-c", "import pylabeador")
+    assert modules == {"pylabeador", "pylabeador.__version__"}
+    assert total < IMPORT_BUDGET_US
+
+
+def test_names_are_loaded_on_access():
+    modules, _ = import_times("-c", "import pylabeador; pylabeador.hyphenate; pylabeador.HyphenatorError")
+    assert "pylabeador.api" in modules
+    assert not {"pylabeador.parallel", "pylabeador.text", "pylabeador.softhyphen"} & modules
+
+
+OPTIONAL_MODULES = {
+    "pylabeador.cachefile",
+    "pylabeador.lexicon",
+    "pylabeador.metrics",
+    "pylabeador.prefixes",
+    "pylabeador.wordtable",
+}
+
+
+def test_one_word_run_loads_only_the_engine():
+    modules, total = import_times("-m", "pylabeador", "casa")
+    assert not {"argparse", "pylabeador.parallel", "pylabeador.server", "http.server", "asyncio", "typing"} & modules
+    assert not OPTIONAL_MODULES & modules
+    assert not {"pylabeador.daemonclient", "socket"} & modules
+    assert total < ONE_WORD_BUDGET_US
+
+
+def test_cli_does_not_load_the_daemon_client():
+    modules, _ = import_times("-c", "import pylabeador.cli")
+    assert "pylabeador.daemonclient" not in modules
+
+
+def test_forwarding_does_not_load_the_library():
+    modules, _ = import_times("-c", "from pylabeador.daemonclient import connect_daemon")
+    assert not {"pylabeador.api", "pylabeador.errors", "typing", "dataclasses"} & modules
+
+
+def test_command_names():
+    assert entry.COMMAND_NAMES == set(cli.COMMANDS)
@@ -0,0 +1,79 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import io
+
+import pytest
+
+import pylabeador
+from pylabeador.text import tokenize
+
+TEXT = """\
+En un lugar de la Mancha, de cuyo nombre no quiero acordarme, no ha mucho
+tiempo que vivía un hidalgo de los de lanza en astillero, adarga antigua,
+rocín flaco y galgo corredor. (Año 1605; naïve müsica.)
+"""
+
+HYPHENATED = """\
+En un lu-gar de la Man-cha, de cu-yo nom-bre no quie-ro a-cor-dar-me, no ha mu-cho
+tiem-po que vi-ví-a un hi-dal-go de los de lan-za en as-ti-lle-ro, a-dar-ga an-ti-gua,
+ro-cín fla-co y gal-go co-rre-dor. (A-ño 1605; naïve müsica.)
+"""
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param(lambda: TEXT, id="string"),
+        pytest.param(lambda: io.StringIO(TEXT), id="file"),
+        pytest.param(lambda: TEXT.splitlines(keepends=True), id="lines"),
+        pytest.param(lambda: iter(TEXT), id="characters"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_hyphenate_text(source, chunk_size):
+    assert "".join(pylabeador.hyphenate_text(source(), chunk_size=chunk_size)) == HYPHENATED
+
+
+def test_hyphenate_text_with_separator():
+    assert "".join(pylabeador.hyphenate_text("¡Qué camión!", separator="·")) == "¡Qué ca·mión!"
+
+
+def test_syllabify_text_keeps_all_the_text():
+    spans = list(pylabeador.syllabify_text(io.StringIO(TEXT), chunk_size=5))
+    assert "".join(span for span, _ in spans) == TEXT
+    for span, res in spans:
+        if res is not None:
+            assert res == pylabeador.syllabify_with_details(span)
+
+
+def test_syllabify_text_invalid_words():
+    spans = dict(pylabeador.syllabify_text("naïve müsica casa"))
+    assert spans["naïve"] is None
+    assert spans["müsica"] is None
+    assert spans["casa"].hyphenated == "ca-sa"
+
+
+def test_tokenize_never_splits_words():
+    chunks = ["ca", "sa ", "pe", "rr", "o", "."]
+    assert list(tokenize(chunks)) == [("casa", True), (" ", False), ("perro", True), (".", False)]
+
+
+def test_tokenize_digits_and_underscores_are_not_words():
+    assert list(tokenize("mi_casa2")) == [("mi", True), ("_", False), ("casa", True), ("2", False)]
@@ -0,0 +1,140 @@
+# -------------------------------------------------------------------------------------
+# Copyright (c) 2025 Jacobo de Vera Hernández
+#
+# This file is part of Pylabeador.
+#
+# Pylabeador is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pylabeador is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pylabeador.  If not, see <https://www.gnu.org/licenses/>.
+# -------------------------------------------------------------------------------------
+
+import inspect
+import io
+from unittest.mock import patch
+
+import pytest
+
+import pylabeador
+from pylabeador import build_word_table, load_word_table
+from pylabeador.__main__ import main
+from pylabeador.wordtable import COMMON_WORDS_PATH, pack_entry, table_entries, table_source, unpack_entry
+
+from .utils import spanish_common_words
+
+GOLDEN = list(spanish_common_words())
+
+
+@pytest.fixture(scope="module")
+def common_words():
+    return load_word_table()
+
+
+@pytest.fixture
+def table_in_use():
+    yield pylabeador.use_word_table()
+    pylabeador.use_word_table(None)
+
+
+def test_common_words_are_up_to_date(common_words):
+    # Rebuild the table with: pylabeador build-word-table src/pylabeador/commonwords.py test/spanish-hyphens.txt
+    assert dict(common_words._words) == table_entries(word for word, *_ in GOLDEN)
+
+
+def test_common_words_have_golden_results(common_words):
+    for word, hyphenated, stressed, accent_pos in GOLDEN:
+        res = common_words[word]
+        assert res == pylabeador.syllabify_with_details(word)
+        assert (res.hyphenated, res.stressed, res.accented) == (hyphenated, stressed, accent_pos)
+
+
+def test_default_table_is_the_common_words():
+    default = inspect.signature(pylabeador.use_word_table).parameters["path"].default
+    assert default == COMMON_WORDS_PATH
+
+
+@pytest.mark.parametrize("word", ["a", "casa", "Canción", "PINGÜINO", "transatlántico", "ahí"])
+def test_pack_and_unpack(word):
+    assert unpack_entry(word, pack_entry(word)) == pylabeador.compiled.scan(word)
+
+
+def test_pack_invalid_words():
+    assert pack_entry("hello123") is None
+    assert pack_entry("müsica") is None
+
+
+def test_lookup_is_case_insensitive(common_words):
+    assert common_words["CASA"].hyphenated == "CA-SA"
+    assert "Casa" in common_words
+    assert common_words.get("transatlántico") is None
+    with pytest.raises(KeyError):
+        common_words["transatlántico"]
+
+
+def test_results_are_built_once(common_words):
+    assert common_words["casa"] is common_words["casa"]
+    assert common_words["Casa"].original == "Casa"
+
+
+def test_build_word_table(tmp_path):
+    path = tmp_path / "table.py"
+    assert build_word_table(path, ["de", "casa", "hello123", "Casa", "perro"], limit=2) == 2
+    table = load_word_table(path)
+    assert list(table) == ["de", "casa"]
+    assert table.path == path
+
+
+def test_table_source_is_a_module():
+    source = table_source(table_entries(["casa", "camión"]))
+    namespace: dict = {}
+    exec(source, namespace)  # noqa: S102
+    assert namespace["WORDS"] == {"casa": pack_entry("casa"), "camión": pack_entry("camión")}
+
+
+def test_not_a_word_table(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("casa\n")
+    with pytest.raises(ValueError, match="not a pylabeador word table"):
+        load_word_table(path)
+
+
+def test_use_word_table(table_in_use):
+    with patch("pylabeador.api._parse", side_effect=AssertionError("Should not parse")):
+        assert pylabeador.hyphenate("después") == "des-pués"
+        assert list(pylabeador.hyphenate_many(["casa", "Perro"])) == ["ca-sa", "Pe-rro"]
+    assert pylabeador.hyphenate("transatlántico") == "tran-sa-tlán-ti-co"
+    assert list(pylabeador.hyphenate_many(["transatlántico"])) == ["tran-sa-tlán-ti-co"]
+    with pytest.raises(pylabeador.HyphenatorError):
+        pylabeador.hyphenate("hello123")
+
+
+def test_prefixes_take_precedence(table_in_use):
+    assert table_in_use["desastre"].hyphenated == "de-sas-tre"
+    pylabeador.use_prefixes({"astre"})
+    try:
+        assert pylabeador.hyphenate("desastre") == "des-as-tre"
+        assert list(pylabeador.hyphenate_many(["desastre"])) == ["des-as-tre"]
+    finally:
+        pylabeador.use_prefixes(None)
+
+
+def test_cli_build_and_use_table(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("# Some words\ncasa ca-sa 0 -\n\nperro\n")
+    table_path = tmp_path / "table.py"
+    with patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+        main(["pylabeador", "build-word-table", str(table_path), str(words)])
+    assert "Stored 2 words" in mock_stderr.getvalue()
+    for option in (["--word-table", str(table_path)], ["--common-words"]):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            main(["pylabeador", *option, "perro", "gato"])
+        pylabeador.use_word_table(None)
+        assert mock_stdout.getvalue().split() == ["pe-rro", "ga-to"]
@@ -20,8 +20,36 @@
 import pathlib
 from typing import TextIO
 
+import pytest
+
 
 def data_file_open(filename) -> TextIO:
     test_dir = pathlib.Path(__file__).parent
     path = test_dir / filename
     return path.open()
+
+
+def lines_from(filename):
+    with data_file_open(filename) as fin:
+        for line in fin:
+            clean_line = line.strip()
+            if not clean_line or clean_line.startswith("#"):
+                continue
+            yield clean_line
+
+
+def spanish_common_words():
+    for line in lines_from("spanish-hyphens.txt"):
+        word, hyphenation, stressed, accent_pos = line.split()
+        accent_pos = int(accent_pos) if accent_pos != "-" else None
+        yield word, hyphenation, int(stressed), accent_pos
+
+
+def parametrize_with_words_from(source):
+    return pytest.mark.parametrize(
+        "word, hyphenated, stressed, accent_pos",
+        (
+            pytest.param(word, hyphenation, stressed, accent_pos, id=word)
+            for word, hyphenation, stressed, accent_pos in source
+        ),
+    )
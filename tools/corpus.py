@@ -0,0 +1,387 @@
+#!/usr/bin/env -S uv run -q --script
+#
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#       "click",
+#       "rich",
+# ]
+# ///
+
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+import gzip
+import heapq
+import itertools
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import IO
+
+import click
+from rich.console import Console
+from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TimeRemainingColumn, TransferSpeedColumn
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR.parent / "src"))
+
+import pylabeador  # noqa: E402
+from pylabeador.text import WORD_RE  # noqa: E402
+
+CHECKPOINT_NAME = "checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+# Bytes of input read at a time, cut at the last space or line break
+READ_SIZE = 1024 * 1024
+
+# Merging more runs than this at once would open too many files, so they are merged
+# into one first
+MAX_RUNS = 64
+
+HEADER = "# word\tcount\thyphenated\tstressed\taccent\n"
+
+# Files written to the work directory, the only ones removed from it when done
+WORK_FILES = (CHECKPOINT_NAME, "run-*.tsv", "sorted-*.tsv", "*.tmp")
+
+
+def read_run(path: Path) -> Iterator[tuple[str, int]]:
+    with path.open(encoding="utf-8") as fin:
+        for line in fin:
+            word, count = line.rstrip("\n").split("\t")
+            yield word, int(count)
+
+
+def merge_counts(streams: Iterable[Iterator[tuple[str, int]]]) -> Iterator[tuple[str, int]]:
+    """Merge streams of words and counts sorted by word, adding up the counts of each word"""
+    for word, group in itertools.groupby(heapq.merge(*streams), key=lambda item: item[0]):
+        yield word, sum(count for _, count in group)
+
+
+def write_lines(path: Path, lines: Iterable[str]) -> None:
+    """Write a file, replacing it atomically if it exists"""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fout:
+        fout.writelines(lines)
+    os.replace(tmp_path, path)
+
+
+class SpillingCounter:
+    """
+    Count words in memory, spilling them to disk when asked.
+
+    Spilled counts are written to runs, files of words and counts sorted by word,
+    which are merged when the counts are read.
+    """
+
+    def __init__(self, work_dir: Path, runs: Iterable[str] = (), next_run: int = 0):
+        self.work_dir = work_dir
+        self.runs = list(runs)
+        self.next_run = next_run
+        self.counts: Counter[str] = Counter()
+
+    def _write_run(self, items: Iterable[tuple[str, int]]) -> None:
+        name = f"run-{self.next_run:06d}.tsv"
+        self.next_run += 1
+        write_lines(self.work_dir / name, (f"{word}\t{count}\n" for word, count in items))
+        self.runs.append(name)
+
+    def spill(self) -> list[str]:
+        """
+        Write the counts in memory to a new run, merging the runs when there are many.
+
+        Returns:
+            The runs that are no longer needed, which are left for the caller to
+            remove once it no longer refers to them.
+        """
+        if self.counts:
+            self._write_run(sorted(self.counts.items()))
+            self.counts.clear()
+        if len(self.runs) <= MAX_RUNS:
+            return []
+        old_runs = self.runs
+        self.runs = []
+        self._write_run(merge_counts(read_run(self.work_dir / name) for name in old_runs))
+        return old_runs
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Yield each word and its count, sorted by word"""
+        runs = [read_run(self.work_dir / name) for name in self.runs]
+        yield from merge_counts([*runs, iter(sorted(self.counts.items()))])
+
+
+def open_input(path: Path) -> tuple[IO[bytes], IO[bytes]]:
+    """
+    Open an input file, decompressing it if it is gzipped.
+
+    Returns:
+        The file to read and the raw file below it, whose position tells the progress.
+    """
+    raw = path.open("rb")
+    if path.suffix == ".gz":
+        return gzip.GzipFile(fileobj=raw), raw
+    return raw, raw
+
+
+class CorpusCounter:
+    """
+    Count the words of some input files, saving checkpoints from which to resume.
+
+    The counts are only spilled to disk along with a checkpoint, so that the runs
+    always hold the words up to the offset of the last checkpoint.
+    """
+
+    def __init__(self, inputs: list[Path], work_dir: Path, max_words: int, keep_case: bool):
+        self.inputs = [str(path.resolve()) for path in inputs]
+        self.work_dir = work_dir
+        self.max_words = max_words
+        self.keep_case = keep_case
+        self.input = 0
+        self.offset = 0
+        self.tokens = 0
+        self.counted = False
+        self.counter = SpillingCounter(work_dir)
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.work_dir / CHECKPOINT_NAME
+
+    def save_checkpoint(self) -> None:
+        """Spill the counts and save how far the counting has got"""
+        old_runs = self.counter.spill()
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "inputs": self.inputs,
+            "keep_case": self.keep_case,
+            "input": self.input,
+            "offset": self.offset,
+            "tokens": self.tokens,
+            "runs": self.counter.runs,
+            "next_run": self.counter.next_run,
+            "counted": self.counted,
+        }
+        write_lines(self.checkpoint_path, [json.dumps(state, indent=2)])
+        for name in old_runs:
+            (self.work_dir / name).unlink()
+
+    def load_checkpoint(self) -> None:
+        state = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise click.ClickException(f"{self.checkpoint_path} was saved by another version of this tool")
+        if state["inputs"] != self.inputs or state["keep_case"] != self.keep_case:
+            raise click.ClickException(f"{self.checkpoint_path} was saved for other inputs or options")
+        self.input = state["input"]
+        self.offset = state["offset"]
+        self.tokens = state["tokens"]
+        self.counted = state["counted"]
+        self.counter = SpillingCounter(self.work_dir, state["runs"], state["next_run"])
+
+    def count_text(self, data: bytes) -> None:
+        text = data.decode("utf-8", errors="replace")
+        words = WORD_RE.findall(text if self.keep_case else text.lower())
+        self.counter.counts.update(words)
+        self.tokens += len(words)
+        self.offset += len(data)
+
+    def count_file(self, fin: IO[bytes], raw: IO[bytes], checkpoint_every: int, advance) -> None:
+        """Count the words of an input from the current offset, saving checkpoints on the way"""
+        fin.seek(self.offset)
+        last_checkpoint = self.offset
+        position = raw.tell()
+        advance(position)
+        pending = b""
+        while block := fin.read(READ_SIZE):
+            block = pending + block
+            # Cut at the last space or line break, which is never inside a word or
+            # a UTF-8 sequence
+            end = max(block.rfind(b"\n"), block.rfind(b" ")) + 1
+            pending = block[end:]
+            self.count_text(block[:end])
+            advance(raw.tell() - position)
+            position = raw.tell()
+            if len(self.counter.counts) > self.max_words or self.offset - last_checkpoint >= checkpoint_every:
+                self.save_checkpoint()
+                last_checkpoint = self.offset
+        self.count_text(pending)
+
+    def count(self, checkpoint_every: int, progress: Progress) -> None:
+        """Count the words of all the inputs, from the last checkpoint"""
+        sizes = [os.path.getsize(path) for path in self.inputs]
+        task = progress.add_task("Counting", total=sum(sizes), completed=sum(sizes[: self.input]))
+        while self.input < len(self.inputs):
+            fin, raw = open_input(Path(self.inputs[self.input]))
+            with fin, raw:
+                self.count_file(fin, raw, checkpoint_every, lambda size: progress.advance(task, size))
+            self.input += 1
+            self.offset = 0
+            if self.input < len(self.inputs):
+                self.save_checkpoint()
+        self.counted = True
+        self.save_checkpoint()
+
+
+def syllabified_rows(items: Iterable[tuple[str, int]], stats: Counter) -> Iterator[tuple[int, str]]:
+    """Syllabify each word once, yielding its count and its row of the output"""
+    counts: deque[int] = deque()
+
+    def just_words():
+        for word, count in items:
+            counts.append(count)
+            yield word
+
+    for res in pylabeador.syllabify_with_details_many(just_words(), errors="return"):
+        count = counts.popleft()
+        if isinstance(res, pylabeador.InvalidWord):
+            stats["invalid words"] += 1
+            stats["invalid tokens"] += count
+            continue
+        stats["words"] += 1
+        accent = res.accented if res.accented is not None else "-"
+        yield count, f"{res.original}\t{count}\t{res.hyphenated}\t{res.stressed}\t{accent}\n"
+
+
+def by_frequency(rows: Iterable[tuple[int, str]], work_dir: Path, max_rows: int) -> Iterator[str]:
+    """Sort rows by count, most frequent first, spilling sorted runs to disk when there are too many"""
+    # Rows are prefixed with a key that sorts as the descending count
+    runs: list[Path] = []
+    batch: list[str] = []
+
+    def spill():
+        batch.sort()
+        path = work_dir / f"sorted-{len(runs):06d}.tsv"
+        write_lines(path, batch)
+        runs.append(path)
+        batch.clear()
+
+    for count, row in rows:
+        batch.append(f"{(1 << 64) - count:016x}\t{row}")
+        if len(batch) >= max_rows:
+            spill()
+    files = [path.open(encoding="utf-8") for path in runs]
+    try:
+        for line in heapq.merge(*files, sorted(batch)):
+            yield line.split("\t", 1)[1]
+    finally:
+        for fin in files:
+            fin.close()
+
+
+def remove_work_files(work_dir: Path) -> None:
+    """Remove the files written to the work directory, and the directory if nothing else is left in it"""
+    for pattern in WORK_FILES:
+        for path in work_dir.glob(pattern):
+            path.unlink()
+    try:
+        work_dir.rmdir()
+    except OSError:
+        pass
+
+
+@click.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path), required=True)
+@click.option(
+    "--work-dir",
+    "-w",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Empty directory for the spilled counts and the checkpoint  [default: OUTPUT.work]",
+)
+@click.option("--resume", "-r", is_flag=True, help="Carry on from the checkpoint in the work directory")
+@click.option(
+    "--max-words",
+    type=click.IntRange(min=1),
+    default=1_000_000,
+    show_default=True,
+    help="Distinct words counted in memory before spilling them to disk",
+)
+@click.option(
+    "--checkpoint-every",
+    type=click.IntRange(min=1),
+    default=256,
+    show_default=True,
+    help="Megabytes of input read between checkpoints",
+)
+@click.option("--min-count", type=click.IntRange(min=1), default=1, show_default=True, help="Leave out rarer words")
+@click.option(
+    "--order",
+    type=click.Choice(["frequency", "word"]),
+    default="frequency",
+    show_default=True,
+    help="Order of the output rows: most frequent words first, or sorted by word",
+)
+@click.option("--keep-case", is_flag=True, help="Count words as they are written, instead of lowercase")
+@click.option("--keep-work", is_flag=True, help="Keep the work directory when done")
+def main(
+    inputs: tuple[Path, ...],
+    output: Path,
+    work_dir: Path | None,
+    resume: bool,
+    max_words: int,
+    checkpoint_every: int,
+    min_count: int,
+    order: str,
+    keep_case: bool,
+    keep_work: bool,
+):
+    """
+    Count the words of text corpora and syllabify each distinct word once.
+
+    The inputs, plain or gzipped UTF-8 text, are read as a stream, and the counts of
+    the words are spilled to sorted files in the work directory when they do not fit
+    in memory. The output is a table with a row per valid word: the word, the number
+    of times it appears, its syllables, its stressed syllable and the position of its
+    accent. With the most frequent words first, it can be given to `pylabeador
+    build-word-table`.
+
+    A checkpoint is saved in the work directory every so often. If the run is
+    interrupted, run the same command with --resume to carry on from there. The
+    work directory must be empty when starting from scratch. When done, the files
+    written to it are removed, and so is the directory if nothing else is in it.
+    """
+    console = Console(stderr=True)
+    work_dir = work_dir or output.with_name(f"{output.name}.work")
+    work_dir.mkdir(parents=True, exist_ok=True)
+    counter = CorpusCounter(list(inputs), work_dir, max_words, keep_case)
+    if resume:
+        if not counter.checkpoint_path.exists():
+            raise click.ClickException(f"There is no checkpoint in {work_dir}")
+        counter.load_checkpoint()
+        console.print(f"Resuming from input {counter.input + 1}, byte {counter.offset}")
+    elif counter.checkpoint_path.exists():
+        raise click.ClickException(f"There is a checkpoint in {work_dir}, use --resume or another --work-dir")
+    elif any(work_dir.iterdir()):
+        # Only the files of this tool are removed when done, but better not mix them with others
+        raise click.ClickException(f"{work_dir} is not empty, use another --work-dir")
+
+    start = time.monotonic()
+    columns = [TextColumn("{task.description}"), BarColumn(), DownloadColumn(), TransferSpeedColumn()]
+    try:
+        with Progress(*columns, TimeRemainingColumn(), console=console) as progress:
+            if not counter.counted:
+                counter.count(checkpoint_every * 1024 * 1024, progress)
+    except KeyboardInterrupt:
+        console.print("[bold red]Interrupted[/bold red], run again with --resume to carry on from the last checkpoint")
+        sys.exit(130)
+
+    stats: Counter = Counter()
+    items = ((word, count) for word, count in counter.counter.items() if count >= min_count)
+    with console.status("Syllabifying"):
+        rows = syllabified_rows(items, stats)
+        if order == "frequency":
+            lines = by_frequency(rows, work_dir, max_words)
+        else:
+            lines = (row for _, row in rows)
+        write_lines(output, itertools.chain([HEADER], lines))
+    if not keep_work:
+        remove_work_files(work_dir)
+
+    elapsed = time.monotonic() - start
+    console.print(f"[bold green]DONE[/bold green] in {elapsed:.1f}s: {counter.tokens} tokens")
+    console.print(f"{stats['words']} distinct valid words written to {output}")
+    if stats["invalid words"]:
+        console.print(f"{stats['invalid words']} distinct invalid words skipped, {stats['invalid tokens']} tokens")
+
+
+if __name__ == "__main__":
+    main()
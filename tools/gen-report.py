@@ -8,6 +8,10 @@
 # ]
 # ///
 
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+import html
+import itertools
 from pathlib import Path
 import sys
 from typing import IO
@@ -21,6 +25,35 @@ sys.path.insert(0, str(THIS_DIR.parent / "src"))
 
 import pylabeador  # noqa: E402
 
+# Names of the stress positions, counted from the end of the word
+STRESS_NAMES = {1: "aguda", 2: "llana", 3: "esdrújula"}
+
+HTML_HEAD = """\
+<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>pylabeador report</title>
+<style>
+body { font-family: sans-serif; }
+table { border-collapse: collapse; margin-bottom: 1em; }
+td, th { padding: 0.1em 0.8em; text-align: left; }
+tbody tr:nth-child(even) { background: #eee; }
+td.line, td.count { text-align: right; }
+.accent { color: #0050c0; font-weight: bold; }
+.stressed { color: #008000; font-weight: bold; }
+.error { color: #c00000; }
+</style>
+</head>
+<body>
+<h1>pylabeador report</h1>
+"""
+
+HTML_TAIL = """\
+</body>
+</html>
+"""
+
 
 def lines_from(filename, start=1, limit=None):
     count = 0
@@ -49,32 +82,170 @@ def format_result(res: pylabeador.SyllabifiedWord):
     return original, hyphenated
 
 
+def results_from(lines: Iterable[tuple[int, str]]) -> Iterator[tuple[int, pylabeador.SyllabifiedWord | Exception]]:
+    """Syllabify the words of the lines as a batch, yielding the line number and the result or the error"""
+    line_numbers: deque[int] = deque()
+
+    def just_words():
+        for lineno, word in lines:
+            line_numbers.append(lineno)
+            yield word
+
+    for res in pylabeador.syllabify_with_details_many(just_words(), errors="return"):
+        lineno = line_numbers.popleft()
+        yield lineno, res.error() if isinstance(res, pylabeador.InvalidWord) else res
+
+
+def stress_name(from_end: int) -> str:
+    return STRESS_NAMES.get(from_end, "sobresdrújula")
+
+
+class ReportStats:
+    """Summary statistics, updated as each result is produced"""
+
+    def __init__(self):
+        self.words = 0
+        self.errors = 0
+        self.syllable_counts: Counter[int] = Counter()
+        self.stress_positions: Counter[int] = Counter()
+
+    def add(self, res: pylabeador.SyllabifiedWord | Exception) -> None:
+        if isinstance(res, Exception):
+            self.errors += 1
+            return
+        self.words += 1
+        num_syllables = len(res.syllables)
+        self.syllable_counts[num_syllables] += 1
+        self.stress_positions[num_syllables - res.stressed] += 1
+
+    @property
+    def total(self) -> int:
+        return self.words + self.errors
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.total if self.total else 0.0
+
+    def histograms(self) -> Iterator[tuple[str, str, list[tuple[str, int]]]]:
+        """Yield the title, the name of the key and the rows of each histogram"""
+        yield "Syllables per word", "Syllables", [(str(n), c) for n, c in sorted(self.syllable_counts.items())]
+        yield (
+            "Stress position",
+            "From the end",
+            [(f"{n} ({stress_name(n)})", c) for n, c in sorted(self.stress_positions.items())],
+        )
+
+
+def percent(count: int, total: int) -> str:
+    return f"{100 * count / total:.1f}%" if total else "-"
+
+
+class TerminalReport:
+    """Print the rows in pages of a table, each one as soon as it is complete"""
+
+    def __init__(self, console: Console):
+        self.console = console
+        self.first_page = True
+
+    def page(self, rows: list[tuple[int, pylabeador.SyllabifiedWord | Exception]]) -> None:
+        # The same widths in every page, so that they line up
+        table = Table(row_styles=["", "on bright_black"], show_header=self.first_page)
+        table.add_column("Line", justify="right", width=8)
+        table.add_column("Original", justify="left", width=24)
+        table.add_column("Hyphenated", justify="left", width=40)
+        for lineno, res in rows:
+            if isinstance(res, Exception):
+                table.add_row(str(lineno), "", f"[bold red]{res}[/bold red]")
+            else:
+                table.add_row(str(lineno), *format_result(res))
+        self.console.print(table)
+        self.first_page = False
+
+    def finish(self, stats: ReportStats) -> None:
+        self.console.print(
+            f"[bold]{stats.total}[/bold] words, [bold red]{stats.errors}[/bold red] errors ({stats.error_rate:.1%})"
+        )
+        for title, key, rows in stats.histograms():
+            table = Table(title=title)
+            table.add_column(key)
+            table.add_column("Words", justify="right")
+            table.add_column("%", justify="right")
+            for name, count in rows:
+                table.add_row(name, str(count), percent(count, stats.words))
+            self.console.print(table)
+
+
+class HtmlReport:
+    """Write a static HTML page, appending the rows of each page as soon as it is complete"""
+
+    def __init__(self, out: IO[str]):
+        self.out = out
+        out.write(HTML_HEAD)
+        out.write("<table>\n<thead><tr><th>Line</th><th>Original</th><th>Hyphenated</th></tr></thead>\n<tbody>\n")
+
+    def format_result(self, res: pylabeador.SyllabifiedWord) -> tuple[str, str]:
+        original = html.escape(res.original)
+        if res.accented is not None:
+            original = (
+                html.escape(res.original[: res.accented])
+                + f'<span class="accent">{html.escape(res.original[res.accented])}</span>'
+                + html.escape(res.original[res.accented + 1 :])
+            )
+        hyphenated = "-".join(
+            f'<span class="stressed">{html.escape(s.value)}</span>' if s.stressed else html.escape(s.value)
+            for s in res.syllables
+        )
+        return original, hyphenated
+
+    def page(self, rows: list[tuple[int, pylabeador.SyllabifiedWord | Exception]]) -> None:
+        lines = []
+        for lineno, res in rows:
+            if isinstance(res, Exception):
+                cells = f'<td></td><td class="error">{html.escape(str(res))}</td>'
+            else:
+                cells = "<td>{}</td><td>{}</td>".format(*self.format_result(res))
+            lines.append(f'<tr><td class="line">{lineno}</td>{cells}</tr>\n')
+        self.out.write("".join(lines))
+        self.out.flush()
+
+    def finish(self, stats: ReportStats) -> None:
+        out = self.out
+        out.write("</tbody>\n</table>\n<h2>Summary</h2>\n")
+        out.write(f"<p>{stats.total} words, {stats.errors} errors ({stats.error_rate:.1%})</p>\n")
+        for title, key, rows in stats.histograms():
+            out.write(f"<h3>{html.escape(title)}</h3>\n<table>\n")
+            out.write(f"<thead><tr><th>{html.escape(key)}</th><th>Words</th><th>%</th></tr></thead>\n<tbody>\n")
+            for name, count in rows:
+                out.write(
+                    f'<tr><td>{html.escape(name)}</td><td class="count">{count}</td>'
+                    f'<td class="count">{percent(count, stats.words)}</td></tr>\n'
+                )
+            out.write("</tbody>\n</table>\n")
+        out.write(HTML_TAIL)
+
+
 @click.command()
 @click.option("--input", "-i", type=click.File("r"), required=True)
 @click.option("--start", "-s", type=int, default=1)
 @click.option("--limit", "-l", type=int, default=None)
-def main(input: IO[str], start: int, limit: int | None):
+@click.option("--page-size", "-p", type=click.IntRange(min=1), default=100, show_default=True, help="Rows per page")
+@click.option("--html", "html_output", type=click.File("w"), help="Write the report to this HTML file")
+def main(input: IO[str], start: int, limit: int | None, page_size: int, html_output: IO[str] | None):
     """
     Generate a report of the syllabification and stress detection of a file of words.
+
+    Rows are written in pages as they are produced, so the memory used does not grow
+    with the input. A summary with the distribution of the number of syllables and
+    of the stressed syllable, and the rate of errors, is written at the end.
     """
-    errors = []
-    console = Console()
-    table = Table(row_styles=["", "on bright_black"])
-    table.add_column("Line", justify="right")
-    table.add_column("Original", justify="left")
-    table.add_column("Hyphenated", justify="left")
-    for lineno, line in lines_from(input, start, limit):
-        try:
-            res = pylabeador.syllabify_with_details(line)
-            original, hyphenated = format_result(res)
-            table.add_row(str(lineno), original, hyphenated)
-        except pylabeador.HyphenatorError as e:
-            errors.append((lineno, e))
-    console.print(table)
-    if errors:
-        console.print("[bold red]Errors:[/bold red]")
-        for lineno, error in errors:
-            console.print(f"[bold red]{lineno}[/bold red]: {error}")
+    report = HtmlReport(html_output) if html_output else TerminalReport(Console())
+    stats = ReportStats()
+    results = results_from(lines_from(input, start, limit))
+    while page := list(itertools.islice(results, page_size)):
+        for _, res in page:
+            stats.add(res)
+        report.page(page)
+    report.finish(stats)
 
 
 if __name__ == "__main__":
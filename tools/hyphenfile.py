@@ -8,7 +8,8 @@
 # ]
 # ///
 
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import sys
 from typing import IO
@@ -43,6 +44,73 @@ HEADER = """\
 DEFAULT_OUTPUT_FILE = TEST_DIR / "spanish-hyphens.txt"
 DEFAULT_INPUT_FILE = TEST_DIR / "commonspanish"
 
+# Number of output lines written at a time
+BATCH_SIZE = 8192
+
+
+def format_line(word: str, hyphenated: str, stressed: int, accent: int | None) -> str:
+    return f"{word} {hyphenated} {stressed} {accent if accent is not None else '-'}"
+
+
+def numbered_words(lines: Iterable[str], try_hard: bool, errors: list) -> Iterator[tuple[int, str]]:
+    """Yield the line number and the word of each line, adding lines with many words to errors"""
+    for line_no, line in enumerate(lines, start=1):
+        text = line.strip()
+        parts = text.split()
+        if len(parts) > 1:
+            if try_hard:
+                text = parts[0]
+            else:
+                errors.append((line_no, f"Multiple words on line: [bold red]{text}[/bold red]"))
+                continue
+        if not text or text.startswith("#"):
+            continue
+        yield line_no, text
+
+
+def syllabify_lines(
+    words: Iterable[tuple[int, str]], jobs: int | None
+) -> Iterator[tuple[int, pylabeador.SyllabifiedWord | pylabeador.HyphenatorError]]:
+    """Yield the line number and the result, or the error, of each word"""
+    if jobs == 1:
+        for line_no, word in words:
+            try:
+                yield line_no, pylabeador.syllabify_with_details(word)
+            except pylabeador.HyphenatorError as e:
+                yield line_no, e
+        return
+
+    line_numbers: deque[int] = deque()
+
+    def just_words():
+        for line_no, word in words:
+            line_numbers.append(line_no)
+            yield word
+
+    for _, res in pylabeador.syllabify_with_details_parallel(just_words(), jobs):
+        yield line_numbers.popleft(), res
+
+
+def valid_results(results, errors: list) -> Iterator[pylabeador.SyllabifiedWord]:
+    """Yield the valid results, adding the errors to the list"""
+    for line_no, res in results:
+        if isinstance(res, pylabeador.HyphenatorError):
+            errors.append((line_no, str(res)))
+        else:
+            yield res
+
+
+def write_golden(output_file: IO[str], results, errors: list):
+    """Write the results in the test-data format, in batches of lines"""
+    batch = [HEADER]
+    for res in valid_results(results, errors):
+        batch.append(format_line(res.original, res.hyphenated, res.stressed, res.accented))
+        if len(batch) >= BATCH_SIZE:
+            output_file.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        output_file.write("\n".join(batch) + "\n")
+
 
 @click.command()
 @click.option("--input", "-i", "input_file", type=click.File("r"), default=DEFAULT_INPUT_FILE)
@@ -54,7 +122,24 @@ DEFAULT_INPUT_FILE = TEST_DIR / "commonspanish"
     default=False,
     help="When source lines have more than one word, take the first of each line",
 )
-def main(input_file: IO[str], output_file: IO[str], try_hard: bool):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes, 0 for one per CPU",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["golden", *pylabeador.formats.FORMATS]),
+    default="golden",
+    show_default=True,
+    help="Output format: the test-data format, or whole results as JSON lines, TSV or binary records",
+)
+def main(input_file: IO[str], output_file: IO[str], try_hard: bool, jobs: int, output_format: str):
     """
     Generate a test-data file from a list of words.
 
@@ -70,32 +155,18 @@ def main(input_file: IO[str], output_file: IO[str], try_hard: bool):
         input_lines = list(input_file)
         input_file.close()
 
-    print(HEADER, file=output_file)
-    for line_no, line in enumerate(input_lines, start=1):
-        text = line.strip()
-        parts = text.split()
-        if len(parts) > 1:
-            if try_hard:
-                text = parts[0]
-            else:
-                errors.append((line_no, f"Multiple words on line: [bold red]{text}[/bold red]"))
-                continue
-        if not text or text.startswith("#"):
-            continue
-        try:
-            w = pylabeador.syllabify_with_details(text)
-            print(
-                f"{w.original} {w.hyphenated} {w.stressed} {w.accented if w.accented is not None else '-'}".strip(),
-                file=output_file,
-            )
-        except pylabeador.HyphenatorError as e:
-            errors.append((line_no, str(e)))
+    results = syllabify_lines(numbered_words(input_lines, try_hard, errors), jobs or None)
+    if output_format == "golden":
+        write_golden(output_file, results, errors)
+    else:
+        out = output_file.buffer if pylabeador.formats.FORMATS[output_format].binary else output_file  # type: ignore[attr-defined]
+        pylabeador.formats.write_results(out, valid_results(results, errors), output_format)
     console = Console(stderr=True)
     console.print("[bold green]DONE[/bold green]")
 
     if errors:
         console.print("[bold red]With errors:[/bold red]")
-        for line_no, err in errors:
+        for line_no, err in sorted(errors):
             console.print(f"[bold red]{line_no}[/bold red]: {err}")
 
 